@@ -1,10 +1,14 @@
+from .duplicate_discovery import DuplicateDiscoveryAnalyzer
 from .duplicates import ExactDuplicateAnalyzer
+from .near_duplicates import NearDuplicateAnalyzer
 from .retrieval_eval import RetrievalEvalAnalyzer
 from .sidecar_links import SidecarLinksAnalyzer
 from .stats import StatsAnalyzer
 
 __all__ = [
+    "DuplicateDiscoveryAnalyzer",
     "ExactDuplicateAnalyzer",
+    "NearDuplicateAnalyzer",
     "RetrievalEvalAnalyzer",
     "SidecarLinksAnalyzer",
     "StatsAnalyzer",
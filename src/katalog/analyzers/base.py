@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, ClassVar, FrozenSet, cast
+from typing import Any, ClassVar, FrozenSet, Iterable, cast
 
 from pydantic import BaseModel, Field
 
@@ -49,6 +49,32 @@ class AnalyzerResult(BaseModel):
     groups: list[FileGroupFinding] = Field(default_factory=list)
     issues: list[AnalyzerIssue] = Field(default_factory=list)
     output: dict[str, Any] | None = None
+    # Asset id groups to merge, the first id of each being the canonical asset.
+    merges: list[list[int]] = Field(default_factory=list)
+    # Committed with the changeset when it completes, see `Analyzer.load_analyzer_state()`.
+    state: dict[str, Any] | None = None
+    # True when `Analyzer.should_run()` declined the run.
+    skipped: bool = False
+
+
+class AnalyzerChanges(BaseModel):
+    """What a changeset changed, as seen by scheduled analyzers."""
+
+    changeset_id: int
+    asset_ids: frozenset[int] = frozenset()
+    keys: frozenset[MetadataKey] = frozenset()
+    # Assets were lost or deleted, which leaves no metadata rows behind.
+    assets_removed: bool = False
+
+    def extend(
+        self, *, asset_ids: Iterable[int] = (), keys: Iterable[MetadataKey] = ()
+    ) -> "AnalyzerChanges":
+        return self.model_copy(
+            update={
+                "asset_ids": self.asset_ids | frozenset(asset_ids),
+                "keys": self.keys | frozenset(keys),
+            }
+        )
 
 
 class AnalyzerScope(BaseModel):
@@ -90,6 +116,9 @@ class Analyzer(PluginBase, ABC):
     supports_single_asset: ClassVar[bool] = True
     supports_collection: ClassVar[bool] = True
 
+    # Set by the runtime before `run()`; None when the run was not scheduled.
+    changes: AnalyzerChanges | None = None
+
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         deps = cls.dependencies
@@ -100,9 +129,21 @@ class Analyzer(PluginBase, ABC):
             outs = frozenset(outs)
         cls.dependencies, cls.outputs = deps, outs
 
-    @abstractmethod
-    def should_run(self, *, changeset: Changeset) -> bool:
-        """Return True if the analyzer needs to execute for the given changeset."""
+    def should_run(
+        self, *, changeset: Changeset, changes: AnalyzerChanges | None = None
+    ) -> bool:
+        """Return True if the analyzer needs to execute for the given changeset.
+
+        Explicit runs (no `changes`) always execute. Scheduled runs execute when
+        assets were removed or when a declared dependency changed; analyzers
+        without dependencies run on any metadata change.
+        """
+        _ = changeset
+        if changes is None or changes.assets_removed:
+            return True
+        if not self.dependencies:
+            return bool(changes.keys)
+        return not self.dependencies.isdisjoint(changes.keys)
 
     @abstractmethod
     async def run(
@@ -110,6 +151,14 @@ class Analyzer(PluginBase, ABC):
     ) -> AnalyzerResult:
         """Execute the analyzer and return the metadata mutations to persist."""
 
+    async def load_analyzer_state(self) -> dict[str, Any] | None:
+        """Return the `AnalyzerResult.state` of this actor's last completed run."""
+        if self.actor.id is None:
+            return None
+        from katalog.db.changesets import get_changeset_repo
+
+        return await get_changeset_repo().latest_analyzer_state(int(self.actor.id))
+
 
 async def make_analyzer_instance(analyzer_record: Actor) -> Analyzer:
     return cast(Analyzer, await get_actor_instance(analyzer_record))
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+from typing import Any
+
+from loguru import logger
+from pydantic import BaseModel, ConfigDict, Field
+
+from katalog.analyzers.base import (
+    Analyzer,
+    AnalyzerResult,
+    AnalyzerScope,
+    FileGroupFinding,
+)
+from katalog.analyzers.utils import build_scoped_assets_cte
+from katalog.constants.metadata import (
+    FILE_SIZE,
+    HASH_MD5,
+    HASH_SAMPLE,
+    MetadataKey,
+    get_metadata_id,
+)
+from katalog.db.sqlspec import session_scope
+from katalog.db.sqlspec.sql_helpers import select
+from katalog.db.sqlspec.tables import ASSET_TABLE, METADATA_TABLE
+from katalog.models import Actor, Changeset, ChangesetStats
+from katalog.processors.md5_hash import MD5HashProcessor
+from katalog.processors.runtime import do_run_processors
+from katalog.processors.sample_hash import SampleHashProcessor
+from katalog.runtime.batch import get_batch_size, iter_batches
+
+
+class DuplicateDiscoveryAnalyzer(Analyzer):
+    """Finds duplicate files while reading as little data as possible.
+
+    Stages narrow the candidates before any expensive read:
+
+    1. group by `file/size` in SQL; files with a unique size are done,
+    2. hash head/middle/tail samples of the size collisions (`hash/sample`),
+    3. fully hash (`hash/md5`) only files whose samples still collide.
+
+    Hashes are produced by this analyzer's actor and skipped for assets whose
+    data did not change since they were computed.
+    """
+
+    plugin_id = "katalog.analyzers.duplicate_discovery.DuplicateDiscoveryAnalyzer"
+    title = "Duplicate discovery"
+    description = "Find duplicates by size, then sample hash, then full MD5."
+    output_kind = "duplicate_discovery"
+    dependencies = frozenset({FILE_SIZE})
+    outputs = frozenset({HASH_SAMPLE, HASH_MD5})
+    supports_single_asset = False
+
+    class ConfigModel(BaseModel):
+        model_config = ConfigDict(extra="ignore")
+
+        min_size: int = Field(
+            default=1,
+            ge=0,
+            description="Ignore smaller files (empty files are all identical)",
+        )
+        sample_size: int = Field(
+            default=64 * 1024,
+            gt=0,
+            description="Bytes read at the head, middle and tail for the sample hash",
+        )
+        full_hash: bool = Field(
+            default=True,
+            description="Confirm sample matches with a full MD5; otherwise report them as probable",
+        )
+        max_groups: int = Field(
+            default=5000,
+            gt=0,
+            description="Hard cap on number of duplicate groups emitted to avoid unbounded memory",
+        )
+
+    config_model = ConfigModel
+
+    def __init__(self, actor: Actor, **config: Any) -> None:
+        self.config = self.config_model.model_validate(config or {})
+        super().__init__(actor, **config)
+
+    async def run(
+        self, *, changeset: Changeset, scope: AnalyzerScope
+    ) -> AnalyzerResult:
+        stats = changeset.stats
+        if stats is None:
+            stats = ChangesetStats()
+            changeset.stats = stats
+        sample_processor = SampleHashProcessor(
+            self.actor, sample_size=self.config.sample_size
+        )
+        md5_processor = MD5HashProcessor(self.actor)
+        read_before = _bytes_read(stats, sample_processor, md5_processor)
+
+        size_candidates, sized = await self._size_candidates(scope)
+        logger.info(
+            "Duplicate discovery size stage sized_assets={assets} candidates={candidates}",
+            assets=sized["assets"],
+            candidates=len(size_candidates),
+        )
+
+        if size_candidates:
+            await do_run_processors(
+                changeset=changeset,
+                assets=None,
+                asset_ids=size_candidates,
+                pipeline=[[sample_processor]],
+            )
+        sample_groups = await self._current_groups(HASH_SAMPLE, size_candidates)
+        sample_candidates = sorted(
+            {asset_id for members in sample_groups.values() for asset_id in members}
+        )
+        logger.info(
+            "Duplicate discovery sample stage groups={groups} candidates={candidates}",
+            groups=len(sample_groups),
+            candidates=len(sample_candidates),
+        )
+
+        if self.config.full_hash and sample_candidates:
+            await do_run_processors(
+                changeset=changeset,
+                assets=None,
+                asset_ids=sample_candidates,
+                pipeline=[[md5_processor]],
+            )
+        md5_by_asset = await self._current_values(HASH_MD5, sample_candidates)
+        md5_groups: dict[str, list[int]] = {}
+        for asset_id, md5 in md5_by_asset.items():
+            md5_groups.setdefault(md5, []).append(asset_id)
+        md5_groups = {md5: sorted(ids) for md5, ids in md5_groups.items() if len(ids) > 1}
+
+        bytes_read = _bytes_read(stats, sample_processor, md5_processor) - read_before
+        bytes_skipped = max(int(sized["unhashed_bytes"]) - bytes_read, 0)
+        stats.bytes_read += bytes_read
+        stats.bytes_skipped += bytes_skipped
+        logger.info(
+            "Duplicate discovery full stage groups={groups} bytes_read={read} bytes_skipped={skipped}",
+            groups=len(md5_groups),
+            read=bytes_read,
+            skipped=bytes_skipped,
+        )
+
+        groups: list[FileGroupFinding] = [
+            _group_finding("exact_duplicate", "full", md5, ids)
+            for md5, ids in md5_groups.items()
+        ]
+        # Sample matches that could not be confirmed (full hashing disabled or
+        # failed) are still worth reviewing.
+        for sample, ids in sample_groups.items():
+            if any(asset_id not in md5_by_asset for asset_id in ids):
+                groups.append(_group_finding("probable_duplicate", "sample", sample, ids))
+        groups.sort(key=lambda group: (-len(group.file_ids), group.kind, group.label))
+
+        return AnalyzerResult(
+            groups=groups[: int(self.config.max_groups)],
+            output={
+                "stages": {
+                    "size": {
+                        "assets": int(sized["assets"]),
+                        "candidates": len(size_candidates),
+                    },
+                    "sample": {
+                        "groups": len(sample_groups),
+                        "candidates": len(sample_candidates),
+                    },
+                    "full": {
+                        "hashed": len(sample_candidates) if self.config.full_hash else 0,
+                        "groups": len(md5_groups),
+                    },
+                },
+                "bytes_total": int(sized["bytes"]),
+                "bytes_read": bytes_read,
+                "bytes_skipped": bytes_skipped,
+            },
+        )
+
+    async def _size_candidates(
+        self, scope: AnalyzerScope
+    ) -> tuple[list[int], dict[str, int]]:
+        """Assets sharing their size with another asset, plus totals over all sized assets."""
+        scoped_cte, scoped_params = build_scoped_assets_cte(
+            scope, asset_table=ASSET_TABLE, metadata_table=METADATA_TABLE
+        )
+        size_key_id = int(get_metadata_id(FILE_SIZE))
+        md5_key_id = int(get_metadata_id(HASH_MD5))
+        base_cte = f"""
+            WITH {scoped_cte},
+            latest AS (
+                SELECT
+                    m.asset_id,
+                    m.metadata_key_id,
+                    m.value_int,
+                    m.removed,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY m.asset_id, m.metadata_key_id
+                        ORDER BY m.changeset_id DESC, m.id DESC
+                    ) AS rn
+                FROM {METADATA_TABLE} m
+                JOIN scoped_assets s ON s.asset_id = m.asset_id
+                WHERE m.metadata_key_id IN (?, ?)
+            ),
+            sizes AS (
+                SELECT asset_id, value_int AS size
+                FROM latest
+                WHERE rn = 1 AND removed = 0 AND metadata_key_id = ? AND value_int >= ?
+            ),
+            hashed AS (
+                SELECT asset_id
+                FROM latest
+                WHERE rn = 1 AND removed = 0 AND metadata_key_id = ?
+            )
+        """
+        params = [
+            *scoped_params,
+            size_key_id,
+            md5_key_id,
+            size_key_id,
+            int(self.config.min_size),
+            md5_key_id,
+        ]
+        async with session_scope(analysis=True) as session:
+            rows = await select(
+                session,
+                f"""
+                {base_cte}
+                SELECT asset_id
+                FROM sizes
+                WHERE size IN (SELECT size FROM sizes GROUP BY size HAVING COUNT(*) > 1)
+                ORDER BY asset_id
+                """,
+                params,
+            )
+            totals = await select(
+                session,
+                f"""
+                {base_cte}
+                SELECT
+                    COUNT(*) AS assets,
+                    COALESCE(SUM(size), 0) AS bytes,
+                    COALESCE(
+                        SUM(CASE WHEN asset_id IN (SELECT asset_id FROM hashed) THEN 0 ELSE size END),
+                        0
+                    ) AS unhashed_bytes
+                FROM sizes
+                """,
+                params,
+            )
+        total = totals[0] if totals else {}
+        return [int(row["asset_id"]) for row in rows], {
+            "assets": int(total.get("assets") or 0),
+            "bytes": int(total.get("bytes") or 0),
+            "unhashed_bytes": int(total.get("unhashed_bytes") or 0),
+        }
+
+    async def _current_values(
+        self, key: MetadataKey, asset_ids: list[int]
+    ) -> dict[int, str]:
+        """Newest non-removed text value of `key` per asset."""
+        values: dict[int, str] = {}
+        key_id = int(get_metadata_id(key))
+        for id_batch in iter_batches(asset_ids, get_batch_size()):
+            placeholders = ", ".join("?" for _ in id_batch)
+            sql = f"""
+                WITH latest AS (
+                    SELECT
+                        m.asset_id,
+                        lower(trim(m.value_text)) AS value,
+                        m.removed,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY m.asset_id
+                            ORDER BY m.changeset_id DESC, m.id DESC
+                        ) AS rn
+                    FROM {METADATA_TABLE} m
+                    WHERE m.asset_id IN ({placeholders})
+                      AND m.metadata_key_id = ?
+                )
+                SELECT asset_id, value
+                FROM latest
+                WHERE rn = 1 AND removed = 0 AND value IS NOT NULL AND value != ''
+            """
+            async with session_scope(analysis=True) as session:
+                rows = await select(session, sql, [*id_batch, key_id])
+            values.update({int(row["asset_id"]): str(row["value"]) for row in rows})
+        return values
+
+    async def _current_groups(
+        self, key: MetadataKey, asset_ids: list[int]
+    ) -> dict[str, list[int]]:
+        groups: dict[str, list[int]] = {}
+        for asset_id, value in (await self._current_values(key, asset_ids)).items():
+            groups.setdefault(value, []).append(asset_id)
+        return {value: sorted(ids) for value, ids in groups.items() if len(ids) > 1}
+
+
+def _bytes_read(stats: ChangesetStats, *processors: Any) -> int:
+    return int(
+        sum(
+            stats.processor_stats.get(processor.plugin_id, {}).get("bytes_read_total", 0)
+            for processor in processors
+        )
+    )
+
+
+def _group_finding(kind: str, stage: str, label: str, asset_ids: list[int]) -> FileGroupFinding:
+    return FileGroupFinding(
+        kind=kind,
+        label=label,
+        file_ids=[str(asset_id) for asset_id in asset_ids],
+        attributes={
+            "hash": label,
+            "stage": stage,
+            "file_count": len(asset_ids),
+            "asset_ids": asset_ids,
+        },
+    )
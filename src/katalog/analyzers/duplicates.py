@@ -12,15 +12,25 @@ from katalog.analyzers.base import (
     FileGroupFinding,
 )
 from katalog.analyzers.utils import build_scoped_assets_cte
+from katalog.db.exact_duplicates import (
+    HashGroup,
+    IndexedHash,
+    get_exact_duplicate_repo,
+)
 from katalog.db.sqlspec.sql_helpers import select
 from katalog.db.sqlspec import session_scope
 from katalog.db.sqlspec.tables import ASSET_TABLE, METADATA_TABLE
 from katalog.models import Metadata, Actor, Changeset
 from katalog.constants.metadata import HASH_MD5, get_metadata_id
+from katalog.runtime.batch import get_batch_size, iter_batches
 
 
 class ExactDuplicateAnalyzer(Analyzer):
-    """Groups files that share the same MD5 hash."""
+    """Groups files that share the same MD5 hash.
+
+    Full-dataset runs maintain a persistent hash index and only revisit the
+    assets whose `hash/md5` changed since the previous run.
+    """
 
     plugin_id = "katalog.analyzers.duplicates.ExactDuplicateAnalyzer"
     title = "Exact duplicates"
@@ -36,6 +46,10 @@ class ExactDuplicateAnalyzer(Analyzer):
             gt=0,
             description="Hard cap on number of duplicate groups emitted to avoid unbounded memory",
         )
+        propose_merges: bool = Field(
+            default=False,
+            description="Merge each duplicate group into its oldest asset",
+        )
 
     config_model = ConfigModel
 
@@ -43,17 +57,184 @@ class ExactDuplicateAnalyzer(Analyzer):
         self.config = self.config_model.model_validate(config or {})
         super().__init__(actor, **config)
 
-    def should_run(self, *, changeset: Changeset) -> bool:  # noqa: D401
-        """Currently always runs; future versions may add change detection."""
-
-        return True
-
     async def run(
         self, *, changeset: Changeset, scope: AnalyzerScope
     ) -> AnalyzerResult:
-        """Find duplicate assets by MD5 using SQL-only grouping."""
+        if scope.kind == "all" and self.actor.id is not None:
+            return await self._run_incremental(changeset)
+        return await self._run_scoped(scope)
+
+    async def _run_incremental(self, changeset: Changeset) -> AnalyzerResult:
+        """Update the persistent hash index from hashes changed since the last run.
+
+        Only groups whose membership changed are reported, each tagged with
+        `change` (`added`, `changed` or `removed`). The first run, without a
+        checkpoint, rebuilds the index and reports every group as added.
+        """
+
+        actor_id = int(self.actor.id)  # type: ignore[arg-type]
+        repo = get_exact_duplicate_repo()
+        state = await self.load_analyzer_state() or {}
+        since = state.get("changeset_id")
+        if since is None:
+            await repo.clear(actor_id=actor_id)
+        changed = await self._changed_asset_ids(since)
+
+        issues: list[AnalyzerIssue] = []
+        updates: dict[int, IndexedHash | None] = {}
+        touched: set[str] = set()
+        for id_batch in iter_batches(changed, get_batch_size()):
+            current = await self._current_hashes(id_batch)
+            previous = await repo.hashes_for(actor_id=actor_id, asset_ids=id_batch)
+            for asset_id in id_batch:
+                by_hash = current.get(asset_id, {})
+                new: IndexedHash | None = None
+                if len(by_hash) > 1:
+                    issues.append(self._conflict_issue(asset_id, sorted(by_hash)))
+                elif by_hash:
+                    md5, actor_ids = next(iter(by_hash.items()))
+                    new = IndexedHash(md5=md5, actor_ids=tuple(sorted(actor_ids)))
+                old = previous.get(asset_id)
+                if new == old:
+                    continue
+                updates[asset_id] = new
+                touched.update(value.md5 for value in (old, new) if value is not None)
+
+        sizes_before = await repo.group_sizes(actor_id=actor_id, md5s=touched)
+        for id_batch in iter_batches(sorted(updates), get_batch_size()):
+            await repo.replace(
+                actor_id=actor_id,
+                hashes={asset_id: updates[asset_id] for asset_id in id_batch},
+            )
+
+        max_groups = int(self.config.max_groups)
+        groups: list[FileGroupFinding] = []
+        if since is None:
+            for group in await repo.groups(actor_id=actor_id, limit=max_groups):
+                groups.append(self._group_finding(group, change="added"))
+        else:
+            for group in await repo.groups(
+                actor_id=actor_id, md5s=touched, min_size=1, limit=None
+            ):
+                before = sizes_before.get(group.md5, 0)
+                if len(group.asset_ids) > 1:
+                    change = "changed" if before > 1 else "added"
+                elif before > 1:
+                    change = "removed"
+                else:
+                    continue
+                groups.append(self._group_finding(group, change=change))
+            # Hashes that no asset has anymore dissolve their group entirely.
+            reported = {finding.label for finding in groups}
+            for md5 in sorted(touched):
+                if sizes_before.get(md5, 0) > 1 and md5 not in reported:
+                    groups.append(
+                        self._group_finding(HashGroup(md5=md5), change="removed")
+                    )
+            groups.sort(key=lambda finding: (-len(finding.file_ids), finding.label))
+            groups = groups[:max_groups]
+
+        logger.info(
+            "Exact duplicate index updated changed={changed} updated={updated} touched_hashes={touched} groups={groups}",
+            changed=len(changed),
+            updated=len(updates),
+            touched=len(touched),
+            groups=len(groups),
+        )
+        return AnalyzerResult(
+            metadata=[],
+            groups=groups,
+            issues=issues,
+            merges=self._merges(groups),
+            output={
+                "full_rebuild": since is None,
+                "changed_assets": len(changed),
+                "updated_assets": len(updates),
+                "touched_hashes": len(touched),
+                "groups": len(groups),
+            },
+            state={"changeset_id": int(changeset.id)},
+        )
+
+    async def _changed_asset_ids(self, since: int | None) -> list[int]:
+        sql = f"""
+            SELECT DISTINCT asset_id
+            FROM {METADATA_TABLE}
+            WHERE metadata_key_id = ?
+        """
+        params: list[Any] = [int(get_metadata_id(HASH_MD5))]
+        if since is not None:
+            sql += " AND changeset_id > ?"
+            params.append(int(since))
+        sql += " ORDER BY asset_id"
+        async with session_scope(analysis=True) as session:
+            rows = await select(session, sql, params)
+        return [int(row["asset_id"]) for row in rows]
+
+    async def _current_hashes(self, asset_ids: list[int]) -> dict[int, dict[str, set[int]]]:
+        """Current normalized hashes by asset, with the actors reporting each."""
+        placeholders = ", ".join("?" for _ in asset_ids)
+        sql = f"""
+        WITH latest_md5 AS (
+            SELECT
+                m.asset_id,
+                m.actor_id,
+                m.removed,
+                lower(trim(m.value_text)) AS md5,
+                ROW_NUMBER() OVER (
+                    PARTITION BY m.asset_id, m.actor_id
+                    ORDER BY m.changeset_id DESC, m.id DESC
+                ) AS rn
+            FROM {METADATA_TABLE} AS m
+            WHERE m.asset_id IN ({placeholders})
+              AND m.metadata_key_id = ?
+        )
+        SELECT asset_id, actor_id, md5
+        FROM latest_md5
+        WHERE rn = 1 AND removed = 0 AND md5 IS NOT NULL AND md5 != ''
+        """
+        async with session_scope(analysis=True) as session:
+            rows = await select(
+                session, sql, [*asset_ids, int(get_metadata_id(HASH_MD5))]
+            )
+        current: dict[int, dict[str, set[int]]] = {}
+        for row in rows:
+            by_hash = current.setdefault(int(row["asset_id"]), {})
+            by_hash.setdefault(str(row["md5"]), set()).add(int(row["actor_id"]))
+        return current
+
+    @staticmethod
+    def _conflict_issue(asset_id: int, hashes: list[str]) -> AnalyzerIssue:
+        message = (
+            "Multiple current hash/md5 values for asset "
+            f"{asset_id}: {', '.join(hashes)}"
+        )
+        logger.error(message)
+        return AnalyzerIssue(
+            level="error",
+            message=message,
+            file_ids=[str(asset_id)],
+            extra={"hashes": hashes},
+        )
+
+    @staticmethod
+    def _group_finding(group: HashGroup, *, change: str) -> FileGroupFinding:
+        return FileGroupFinding(
+            kind="exact_duplicate",
+            label=group.md5,
+            file_ids=[str(a) for a in group.asset_ids],
+            attributes={
+                "hash": group.md5,
+                "file_count": len(group.asset_ids),
+                "asset_ids": group.asset_ids,
+                "actor_ids": group.actor_ids,
+                "change": change,
+            },
+        )
+
+    async def _run_scoped(self, scope: AnalyzerScope) -> AnalyzerResult:
+        """Find duplicate assets by MD5 within a scope using SQL-only grouping."""
 
-        _ = changeset
         md5_registry_id = get_metadata_id(HASH_MD5)
         max_groups = int(self.config.max_groups)
         metadata_table = METADATA_TABLE
@@ -192,8 +373,18 @@ class ExactDuplicateAnalyzer(Analyzer):
             relationships=[],
             groups=groups,
             issues=issues,
+            merges=self._merges(groups),
         )
 
+    def _merges(self, groups: list[FileGroupFinding]) -> list[list[int]]:
+        if not self.config.propose_merges:
+            return []
+        return [
+            sorted(int(asset_id) for asset_id in group.file_ids)
+            for group in groups
+            if len(group.file_ids) > 1 and group.attributes.get("change") != "removed"
+        ]
+
     @staticmethod
     def _extract_hash(metadata: Metadata) -> str | None:
         if metadata.value is None:
@@ -35,10 +35,15 @@ class EvalMetricsAnalyzer(Analyzer):
     description = "Aggregate and export parsing-eval metrics."
     output_kind = "eval_metrics"
     supports_single_asset = False
-
-    def should_run(self, *, changeset: Changeset) -> bool:
-        _ = changeset
-        return True
+    dependencies = frozenset(
+        {
+            EVAL_SIMILARITY,
+            EVAL_COMPLETENESS,
+            EVAL_UNIQUE_WORD_RATIO,
+            EVAL_SENTENCE_COUNT,
+            EVAL_AVG_SENTENCE_WORDS,
+        }
+    )
 
     async def run(
         self, *, changeset: Changeset, scope: AnalyzerScope
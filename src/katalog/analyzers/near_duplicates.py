@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from loguru import logger
+from pydantic import BaseModel, ConfigDict, Field
+
+from katalog.analyzers.base import Analyzer, AnalyzerResult, AnalyzerScope
+from katalog.constants.metadata import (
+    HASH_MINHASH,
+    HASH_SIMHASH,
+    REL_SIMILAR_TO,
+    get_metadata_id,
+)
+from katalog.db.near_duplicates import (
+    NearDuplicatePair,
+    NearDuplicateSignature,
+    get_near_duplicate_repo,
+)
+from katalog.db.sqlspec import session_scope
+from katalog.db.sqlspec.sql_helpers import select
+from katalog.db.sqlspec.tables import METADATA_TABLE
+from katalog.models import Actor, Changeset, Metadata, make_metadata
+from katalog.runtime.batch import get_batch_size, iter_batches
+from katalog.utils.similarity import (
+    SIMHASH_BITS,
+    hamming_distance,
+    minhash_bands,
+    minhash_similarity,
+    parse_minhash,
+    parse_simhash,
+    simhash_blocks,
+)
+
+
+class NearDuplicateAnalyzer(Analyzer):
+    """Links assets whose MinHash or SimHash fingerprints are nearly identical.
+
+    Fingerprints are indexed into LSH band tables, so each asset is only
+    compared with the few assets sharing a band instead of with every other
+    asset. Runs are incremental: only assets whose fingerprints changed since
+    the last completed run are re-indexed and re-verified.
+    """
+
+    plugin_id = "katalog.analyzers.near_duplicates.NearDuplicateAnalyzer"
+    title = "Near duplicates"
+    description = "Link near-duplicate assets using MinHash/SimHash LSH."
+    output_kind = "near_duplicates"
+    dependencies = frozenset({HASH_MINHASH, HASH_SIMHASH})
+    outputs = frozenset({REL_SIMILAR_TO})
+    supports_single_asset = False
+    supports_collection = False
+
+    class ConfigModel(BaseModel):
+        model_config = ConfigDict(extra="ignore")
+
+        jaccard_threshold: float = Field(
+            default=0.8,
+            gt=0,
+            le=1,
+            description="Minimum estimated Jaccard similarity of MinHash signatures",
+        )
+        max_hamming_distance: int = Field(
+            default=3,
+            ge=0,
+            lt=SIMHASH_BITS,
+            description="Maximum differing SimHash bits",
+        )
+        minhash_bands: int = Field(
+            default=16,
+            gt=0,
+            description="LSH bands per MinHash signature; more bands find lower similarities",
+        )
+        max_bucket_size: int = Field(
+            default=1000,
+            gt=1,
+            description="Skip LSH buckets with more members (boilerplate shared by many documents)",
+        )
+        merge_min_similarity: float | None = Field(
+            default=None,
+            gt=0,
+            le=1,
+            description="Merge newly found pairs at least this similar into the older asset",
+        )
+
+    config_model = ConfigModel
+
+    def __init__(self, actor: Actor, **config: Any) -> None:
+        self.config = self.config_model.model_validate(config or {})
+        super().__init__(actor, **config)
+
+    async def run(
+        self, *, changeset: Changeset, scope: AnalyzerScope
+    ) -> AnalyzerResult:
+        if scope.kind != "all":
+            raise ValueError("NearDuplicateAnalyzer only supports full-dataset scope")
+        if self.actor.id is None:
+            raise ValueError("Analyzer actor id is missing")
+        actor_id = int(self.actor.id)
+        repo = get_near_duplicate_repo()
+        batch_size = get_batch_size()
+
+        state = await self.load_analyzer_state() or {}
+        since = state.get("changeset_id")
+        changed = set(await self._changed_asset_ids(since))
+        # Assets of an interrupted run that were indexed but never verified.
+        changed.update(await repo.dirty_asset_ids(actor_id=actor_id))
+
+        metadata: list[Metadata] = []
+        merges: list[list[int]] = []
+        indexed: list[int] = []
+        removed_pairs = 0
+        for id_batch in iter_batches(sorted(changed), batch_size):
+            fingerprints = await self._load_fingerprints(id_batch)
+            signatures: list[NearDuplicateSignature] = []
+            gone: list[int] = []
+            for asset_id in id_batch:
+                signature = self._signature(asset_id, fingerprints.get(asset_id, {}))
+                if signature is None:
+                    gone.append(asset_id)
+                else:
+                    signatures.append(signature)
+            for pair in await repo.remove(actor_id=actor_id, asset_ids=gone):
+                metadata.append(self._relation(pair.asset_id, pair.other_id, removed=True))
+                removed_pairs += 1
+            await repo.index(actor_id=actor_id, signatures=signatures)
+            indexed.extend(signature.asset_id for signature in signatures)
+
+        candidates = 0
+        added_pairs = 0
+        for id_batch in iter_batches(sorted(indexed), batch_size):
+            candidate_pairs = await repo.candidate_pairs(
+                actor_id=actor_id,
+                asset_ids=id_batch,
+                max_bucket_size=self.config.max_bucket_size,
+            )
+            existing = await repo.pairs_for(actor_id=actor_id, asset_ids=id_batch)
+            signatures_by_id = await repo.signatures(
+                actor_id=actor_id,
+                asset_ids={asset_id for pair in candidate_pairs for asset_id in pair},
+            )
+            candidates += len(candidate_pairs)
+
+            verified: dict[tuple[int, int], float] = {}
+            for probe, other in candidate_pairs:
+                similarity = self._similarity(
+                    signatures_by_id.get(probe), signatures_by_id.get(other)
+                )
+                if similarity is not None:
+                    verified[(probe, other)] = similarity
+
+            added = [
+                NearDuplicatePair(max(pair), min(pair), similarity)
+                for pair, similarity in verified.items()
+                if pair not in existing
+            ]
+            dropped = [pair for pair in existing if pair not in verified]
+            await repo.save_pairs(
+                actor_id=actor_id,
+                added=added,
+                removed=dropped,
+                verified_asset_ids=id_batch,
+            )
+            merge_min = self.config.merge_min_similarity
+            for pair in added:
+                metadata.append(
+                    self._relation(pair.asset_id, pair.other_id, confidence=pair.similarity)
+                )
+                if merge_min is not None and pair.similarity >= merge_min:
+                    merges.append([pair.other_id, pair.asset_id])
+            for left, right in dropped:
+                metadata.append(self._relation(max(left, right), min(left, right), removed=True))
+            added_pairs += len(added)
+            removed_pairs += len(dropped)
+
+        logger.info(
+            "Near-duplicate analysis done changed={changed} indexed={indexed} candidates={candidates} added={added} removed={removed}",
+            changed=len(changed),
+            indexed=len(indexed),
+            candidates=candidates,
+            added=added_pairs,
+            removed=removed_pairs,
+        )
+        return AnalyzerResult(
+            metadata=metadata,
+            merges=merges,
+            output={
+                "changed_assets": len(changed),
+                "indexed_assets": len(indexed),
+                "candidate_pairs": candidates,
+                "pairs_added": added_pairs,
+                "pairs_removed": removed_pairs,
+                "merges_proposed": len(merges),
+            },
+            state={"changeset_id": int(changeset.id)},
+        )
+
+    def _signature(
+        self, asset_id: int, fingerprints: dict[int, Any]
+    ) -> NearDuplicateSignature | None:
+        minhash = parse_minhash(fingerprints.get(int(get_metadata_id(HASH_MINHASH))))
+        simhash = parse_simhash(fingerprints.get(int(get_metadata_id(HASH_SIMHASH))))
+        if minhash is None and simhash is None:
+            return None
+        bands: list[tuple[str, int, int]] = []
+        if minhash is not None:
+            bands.extend(
+                ("minhash", band, bucket)
+                for band, bucket in minhash_bands(minhash, self.config.minhash_bands)
+            )
+        if simhash is not None:
+            bands.extend(
+                ("simhash", block, bits)
+                for block, bits in simhash_blocks(simhash, self.config.max_hamming_distance)
+            )
+        return NearDuplicateSignature(
+            asset_id=asset_id, minhash=minhash, simhash=simhash, bands=bands
+        )
+
+    def _similarity(
+        self,
+        left: NearDuplicateSignature | None,
+        right: NearDuplicateSignature | None,
+    ) -> float | None:
+        if left is None or right is None:
+            return None
+        if left.minhash is not None and right.minhash is not None:
+            jaccard = minhash_similarity(left.minhash, right.minhash)
+            if jaccard is not None and jaccard >= self.config.jaccard_threshold:
+                return jaccard
+        if left.simhash is not None and right.simhash is not None:
+            distance = hamming_distance(left.simhash, right.simhash)
+            if distance <= self.config.max_hamming_distance:
+                return 1 - distance / SIMHASH_BITS
+        return None
+
+    def _relation(
+        self,
+        asset_id: int,
+        other_id: int,
+        *,
+        confidence: float | None = None,
+        removed: bool = False,
+    ) -> Metadata:
+        return make_metadata(
+            REL_SIMILAR_TO,
+            other_id,
+            actor_id=self.actor.id,
+            removed=removed,
+            confidence=confidence,
+            asset_id=asset_id,
+        )
+
+    async def _changed_asset_ids(self, since: int | None) -> list[int]:
+        sql = f"""
+            SELECT DISTINCT asset_id
+            FROM {METADATA_TABLE}
+            WHERE metadata_key_id IN (?, ?)
+        """
+        params: list[Any] = [
+            int(get_metadata_id(HASH_MINHASH)),
+            int(get_metadata_id(HASH_SIMHASH)),
+        ]
+        if since is not None:
+            sql += " AND changeset_id > ?"
+            params.append(int(since))
+        async with session_scope(analysis=True) as session:
+            rows = await select(session, sql, params)
+        return [int(row["asset_id"]) for row in rows]
+
+    async def _load_fingerprints(self, asset_ids: list[int]) -> dict[int, dict[int, Any]]:
+        """Latest non-removed fingerprint values by asset and metadata key id."""
+        minhash_key_id = int(get_metadata_id(HASH_MINHASH))
+        simhash_key_id = int(get_metadata_id(HASH_SIMHASH))
+        placeholders = ", ".join("?" for _ in asset_ids)
+        sql = f"""
+            WITH latest AS (
+                SELECT
+                    m.asset_id,
+                    m.metadata_key_id,
+                    m.value_text,
+                    m.value_json,
+                    m.removed,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY m.asset_id, m.metadata_key_id
+                        ORDER BY m.changeset_id DESC, m.id DESC
+                    ) AS rn
+                FROM {METADATA_TABLE} m
+                WHERE m.asset_id IN ({placeholders})
+                  AND m.metadata_key_id IN (?, ?)
+            )
+            SELECT asset_id, metadata_key_id, value_text, value_json
+            FROM latest
+            WHERE rn = 1 AND removed = 0
+        """
+        async with session_scope(analysis=True) as session:
+            rows = await select(
+                session, sql, [*asset_ids, minhash_key_id, simhash_key_id]
+            )
+        fingerprints: dict[int, dict[int, Any]] = {}
+        for row in rows:
+            key_id = int(row["metadata_key_id"])
+            if key_id == minhash_key_id:
+                value = row["value_json"]
+                if isinstance(value, str):
+                    try:
+                        value = json.loads(value)
+                    except ValueError:
+                        continue
+            else:
+                value = row["value_text"]
+            fingerprints.setdefault(int(row["asset_id"]), {})[key_id] = value
+        return fingerprints
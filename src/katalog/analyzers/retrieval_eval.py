@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import math
 from dataclasses import dataclass
 from time import perf_counter
 from typing import Any
@@ -16,6 +18,7 @@ from katalog.constants.metadata import (
     DOC_CHUNK_TEXT,
     EVAL_QUERIES,
     SIDECAR_TYPE,
+    MetadataKey,
     get_metadata_def_by_id,
     get_metadata_id,
 )
@@ -23,8 +26,9 @@ from katalog.db.assets import get_asset_repo
 from katalog.db.vectors import VectorSearchHit, get_vector_repo
 from katalog.models import Actor, Changeset
 from katalog.models.query import AssetFilter, AssetQuery
+from katalog.runtime.batch import get_batch_size
 from katalog.utils.exports import analyzer_export_dir, write_csv_tables
-from katalog.vectors.embedding import embed_text_kreuzberg
+from katalog.vectors.embedding import EmbeddingBackend, embed_query_cached
 
 
 @dataclass(frozen=True)
@@ -61,12 +65,21 @@ class RetrievalEvalAnalyzer(Analyzer):
         min_score: float | None = Field(default=None, ge=0.0, le=1.0)
         search_dimension: int = Field(default=64, gt=0)
         embedding_model: str = "fast"
-        embedding_backend: str = "preset"
+        embedding_backend: EmbeddingBackend = "preset"
         max_queries: int = Field(
             default=0,
             ge=0,
             description="0 means evaluate all query cases.",
         )
+        concurrency: int = Field(
+            default=8,
+            gt=0,
+            description="Query cases embedded and searched at the same time.",
+        )
+        cache_query_embeddings: bool = Field(
+            default=True,
+            description="Keep query embeddings in the workspace cache across runs.",
+        )
 
     config_model = ConfigModel
 
@@ -74,10 +87,6 @@ class RetrievalEvalAnalyzer(Analyzer):
         self.config = self.config_model.model_validate(config or {})
         super().__init__(actor, **config)
 
-    def should_run(self, *, changeset: Changeset) -> bool:
-        _ = changeset
-        return True
-
     async def run(self, *, changeset: Changeset, scope: AnalyzerScope) -> AnalyzerResult:
         if scope.kind == "asset":
             raise ValueError("Retrieval eval analyzer does not support single-asset scope")
@@ -106,72 +115,117 @@ class RetrievalEvalAnalyzer(Analyzer):
         if not ready:
             raise RuntimeError(f"Vector search is not ready: {reason or 'unknown reason'}")
 
-        key_ids = [int(get_metadata_id(key)) for key in self.config.metadata_keys]
+        key_ids = [int(get_metadata_id(MetadataKey(key))) for key in self.config.metadata_keys]
         max_k = max(self._k_values())
         search_limit = max(int(self.config.top_k), max_k)
         metrics_acc = {k: {"hit": 0.0, "mrr": 0.0, "recall": 0.0} for k in self._k_values()}
         rows: list[dict[str, Any]] = []
+        latencies_ms: list[float] = []
+
+        # Asset rows are only needed to match external ids or URIs, and are
+        # loaded for hit assets only, shared across cases.
+        needs_assets = any(
+            case.relevant_asset_external_ids or case.relevant_asset_uris for case in query_cases
+        )
+        assets_by_id: dict[int, Any] = {}
+        quote_totals: dict[str, int] = {}
+        quote_texts: list[str] | None = None
+        semaphore = asyncio.Semaphore(int(self.config.concurrency))
+
+        async def _search(case: QueryCase) -> tuple[list[VectorSearchHit], float]:
+            async with semaphore:
+                case_start = perf_counter()
+                query_vector = await embed_query_cached(
+                    case.query,
+                    actor_id=int(self.config.search_index),
+                    model=self.config.embedding_model,
+                    backend=self.config.embedding_backend,
+                    dim=int(self.config.search_dimension),
+                    persist=bool(self.config.cache_query_embeddings),
+                )
+                raw_hits = await vec_db.search(
+                    actor_id=int(self.config.search_index),
+                    dim=int(self.config.search_dimension),
+                    query_vector=query_vector,
+                    limit=search_limit,
+                    asset_ids=scoped_asset_ids,
+                )
+                hits = self._filter_hits(raw_hits, key_ids)
+                return hits, (perf_counter() - case_start) * 1000
 
-        assets_by_id = await self._load_assets_by_id(scoped_asset_ids)
         query_count = 0
-        for case in query_cases:
-            query_count += 1
-            query_vector = await embed_text_kreuzberg(
-                case.query,
-                model=self.config.embedding_model,
-                backend=self.config.embedding_backend,
-                dim=int(self.config.search_dimension),
-            )
-            raw_hits = await vec_db.search(
-                actor_id=int(self.config.search_index),
-                dim=int(self.config.search_dimension),
-                query_vector=query_vector,
-                limit=search_limit,
-                asset_ids=scoped_asset_ids,
-            )
-            hits = self._filter_hits(raw_hits, key_ids)
-            relevant_ranks = self._relevant_ranks(case=case, hits=hits, assets_by_id=assets_by_id)
-            total_relevant = await self._count_total_relevant(
-                case=case,
-                scope=scope,
-                scoped_asset_ids=scoped_asset_ids,
-                key_ids=key_ids,
-            )
+        batch_size = get_batch_size()
+        for offset in range(0, len(query_cases), batch_size):
+            window = query_cases[offset : offset + batch_size]
+            results = await asyncio.gather(*(_search(case) for case in window))
+
+            if needs_assets:
+                missing = {int(hit.asset_id) for hits, _ in results for hit in hits}
+                missing -= assets_by_id.keys()
+                assets_by_id.update(await self._load_assets_by_id(sorted(missing)))
+            quotes = {
+                case.quote
+                for case in window
+                if case.quote and not self._has_explicit_relevance(case)
+            } - quote_totals.keys()
+            if quotes:
+                if quote_texts is None:
+                    quote_texts = await self._load_quote_texts(
+                        scope=scope, scoped_asset_ids=scoped_asset_ids, key_ids=key_ids
+                    )
+                for quote in quotes:
+                    quote_norm = _normalize_text(quote)
+                    quote_totals[quote] = (
+                        sum(1 for text in quote_texts if quote_norm in text) if quote_norm else 0
+                    )
 
-            first_rank = min(relevant_ranks) if relevant_ranks else None
-            for k in self._k_values():
-                in_top_k = [rank for rank in relevant_ranks if rank <= k]
-                hit_rate = 1.0 if in_top_k else 0.0
-                mrr = (1.0 / float(first_rank)) if first_rank is not None and first_rank <= k else 0.0
-                recall = (
-                    float(len(in_top_k)) / float(total_relevant)
-                    if total_relevant > 0
-                    else 0.0
+            for case, (hits, latency_ms) in zip(window, results):
+                query_count += 1
+                latencies_ms.append(latency_ms)
+                relevant_ranks = self._relevant_ranks(
+                    case=case, hits=hits, assets_by_id=assets_by_id
+                )
+                total_relevant = self._count_total_relevant(case=case, quote_totals=quote_totals)
+
+                first_rank = min(relevant_ranks) if relevant_ranks else None
+                for k in self._k_values():
+                    in_top_k = [rank for rank in relevant_ranks if rank <= k]
+                    hit_rate = 1.0 if in_top_k else 0.0
+                    mrr = (
+                        (1.0 / float(first_rank))
+                        if first_rank is not None and first_rank <= k
+                        else 0.0
+                    )
+                    recall = (
+                        float(len(in_top_k)) / float(total_relevant)
+                        if total_relevant > 0
+                        else 0.0
+                    )
+                    metrics_acc[k]["hit"] += hit_rate
+                    metrics_acc[k]["mrr"] += mrr
+                    metrics_acc[k]["recall"] += recall
+
+                top_hit = hits[0] if hits else None
+                rows.append(
+                    {
+                        "query_id": case.case_id,
+                        "query_asset_id": case.source_asset_id,
+                        "query": case.query,
+                        "quote": case.quote or "",
+                        "first_relevant_rank": first_rank or "",
+                        "total_relevant": total_relevant,
+                        "latency_ms": round(latency_ms, 3),
+                        "top_hit_asset_id": top_hit.asset_id if top_hit is not None else "",
+                        "top_hit_metadata_id": top_hit.metadata_id if top_hit is not None else "",
+                        "top_hit_distance": top_hit.distance if top_hit is not None else "",
+                        "top_hit_cosine_similarity": (
+                            l2_distance_to_cosine_similarity(top_hit.distance)
+                            if top_hit is not None
+                            else ""
+                        ),
+                        "top_hit_text": top_hit.source_text if top_hit is not None else "",
+                    }
                 )
-                metrics_acc[k]["hit"] += hit_rate
-                metrics_acc[k]["mrr"] += mrr
-                metrics_acc[k]["recall"] += recall
-
-            top_hit = hits[0] if hits else None
-            rows.append(
-                {
-                    "query_id": case.case_id,
-                    "query_asset_id": case.source_asset_id,
-                    "query": case.query,
-                    "quote": case.quote or "",
-                    "first_relevant_rank": first_rank or "",
-                    "total_relevant": total_relevant,
-                    "top_hit_asset_id": top_hit.asset_id if top_hit is not None else "",
-                    "top_hit_metadata_id": top_hit.metadata_id if top_hit is not None else "",
-                    "top_hit_distance": top_hit.distance if top_hit is not None else "",
-                    "top_hit_cosine_similarity": (
-                        l2_distance_to_cosine_similarity(top_hit.distance)
-                        if top_hit is not None
-                        else ""
-                    ),
-                    "top_hit_text": top_hit.source_text if top_hit is not None else "",
-                }
-            )
 
         summary_metrics: dict[str, float] = {}
         for k in self._k_values():
@@ -184,8 +238,12 @@ class RetrievalEvalAnalyzer(Analyzer):
         summary_rows = [
             {"metric": key, "value": value} for key, value in sorted(summary_metrics.items())
         ]
+        latency = _latency_percentiles(latencies_ms)
         summary_rows.append({"metric": "queries_evaluated", "value": query_count})
         summary_rows.append({"metric": "duration_ms", "value": duration_ms})
+        summary_rows.extend(
+            {"metric": f"latency_{name}_ms", "value": value} for name, value in latency.items()
+        )
 
         export_dir = analyzer_export_dir(
             changeset_id=int(changeset.id),
@@ -206,6 +264,7 @@ class RetrievalEvalAnalyzer(Analyzer):
                 "k_values": self._k_values(),
                 "metrics": summary_metrics,
                 "duration_ms": duration_ms,
+                "latency_ms": latency,
             }
         }
         summary_json_path.write_text(
@@ -219,9 +278,13 @@ class RetrievalEvalAnalyzer(Analyzer):
         }
 
         logger.info(
-            "Retrieval eval completed queries={queries} duration_ms={duration}",
+            "Retrieval eval completed queries={queries} duration_ms={duration} "
+            "p50_ms={p50} p95_ms={p95} p99_ms={p99}",
             queries=query_count,
             duration=duration_ms,
+            p50=latency["p50"],
+            p95=latency["p95"],
+            p99=latency["p99"],
         )
         return AnalyzerResult(output=output)
 
@@ -287,14 +350,17 @@ class RetrievalEvalAnalyzer(Analyzer):
                 out[int(asset.id)] = asset
         return out
 
-    async def _count_total_relevant(
-        self,
-        *,
-        case: QueryCase,
-        scope: AnalyzerScope,
-        scoped_asset_ids: list[int],
-        key_ids: list[int],
-    ) -> int:
+    @staticmethod
+    def _has_explicit_relevance(case: QueryCase) -> bool:
+        return bool(
+            case.relevant_metadata_ids
+            or case.relevant_asset_ids
+            or case.relevant_asset_external_ids
+            or case.relevant_asset_uris
+        )
+
+    @staticmethod
+    def _count_total_relevant(*, case: QueryCase, quote_totals: dict[str, int]) -> int:
         if case.relevant_metadata_ids:
             return len(set(case.relevant_metadata_ids))
         if case.relevant_asset_ids:
@@ -304,38 +370,31 @@ class RetrievalEvalAnalyzer(Analyzer):
         if case.relevant_asset_uris:
             return len(set(case.relevant_asset_uris))
         if case.quote:
-            return await self._count_quote_matches(
-                quote=case.quote,
-                scope=scope,
-                scoped_asset_ids=scoped_asset_ids,
-                key_ids=key_ids,
-            )
+            return quote_totals.get(case.quote, 0)
         return 1
 
-    async def _count_quote_matches(
+    async def _load_quote_texts(
         self,
         *,
-        quote: str,
         scope: AnalyzerScope,
         scoped_asset_ids: list[int],
         key_ids: list[int],
-    ) -> int:
-        if not quote.strip() or not key_ids:
-            return 0
+    ) -> list[str]:
+        """Normalized texts that quotes are counted against, loaded once per run."""
+        if not key_ids:
+            return []
         metadata_keys = [str(get_metadata_def_by_id(key_id).key) for key_id in key_ids]
         query = self._asset_query_for_scope(scope, limit=1_000_000)
         query.search_granularity = "metadata"
         query.search_metadata_keys = metadata_keys
         query.metadata_aggregation = "latest"
         result = await list_metadata_api(query)
-        quote_norm = _normalize_text(quote)
-        matches = 0
-        for item in result.get("items", []):
-            text = _normalize_text(str(item.get("text") or ""))
-            if quote_norm and quote_norm in text:
-                if not scoped_asset_ids or int(item.get("asset_id") or 0) in set(scoped_asset_ids):
-                    matches += 1
-        return matches
+        scoped = set(scoped_asset_ids)
+        return [
+            _normalize_text(str(item.get("text") or ""))
+            for item in result.get("items", [])
+            if not scoped or int(item.get("asset_id") or 0) in scoped
+        ]
 
     def _filter_hits(self, hits: list[VectorSearchHit], key_ids: list[int]) -> list[VectorSearchHit]:
         key_id_set = set(int(value) for value in key_ids)
@@ -472,3 +531,21 @@ class RetrievalEvalAnalyzer(Analyzer):
 
 def _normalize_text(value: str) -> str:
     return " ".join(str(value or "").lower().split())
+
+
+def _latency_percentiles(values: list[float]) -> dict[str, float]:
+    """Nearest-rank p50/p95/p99 and max of per-query latencies in milliseconds."""
+    if not values:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    ordered = sorted(values)
+
+    def _rank(fraction: float) -> float:
+        index = max(0, math.ceil(fraction * len(ordered)) - 1)
+        return round(ordered[index], 3)
+
+    return {
+        "p50": _rank(0.50),
+        "p95": _rank(0.95),
+        "p99": _rank(0.99),
+        "max": round(ordered[-1], 3),
+    }
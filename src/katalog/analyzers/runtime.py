@@ -1,19 +1,37 @@
 from __future__ import annotations
 
-from katalog.analyzers.base import AnalyzerResult, AnalyzerScope, make_analyzer_instance
+import time
+from collections.abc import Sequence
+
+from loguru import logger
+
+from katalog.analyzers.base import (
+    AnalyzerChanges,
+    AnalyzerResult,
+    AnalyzerScope,
+    make_analyzer_instance,
+)
 from katalog.db.assets import get_asset_repo
-from katalog.models import Actor, Changeset
+from katalog.db.canonical import get_canonical_repo
+from katalog.models import Actor, Changeset, Metadata
 from katalog.db.changesets import get_changeset_repo
 from katalog.db.metadata import get_metadata_repo
 from katalog.models import MetadataChanges
+from katalog.runtime.batch import get_batch_size, iter_batches
 
 
 async def do_run_analyzer(
     actor: Actor,
     changeset: Changeset,
     scope: AnalyzerScope | None = None,
+    *,
+    changes: AnalyzerChanges | None = None,
 ) -> AnalyzerResult:
-    """Run a specific analyzer (by actor instance) and return serialized results."""
+    """Run a specific analyzer (by actor instance) and return serialized results.
+
+    `changes` marks a scheduled run: the analyzer may skip it when none of its
+    inputs changed, in which case nothing is persisted.
+    """
 
     if actor.disabled:
         raise ValueError("Analyzer actor disabled")
@@ -26,45 +44,123 @@ async def do_run_analyzer(
         raise ValueError("Analyzer does not support single-asset scope")
     if resolved_scope.kind == "all" and not analyzer.supports_all:
         raise ValueError("Analyzer does not support full-dataset scope")
-    result: AnalyzerResult
-    if not analyzer.should_run(changeset=changeset):
-        # TODO mark as skipped
-        result = AnalyzerResult()
-    else:
+    if not analyzer.should_run(changeset=changeset, changes=changes):
+        logger.info(
+            "Analyzer {plugin_id} skipped, inputs unchanged",
+            plugin_id=actor.plugin_id,
+        )
+        return AnalyzerResult(skipped=True)
+    analyzer.changes = changes
+    try:
         result = await analyzer.run(changeset=changeset, scope=resolved_scope)
+    finally:
+        analyzer.changes = None
 
     if result.metadata:
-        md_db = get_metadata_repo()
-        asset_db = get_asset_repo()
-        by_asset: dict[int, list] = {}
-        for entry in result.metadata:
-            if entry.asset_id is None:
-                continue
-            if entry.actor_id is None:
-                entry.actor_id = actor.id
-            if entry.changeset_id is None:
-                entry.changeset_id = changeset.id
-            by_asset.setdefault(int(entry.asset_id), []).append(entry)
-        for asset_id, staged in by_asset.items():
-            asset = await asset_db.get_or_none(id=asset_id)
-            if asset is None:
-                continue
-            loaded = await asset_db.load_metadata(asset, include_removed=True)
-            changes = MetadataChanges(asset=asset, loaded=list(loaded), staged=staged)
-            await md_db.persist_changes(changes, changeset=changeset)
-
-    if result.output is not None:
+        await persist_analyzer_metadata(
+            actor=actor, changeset=changeset, metadata=result.metadata
+        )
+
+    if result.merges:
+        merged = await get_canonical_repo().merge_groups(result.merges)
+        logger.info(
+            "Analyzer {plugin_id} merged {merged} assets in {groups} groups",
+            plugin_id=actor.plugin_id,
+            merged=merged,
+            groups=len(result.merges),
+        )
+
+    if result.output is not None or result.state is not None:
         data_payload = dict(changeset.data or {})
-        outputs = dict(data_payload.get("outputs") or {})
-        outputs[str(actor.id)] = {
-            "plugin_id": actor.plugin_id,
-            "kind": analyzer.output_kind or "analysis",
-            "scope": resolved_scope.model_dump(mode="json"),
-            "data": result.output,
-        }
-        data_payload["outputs"] = outputs
+        if result.output is not None:
+            outputs = dict(data_payload.get("outputs") or {})
+            outputs[str(actor.id)] = {
+                "plugin_id": actor.plugin_id,
+                "kind": analyzer.output_kind or "analysis",
+                "scope": resolved_scope.model_dump(mode="json"),
+                "data": result.output,
+            }
+            data_payload["outputs"] = outputs
+        if result.state is not None:
+            states = dict(data_payload.get("analyzer_state") or {})
+            states[str(actor.id)] = result.state
+            data_payload["analyzer_state"] = states
         changeset.data = data_payload
         db = get_changeset_repo()
         await db.save(changeset, update_data=changeset.data)
 
     return result
+
+
+async def persist_analyzer_metadata(
+    *,
+    actor: Actor,
+    changeset: Changeset,
+    metadata: Sequence[Metadata],
+) -> None:
+    """Persist analyzer output in asset chunks, one load and one transaction per chunk."""
+
+    by_asset: dict[int, list[Metadata]] = {}
+    for entry in metadata:
+        if entry.asset_id is None:
+            continue
+        if entry.actor_id is None:
+            entry.actor_id = actor.id
+        if entry.changeset_id is None:
+            entry.changeset_id = changeset.id
+        by_asset.setdefault(int(entry.asset_id), []).append(entry)
+    if not by_asset:
+        return
+
+    batch_size = get_batch_size()
+    for batch_index, id_batch in enumerate(iter_batches(sorted(by_asset), batch_size), 1):
+        # Enqueued (and awaited) one at a time so chunks show up in the
+        # changeset's task progress while writes stay sequential.
+        await changeset.enqueue(
+            _persist_analyzer_batch(
+                changeset=changeset,
+                asset_ids=id_batch,
+                staged_by_asset=by_asset,
+                batch_label=f"{batch_index}",
+            )
+        )
+
+
+async def _persist_analyzer_batch(
+    *,
+    changeset: Changeset,
+    asset_ids: list[int],
+    staged_by_asset: dict[int, list[Metadata]],
+    batch_label: str,
+) -> None:
+    started = time.perf_counter()
+    asset_db = get_asset_repo()
+    md_db = get_metadata_repo()
+    assets = await asset_db.list_rows(order_by="id", id__in=asset_ids)
+    metadata_by_asset = await md_db.for_assets(
+        [int(asset.id) for asset in assets if asset.id is not None],
+        include_removed=True,
+    )
+    changes_list = [
+        MetadataChanges(
+            asset=asset,
+            loaded=metadata_by_asset.get(int(asset.id), []),
+            staged=staged_by_asset[int(asset.id)],
+        )
+        for asset in assets
+        if asset.id is not None
+    ]
+    normal_rows, search_rows, delete_rows = await md_db.persist_changes_batch(
+        changeset,
+        changes_list,
+        metadata_by_asset,
+    )
+    logger.info(
+        "Analyzer batch persist done batch={batch} assets={assets} rows={rows} search_upserts={upserts} search_deletes={deletes} seconds={seconds:.2f}",
+        batch=batch_label,
+        assets=len(changes_list),
+        rows=normal_rows,
+        upserts=search_rows,
+        deletes=delete_rows,
+        seconds=time.perf_counter() - started,
+    )
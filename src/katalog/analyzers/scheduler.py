@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Sequence
+from typing import Any, cast
+
+from loguru import logger
+
+from katalog.analyzers.base import (
+    Analyzer,
+    AnalyzerChanges,
+    AnalyzerResult,
+    AnalyzerScope,
+    make_analyzer_instance,
+)
+from katalog.analyzers.runtime import do_run_analyzer
+from katalog.constants.metadata import MetadataKey, metadata_key_for_id_or_fallback
+from katalog.db.changesets import get_changeset_repo
+from katalog.db.metadata import get_metadata_repo
+from katalog.db.sqlspec import read_only_analysis
+from katalog.models import Actor, Changeset, OpStatus
+from katalog.plugins.registry import get_plugin_class
+
+DEFAULT_ANALYZER_CONCURRENCY = 4
+
+
+async def collect_changes(changeset: Changeset) -> AnalyzerChanges:
+    """Assets and metadata keys a finished changeset wrote."""
+
+    asset_ids, key_ids = await get_metadata_repo().changeset_changes(int(changeset.id))
+    stats = changeset.stats
+    return AnalyzerChanges(
+        changeset_id=int(changeset.id),
+        asset_ids=frozenset(asset_ids),
+        keys=frozenset(metadata_key_for_id_or_fallback(key_id) for key_id in key_ids),
+        assets_removed=bool(stats is not None and stats.assets_lost > 0),
+    )
+
+
+def analyzer_stages(actors: Sequence[Actor]) -> list[list[Actor]]:
+    """Layer analyzers via Kahn sorting on their declared dependencies and outputs.
+
+    Analyzers without dependencies consume any key, so they wait for every
+    analyzer that declares outputs.
+    """
+
+    by_id: dict[int, Actor] = {}
+    dependencies: dict[int, frozenset[MetadataKey]] = {}
+    outputs: dict[int, frozenset[MetadataKey]] = {}
+    for actor in actors:
+        if actor.id is None or actor.plugin_id is None:
+            continue
+        plugin_cls = cast(type[Analyzer], get_plugin_class(actor.plugin_id))
+        actor_id = int(actor.id)
+        by_id[actor_id] = actor
+        dependencies[actor_id] = plugin_cls.dependencies
+        outputs[actor_id] = plugin_cls.outputs
+
+    remaining: dict[int, set[int]] = {}
+    for actor_id, deps in dependencies.items():
+        producers = {
+            other_id
+            for other_id, produced in outputs.items()
+            if other_id != actor_id
+            and produced
+            and (not deps or not deps.isdisjoint(produced))
+        }
+        remaining[actor_id] = producers
+
+    stages: list[list[Actor]] = []
+    while remaining:
+        ready = sorted(actor_id for actor_id, deps in remaining.items() if not deps)
+        if not ready:
+            logger.warning(
+                "Circular analyzer dependencies among {actor_ids}; running them together",
+                actor_ids=sorted(remaining),
+            )
+            ready = sorted(remaining)
+        stages.append([by_id[actor_id] for actor_id in ready])
+        for actor_id in ready:
+            remaining.pop(actor_id, None)
+        for deps in remaining.values():
+            deps.difference_update(ready)
+    return stages
+
+
+def _record(actor: Actor, *, stage: int, status: str, **extra: Any) -> dict[str, Any]:
+    return {
+        "actor_id": int(actor.id) if actor.id is not None else None,
+        "name": actor.name,
+        "plugin_id": actor.plugin_id,
+        "stage": stage,
+        "status": status,
+        **extra,
+    }
+
+
+async def run_scheduled_analyzers(
+    analyzers: Sequence[Actor],
+    *,
+    trigger: Changeset,
+    max_concurrency: int = DEFAULT_ANALYZER_CONCURRENCY,
+) -> Changeset | None:
+    """Run analyzers whose inputs `trigger` changed, one dependency stage at a time.
+
+    Analyzers within a stage run concurrently and read through read-only
+    analysis sessions. Executed analyzers share one analyzer changeset, which
+    is returned (None when every analyzer was skipped). Skipped and executed
+    runs are recorded under `analyzers` in the trigger changeset's data.
+    """
+
+    started = time.perf_counter()
+    changeset_db = get_changeset_repo()
+    trigger_changes = changes = await collect_changes(trigger)
+    enabled = [actor for actor in analyzers if actor.id is not None and not actor.disabled]
+    stages = analyzer_stages(enabled)
+    semaphore = asyncio.Semaphore(max(1, int(max_concurrency)))
+    records: list[dict[str, Any]] = []
+    analyzer_changeset: Changeset | None = None
+
+    async def _run(
+        actor: Actor, stage: int, stage_changes: AnalyzerChanges
+    ) -> AnalyzerResult | None:
+        assert analyzer_changeset is not None
+        async with semaphore:
+            run_started = time.perf_counter()
+            try:
+                with read_only_analysis():
+                    result = await do_run_analyzer(
+                        actor,
+                        changeset=analyzer_changeset,
+                        scope=AnalyzerScope.all(),
+                        changes=stage_changes,
+                    )
+            except Exception as exc:  # noqa: BLE001
+                logger.exception(
+                    "Scheduled analyzer failed analyzer_id={analyzer_id}",
+                    analyzer_id=actor.id,
+                )
+                records.append(
+                    _record(
+                        actor,
+                        stage=stage,
+                        status=OpStatus.ERROR.value,
+                        changeset_id=int(analyzer_changeset.id),
+                        duration_ms=int((time.perf_counter() - run_started) * 1000),
+                        error=str(exc),
+                    )
+                )
+                return None
+        records.append(
+            _record(
+                actor,
+                stage=stage,
+                status=(OpStatus.SKIPPED if result.skipped else OpStatus.COMPLETED).value,
+                changeset_id=int(analyzer_changeset.id),
+                duration_ms=int((time.perf_counter() - run_started) * 1000),
+            )
+        )
+        return result
+
+    cancelled = False
+    try:
+        for stage_index, stage in enumerate(stages):
+            stage_changes = changes
+            due: list[Actor] = []
+            for actor in stage:
+                try:
+                    analyzer = await make_analyzer_instance(actor)
+                except Exception as exc:  # noqa: BLE001
+                    logger.exception(
+                        "Scheduled analyzer unavailable analyzer_id={analyzer_id}",
+                        analyzer_id=actor.id,
+                    )
+                    records.append(
+                        _record(actor, stage=stage_index, status=OpStatus.ERROR.value, error=str(exc))
+                    )
+                    continue
+                if analyzer.should_run(changeset=trigger, changes=stage_changes):
+                    due.append(actor)
+                    continue
+                records.append(
+                    _record(
+                        actor,
+                        stage=stage_index,
+                        status=OpStatus.SKIPPED.value,
+                        reason="inputs unchanged",
+                    )
+                )
+            if not due:
+                continue
+            if analyzer_changeset is None:
+                analyzer_changeset = await changeset_db.begin(
+                    message=f"Scheduled analyzers after changeset {trigger.id}",
+                    actors=due,
+                    status=OpStatus.IN_PROGRESS,
+                    data={"trigger_changeset_id": int(trigger.id)},
+                )
+            else:
+                await changeset_db.add_actors(analyzer_changeset, due)
+                analyzer_changeset.actor_ids = [
+                    *(analyzer_changeset.actor_ids or []),
+                    *(int(actor.id) for actor in due if actor.id is not None),
+                ]
+            results = await asyncio.gather(
+                *(_run(actor, stage_index, stage_changes) for actor in due)
+            )
+            # Later stages see what this stage wrote as changed too.
+            for result in results:
+                if result is None or result.skipped:
+                    continue
+                changes = changes.extend(
+                    asset_ids=(int(md.asset_id) for md in result.metadata if md.asset_id is not None),
+                    keys=(md.key for md in result.metadata if md.metadata_key_id is not None),
+                )
+    except asyncio.CancelledError:
+        # Do not leave the analyzer changeset in progress; it would block the next run.
+        if analyzer_changeset is None:
+            raise
+        cancelled = True
+    if cancelled:
+        assert analyzer_changeset is not None
+        await analyzer_changeset.finalize(status=OpStatus.CANCELED)
+        raise asyncio.CancelledError
+
+    failures = [record for record in records if record["status"] == OpStatus.ERROR.value]
+    if analyzer_changeset is not None:
+        executed = [record for record in records if record.get("changeset_id") is not None]
+        failed_runs = [record for record in executed if record["status"] == OpStatus.ERROR.value]
+        if not failed_runs:
+            status = OpStatus.COMPLETED
+        elif len(failed_runs) < len(executed):
+            status = OpStatus.PARTIAL
+        else:
+            status = OpStatus.ERROR
+        if failed_runs:
+            data = dict(analyzer_changeset.data or {})
+            data["error_message"] = "; ".join(
+                f"{record['name']}: {record['error']}" for record in failed_runs
+            )
+            analyzer_changeset.data = data
+        await analyzer_changeset.finalize(status=status)
+
+    trigger_data = dict(trigger.data or {})
+    trigger_data["analyzers"] = {
+        "changed_assets": len(trigger_changes.asset_ids),
+        "changed_keys": sorted(str(key) for key in trigger_changes.keys),
+        "assets_removed": trigger_changes.assets_removed,
+        "changeset_id": int(analyzer_changeset.id) if analyzer_changeset is not None else None,
+        "duration_ms": int((time.perf_counter() - started) * 1000),
+        "runs": sorted(records, key=lambda record: (record["stage"], record["actor_id"] or 0)),
+    }
+    trigger.data = trigger_data
+    await changeset_db.save(trigger, update_data=trigger.data)
+    logger.info(
+        "Scheduled analyzers done changeset={changeset_id} executed={executed} skipped={skipped} failed={failed}",
+        changeset_id=trigger.id,
+        executed=sum(1 for record in records if record["status"] == OpStatus.COMPLETED.value),
+        skipped=sum(1 for record in records if record["status"] == OpStatus.SKIPPED.value),
+        failed=len(failures),
+    )
+    return analyzer_changeset
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from typing import Any
-
 from loguru import logger
 
 from katalog.analyzers.base import Analyzer, AnalyzerIssue, AnalyzerResult, AnalyzerScope
@@ -13,22 +11,26 @@ from katalog.constants.metadata import (
     SIDECAR_TYPE,
     get_metadata_id,
 )
-from katalog.db.sqlspec import session_scope
-from katalog.db.sqlspec.sql_helpers import select
-from katalog.db.sqlspec.tables import ASSET_TABLE, METADATA_TABLE
-from katalog.models import Changeset, make_metadata
+from katalog.db.sidecars import SidecarLookup, get_sidecar_index_repo
+from katalog.models import Changeset, Metadata, make_metadata
+from katalog.runtime.batch import get_batch_size
 
 
 class SidecarLinksAnalyzer(Analyzer):
+    """Link sidecar assets to their target assets.
+
+    Candidate keys of targets and sidecars are kept in an index that each run
+    updates for assets whose name, path or sidecar metadata changed since the
+    previous run; matching itself happens in SQL against that index.
+    """
+
     plugin_id = "katalog.analyzers.sidecar_links.SidecarLinksAnalyzer"
     title = "Sidecar linker"
     description = "Link sidecar assets to their target assets."
     output_kind = "sidecar_links"
     supports_single_asset = False
-
-    def should_run(self, *, changeset: Changeset) -> bool:
-        _ = changeset
-        return True
+    dependencies = frozenset({FILE_NAME, FILE_PATH, SIDECAR_TYPE, SIDECAR_TARGET_NAME})
+    outputs = frozenset({REL_LINK_TO})
 
     async def run(
         self, *, changeset: Changeset, scope: AnalyzerScope
@@ -38,180 +40,103 @@ class SidecarLinksAnalyzer(Analyzer):
 
         if self.actor.id is None:
             raise ValueError("Analyzer actor id is missing")
+        actor_id = int(self.actor.id)
 
-        sidecar_rows = await self._load_sidecar_rows()
-        if not sidecar_rows:
-            return AnalyzerResult(output={"linked": 0, "unresolved": 0})
+        repo = get_sidecar_index_repo()
+        state = await self.load_analyzer_state() or {}
+        since = state.get("changeset_id")
+        if since is None:
+            await repo.clear(actor_id=actor_id)
 
-        targets = await self._load_target_rows()
-        target_by_key: dict[str, int] = {}
-        for row in targets:
-            asset_id = int(row["asset_id"])
-            for key in _candidate_keys(path=row.get("path"), name=row.get("name")):
-                target_by_key.setdefault(key, asset_id)
+        type_key_id = int(get_metadata_id(SIDECAR_TYPE))
+        target_key_id = int(get_metadata_id(SIDECAR_TARGET_NAME))
+        name_key_id = int(get_metadata_id(FILE_NAME))
+        path_key_id = int(get_metadata_id(FILE_PATH))
+        key_ids = [type_key_id, target_key_id, name_key_id, path_key_id]
+
+        changed = await repo.changed_asset_ids(
+            key_ids=key_ids,
+            since_changeset_id=int(since) if since is not None else None,
+        )
+        pending = set(await repo.stale_sidecar_ids(actor_id=actor_id))
+        batch_size = get_batch_size()
+        for start in range(0, len(changed), batch_size):
+            batch = changed[start : start + batch_size]
+            values = await repo.current_values(asset_ids=batch, key_ids=key_ids)
+            target_keys: dict[int, list[str]] = {}
+            lookups: dict[int, SidecarLookup] = {}
+            for asset_id in batch:
+                fields = values.get(asset_id, {})
+                if type_key_id not in fields:
+                    target_keys[asset_id] = _candidate_keys(
+                        path=fields.get(path_key_id), name=fields.get(name_key_id)
+                    )
+                elif target_key_id in fields:
+                    target_name = fields[target_key_id].strip()
+                    lookups[asset_id] = SidecarLookup(
+                        target_name=target_name,
+                        keys=tuple(_candidate_keys(path=target_name, name=target_name)),
+                    )
+            pending |= await repo.reindex(
+                actor_id=actor_id,
+                asset_ids=batch,
+                target_keys=target_keys,
+                lookups=lookups,
+            )
 
-        metadata = []
+        metadata: list[Metadata] = []
         unresolved: list[AnalyzerIssue] = []
-        linked = 0
-        for row in sidecar_rows:
-            sidecar_asset_id = int(row["asset_id"])
-            target_name = str(row.get("target_name") or "").strip()
-            found_target_id: int | None = None
-            for key in _candidate_keys(path=target_name, name=target_name):
-                match = target_by_key.get(key)
-                if match is not None and match != sidecar_asset_id:
-                    found_target_id = match
-                    break
-            if found_target_id is None:
+        updated = 0
+        for link in await repo.resolve(actor_id=actor_id, sidecar_ids=pending):
+            if link.target_asset_id != link.previous_target_id:
+                updated += 1
+                if link.previous_target_id is not None:
+                    metadata.append(
+                        self._link(link.sidecar_asset_id, link.previous_target_id, removed=True)
+                    )
+                if link.target_asset_id is not None:
+                    metadata.append(self._link(link.sidecar_asset_id, link.target_asset_id))
+            if link.target_name is not None and link.target_asset_id is None:
                 unresolved.append(
                     AnalyzerIssue(
                         level="warning",
-                        message=f"Unresolved sidecar target: {target_name or 'unknown'}",
-                        extra={"sidecar_asset_id": sidecar_asset_id},
+                        message=f"Unresolved sidecar target: {link.target_name or 'unknown'}",
+                        extra={"sidecar_asset_id": link.sidecar_asset_id},
                     )
                 )
-                continue
-
-            linked += 1
-            metadata.append(
-                make_metadata(
-                    REL_LINK_TO,
-                    found_target_id,
-                    actor_id=int(self.actor.id),
-                    asset_id=sidecar_asset_id,
-                )
-            )
 
+        linked, unresolved_total = await repo.counts(actor_id=actor_id)
         logger.info(
-            "Sidecar linker done linked={linked} unresolved={unresolved}",
+            "Sidecar linker done changed_assets={changed} resolved={resolved} "
+            "updated={updated} linked={linked} unresolved={unresolved}",
+            changed=len(changed),
+            resolved=len(pending),
+            updated=updated,
             linked=linked,
-            unresolved=len(unresolved),
+            unresolved=unresolved_total,
         )
         return AnalyzerResult(
             metadata=metadata,
             issues=unresolved,
-            output={"linked": linked, "unresolved": len(unresolved)},
+            output={
+                "linked": linked,
+                "unresolved": unresolved_total,
+                "full_rebuild": since is None,
+                "changed_assets": len(changed),
+                "resolved_sidecars": len(pending),
+                "updated_links": updated,
+            },
+            state={"changeset_id": int(changeset.id)},
         )
 
-    async def _load_sidecar_rows(self) -> list[dict[str, Any]]:
-        type_key_id = int(get_metadata_id(SIDECAR_TYPE))
-        target_key_id = int(get_metadata_id(SIDECAR_TARGET_NAME))
-        name_key_id = int(get_metadata_id(FILE_NAME))
-        path_key_id = int(get_metadata_id(FILE_PATH))
-        sql = f"""
-            WITH latest AS (
-                SELECT
-                    m.asset_id,
-                    m.metadata_key_id,
-                    m.value_type,
-                    m.value_text,
-                    m.value_int,
-                    m.value_real,
-                    m.value_datetime,
-                    m.value_json,
-                    m.value_relation_id,
-                    m.value_collection_id,
-                    ROW_NUMBER() OVER (
-                        PARTITION BY m.asset_id, m.metadata_key_id
-                        ORDER BY m.changeset_id DESC, m.id DESC
-                    ) AS rn
-                FROM {METADATA_TABLE} m
-                WHERE m.metadata_key_id IN (?, ?, ?, ?)
-                  AND m.removed = 0
-            )
-            SELECT
-                t.asset_id,
-                t.value_text AS sidecar_type,
-                tn.value_text AS target_name,
-                fn.value_text AS name,
-                fp.value_text AS path
-            FROM latest t
-            JOIN latest tn
-              ON tn.asset_id = t.asset_id
-             AND tn.metadata_key_id = ?
-             AND tn.rn = 1
-            LEFT JOIN latest fn
-              ON fn.asset_id = t.asset_id
-             AND fn.metadata_key_id = ?
-             AND fn.rn = 1
-            LEFT JOIN latest fp
-              ON fp.asset_id = t.asset_id
-             AND fp.metadata_key_id = ?
-             AND fp.rn = 1
-            WHERE t.metadata_key_id = ?
-              AND t.rn = 1
-        """
-        params = [
-            type_key_id,
-            target_key_id,
-            name_key_id,
-            path_key_id,
-            target_key_id,
-            name_key_id,
-            path_key_id,
-            type_key_id,
-        ]
-        async with session_scope(analysis=True) as session:
-            rows = await select(session, sql, params)
-        return [dict(row) for row in rows]
-
-    async def _load_target_rows(self) -> list[dict[str, Any]]:
-        name_key_id = int(get_metadata_id(FILE_NAME))
-        path_key_id = int(get_metadata_id(FILE_PATH))
-        type_key_id = int(get_metadata_id(SIDECAR_TYPE))
-        sql = f"""
-            WITH latest AS (
-                SELECT
-                    m.asset_id,
-                    m.metadata_key_id,
-                    m.value_type,
-                    m.value_text,
-                    m.value_int,
-                    m.value_real,
-                    m.value_datetime,
-                    m.value_json,
-                    m.value_relation_id,
-                    m.value_collection_id,
-                    ROW_NUMBER() OVER (
-                        PARTITION BY m.asset_id, m.metadata_key_id
-                        ORDER BY m.changeset_id DESC, m.id DESC
-                    ) AS rn
-                FROM {METADATA_TABLE} m
-                WHERE m.metadata_key_id IN (?, ?, ?)
-            )
-            SELECT
-                a.id AS asset_id,
-                fn.value_text AS name,
-                fp.value_text AS path
-            FROM {ASSET_TABLE} a
-            LEFT JOIN latest fn
-              ON fn.asset_id = a.id
-             AND fn.metadata_key_id = ?
-             AND fn.rn = 1
-             AND fn.value_text IS NOT NULL
-            LEFT JOIN latest fp
-              ON fp.asset_id = a.id
-             AND fp.metadata_key_id = ?
-             AND fp.rn = 1
-             AND fp.value_text IS NOT NULL
-            LEFT JOIN latest st
-              ON st.asset_id = a.id
-             AND st.metadata_key_id = ?
-             AND st.rn = 1
-             AND st.value_text IS NOT NULL
-            WHERE st.value_text IS NULL
-        """
-        params = [
-            name_key_id,
-            path_key_id,
-            type_key_id,
-            name_key_id,
-            path_key_id,
-            type_key_id,
-        ]
-        async with session_scope(analysis=True) as session:
-            rows = await select(session, sql, params)
-        return [dict(row) for row in rows]
+    def _link(self, sidecar_asset_id: int, target_asset_id: int, *, removed: bool = False) -> Metadata:
+        return make_metadata(
+            REL_LINK_TO,
+            target_asset_id,
+            actor_id=self.actor.id,
+            removed=removed,
+            asset_id=sidecar_asset_id,
+        )
 
 
 def _candidate_keys(*, path: str | None, name: str | None) -> list[str]:
@@ -15,14 +15,29 @@ from katalog.constants.metadata import (
 )
 from katalog.db.sqlspec.sql_helpers import select
 from katalog.db.sqlspec import session_scope
-from katalog.db.sqlspec.tables import ASSET_TABLE, METADATA_TABLE
+from katalog.db.sqlspec.tables import (
+    ASSET_TABLE,
+    METADATA_TABLE,
+    STATS_CURRENT_TABLE,
+    STATS_ROLLUP_TABLE,
+    STATS_VALUE_COUNT_TABLE,
+)
+from katalog.db.stats import get_stats_repo
 from katalog.models import Changeset
+from katalog.runtime.batch import get_batch_size
 from katalog.utils.exports import build_tables_from_stats, write_csv_tables
 from katalog.config import current_workspace
 
+_TOP_N = 50
+
 
 class StatsAnalyzer(Analyzer):
-    """Aggregate basic stats for assets and metadata."""
+    """Aggregate basic stats for assets and metadata.
+
+    Current values per (asset, key) and rollups per (source, key) are kept in
+    tables that each run updates from the metadata written since the previous
+    run, so full-dataset stats are read from precomputed numbers.
+    """
 
     plugin_id = "katalog.analyzers.stats.StatsAnalyzer"
     title = "Asset statistics"
@@ -31,11 +46,6 @@ class StatsAnalyzer(Analyzer):
     output_kind = "stats"
     supports_single_asset = False
 
-    def should_run(self, *, changeset: Changeset) -> bool:  # noqa: D401
-        """Currently always runs; future versions may add change detection."""
-
-        return True
-
     async def run(
         self, *, changeset: Changeset, scope: AnalyzerScope
     ) -> AnalyzerResult:
@@ -43,67 +53,15 @@ class StatsAnalyzer(Analyzer):
             raise ValueError("Stats analyzer does not support single-asset scope")
 
         logger.info("Stats analyzer starting ({kind})", kind=scope.kind)
-        metadata_table = METADATA_TABLE
-        asset_table = ASSET_TABLE
-        scoped_cte, scoped_params = build_scoped_assets_cte(
-            scope,
-            asset_table=asset_table,
-            metadata_table=metadata_table,
-        )
-
-        async with session_scope(analysis=True) as session:
-            asset_count = await self._count_assets(session, scoped_cte, scoped_params)
-            logger.info("Stats analyzer assets counted: {count}", count=asset_count)
-            size_stats = await self._size_stats(
-                session, scoped_cte, scoped_params, metadata_table
-            )
-            type_breakdown = await self._string_breakdown(
-                session,
-                scoped_cte,
-                scoped_params,
-                metadata_table,
-                get_metadata_id(FILE_TYPE),
-                limit=50,
-            )
-            extension_breakdown = await self._string_breakdown(
-                session,
-                scoped_cte,
-                scoped_params,
-                metadata_table,
-                get_metadata_id(FILE_EXTENSION),
-                limit=50,
-            )
-            modified_stats = await self._modified_stats(
-                session, scoped_cte, scoped_params, metadata_table
-            )
-            coverage = await self._coverage_stats(
-                session, scoped_cte, scoped_params, metadata_table, asset_count
-            )
-            duplicates = await self._duplicate_stats(
-                session, scoped_cte, scoped_params, metadata_table
-            )
-            largest_assets = await self._largest_assets(
-                session, scoped_cte, scoped_params, metadata_table
-            )
+        state = await self._update_current_values()
 
+        if scope.kind == "all":
+            aggregates = await self._rollup_aggregates()
+        else:
+            aggregates = await self._scoped_aggregates(scope)
+        output = self._build_output(**aggregates)
         logger.info("Stats analyzer aggregation finished")
 
-        output = {
-            "summary": {
-                "asset_count": asset_count,
-                "total_bytes": size_stats.get("total"),
-                "size": size_stats,
-                "modified": modified_stats,
-            },
-            "breakdowns": {
-                "file_type": type_breakdown,
-                "file_extension": extension_breakdown,
-            },
-            "coverage": coverage,
-            "duplicates": duplicates,
-            "largest_assets": largest_assets,
-        }
-
         tables = build_tables_from_stats(output)
         prefix = f"changeset-{changeset.id}_actor-{self.actor.id}_stats"
         csv_paths = write_csv_tables(tables, prefix=prefix)
@@ -118,252 +76,327 @@ class StatsAnalyzer(Analyzer):
                 ]
             }
 
-        return AnalyzerResult(output=output)
+        return AnalyzerResult(
+            output=output,
+            state={"changeset_id": int(changeset.id), **state},
+        )
 
-    @staticmethod
-    async def _count_assets(
-        session,
-        scoped_cte: str,
-        scoped_params: list[Any],
-    ) -> int:
-        sql = f"""
-        WITH {scoped_cte}
-        SELECT COUNT(*) AS cnt FROM scoped_assets
+    async def _update_current_values(self) -> dict[str, Any]:
+        """Bring the current-value and rollup tables up to date.
+
+        The first run rebuilds them from every asset; later runs only revisit
+        assets with metadata newer than the previous run, plus deleted assets.
         """
-        rows = await select(session, sql, scoped_params)
-        return int(rows[0]["cnt"]) if rows else 0
+        repo = get_stats_repo()
+        state = await self.load_analyzer_state() or {}
+        since = state.get("changeset_id")
+        value_key_ids = [get_metadata_id(FILE_SIZE), get_metadata_id(TIME_MODIFIED)]
+        count_key_ids = [
+            get_metadata_id(FILE_TYPE),
+            get_metadata_id(FILE_EXTENSION),
+            get_metadata_id(HASH_MD5),
+        ]
+        batch_size = get_batch_size()
+        totals = await self._asset_totals(int(state.get("max_asset_id") or 0))
 
-    async def _size_stats(
-        self,
-        session,
-        scoped_cte: str,
-        scoped_params: list[Any],
-        metadata_table: str,
-    ) -> dict[str, Any]:
-        size_key_id = get_metadata_id(FILE_SIZE)
-        stats_sql = f"""
-        WITH {scoped_cte},
-        latest_size AS (
-            SELECT
-                m.asset_id,
-                m.value_int AS size,
-                ROW_NUMBER() OVER (
-                    PARTITION BY m.asset_id
-                    ORDER BY m.changeset_id DESC, m.id DESC
-                ) AS rn
-            FROM {metadata_table} AS m
-            JOIN scoped_assets s ON s.asset_id = m.asset_id
-            WHERE m.metadata_key_id = ?
-              AND m.removed = 0
-              AND m.value_int IS NOT NULL
+        revisited = 0
+        changed = 0
+        if since is None:
+            await repo.clear()
+            after_id = 0
+            while asset_ids := await repo.all_asset_ids(after_id=after_id, limit=batch_size):
+                changed += await repo.refresh(
+                    asset_ids=asset_ids,
+                    value_key_ids=value_key_ids,
+                    count_key_ids=count_key_ids,
+                )
+                revisited += len(asset_ids)
+                after_id = asset_ids[-1]
+        else:
+            asset_ids = await repo.changed_asset_ids(since_changeset_id=int(since))
+            # Deleted assets leave no metadata behind; notice them from the asset count.
+            expected = int(state.get("asset_count") or 0) + totals["added"]
+            if totals["count"] != expected:
+                asset_ids = sorted({*asset_ids, *await repo.orphaned_asset_ids()})
+            for start in range(0, len(asset_ids), batch_size):
+                batch = asset_ids[start : start + batch_size]
+                changed += await repo.refresh(
+                    asset_ids=batch,
+                    value_key_ids=value_key_ids,
+                    count_key_ids=count_key_ids,
+                )
+            revisited = len(asset_ids)
+
+        logger.info(
+            "Stats current values updated full_rebuild={full} assets={assets} changed_values={changed}",
+            full=since is None,
+            assets=revisited,
+            changed=changed,
         )
+        return {"asset_count": totals["count"], "max_asset_id": totals["max_id"]}
+
+    @staticmethod
+    async def _asset_totals(after_id: int) -> dict[str, int]:
+        sql = f"""
         SELECT
             COUNT(*) AS cnt,
-            SUM(size) AS total,
-            MIN(size) AS min,
-            MAX(size) AS max,
-            AVG(size) AS avg
-        FROM latest_size
-        WHERE rn = 1
+            COALESCE(MAX(id), 0) AS max_id,
+            COALESCE(SUM(CASE WHEN id > ? THEN 1 ELSE 0 END), 0) AS added
+        FROM {ASSET_TABLE}
         """
-        rows = await select(session, stats_sql, [*scoped_params, size_key_id])
+        async with session_scope(analysis=True) as session:
+            rows = await select(session, sql, [int(after_id)])
         row = rows[0] if rows else {}
         return {
             "count": int(row.get("cnt") or 0),
-            "total": int(row.get("total") or 0),
-            "min": int(row.get("min") or 0),
-            "max": int(row.get("max") or 0),
-            "avg": float(row.get("avg") or 0),
+            "max_id": int(row.get("max_id") or 0),
+            "added": int(row.get("added") or 0),
         }
 
-    async def _string_breakdown(
-        self,
-        session,
-        scoped_cte: str,
-        scoped_params: list[Any],
-        metadata_table: str,
-        key_id: int,
-        *,
-        limit: int = 50,
-    ) -> list[dict[str, Any]]:
-        sql = f"""
-        WITH {scoped_cte},
-        latest_values AS (
-            SELECT
-                m.asset_id,
-                m.value_text AS val,
-                ROW_NUMBER() OVER (
-                    PARTITION BY m.asset_id
-                    ORDER BY m.changeset_id DESC, m.id DESC
-                ) AS rn
-            FROM {metadata_table} AS m
-            JOIN scoped_assets s ON s.asset_id = m.asset_id
-            WHERE m.metadata_key_id = ?
-              AND m.removed = 0
-              AND m.value_text IS NOT NULL
-        )
-        SELECT
-            val AS value,
-            COUNT(*) AS cnt
-        FROM latest_values
-        WHERE rn = 1 AND value != ''
-        GROUP BY value
-        ORDER BY cnt DESC
-        LIMIT ?
-        """
-        rows = await select(session, sql, [*scoped_params, key_id, limit])
-        return [{"value": row["value"], "count": int(row["cnt"])} for row in rows]
-
-    async def _modified_stats(
-        self,
-        session,
-        scoped_cte: str,
-        scoped_params: list[Any],
-        metadata_table: str,
-    ) -> dict[str, Any]:
-        modified_key_id = get_metadata_id(TIME_MODIFIED)
-        sql = f"""
-        WITH {scoped_cte},
-        latest_mod AS (
-            SELECT
-                m.asset_id,
-                m.value_datetime AS modified_at,
-                ROW_NUMBER() OVER (
-                    PARTITION BY m.asset_id
-                    ORDER BY m.changeset_id DESC, m.id DESC
-                ) AS rn
-            FROM {metadata_table} AS m
-            JOIN scoped_assets s ON s.asset_id = m.asset_id
-            WHERE m.metadata_key_id = ?
-              AND m.removed = 0
-              AND m.value_datetime IS NOT NULL
-        )
-        SELECT
-            MIN(modified_at) AS min,
-            MAX(modified_at) AS max
-        FROM latest_mod
-        WHERE rn = 1
-        """
-        rows = await select(session, sql, [*scoped_params, modified_key_id])
-        row = rows[0] if rows else {}
+    async def _rollup_aggregates(self) -> dict[str, Any]:
+        """Read full-dataset aggregates from the persisted rollups."""
+        size_key_id = get_metadata_id(FILE_SIZE)
+        async with session_scope(analysis=True) as session:
+            key_rows = await select(
+                session,
+                f"""
+                SELECT
+                    metadata_key_id AS key_id,
+                    SUM(asset_count) AS asset_count,
+                    SUM(int_count) AS int_count,
+                    SUM(int_sum) AS int_sum,
+                    MIN(int_min) AS int_min,
+                    MAX(int_max) AS int_max,
+                    MIN(datetime_min) AS datetime_min,
+                    MAX(datetime_max) AS datetime_max
+                FROM {STATS_ROLLUP_TABLE}
+                GROUP BY metadata_key_id
+                """,
+            )
+            source_rows = await select(
+                session,
+                f"""
+                SELECT
+                    COALESCE(a.actor_id, 0) AS source_id,
+                    COUNT(*) AS asset_count,
+                    COALESCE(r.int_sum, 0) AS total_bytes
+                FROM {ASSET_TABLE} a
+                LEFT JOIN {STATS_ROLLUP_TABLE} r
+                  ON r.source_id = COALESCE(a.actor_id, 0) AND r.metadata_key_id = ?
+                GROUP BY COALESCE(a.actor_id, 0)
+                ORDER BY source_id
+                """,
+                [size_key_id],
+            )
+            value_counts: dict[int, list[dict[str, Any]]] = {}
+            for key in (FILE_TYPE, FILE_EXTENSION, HASH_MD5):
+                key_id = get_metadata_id(key)
+                value_counts[key_id] = await select(
+                    session,
+                    f"""
+                    SELECT value, SUM(asset_count) AS cnt
+                    FROM {STATS_VALUE_COUNT_TABLE}
+                    WHERE metadata_key_id = ?
+                    GROUP BY value
+                    HAVING cnt > ?
+                    ORDER BY cnt DESC, value
+                    LIMIT ?
+                    """,
+                    [key_id, 1 if key == HASH_MD5 else 0, _TOP_N],
+                )
+            # Walk the (key, source, value) index once per source instead of
+            # sorting every size.
+            largest: list[dict[str, Any]] = []
+            for row in source_rows:
+                largest.extend(
+                    await select(
+                        session,
+                        f"""
+                        SELECT asset_id, value_int AS size
+                        FROM {STATS_CURRENT_TABLE}
+                        WHERE metadata_key_id = ? AND source_id = ? AND value_int IS NOT NULL
+                        ORDER BY value_int DESC
+                        LIMIT ?
+                        """,
+                        [size_key_id, int(row["source_id"]), _TOP_N],
+                    )
+                )
         return {
-            "min": row.get("min"),
-            "max": row.get("max"),
+            "asset_count": sum(int(row["asset_count"]) for row in source_rows),
+            "key_rows": key_rows,
+            "value_counts": value_counts,
+            "largest": largest,
+            "source_rows": source_rows,
         }
 
-    async def _coverage_stats(
-        self,
-        session,
-        scoped_cte: str,
-        scoped_params: list[Any],
-        metadata_table: str,
-        asset_count: int,
-    ) -> dict[str, Any]:
-        sql = f"""
-        WITH {scoped_cte},
-        latest_keys AS (
-            SELECT
-                m.metadata_key_id,
-                m.asset_id,
-                ROW_NUMBER() OVER (
-                    PARTITION BY m.asset_id, m.metadata_key_id
-                    ORDER BY m.changeset_id DESC, m.id DESC
-                ) AS rn
-            FROM {metadata_table} AS m
-            JOIN scoped_assets s ON s.asset_id = m.asset_id
-            WHERE m.removed = 0
+    async def _scoped_aggregates(self, scope: AnalyzerScope) -> dict[str, Any]:
+        """Aggregate the current values of the scoped assets in a single pass."""
+        scoped_cte, scoped_params = build_scoped_assets_cte(
+            scope,
+            asset_table=ASSET_TABLE,
+            metadata_table=METADATA_TABLE,
         )
-        SELECT
-            metadata_key_id AS key_id,
-            COUNT(*) AS cnt
-        FROM latest_keys
-        WHERE rn = 1
-        GROUP BY key_id
-        """
-        rows = await select(session, sql, scoped_params)
-        coverage = []
-        for row in rows:
-            coverage.append(
-                {
-                    "key_id": int(row["key_id"]),
-                    "count": int(row["cnt"]),
-                    "coverage": float(row["cnt"] or 0) / max(1, asset_count),
-                }
+        size_key_id = get_metadata_id(FILE_SIZE)
+        count_key_ids = [get_metadata_id(key) for key in (FILE_TYPE, FILE_EXTENSION, HASH_MD5)]
+        async with session_scope(analysis=True) as session:
+            count_rows = await select(
+                session,
+                f"WITH {scoped_cte} SELECT COUNT(*) AS cnt FROM scoped_assets",
+                scoped_params,
+            )
+            key_rows = await select(
+                session,
+                f"""
+                WITH {scoped_cte}
+                SELECT
+                    c.metadata_key_id AS key_id,
+                    COUNT(*) AS asset_count,
+                    COUNT(c.value_int) AS int_count,
+                    COALESCE(SUM(c.value_int), 0) AS int_sum,
+                    MIN(c.value_int) AS int_min,
+                    MAX(c.value_int) AS int_max,
+                    MIN(c.value_datetime) AS datetime_min,
+                    MAX(c.value_datetime) AS datetime_max
+                FROM {STATS_CURRENT_TABLE} c
+                JOIN scoped_assets s ON s.asset_id = c.asset_id
+                GROUP BY c.metadata_key_id
+                """,
+                scoped_params,
+            )
+            source_rows = await select(
+                session,
+                f"""
+                WITH {scoped_cte}
+                SELECT
+                    COALESCE(a.actor_id, 0) AS source_id,
+                    COUNT(*) AS asset_count,
+                    COALESCE(SUM(c.value_int), 0) AS total_bytes
+                FROM scoped_assets s
+                JOIN {ASSET_TABLE} a ON a.id = s.asset_id
+                LEFT JOIN {STATS_CURRENT_TABLE} c
+                  ON c.asset_id = s.asset_id AND c.metadata_key_id = ?
+                GROUP BY COALESCE(a.actor_id, 0)
+                ORDER BY source_id
+                """,
+                [*scoped_params, size_key_id],
+            )
+            value_rows = await select(
+                session,
+                f"""
+                WITH {scoped_cte}
+                SELECT c.metadata_key_id AS key_id, c.value_text AS value, COUNT(*) AS cnt
+                FROM {STATS_CURRENT_TABLE} c
+                JOIN scoped_assets s ON s.asset_id = c.asset_id
+                WHERE c.metadata_key_id IN ({", ".join("?" for _ in count_key_ids)})
+                  AND c.value_text IS NOT NULL
+                GROUP BY c.metadata_key_id, c.value_text
+                """,
+                [*scoped_params, *count_key_ids],
+            )
+            largest = await select(
+                session,
+                f"""
+                WITH {scoped_cte}
+                SELECT c.asset_id, c.value_int AS size
+                FROM {STATS_CURRENT_TABLE} c
+                JOIN scoped_assets s ON s.asset_id = c.asset_id
+                WHERE c.metadata_key_id = ? AND c.value_int IS NOT NULL
+                ORDER BY c.value_int DESC
+                LIMIT ?
+                """,
+                [*scoped_params, size_key_id, _TOP_N],
             )
-        return {"keys": coverage}
 
-    async def _duplicate_stats(
-        self,
-        session,
-        scoped_cte: str,
-        scoped_params: list[Any],
-        metadata_table: str,
-    ) -> dict[str, Any]:
         md5_key_id = get_metadata_id(HASH_MD5)
-        sql = f"""
-        WITH {scoped_cte},
-        latest_hash AS (
-            SELECT
-                m.asset_id,
-                m.value_text AS md5,
-                ROW_NUMBER() OVER (
-                    PARTITION BY m.asset_id
-                    ORDER BY m.changeset_id DESC, m.id DESC
-                ) AS rn
-            FROM {metadata_table} AS m
-            JOIN scoped_assets s ON s.asset_id = m.asset_id
-            WHERE m.metadata_key_id = ?
-              AND m.removed = 0
-              AND m.value_text IS NOT NULL
-        ),
-        current AS (
-            SELECT md5 FROM latest_hash WHERE rn = 1
-        )
-        SELECT
-            md5,
-            COUNT(*) AS cnt
-        FROM current
-        GROUP BY md5
-        HAVING cnt > 1
-        ORDER BY cnt DESC
-        LIMIT 50
-        """
-        rows = await select(session, sql, [*scoped_params, md5_key_id])
+        value_counts: dict[int, list[dict[str, Any]]] = {key_id: [] for key_id in count_key_ids}
+        for row in value_rows:
+            key_id = int(row["key_id"])
+            if key_id == md5_key_id and int(row["cnt"]) < 2:
+                continue
+            value_counts[key_id].append({"value": row["value"], "cnt": row["cnt"]})
+        for key_id, rows in value_counts.items():
+            rows.sort(key=lambda row: (-int(row["cnt"]), str(row["value"])))
+            del rows[_TOP_N:]
         return {
-            "groups": [{"md5": row["md5"], "count": int(row["cnt"])} for row in rows]
+            "asset_count": int(count_rows[0]["cnt"]) if count_rows else 0,
+            "key_rows": key_rows,
+            "value_counts": value_counts,
+            "largest": largest,
+            "source_rows": source_rows,
         }
 
-    async def _largest_assets(
-        self,
-        session,
-        scoped_cte: str,
-        scoped_params: list[Any],
-        metadata_table: str,
-    ) -> list[dict[str, Any]]:
-        size_key_id = get_metadata_id(FILE_SIZE)
-        sql = f"""
-        WITH {scoped_cte},
-        latest_size AS (
-            SELECT
-                m.asset_id,
-                m.value_int AS size,
-                ROW_NUMBER() OVER (
-                    PARTITION BY m.asset_id
-                    ORDER BY m.changeset_id DESC, m.id DESC
-                ) AS rn
-            FROM {metadata_table} AS m
-            JOIN scoped_assets s ON s.asset_id = m.asset_id
-            WHERE m.metadata_key_id = ?
-              AND m.removed = 0
-              AND m.value_int IS NOT NULL
-        )
-        SELECT asset_id, size
-        FROM latest_size
-        WHERE rn = 1
-        ORDER BY size DESC
-        LIMIT 50
-        """
-        rows = await select(session, sql, [*scoped_params, size_key_id])
-        return [
-            {"asset_id": int(row["asset_id"]), "size": int(row["size"])} for row in rows
-        ]
+    @staticmethod
+    def _build_output(
+        *,
+        asset_count: int,
+        key_rows: list[dict[str, Any]],
+        value_counts: dict[int, list[dict[str, Any]]],
+        largest: list[dict[str, Any]],
+        source_rows: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        by_key = {int(row["key_id"]): row for row in key_rows}
+        size_row = by_key.get(get_metadata_id(FILE_SIZE)) or {}
+        size_count = int(size_row.get("int_count") or 0)
+        size_total = int(size_row.get("int_sum") or 0)
+        size_stats = {
+            "count": size_count,
+            "total": size_total,
+            "min": int(size_row.get("int_min") or 0),
+            "max": int(size_row.get("int_max") or 0),
+            "avg": float(size_total / size_count) if size_count else 0.0,
+        }
+        modified_row = by_key.get(get_metadata_id(TIME_MODIFIED)) or {}
+
+        def _breakdown(key_id: int) -> list[dict[str, Any]]:
+            return [
+                {"value": row["value"], "count": int(row["cnt"])}
+                for row in value_counts.get(key_id, [])
+            ]
+
+        largest_assets = sorted(
+            (
+                {"asset_id": int(row["asset_id"]), "size": int(row["size"])}
+                for row in largest
+            ),
+            key=lambda row: (-row["size"], row["asset_id"]),
+        )[:_TOP_N]
+        return {
+            "summary": {
+                "asset_count": asset_count,
+                "total_bytes": size_stats.get("total"),
+                "size": size_stats,
+                "modified": {
+                    "min": modified_row.get("datetime_min"),
+                    "max": modified_row.get("datetime_max"),
+                },
+            },
+            "breakdowns": {
+                "file_type": _breakdown(get_metadata_id(FILE_TYPE)),
+                "file_extension": _breakdown(get_metadata_id(FILE_EXTENSION)),
+            },
+            "coverage": {
+                "keys": [
+                    {
+                        "key_id": key_id,
+                        "count": int(row["asset_count"] or 0),
+                        "coverage": float(row["asset_count"] or 0) / max(1, asset_count),
+                    }
+                    for key_id, row in sorted(by_key.items())
+                ]
+            },
+            "duplicates": {
+                "groups": [
+                    {"md5": entry["value"], "count": entry["count"]}
+                    for entry in _breakdown(get_metadata_id(HASH_MD5))
+                ]
+            },
+            "largest_assets": largest_assets,
+            "sources": [
+                {
+                    "source_id": int(row["source_id"]),
+                    "asset_count": int(row["asset_count"]),
+                    "total_bytes": int(row["total_bytes"] or 0),
+                }
+                for row in source_rows
+            ],
+        }
@@ -1,8 +1,12 @@
+from time import perf_counter
 from typing import Any, Literal, Sequence
 
-from katalog.api.search import ensure_fts_index_ready, semantic_hits_for_query
+from pydantic import BaseModel, Field
+
+from katalog.api.search import ensure_fts_index_ready, search_hits_for_query
 from katalog.constants.metadata import MetadataKey
 from katalog.db.assets import get_asset_repo
+from katalog.db.canonical import get_canonical_repo
 from katalog.editors.user_editor import ensure_user_editor
 from katalog.models import Asset, Metadata, MetadataChanges, make_metadata
 from katalog.models.query import AssetQuery
@@ -18,6 +22,17 @@ from loguru import logger
 
 
 
+class AssetMerge(BaseModel):
+    """Payload for merging assets into the merge set of a canonical asset."""
+    canonical_asset_id: int
+    asset_ids: list[int] = Field(min_length=1)
+
+
+class AssetUnmerge(BaseModel):
+    """Payload for detaching assets from their merge sets."""
+    asset_ids: list[int] = Field(min_length=1)
+
+
 async def list_assets(query: AssetQuery) -> AssetsListResponse:
     """List assets for a query, including semantic search when requested."""
     await ensure_fts_index_ready(query)
@@ -143,8 +158,9 @@ async def update_asset() -> None:
 
 
 async def _list_assets_semantic(query: AssetQuery) -> AssetsListResponse:
-    """List assets ranked by semantic search hits."""
-    hits, _total_hits, _duration_ms = await semantic_hits_for_query(query)
+    """List assets ranked by semantic or hybrid search hits."""
+    result = await search_hits_for_query(query)
+    hits = result.hits
 
     ordered_asset_ids: list[int] = []
     seen_asset_ids: set[int] = set()
@@ -160,9 +176,10 @@ async def _list_assets_semantic(query: AssetQuery) -> AssetsListResponse:
         if best is None or float(hit.score) > float(best["score"]):
             top_hit_by_asset[hit.asset_id] = {
                 "score": float(hit.score),
-                "cosine_similarity": float(hit.cosine_similarity),
+                "cosine_similarity": hit.cosine_similarity,
                 "text": hit.text,
-                "distance": float(hit.distance),
+                "distance": hit.distance,
+                "fts_rank": hit.fts_rank,
                 "metadata_key": hit.metadata_key,
             }
 
@@ -190,9 +207,11 @@ async def _list_assets_semantic(query: AssetQuery) -> AssetsListResponse:
             {"key": "asset/id", "op": "equals", "value": "-1"},
         ]
 
+    hydrate_started = perf_counter()
     view = await get_view_api(scoped_query.view_id or "default")
     db = get_asset_repo()
     response = await db.list_assets_for_view_db(view, query=scoped_query)
+    hydrate_ms = int((perf_counter() - hydrate_started) * 1000)
     rank = {asset_id: index for index, asset_id in enumerate(page_asset_ids)}
     sorted_items = sorted(response.items, key=lambda item: rank.get(int(item.asset_id), 10**9))
     updated_items: list[Any] = []
@@ -205,14 +224,16 @@ async def _list_assets_semantic(query: AssetQuery) -> AssetsListResponse:
                 "search_cosine_similarity": None,
                 "search_match": None,
                 "search_distance": None,
+                "search_fts_rank": None,
                 "search_metadata_key": None,
             }
         else:
             updates = {
                 "search_score": float(best["score"]),
-                "search_cosine_similarity": float(best["cosine_similarity"]),
+                "search_cosine_similarity": best["cosine_similarity"],
                 "search_match": str(best.get("text") or ""),
-                "search_distance": float(best["distance"]),
+                "search_distance": best["distance"],
+                "search_fts_rank": best["fts_rank"],
                 "search_metadata_key": str(best.get("metadata_key") or ""),
             }
         updated_items.append(item.model_copy(update=updates))
@@ -229,6 +250,9 @@ async def _list_assets_semantic(query: AssetQuery) -> AssetsListResponse:
                     "distance": hit.distance,
                     "score": hit.score,
                     "cosine_similarity": hit.cosine_similarity,
+                    "fts_rank": hit.fts_rank,
+                    "lexical_rank": hit.lexical_rank,
+                    "semantic_rank": hit.semantic_rank,
                     "text": hit.text,
                 }
             )
@@ -240,6 +264,36 @@ async def _list_assets_semantic(query: AssetQuery) -> AssetsListResponse:
         ]
     response.stats.total = len(ordered_asset_ids)
     response.stats.returned = len(response.items)
+    response.stats.duration_ms = result.duration_ms + hydrate_ms
+    response.stats.stages_ms = {**result.stages_ms, "hydrate": hydrate_ms}
     response.pagination.offset = query.offset
     response.pagination.limit = query.limit
     return response
+
+
+async def get_asset_merge_set(asset_id: int) -> dict[str, Any]:
+    """Return the merge set of an asset, canonical asset first."""
+    if not await get_asset_repo().existing_asset_ids([asset_id]):
+        raise ApiError(status_code=404, detail="Asset not found")
+    members = await get_canonical_repo().members(asset_id)
+    return {"canonical_asset_id": members[0], "asset_ids": members}
+
+
+@requires_write_access()
+async def merge_assets(payload: AssetMerge) -> dict[str, Any]:
+    """Merge assets, and any sets they belong to, into one canonical asset."""
+    requested = [payload.canonical_asset_id, *payload.asset_ids]
+    missing = set(requested) - await get_asset_repo().existing_asset_ids(requested)
+    if missing:
+        raise ApiError(status_code=404, detail=f"Assets not found: {sorted(missing)}")
+    repo = get_canonical_repo()
+    merged = await repo.merge_groups([requested])
+    members = await repo.members(payload.canonical_asset_id)
+    return {"merged": merged, "canonical_asset_id": members[0], "asset_ids": members}
+
+
+@requires_write_access()
+async def unmerge_assets(payload: AssetUnmerge) -> dict[str, int]:
+    """Detach assets from their merge sets."""
+    unmerged = await get_canonical_repo().unmerge(payload.asset_ids)
+    return {"unmerged": unmerged}
@@ -1,8 +1,15 @@
 from time import perf_counter
+from typing import Any, Sequence
 
-from katalog.api.helpers import ApiError
-from katalog.api.search import ensure_fts_index_ready, semantic_hits_for_query
+from katalog.api.helpers import ApiError, requires_write_access
+from katalog.api.search import ensure_fts_index_ready, search_hits_for_query
 from katalog.constants.metadata import (
+    FILE_NAME,
+    FILE_PATH,
+    FILE_TITLE,
+    METADATA_REGISTRY,
+    MetadataKey,
+    MetadataType,
     MetadataDef,
     editable_metadata_schema,
     get_metadata_id,
@@ -12,6 +19,7 @@ from katalog.constants.metadata import (
 from katalog.db.assets import get_asset_repo
 from katalog.db.fts import get_fts_repo
 from katalog.db.metadata import get_metadata_repo
+from katalog.db.trigram import TrigramIndexStatus, get_trigram_repo
 from katalog.models import MetadataChanges
 from katalog.models.query import EditableMetadataSchemaResponse, AssetQuery, Pagination, QueryStats
 
@@ -27,6 +35,64 @@ async def metadata_registry() -> dict[str, dict[int, MetadataDef]]:
     return {"registry": metadata_registry_by_id_for_current_db()}
 
 
+DEFAULT_TRIGRAM_KEYS: tuple[MetadataKey, ...] = (FILE_PATH, FILE_NAME, FILE_TITLE)
+
+
+def _trigram_status_payload(status: TrigramIndexStatus) -> dict[str, Any]:
+    return {
+        "metadata_keys": [
+            str(metadata_key_for_id_or_fallback(key_id)) for key_id in status.metadata_key_ids
+        ],
+        "metadata_key_ids": list(status.metadata_key_ids),
+        "indexed_rows": status.indexed_rows,
+        "duration_ms": status.duration_ms,
+    }
+
+
+async def trigram_index_status() -> dict[str, Any]:
+    """Return the keys and row count covered by the substring (trigram) index."""
+    return _trigram_status_payload(await get_trigram_repo().status())
+
+
+@requires_write_access()
+async def build_trigram_index(
+    metadata_keys: Sequence[str] | None = None,
+    *,
+    rebuild: bool = False,
+) -> dict[str, Any]:
+    """Build (or rebuild) the trigram index used by contains/startsWith/endsWith filters.
+
+    Without explicit keys, a plain build indexes path, filename and title while a
+    rebuild re-indexes the currently configured keys.
+    """
+    if metadata_keys:
+        keys = [MetadataKey(key) for key in metadata_keys]
+    elif rebuild:
+        keys = []
+    else:
+        keys = list(DEFAULT_TRIGRAM_KEYS)
+    key_ids: list[int] = []
+    for key in keys:
+        definition = METADATA_REGISTRY.get(key)
+        if definition is None:
+            raise ApiError(status_code=400, detail=f"Unknown metadata key: {key}")
+        if definition.value_type != MetadataType.STRING:
+            raise ApiError(
+                status_code=400,
+                detail=f"Trigram index only supports string metadata keys: {key}",
+            )
+        key_ids.append(int(get_metadata_id(key)))
+    status = await get_trigram_repo().build(metadata_key_ids=key_ids, rebuild=rebuild)
+    return _trigram_status_payload(status)
+
+
+@requires_write_access()
+async def drop_trigram_index() -> dict[str, str]:
+    """Drop the trigram index; substring filters fall back to LIKE scans."""
+    await get_trigram_repo().drop()
+    return {"status": "ok"}
+
+
 async def list_metadata(query: AssetQuery) -> dict:
     """List metadata rows for metadata-granularity queries."""
     await ensure_fts_index_ready(query)
@@ -134,8 +200,9 @@ async def _list_metadata_fts(query: AssetQuery) -> dict:
 
 
 async def _list_metadata_semantic(query: AssetQuery) -> dict:
-    """List metadata rows using semantic vector hits."""
-    hits, total, duration_ms = await semantic_hits_for_query(query)
+    """List metadata rows using semantic or hybrid search hits."""
+    result = await search_hits_for_query(query)
+    hits = result.hits
     start = int(query.offset)
     end = start + int(query.limit)
     page = hits[start:end]
@@ -158,13 +225,21 @@ async def _list_metadata_semantic(query: AssetQuery) -> dict:
                 "distance": hit.distance,
                 "score": hit.score,
                 "cosine_similarity": hit.cosine_similarity,
+                "fts_rank": hit.fts_rank,
+                "lexical_rank": hit.lexical_rank,
+                "semantic_rank": hit.semantic_rank,
                 "text": hit.text,
                 "asset_namespace": asset.namespace if asset else None,
                 "asset_external_id": asset.external_id if asset else None,
                 "asset_canonical_uri": asset.canonical_uri if asset else None,
             }
         )
-    stats = QueryStats(returned=len(items), total=total, duration_ms=duration_ms)
+    stats = QueryStats(
+        returned=len(items),
+        total=result.total,
+        duration_ms=result.duration_ms,
+        stages_ms=result.stages_ms,
+    )
     pagination = Pagination(offset=query.offset, limit=query.limit)
     return {
         "items": items,
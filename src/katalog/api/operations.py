@@ -1,6 +1,6 @@
 import asyncio
 import traceback
-from typing import Literal
+from typing import Awaitable, Callable, Literal
 from typing import cast
 from urllib.parse import urlparse
 
@@ -13,10 +13,14 @@ from katalog.db.asset_collections import get_asset_collection_repo
 from katalog.db.assets import get_asset_repo
 from katalog.db.actors import get_actor_repo
 from katalog.db.changesets import get_changeset_repo
+from katalog.db.scan_journal import get_scan_journal_repo
 from katalog.processors.runtime import do_run_processors, sort_processors
 from katalog.sources.runtime import run_sources
 from katalog.sources.base import SourcePlugin
+from katalog.sources.filesystem_watch import FilesystemWatcher
 from katalog.plugins.registry import get_actor_instance
+from katalog.workflows.contracts import WorkflowSourceActorsInput, WorkflowSourcePathsInput
+from katalog.workflows.pipeline import WorkflowPipelineRunner
 
 from katalog.api.helpers import ApiError, requires_write_access
 from katalog.runtime.state import get_running_changesets
@@ -93,8 +97,12 @@ async def run_source(
     finalize: bool = False,
     run_processors: bool = True,
     missing_assets_policy: Literal["lost", "delete"] = "lost",
+    restart: bool = False,
 ) -> Changeset:
-    """Scan a single source and optionally wait for the changeset to complete."""
+    """Scan a single source and optionally wait for the changeset to complete.
+
+    An interrupted earlier scan of the source is resumed unless `restart` is set.
+    """
 
     db = get_actor_repo()
     source = await db.get_or_none(id=source_id, type=ActorType.SOURCE)
@@ -115,6 +123,9 @@ async def run_source(
         detail = reason or "unknown reason"
         raise ApiError(status_code=409, detail=f"Source is not ready: {detail}")
 
+    if restart and await get_scan_journal_repo().discard(actor_id=source_id):
+        logger.info("Discarded interrupted scan of source {source_id}", source_id=source_id)
+
     # Single-source scans map 1:1 to a changeset. Processor actors may still participate downstream.
     sources = [source]
 
@@ -156,6 +167,89 @@ async def run_source(
     return changeset
 
 
+@requires_write_access()
+async def watch_source(
+    source_id: int,
+    *,
+    run_processors: bool = True,
+    missing_assets_policy: Literal["lost", "delete"] = "lost",
+    initial_rescan: bool = True,
+    stop_event: asyncio.Event | None = None,
+    on_changeset: Callable[[Changeset], Awaitable[None]] | None = None,
+) -> int:
+    """Watch a source and run one changeset per debounced batch of changes.
+
+    Runs until `stop_event` is set and returns the number of changesets run.
+    Overflowing batches (and the initial catch-up, if requested) rescan the whole
+    source, which stays cheap thanks to the fingerprint fast path.
+    """
+
+    db = get_actor_repo()
+    source = await db.get_or_none(id=source_id, type=ActorType.SOURCE)
+    if source is None:
+        raise ApiError(status_code=404, detail="Source not found")
+    if source.disabled:
+        raise ApiError(status_code=409, detail="Source is disabled")
+    source_plugin = cast(SourcePlugin, await get_actor_instance(source))
+    watch = getattr(source_plugin, "watch", None)
+    if not callable(watch):
+        raise ApiError(status_code=409, detail="Source does not support watch mode")
+    watcher = cast(Callable[[], FilesystemWatcher], watch)()
+
+    if run_processors:
+        processor_pipeline, processor_actors = await sort_processors()
+    else:
+        processor_pipeline, processor_actors = [], []
+    runner = WorkflowPipelineRunner()
+    changeset_db = get_changeset_repo()
+    runs = 0
+
+    async for batch in watcher.batches(stop_event=stop_event, initial_rescan=initial_rescan):
+        if batch.overflow:
+            workflow_input = WorkflowSourceActorsInput(actor_ids=[source_id])
+        else:
+            workflow_input = WorkflowSourcePathsInput(
+                actor_ids=[source_id],
+                paths=batch.changed_paths,
+                removed_paths=batch.removed_paths,
+            )
+        changeset = await changeset_db.begin(
+            message="Source rescan" if batch.overflow else "Source watch",
+            actors=[source, *processor_actors],
+            status=OpStatus.IN_PROGRESS,
+            data={
+                "watch": {
+                    "changed_paths": len(batch.changed_paths),
+                    "removed_paths": len(batch.removed_paths),
+                    "overflow": batch.overflow,
+                }
+            },
+        )
+        try:
+            status = await runner.run(
+                changeset=changeset,
+                workflow_input=workflow_input,
+                source_actors=[source],
+                processor_pipeline=processor_pipeline,
+                missing_assets_policy=missing_assets_policy,
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("Source watch run failed (finalizing changeset as error)")
+            data = dict(changeset.data or {})
+            data["error_message"] = str(exc)
+            data["error_traceback"] = traceback.format_exc()
+            changeset.data = data
+            status = OpStatus.ERROR
+        # Finalize outside the handler: the sqlspec driver re-raises the exception
+        # being handled from statements executed inside an except block.
+        await changeset.finalize(status=status)
+        runs += 1
+        if on_changeset is not None:
+            await on_changeset(changeset)
+
+    return runs
+
+
 @requires_write_access()
 async def run_processors(
     processor_ids: list[int] | None,
@@ -48,6 +48,14 @@ def build_asset_query(
     search_dimension: int | None = None,
     search_embedding_model: str | None = None,
     search_embedding_backend: Literal["preset", "fastembed"] | None = None,
+    search_fts_index: int | None = None,
+    search_fusion: Literal["rrf", "weighted"] | None = None,
+    search_lexical_weight: float | None = None,
+    search_semantic_weight: float | None = None,
+    search_rrf_k: int | None = None,
+    search_candidate_pool: int | None = None,
+    search_recency_boost: float | None = None,
+    search_source_boosts: list[str] | None = None,
 ) -> AssetQuery:
     """Build and validate an AssetQuery payload from request arguments."""
     payload: dict[str, object] = {
@@ -93,4 +101,20 @@ def build_asset_query(
         payload["search_embedding_model"] = search_embedding_model
     if search_embedding_backend is not None:
         payload["search_embedding_backend"] = search_embedding_backend
+    if search_fts_index is not None:
+        payload["search_fts_index"] = search_fts_index
+    if search_fusion is not None:
+        payload["search_fusion"] = search_fusion
+    if search_lexical_weight is not None:
+        payload["search_lexical_weight"] = search_lexical_weight
+    if search_semantic_weight is not None:
+        payload["search_semantic_weight"] = search_semantic_weight
+    if search_rrf_k is not None:
+        payload["search_rrf_k"] = search_rrf_k
+    if search_candidate_pool is not None:
+        payload["search_candidate_pool"] = search_candidate_pool
+    if search_recency_boost is not None:
+        payload["search_recency_boost"] = search_recency_boost
+    if search_source_boosts is not None:
+        payload["search_source_boosts"] = search_source_boosts
     return AssetQuery.model_validate(payload)
@@ -0,0 +1,150 @@
+from typing import Sequence
+
+from katalog.api.helpers import ApiError, requires_write_access
+from katalog.api.schemas import (
+    RelatedAssetView,
+    RelationEdgeView,
+    RelationNeighborsResponse,
+    RelationTraversalResponse,
+)
+from katalog.constants.metadata import (
+    MetadataKey,
+    get_metadata_id,
+    metadata_key_for_id_or_fallback,
+)
+from katalog.db.assets import get_asset_repo
+from katalog.db.relations import (
+    MAX_TRAVERSAL_DEPTH,
+    MAX_TRAVERSAL_RESULTS,
+    Traversal,
+    get_relation_repo,
+)
+
+_DIRECTIONS = ("out", "in", "both")
+
+
+async def _require_asset(asset_id: int) -> None:
+    asset = await get_asset_repo().get_or_none(id=asset_id)
+    if asset is None:
+        raise ApiError(status_code=404, detail="Asset not found")
+
+
+def _key_ids(metadata_keys: Sequence[str] | None) -> list[int] | None:
+    if not metadata_keys:
+        return None
+    key_ids: list[int] = []
+    for key in metadata_keys:
+        try:
+            key_ids.append(int(get_metadata_id(MetadataKey(key))))
+        except ValueError:
+            raise ApiError(status_code=400, detail=f"Unknown metadata key: {key}")
+    return key_ids
+
+
+def _validate_direction(direction: str) -> None:
+    if direction not in _DIRECTIONS:
+        raise ApiError(
+            status_code=400,
+            detail=f"direction must be one of: {', '.join(_DIRECTIONS)}",
+        )
+
+
+def _validate_limit(limit: int) -> None:
+    if limit < 1 or limit > MAX_TRAVERSAL_RESULTS:
+        raise ApiError(
+            status_code=400,
+            detail=f"limit must be between 1 and {MAX_TRAVERSAL_RESULTS}",
+        )
+
+
+def _traversal_response(asset_id: int, traversal: Traversal) -> RelationTraversalResponse:
+    return RelationTraversalResponse(
+        asset_id=asset_id,
+        assets=[
+            RelatedAssetView(asset_id=item.asset_id, depth=item.depth)
+            for item in traversal.assets
+        ],
+        truncated=traversal.truncated,
+    )
+
+
+async def list_relation_neighbors(
+    asset_id: int,
+    *,
+    direction: str = "both",
+    metadata_keys: Sequence[str] | None = None,
+    limit: int = 100,
+) -> RelationNeighborsResponse:
+    """List the current relation edges of one asset."""
+    _validate_direction(direction)
+    _validate_limit(limit)
+    key_ids = _key_ids(metadata_keys)
+    await _require_asset(asset_id)
+    edges = await get_relation_repo().neighbors(
+        asset_id,
+        direction=direction,  # type: ignore[arg-type]
+        key_ids=key_ids,
+        limit=limit,
+    )
+    return RelationNeighborsResponse(
+        asset_id=asset_id,
+        direction=direction,
+        edges=[
+            RelationEdgeView(
+                from_asset_id=edge.from_asset_id,
+                metadata_key=str(metadata_key_for_id_or_fallback(edge.metadata_key_id)),
+                to_asset_id=edge.to_asset_id,
+                actor_ids=list(edge.actor_ids),
+            )
+            for edge in edges
+        ],
+    )
+
+
+async def traverse_relations(
+    asset_id: int,
+    *,
+    max_depth: int = 2,
+    direction: str = "both",
+    metadata_keys: Sequence[str] | None = None,
+    limit: int = 1000,
+) -> RelationTraversalResponse:
+    """Return assets within `max_depth` relation hops of an asset, nearest first."""
+    _validate_direction(direction)
+    _validate_limit(limit)
+    if max_depth < 1 or max_depth > MAX_TRAVERSAL_DEPTH:
+        raise ApiError(
+            status_code=400,
+            detail=f"max_depth must be between 1 and {MAX_TRAVERSAL_DEPTH}",
+        )
+    key_ids = _key_ids(metadata_keys)
+    await _require_asset(asset_id)
+    traversal = await get_relation_repo().traverse(
+        asset_id,
+        max_depth=max_depth,
+        direction=direction,  # type: ignore[arg-type]
+        key_ids=key_ids,
+        limit=limit,
+    )
+    return _traversal_response(asset_id, traversal)
+
+
+async def relation_component(
+    asset_id: int,
+    *,
+    metadata_keys: Sequence[str] | None = None,
+    limit: int = 1000,
+) -> RelationTraversalResponse:
+    """Return every asset connected to an asset, ignoring edge direction."""
+    _validate_limit(limit)
+    key_ids = _key_ids(metadata_keys)
+    await _require_asset(asset_id)
+    traversal = await get_relation_repo().component(asset_id, key_ids=key_ids, limit=limit)
+    return _traversal_response(asset_id, traversal)
+
+
+@requires_write_access()
+async def rebuild_relations() -> dict[str, int]:
+    """Recreate the relation edge table from metadata history."""
+    edges = await get_relation_repo().rebuild()
+    return {"edges": edges}
@@ -27,3 +27,31 @@ class ManualEditResult(BaseModel):
     asset_id: int
     changeset_id: int
     changed_keys: list[str]
+
+
+class RelationEdgeView(BaseModel):
+    """One current relation edge between two assets."""
+    from_asset_id: int
+    metadata_key: str
+    to_asset_id: int
+    actor_ids: list[int]
+
+
+class RelationNeighborsResponse(BaseModel):
+    """Edges touching one asset."""
+    asset_id: int
+    direction: str
+    edges: list[RelationEdgeView]
+
+
+class RelatedAssetView(BaseModel):
+    """An asset reached from a traversal start; depth is None for components."""
+    asset_id: int
+    depth: int | None = None
+
+
+class RelationTraversalResponse(BaseModel):
+    """Assets reached from one asset through relation edges."""
+    asset_id: int
+    assets: list[RelatedAssetView]
+    truncated: bool
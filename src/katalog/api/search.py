@@ -1,33 +1,87 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from time import perf_counter
+from typing import Iterator
+
+from loguru import logger
 
 from katalog.constants.metadata import (
+    TIME_MODIFIED,
+    MetadataKey,
     get_metadata_id,
     metadata_key_for_id_or_fallback,
 )
 from katalog.db.actors import get_actor_repo
 from katalog.db.assets import get_asset_repo
-from katalog.db.fts import get_fts_repo
+from katalog.db.fts import FtsSearchHit, get_fts_repo
 from katalog.db.vectors import VectorSearchHit, get_vector_repo
 from katalog.models.query import AssetQuery
+from katalog.models.views import SearchFusionSpec
 from katalog.models import ActorType
 from katalog.api.helpers import ApiError
-from katalog.vectors.embedding import embed_text_kreuzberg
+from katalog.api.search_fusion import (
+    BoostSignals,
+    FusedCandidate,
+    RankedCandidate,
+    apply_boosts,
+    candidate_pool_size,
+    fuse_ranked_lists,
+    has_boosts,
+)
+from katalog.vectors.embedding import (
+    EmbeddingBackend,
+    embed_query_cached,
+    warm_embedding_model,
+)
+
+VECTOR_INDEX_PLUGIN_ID = "katalog.processors.vector_index.KreuzbergVectorIndexProcessor"
 
 
 @dataclass(frozen=True)
 class SemanticHit:
-    """Normalized semantic-search hit payload."""
+    """Normalized semantic/hybrid search hit payload."""
     asset_id: int
     metadata_id: int | None
     metadata_key_id: int
     metadata_key: str
     text: str
-    distance: float
     score: float
-    cosine_similarity: float
+    distance: float | None = None
+    cosine_similarity: float | None = None
+    fts_rank: float | None = None
+    lexical_rank: int | None = None
+    semantic_rank: int | None = None
+
+
+@dataclass
+class SearchHitsResult:
+    """Ranked hits plus timing stats for one semantic or hybrid search."""
+    hits: list[SemanticHit]
+    total: int
+    duration_ms: int
+    stages_ms: dict[str, int] = field(default_factory=dict)
+
+
+class _StageTimer:
+    """Accumulate wall-clock milliseconds per named search stage."""
+
+    def __init__(self) -> None:
+        self.started = perf_counter()
+        self.stages_ms: dict[str, int] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        stage_started = perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = int((perf_counter() - stage_started) * 1000)
+            self.stages_ms[name] = self.stages_ms.get(name, 0) + elapsed
+
+    def elapsed_ms(self) -> int:
+        return int((perf_counter() - self.started) * 1000)
 
 
 def l2_distance_to_cosine_similarity(distance: float) -> float:
@@ -64,11 +118,11 @@ async def ensure_fts_index_ready(query: AssetQuery) -> None:
     )
 
 
-async def semantic_hits_for_query(query: AssetQuery) -> tuple[list[SemanticHit], int, int]:
-    """Run semantic search and return filtered hits with timing stats."""
-    started = perf_counter()
+async def search_hits_for_query(query: AssetQuery) -> SearchHitsResult:
+    """Run semantic or hybrid search and return ranked hits with per-stage timings."""
+    timer = _StageTimer()
     if query.search_mode not in {"semantic", "hybrid"}:
-        return [], 0, 0
+        return SearchHitsResult(hits=[], total=0, duration_ms=0)
     search_text = (query.search or "").strip()
     if not search_text:
         raise ApiError(status_code=400, detail="search is required for semantic mode")
@@ -81,7 +135,12 @@ async def semantic_hits_for_query(query: AssetQuery) -> tuple[list[SemanticHit],
             detail=f"Vector search is not ready: {reason or 'unknown reason'}",
         )
 
-    scope_asset_ids = await _scope_asset_ids(query)
+    with timer.stage("scope"):
+        scope_asset_ids = await _scope_asset_ids(query)
+    if scope_asset_ids is not None and not scope_asset_ids:
+        return SearchHitsResult(
+            hits=[], total=0, duration_ms=timer.elapsed_ms(), stages_ms=timer.stages_ms
+        )
 
     vector_actor_id = await _resolve_vector_actor_id(query.search_index)
     has_records = await vec_db.has_index_records(
@@ -98,27 +157,232 @@ async def semantic_hits_for_query(query: AssetQuery) -> tuple[list[SemanticHit],
             ),
         )
 
-    top_k = query.search_top_k or max(50, query.limit * 5)
-    query_vector = await embed_text_kreuzberg(
-        search_text,
-        model=query.search_embedding_model,
-        backend=query.search_embedding_backend,
-        dim=int(query.search_dimension),
+    spec: SearchFusionSpec | None = None
+    if query.search_mode == "hybrid":
+        spec = await resolve_fusion_spec(query)
+        top_k = candidate_pool_size(
+            spec,
+            top_k=query.search_top_k,
+            minimum=int(query.offset) + int(query.limit),
+        )
+    else:
+        top_k = query.search_top_k or max(50, query.limit * 5)
+
+    with timer.stage("embed"):
+        model, backend, dim = _query_embedding_params(query)
+        query_vector = await embed_query_cached(
+            search_text,
+            actor_id=vector_actor_id,
+            model=model,
+            backend=backend,
+            dim=dim,
+        )
+    with timer.stage("vector"):
+        raw_hits = await vec_db.search(
+            actor_id=vector_actor_id,
+            dim=int(query.search_dimension),
+            query_vector=query_vector,
+            limit=top_k,
+            asset_ids=scope_asset_ids,
+        )
+        filtered = _filter_hits(
+            raw_hits,
+            metadata_keys=query.search_metadata_keys,
+            min_score=query.search_min_score,
+        )
+
+    if spec is None:
+        return SearchHitsResult(
+            hits=filtered,
+            total=len(filtered),
+            duration_ms=timer.elapsed_ms(),
+            stages_ms=timer.stages_ms,
+        )
+
+    with timer.stage("lexical"):
+        lexical_hits = await _lexical_candidates(
+            query,
+            search_text=search_text,
+            limit=top_k,
+            scope_asset_ids=scope_asset_ids,
+        )
+
+    with timer.stage("fusion"):
+        fused = fuse_ranked_lists(
+            [
+                RankedCandidate(
+                    asset_id=hit.asset_id,
+                    metadata_id=hit.metadata_id,
+                    metadata_key_id=hit.metadata_key_id,
+                    text=hit.source_text,
+                    # bm25() is lower-is-better; flip so that higher is better.
+                    raw_score=-float(hit.rank or 0.0),
+                )
+                for hit in lexical_hits
+            ],
+            [
+                RankedCandidate(
+                    asset_id=hit.asset_id,
+                    metadata_id=hit.metadata_id,
+                    metadata_key_id=hit.metadata_key_id,
+                    text=hit.text,
+                    raw_score=float(hit.cosine_similarity or 0.0),
+                )
+                for hit in filtered
+            ],
+            spec=spec,
+            key="metadata" if query.search_granularity == "metadata" else "asset",
+        )
+
+    if has_boosts(spec) and fused:
+        with timer.stage("boost"):
+            fused = apply_boosts(
+                fused,
+                await _boost_signals([candidate.asset_id for candidate in fused]),
+                spec=spec,
+            )
+
+    semantic_by_metadata_id = {hit.metadata_id: hit for hit in filtered}
+    hits = [_fused_to_hit(candidate, semantic_by_metadata_id) for candidate in fused]
+    return SearchHitsResult(
+        hits=hits,
+        total=len(hits),
+        duration_ms=timer.elapsed_ms(),
+        stages_ms=timer.stages_ms,
     )
-    raw_hits = await vec_db.search(
-        actor_id=vector_actor_id,
-        dim=int(query.search_dimension),
-        query_vector=query_vector,
-        limit=top_k,
-        asset_ids=scope_asset_ids,
+
+
+async def resolve_fusion_spec(query: AssetQuery) -> SearchFusionSpec:
+    """Merge view-level fusion defaults with per-request overrides."""
+    from katalog.api.views import get_view_api
+
+    view = await get_view_api(query.view_id or "default")
+    base = view.search_fusion or SearchFusionSpec()
+    overrides = {
+        "method": query.search_fusion,
+        "lexical_weight": query.search_lexical_weight,
+        "semantic_weight": query.search_semantic_weight,
+        "rrf_k": query.search_rrf_k,
+        "candidate_pool": query.search_candidate_pool,
+        "recency_boost": query.search_recency_boost,
+        "source_boosts": query.search_source_boosts,
+    }
+    updates = {key: value for key, value in overrides.items() if value is not None}
+    if not updates:
+        return base
+    return SearchFusionSpec.model_validate({**base.model_dump(), **updates})
+
+
+async def _lexical_candidates(
+    query: AssetQuery,
+    *,
+    search_text: str,
+    limit: int,
+    scope_asset_ids: list[int] | None,
+) -> list[FtsSearchHit]:
+    """Fetch the lexical side of a hybrid search, or nothing if no FTS index exists."""
+    try:
+        fts_actor_id = await _resolve_fts_actor_id(query.search_fts_index)
+    except ApiError as exc:
+        if query.search_fts_index is not None:
+            raise
+        logger.debug("Hybrid search without lexical side: {detail}", detail=exc.detail)
+        return []
+
+    metadata_key_ids = (
+        [int(get_metadata_id(MetadataKey(key))) for key in (query.search_metadata_keys or [])]
+        or None
+    )
+    fts_db = get_fts_repo()
+    try:
+        hits, _total = await fts_db.search(
+            actor_id=fts_actor_id,
+            query_text=search_text,
+            limit=limit,
+            asset_ids=scope_asset_ids,
+            metadata_key_ids=metadata_key_ids,
+            with_total=False,
+        )
+    except ValueError:
+        # Query text without any indexable tokens; semantic side still applies.
+        return []
+    return hits
+
+
+async def _boost_signals(asset_ids: list[int]) -> dict[int, BoostSignals]:
+    """Load the per-asset metadata used by recency/source boosts."""
+    asset_db = get_asset_repo()
+    rows = await asset_db.list_boost_signals(
+        asset_ids,
+        modified_key_id=int(get_metadata_id(TIME_MODIFIED)),
+    )
+    return {
+        asset_id: BoostSignals(
+            actor_id=int(row["actor_id"]) if row.get("actor_id") is not None else None,
+            age_days=float(row["age_days"]) if row.get("age_days") is not None else None,
+        )
+        for asset_id, row in rows.items()
+    }
+
+
+def _fused_to_hit(
+    candidate: FusedCandidate,
+    semantic_by_metadata_id: dict[int | None, SemanticHit],
+) -> SemanticHit:
+    semantic_hit = (
+        semantic_by_metadata_id.get(candidate.semantic.metadata_id)
+        if candidate.semantic is not None
+        else None
+    )
+    return SemanticHit(
+        asset_id=candidate.asset_id,
+        metadata_id=candidate.metadata_id,
+        metadata_key_id=candidate.metadata_key_id,
+        metadata_key=str(metadata_key_for_id_or_fallback(int(candidate.metadata_key_id))),
+        text=candidate.text,
+        score=candidate.score,
+        distance=semantic_hit.distance if semantic_hit else None,
+        cosine_similarity=semantic_hit.cosine_similarity if semantic_hit else None,
+        fts_rank=-candidate.lexical.raw_score if candidate.lexical is not None else None,
+        lexical_rank=candidate.lexical_rank,
+        semantic_rank=candidate.semantic_rank,
     )
-    filtered = _filter_hits(
-        raw_hits,
-        metadata_keys=query.search_metadata_keys,
-        min_score=query.search_min_score,
+
+
+def _query_embedding_params(query: AssetQuery) -> tuple[str, EmbeddingBackend, int]:
+    """Model, backend and dimension a semantic query is embedded with."""
+    return (
+        query.search_embedding_model,
+        query.search_embedding_backend,
+        int(query.search_dimension),
+    )
+
+
+async def warm_search_embeddings() -> None:
+    """Preload the embedding model default semantic queries are embedded with."""
+    actor_db = get_actor_repo()
+    actors = await actor_db.list_rows(
+        type=ActorType.PROCESSOR,
+        plugin_id=VECTOR_INDEX_PLUGIN_ID,
+        disabled=0,
+        order_by="id ASC",
+    )
+    if not actors:
+        return
+    model, backend, dim = _query_embedding_params(AssetQuery())
+    started = perf_counter()
+    try:
+        await warm_embedding_model(model=model, backend=backend, dim=dim)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Failed to warm embedding model {} ({}): {}", model, backend, exc)
+        return
+    logger.info(
+        "Warmed embedding model {} ({}, dim={}) in {}ms",
+        model,
+        backend,
+        dim,
+        int((perf_counter() - started) * 1000),
     )
-    elapsed_ms = int((perf_counter() - started) * 1000)
-    return filtered, len(filtered), elapsed_ms
 
 
 async def _resolve_vector_actor_id(search_index: int | None) -> int:
@@ -128,7 +392,7 @@ async def _resolve_vector_actor_id(search_index: int | None) -> int:
     actor_db = get_actor_repo()
     actors = await actor_db.list_rows(
         type=ActorType.PROCESSOR,
-        plugin_id="katalog.processors.vector_index.KreuzbergVectorIndexProcessor",
+        plugin_id=VECTOR_INDEX_PLUGIN_ID,
         disabled=0,
         order_by="id ASC",
     )
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, replace
+from typing import Literal, Mapping, Sequence
+
+from katalog.models.views import SearchFusionSpec
+
+# Hard upper bound for per-side candidate pools, regardless of view/query settings.
+MAX_CANDIDATE_POOL = 5000
+
+FusionKey = Literal["asset", "metadata"]
+
+
+@dataclass(frozen=True)
+class RankedCandidate:
+    """One ranked hit from a single retrieval side (lexical or semantic)."""
+
+    asset_id: int
+    metadata_id: int | None
+    metadata_key_id: int
+    text: str
+    # Higher is better; callers convert bm25/distance before fusing.
+    raw_score: float
+
+
+@dataclass(frozen=True)
+class FusedCandidate:
+    """A fused hit, carrying the best contribution from each side."""
+
+    asset_id: int
+    metadata_id: int | None
+    metadata_key_id: int
+    text: str
+    score: float
+    lexical: RankedCandidate | None = None
+    semantic: RankedCandidate | None = None
+    lexical_rank: int | None = None
+    semantic_rank: int | None = None
+
+
+@dataclass(frozen=True)
+class BoostSignals:
+    """Per-asset metadata used for optional score boosts."""
+
+    actor_id: int | None = None
+    age_days: float | None = None
+
+
+def candidate_pool_size(spec: SearchFusionSpec, *, top_k: int | None, minimum: int) -> int:
+    """Return the bounded per-side candidate pool size."""
+    requested = int(top_k) if top_k else int(spec.candidate_pool)
+    return max(1, min(MAX_CANDIDATE_POOL, max(requested, int(minimum))))
+
+
+def _fusion_key(candidate: RankedCandidate, key: FusionKey) -> int:
+    if key == "metadata" and candidate.metadata_id is not None:
+        return int(candidate.metadata_id)
+    return int(candidate.asset_id)
+
+
+def _dedupe_ranked(
+    candidates: Sequence[RankedCandidate], key: FusionKey
+) -> dict[int, tuple[int, RankedCandidate]]:
+    """Keep the first (best) candidate per fusion key with its 1-based rank."""
+    ranked: dict[int, tuple[int, RankedCandidate]] = {}
+    for candidate in candidates:
+        fusion_key = _fusion_key(candidate, key)
+        if fusion_key in ranked:
+            continue
+        ranked[fusion_key] = (len(ranked) + 1, candidate)
+    return ranked
+
+
+def _min_max(values: Sequence[float]) -> tuple[float, float]:
+    if not values:
+        return 0.0, 0.0
+    return min(values), max(values)
+
+
+def _normalized(value: float, bounds: tuple[float, float]) -> float:
+    low, high = bounds
+    if high <= low:
+        return 1.0
+    return (value - low) / (high - low)
+
+
+def fuse_ranked_lists(
+    lexical: Sequence[RankedCandidate],
+    semantic: Sequence[RankedCandidate],
+    *,
+    spec: SearchFusionSpec,
+    key: FusionKey = "asset",
+) -> list[FusedCandidate]:
+    """Fuse two ranked candidate lists with RRF or weighted min-max scores.
+
+    Input lists must already be ordered best-first. Fusion happens per asset or
+    per metadata row depending on `key`.
+    """
+    lexical_ranked = _dedupe_ranked(lexical, key)
+    semantic_ranked = _dedupe_ranked(semantic, key)
+    lexical_bounds = _min_max([c.raw_score for _, c in lexical_ranked.values()])
+    semantic_bounds = _min_max([c.raw_score for _, c in semantic_ranked.values()])
+
+    fused: list[FusedCandidate] = []
+    for fusion_key in {*lexical_ranked.keys(), *semantic_ranked.keys()}:
+        lexical_entry = lexical_ranked.get(fusion_key)
+        semantic_entry = semantic_ranked.get(fusion_key)
+        score = 0.0
+        if spec.method == "rrf":
+            if lexical_entry is not None:
+                score += spec.lexical_weight / (spec.rrf_k + lexical_entry[0])
+            if semantic_entry is not None:
+                score += spec.semantic_weight / (spec.rrf_k + semantic_entry[0])
+        else:
+            if lexical_entry is not None:
+                score += spec.lexical_weight * _normalized(
+                    lexical_entry[1].raw_score, lexical_bounds
+                )
+            if semantic_entry is not None:
+                score += spec.semantic_weight * _normalized(
+                    semantic_entry[1].raw_score, semantic_bounds
+                )
+        # Represent the fused hit by the semantic match when present, since its
+        # text is usually the more specific chunk.
+        primary = (semantic_entry or lexical_entry)[1]  # type: ignore[index]
+        fused.append(
+            FusedCandidate(
+                asset_id=primary.asset_id,
+                metadata_id=primary.metadata_id,
+                metadata_key_id=primary.metadata_key_id,
+                text=primary.text,
+                score=score,
+                lexical=lexical_entry[1] if lexical_entry else None,
+                semantic=semantic_entry[1] if semantic_entry else None,
+                lexical_rank=lexical_entry[0] if lexical_entry else None,
+                semantic_rank=semantic_entry[0] if semantic_entry else None,
+            )
+        )
+    return sort_fused(fused)
+
+
+def sort_fused(candidates: Sequence[FusedCandidate]) -> list[FusedCandidate]:
+    """Order fused candidates by score, breaking ties deterministically."""
+    return sorted(
+        candidates,
+        key=lambda c: (
+            -c.score,
+            min(c.lexical_rank or 10**9, c.semantic_rank or 10**9),
+            c.asset_id,
+            c.metadata_id or 0,
+        ),
+    )
+
+
+def boost_multiplier(signals: BoostSignals | None, *, spec: SearchFusionSpec) -> float:
+    """Return the combined recency/source multiplier for one asset."""
+    if signals is None:
+        return 1.0
+    multiplier = 1.0
+    if spec.source_boosts and signals.actor_id is not None:
+        multiplier *= float(spec.source_boosts.get(int(signals.actor_id), 1.0))
+    if spec.recency_boost > 0 and signals.age_days is not None:
+        age = max(0.0, float(signals.age_days))
+        decay = math.pow(0.5, age / float(spec.recency_half_life_days))
+        multiplier *= 1.0 + float(spec.recency_boost) * decay
+    return multiplier
+
+
+def apply_boosts(
+    candidates: Sequence[FusedCandidate],
+    signals_by_asset: Mapping[int, BoostSignals],
+    *,
+    spec: SearchFusionSpec,
+) -> list[FusedCandidate]:
+    """Scale fused scores by metadata-based boosts and re-sort."""
+    boosted = [
+        replace(
+            candidate,
+            score=candidate.score
+            * boost_multiplier(signals_by_asset.get(candidate.asset_id), spec=spec),
+        )
+        for candidate in candidates
+    ]
+    return sort_fused(boosted)
+
+
+def has_boosts(spec: SearchFusionSpec) -> bool:
+    return bool(spec.source_boosts) or spec.recency_boost > 0
@@ -1,13 +1,23 @@
 import os
+from dataclasses import asdict
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence
 from urllib.parse import urlparse
 
 from katalog.api.helpers import ApiError, requires_write_access
 from katalog.config import current_db_path, current_db_url, current_workspace
+from katalog.db.fts import get_fts_repo
 from katalog.db.system import get_system_repo
 from katalog.db.metadata import sync_config_db
 from katalog.plugins.registry import get_actor_instance
+from katalog.runtime.fts_maintenance import (
+    DEFAULT_MERGE_BUDGET_MS,
+    DEFAULT_MERGE_PAGES,
+    configure_fts_merge,
+    merge_fts_indexes,
+    optimize_fts_indexes,
+    resolve_fts_tables,
+)
 from katalog.sources.base import SourcePlugin
 
 
@@ -233,3 +243,52 @@ async def workspace_size_stats() -> dict[str, Any]:
             "largest_tables_by_size": largest_tables,
         },
     }
+
+
+async def _resolve_fts_tables_or_400(tables: Sequence[str] | None) -> list[str]:
+    try:
+        return await resolve_fts_tables(list(tables) if tables else None)
+    except ValueError as exc:
+        raise ApiError(status_code=400, detail=str(exc)) from exc
+
+
+async def fts_index_stats(tables: Sequence[str] | None = None) -> dict[str, Any]:
+    """Return per-table FTS5 segment statistics and merge settings."""
+    repo = get_fts_repo()
+    resolved = await _resolve_fts_tables_or_400(tables)
+    return {"tables": [asdict(await repo.table_stats(table)) for table in resolved]}
+
+
+@requires_write_access()
+async def fts_maintenance(
+    *,
+    action: str = "merge",
+    tables: Sequence[str] | None = None,
+    pages: int = DEFAULT_MERGE_PAGES,
+    budget_ms: int = DEFAULT_MERGE_BUDGET_MS,
+    automerge: int | None = None,
+    crisismerge: int | None = None,
+    usermerge: int | None = None,
+) -> dict[str, Any]:
+    """Run FTS maintenance: incremental `merge`, full `optimize`, or `configure` merge settings."""
+    resolved = await _resolve_fts_tables_or_400(tables)
+    if action == "merge":
+        results = await merge_fts_indexes(resolved, pages=pages, budget_ms=budget_ms)
+    elif action == "optimize":
+        results = await optimize_fts_indexes(resolved)
+    elif action == "configure":
+        if automerge is None and crisismerge is None and usermerge is None:
+            raise ApiError(
+                status_code=400,
+                detail="configure requires automerge, crisismerge or usermerge",
+            )
+        configured = await configure_fts_merge(
+            automerge=automerge,
+            crisismerge=crisismerge,
+            usermerge=usermerge,
+            tables=resolved,
+        )
+        return {"action": action, "tables": configured}
+    else:
+        raise ApiError(status_code=400, detail=f"Unsupported FTS maintenance action: {action}")
+    return {"action": action, "results": [asdict(result) for result in results]}
@@ -17,6 +17,7 @@ from katalog.help_texts import (
     METADATA_GROUP_HELP,
     PROCESSORS_GROUP_HELP,
     READ_ONLY_OPTION_HELP,
+    RELATIONS_GROUP_HELP,
     SERVER_COMMAND_HELP,
     VIEWS_GROUP_HELP,
     WORKFLOWS_GROUP_HELP,
@@ -110,6 +111,11 @@ async def views_app() -> None:
     """Views command group."""
 
 
+@app.group("relations", help=RELATIONS_GROUP_HELP)
+async def relations_app() -> None:
+    """Relations command group."""
+
+
 def _reset_workspace(ws: pathlib.Path) -> None:
     db_path = ws / "katalog.db"
     actors_dir = ws / "actors"
@@ -367,6 +373,7 @@ from . import processors as _processors  # noqa: E402,F401
 from . import workflows as _workflows  # noqa: E402,F401
 from . import metadata as _metadata  # noqa: E402,F401
 from . import views as _views  # noqa: E402,F401
+from . import relations as _relations  # noqa: E402,F401
 from . import system as _system  # noqa: E402,F401
 
 
@@ -93,6 +93,12 @@ async def show_actor(ctx: click.Context, actor_id: int) -> None:
     default=False,
     help="Skip running processors as part of the scan",
 )
+@click.option(
+    "--restart",
+    is_flag=True,
+    default=False,
+    help="Start over instead of resuming an interrupted scan",
+)
 @click.option(
     "--benchmark",
     is_flag=True,
@@ -106,6 +112,7 @@ async def run_actor(
     reset_workspace: bool,
     workflow_file: str | None,
     skip_processors: bool,
+    restart: bool,
     benchmark: bool,
 ) -> None:
     """Run a source scan for the given actor id without starting the server."""
@@ -125,6 +132,7 @@ async def run_actor(
         actor_id,
         finalize=True,
         run_processors=not skip_processors,
+        restart=restart,
     )
 
     max_rss_mb = None
@@ -152,6 +160,58 @@ async def run_actor(
         click.echo("Deleted: yes")
 
 
+@actors_app.command("watch")
+@click.argument("actor_id", type=int)
+@click.option(
+    "--skip-processors",
+    is_flag=True,
+    default=False,
+    help="Skip running processors on changed files",
+)
+@click.option(
+    "--no-initial-rescan",
+    is_flag=True,
+    default=False,
+    help="Do not rescan the source once before watching for changes",
+)
+@with_lifespan()
+async def watch_actor(
+    ctx: click.Context,
+    actor_id: int,
+    skip_processors: bool,
+    no_initial_rescan: bool,
+) -> None:
+    """Watch a filesystem source and ingest changes until interrupted."""
+    from katalog.api.operations import watch_source
+
+    async def _report(changeset: Any) -> None:
+        summary = changeset_summary(changeset)
+        summary["watch"] = (changeset.data or {}).get("watch")
+        if wants_json(ctx):
+            click.echo(json.dumps(summary, default=str))
+            return
+        watch = summary["watch"] or {}
+        stats = changeset.stats
+        click.echo(
+            f"Changeset {summary['id']} {summary['status']}: "
+            f"{watch.get('changed_paths', 0)} changed, "
+            f"{watch.get('removed_paths', 0)} removed"
+            + (" (rescan)" if watch.get("overflow") else "")
+            + (
+                f", {stats.assets_saved} saved, {stats.assets_lost} lost"
+                if stats is not None
+                else ""
+            )
+        )
+
+    await watch_source(
+        actor_id,
+        run_processors=not skip_processors,
+        initial_rescan=not no_initial_rescan,
+        on_changeset=_report,
+    )
+
+
 @actors_app.command("authorize")
 @click.argument("actor_id", type=int)
 @with_lifespan()
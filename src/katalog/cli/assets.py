@@ -123,3 +123,39 @@ async def get_asset_cli(
     click.echo(f"Actor ID: {row.get('asset/actor_id') or '-'}")
     metadata_keys = [key for key in row.keys() if not key.startswith("asset/")]
     click.echo(f"Metadata keys: {len(metadata_keys)}")
+
+
+@assets_app.command("merge")
+@click.argument("canonical_asset_id", type=int)
+@click.argument("asset_ids", type=int, nargs=-1, required=True)
+@with_lifespan()
+async def merge_assets_cli(
+    ctx: click.Context,
+    canonical_asset_id: int,
+    asset_ids: tuple[int, ...],
+) -> None:
+    """Merge assets into the merge set of CANONICAL_ASSET_ID."""
+    from katalog.api.assets import AssetMerge, merge_assets
+
+    result = await merge_assets(
+        AssetMerge(canonical_asset_id=canonical_asset_id, asset_ids=list(asset_ids))
+    )
+    if wants_json(ctx):
+        click.echo(json.dumps(result))
+        return
+    click.echo(f"Merged {result['merged']} assets into {result['canonical_asset_id']}")
+    click.echo("Merge set: " + ", ".join(str(asset_id) for asset_id in result["asset_ids"]))
+
+
+@assets_app.command("unmerge")
+@click.argument("asset_ids", type=int, nargs=-1, required=True)
+@with_lifespan()
+async def unmerge_assets_cli(ctx: click.Context, asset_ids: tuple[int, ...]) -> None:
+    """Detach assets from their merge sets."""
+    from katalog.api.assets import AssetUnmerge, unmerge_assets
+
+    result = await unmerge_assets(AssetUnmerge(asset_ids=list(asset_ids)))
+    if wants_json(ctx):
+        click.echo(json.dumps(result))
+        return
+    click.echo(f"Unmerged {result['unmerged']} assets")
@@ -1,6 +1,6 @@
 import json
 import re
-from typing import Any
+from typing import Any, Literal, cast
 
 import asyncclick as click
 
@@ -89,6 +89,20 @@ def _text_preview(value: str, *, max_len: int = 90) -> str:
 )
 @click.option("--embedding-model", type=str, default="fast", show_default=True)
 @click.option("--embedding-backend", type=str, default="preset", show_default=True)
+@click.option(
+    "--fts-index",
+    type=int,
+    default=None,
+    help="Full-text index actor id for the lexical side of hybrid mode.",
+)
+@click.option(
+    "--fusion",
+    type=click.Choice(["rrf", "weighted"]),
+    default=None,
+    help="Hybrid rank fusion method (defaults to the view setting, else rrf).",
+)
+@click.option("--lexical-weight", type=click.FloatRange(min=0.0), default=None)
+@click.option("--semantic-weight", type=click.FloatRange(min=0.0), default=None)
 @click.option(
     "--view-id",
     type=str,
@@ -113,6 +127,10 @@ async def list_metadata(
     dimension: int,
     embedding_model: str,
     embedding_backend: str,
+    fts_index: int | None,
+    fusion: str | None,
+    lexical_weight: float | None,
+    semantic_weight: float | None,
     view_id: str,
 ) -> None:
     """List metadata rows, with optional semantic/hybrid ranking."""
@@ -144,6 +162,10 @@ async def list_metadata(
         search_dimension=dimension,
         search_embedding_model=embedding_model,
         search_embedding_backend=embedding_backend,
+        search_fts_index=fts_index,
+        search_fusion=cast(Literal["rrf", "weighted"] | None, fusion),
+        search_lexical_weight=lexical_weight,
+        search_semantic_weight=semantic_weight,
         metadata_actor_ids=list(actor_ids) or None,
         metadata_include_removed=include_removed,
         metadata_aggregation=agg,
@@ -160,6 +182,9 @@ async def list_metadata(
     stats = result.get("stats", {})
     click.echo(f"Rows: {stats.get('returned', len(items))} / {stats.get('total', '-')}")
     click.echo(f"Duration: {stats.get('duration_ms', '-')}ms")
+    stages = stats.get("stages_ms") or {}
+    if stages:
+        click.echo("Stages: " + ", ".join(f"{name}={ms}ms" for name, ms in stages.items()))
     if not items:
         click.echo("No metadata rows found")
         return
@@ -187,3 +212,67 @@ async def list_metadata(
         for item in items
     ]
     render_table(rows, ["Asset", "Key", "Value", "Actor"], ["asset_id", "key", "value", "actor_id"])
+
+
+@metadata_app.group("trigram")
+async def trigram_app() -> None:
+    """Manage the trigram index behind substring metadata filters."""
+
+
+def _echo_trigram_status(ctx: click.Context, status: dict[str, Any]) -> None:
+    if wants_json(ctx):
+        click.echo(json.dumps(status, default=str))
+        return
+    keys = status.get("metadata_keys") or []
+    click.echo(f"Keys: {', '.join(keys) if keys else '-'}")
+    click.echo(f"Indexed rows: {status.get('indexed_rows', 0)}")
+    if status.get("duration_ms") is not None:
+        click.echo(f"Duration: {status['duration_ms']}ms")
+
+
+@trigram_app.command("build")
+@click.option(
+    "--metadata-key",
+    "metadata_keys",
+    multiple=True,
+    help="String metadata key to index (repeatable). Defaults to path, filename and title.",
+)
+@click.option(
+    "--rebuild",
+    is_flag=True,
+    default=False,
+    help="Drop existing index rows and re-index; given keys replace the configured set.",
+)
+@with_lifespan()
+async def build_trigram(
+    ctx: click.Context,
+    metadata_keys: tuple[str, ...],
+    rebuild: bool,
+) -> None:
+    """Build or rebuild the trigram index for contains/startsWith/endsWith filters."""
+    from katalog.api.metadata import build_trigram_index
+
+    status = await build_trigram_index(list(metadata_keys) or None, rebuild=rebuild)
+    _echo_trigram_status(ctx, status)
+
+
+@trigram_app.command("status")
+@with_lifespan(runtime_mode="fast_read")
+async def trigram_status(ctx: click.Context) -> None:
+    """Show which metadata keys are covered by the trigram index."""
+    from katalog.api.metadata import trigram_index_status
+
+    _echo_trigram_status(ctx, await trigram_index_status())
+
+
+@trigram_app.command("drop")
+@with_lifespan()
+async def drop_trigram(ctx: click.Context) -> None:
+    """Drop the trigram index (substring filters fall back to LIKE scans)."""
+    from katalog.api.metadata import drop_trigram_index
+
+    await drop_trigram_index()
+    if wants_json(ctx):
+        click.echo(json.dumps({"status": "ok"}))
+        return
+    click.echo("Trigram index dropped")
@@ -0,0 +1,144 @@
+import json
+
+import asyncclick as click
+
+from . import relations_app
+from .utils import render_table, wants_json, with_lifespan
+
+_KEY_OPTION_HELP = "Follow only relations with this metadata key (repeatable)."
+
+
+def _render_assets(response) -> None:  # noqa: ANN001
+    if not response.assets:
+        click.echo("No related assets found")
+        return
+    rows = [
+        {
+            "asset_id": str(item.asset_id),
+            "depth": "-" if item.depth is None else str(item.depth),
+        }
+        for item in response.assets
+    ]
+    render_table(rows, ["Asset", "Depth"], ["asset_id", "depth"])
+    if response.truncated:
+        click.echo("(truncated; raise --limit to see more)")
+
+
+@relations_app.command("neighbors")
+@click.argument("asset_id", type=int)
+@click.option(
+    "--direction",
+    type=click.Choice(["out", "in", "both"]),
+    default="both",
+    show_default=True,
+)
+@click.option("--metadata-key", "metadata_keys", multiple=True, help=_KEY_OPTION_HELP)
+@click.option("--limit", "-l", type=click.IntRange(min=1, max=10000), default=100, show_default=True)
+@with_lifespan(runtime_mode="fast_read")
+async def list_neighbors(
+    ctx: click.Context,
+    asset_id: int,
+    direction: str,
+    metadata_keys: tuple[str, ...],
+    limit: int,
+) -> None:
+    """List relation edges of one asset."""
+    from katalog.api.relations import list_relation_neighbors
+
+    response = await list_relation_neighbors(
+        asset_id,
+        direction=direction,
+        metadata_keys=list(metadata_keys) or None,
+        limit=limit,
+    )
+    if wants_json(ctx):
+        click.echo(json.dumps(response.model_dump(mode="json")))
+        return
+
+    if not response.edges:
+        click.echo("No relations found")
+        return
+    rows = [
+        {
+            "from": str(edge.from_asset_id),
+            "key": edge.metadata_key,
+            "to": str(edge.to_asset_id),
+            "actors": ",".join(str(actor_id) for actor_id in edge.actor_ids),
+        }
+        for edge in response.edges
+    ]
+    render_table(rows, ["From", "Key", "To", "Actors"], ["from", "key", "to", "actors"])
+
+
+@relations_app.command("traverse")
+@click.argument("asset_id", type=int)
+@click.option("--depth", "max_depth", type=click.IntRange(min=1, max=10), default=2, show_default=True)
+@click.option(
+    "--direction",
+    type=click.Choice(["out", "in", "both"]),
+    default="both",
+    show_default=True,
+)
+@click.option("--metadata-key", "metadata_keys", multiple=True, help=_KEY_OPTION_HELP)
+@click.option("--limit", "-l", type=click.IntRange(min=1, max=10000), default=1000, show_default=True)
+@with_lifespan(runtime_mode="fast_read")
+async def traverse(
+    ctx: click.Context,
+    asset_id: int,
+    max_depth: int,
+    direction: str,
+    metadata_keys: tuple[str, ...],
+    limit: int,
+) -> None:
+    """List assets within a number of relation hops, nearest first."""
+    from katalog.api.relations import traverse_relations
+
+    response = await traverse_relations(
+        asset_id,
+        max_depth=max_depth,
+        direction=direction,
+        metadata_keys=list(metadata_keys) or None,
+        limit=limit,
+    )
+    if wants_json(ctx):
+        click.echo(json.dumps(response.model_dump(mode="json")))
+        return
+    _render_assets(response)
+
+
+@relations_app.command("component")
+@click.argument("asset_id", type=int)
+@click.option("--metadata-key", "metadata_keys", multiple=True, help=_KEY_OPTION_HELP)
+@click.option("--limit", "-l", type=click.IntRange(min=1, max=10000), default=1000, show_default=True)
+@with_lifespan(runtime_mode="fast_read")
+async def component(
+    ctx: click.Context,
+    asset_id: int,
+    metadata_keys: tuple[str, ...],
+    limit: int,
+) -> None:
+    """List every asset connected to an asset, ignoring edge direction."""
+    from katalog.api.relations import relation_component
+
+    response = await relation_component(
+        asset_id,
+        metadata_keys=list(metadata_keys) or None,
+        limit=limit,
+    )
+    if wants_json(ctx):
+        click.echo(json.dumps(response.model_dump(mode="json")))
+        return
+    _render_assets(response)
+
+
+@relations_app.command("rebuild")
+@with_lifespan()
+async def rebuild(ctx: click.Context) -> None:
+    """Recreate the relation edge index from metadata history."""
+    from katalog.api.relations import rebuild_relations
+
+    result = await rebuild_relations()
+    if wants_json(ctx):
+        click.echo(json.dumps(result))
+        return
+    click.echo(f"Indexed {result['edges']} relation edges")
@@ -78,3 +78,127 @@ async def workspace_stats(ctx: click.Context) -> None:
             if rows:
                 click.echo("Indexes")
                 render_table(rows, ["Index", "Size"], ["name", "size"])
+
+
+@app.group("fts")
+async def fts_app() -> None:
+    """Full-text index maintenance (segment stats, merge, optimize)."""
+
+
+@fts_app.command("stats")
+@click.option("--table", "tables", multiple=True, help="FTS table name (repeatable).")
+@with_lifespan(runtime_mode="fast_read")
+async def fts_stats(ctx: click.Context, tables: tuple[str, ...]) -> None:
+    """Show per-table FTS5 segment statistics."""
+    from katalog.api.system import fts_index_stats
+
+    stats = await fts_index_stats(list(tables) or None)
+    if wants_json(ctx):
+        click.echo(json.dumps(stats, default=str))
+        return
+    rows = [
+        {
+            "table": str(table["table"]),
+            "segments": str(table["segments"]),
+            "levels": ",".join(str(count) for count in table["segments_per_level"]) or "-",
+            "pages": str(table["pages"]),
+            "size": format_bytes(table["data_bytes"]),
+            "settings": ", ".join(f"{k}={v}" for k, v in table["settings"].items()) or "-",
+        }
+        for table in stats["tables"]
+    ]
+    if not rows:
+        click.echo("No FTS tables found")
+        return
+    render_table(
+        rows,
+        ["Table", "Segments", "Per level", "Pages", "Size", "Settings"],
+        ["table", "segments", "levels", "pages", "size", "settings"],
+    )
+
+
+def _echo_fts_results(ctx: click.Context, result: dict[str, Any]) -> None:
+    if wants_json(ctx):
+        click.echo(json.dumps(result, default=str))
+        return
+    rows = [
+        {
+            "table": str(item["table"]),
+            "segments": f"{item['segments_before']} -> {item['segments_after']}",
+            "steps": str(item["steps"]),
+            "duration": f"{item['duration_ms']}ms",
+            "complete": "yes" if item["complete"] else "no",
+        }
+        for item in result.get("results", [])
+    ]
+    if not rows:
+        click.echo("No FTS tables found")
+        return
+    render_table(
+        rows,
+        ["Table", "Segments", "Steps", "Duration", "Complete"],
+        ["table", "segments", "steps", "duration", "complete"],
+    )
+
+
+@fts_app.command("merge")
+@click.option("--table", "tables", multiple=True, help="FTS table name (repeatable).")
+@click.option("--pages", type=click.IntRange(min=1), default=500, show_default=True)
+@click.option(
+    "--budget-ms",
+    type=click.IntRange(min=0),
+    default=2000,
+    show_default=True,
+    help="Stop after this much time; rerun to continue.",
+)
+@with_lifespan()
+async def fts_merge(
+    ctx: click.Context, tables: tuple[str, ...], pages: int, budget_ms: int
+) -> None:
+    """Run incremental FTS5 merge steps within a time budget."""
+    from katalog.api.system import fts_maintenance
+
+    result = await fts_maintenance(
+        action="merge", tables=list(tables) or None, pages=pages, budget_ms=budget_ms
+    )
+    _echo_fts_results(ctx, result)
+
+
+@fts_app.command("optimize")
+@click.option("--table", "tables", multiple=True, help="FTS table name (repeatable).")
+@with_lifespan()
+async def fts_optimize(ctx: click.Context, tables: tuple[str, ...]) -> None:
+    """Merge each FTS table into a single segment."""
+    from katalog.api.system import fts_maintenance
+
+    result = await fts_maintenance(action="optimize", tables=list(tables) or None)
+    _echo_fts_results(ctx, result)
+
+
+@fts_app.command("configure")
+@click.option("--table", "tables", multiple=True, help="FTS table name (repeatable).")
+@click.option("--automerge", type=click.IntRange(min=0, max=16), default=None)
+@click.option("--crisismerge", type=click.IntRange(min=2), default=None)
+@click.option("--usermerge", type=click.IntRange(min=2, max=16), default=None)
+@with_lifespan()
+async def fts_configure(
+    ctx: click.Context,
+    tables: tuple[str, ...],
+    automerge: int | None,
+    crisismerge: int | None,
+    usermerge: int | None,
+) -> None:
+    """Persist FTS5 automerge/crisismerge/usermerge settings."""
+    from katalog.api.system import fts_maintenance
+
+    result = await fts_maintenance(
+        action="configure",
+        tables=list(tables) or None,
+        automerge=automerge,
+        crisismerge=crisismerge,
+        usermerge=usermerge,
+    )
+    if wants_json(ctx):
+        click.echo(json.dumps(result, default=str))
+        return
+    click.echo(f"Configured: {', '.join(result['tables']) or '-'}")
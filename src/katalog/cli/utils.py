@@ -130,12 +130,16 @@ def print_changeset_summary(
         scan_seconds = scan_metrics.get("scan_seconds")
         if scan_seconds is not None:
             click.echo(f"Scan time: {scan_seconds:.2f}s")
+        files_per_second = scan_metrics.get("files_per_second")
+        if files_per_second is not None:
+            click.echo(f"Files/s: {files_per_second:.1f}")
         for key, title in [
             ("assets_seen", "Assets seen"),
             ("assets_saved", "Assets saved"),
             ("assets_added", "Assets added"),
             ("assets_changed", "Assets changed"),
             ("assets_ignored", "Assets ignored"),
+            ("assets_unchanged", "Assets unchanged"),
             ("assets_lost", "Assets lost"),
         ]:
             value = scan_metrics.get(key)
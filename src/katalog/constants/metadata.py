@@ -305,6 +305,13 @@ FILE_THUMBNAIL_URI = define_metadata(
     "file/thumbnail_link", MetadataType.STRING, "Thumbnail URI"
 )
 FILE_URI = define_metadata("file/uri", MetadataType.STRING, "URI")
+# Raw validator headers, echoed back in conditional requests on the next scan.
+HTTP_ETAG = define_metadata(
+    "http/etag", MetadataType.STRING, "ETag", searchable=False
+)
+HTTP_LAST_MODIFIED = define_metadata(
+    "http/last_modified", MetadataType.STRING, "Last-Modified header", searchable=False
+)
 SOURCE_JSON_RECORD = define_metadata(
     "source/json_record",
     MetadataType.JSON,
@@ -466,6 +473,12 @@ FLAG_TRASHED = define_metadata(
 # Hashes often represented as strings; some fingerprints are lists/maps
 HASH_MD5 = define_metadata("hash/md5", MetadataType.STRING, "MD5 Hash", width=200)
 HASH_SHA1 = define_metadata("hash/sha1", MetadataType.STRING, "SHA1 Hash")
+HASH_SAMPLE = define_metadata(
+    "hash/sample",
+    MetadataType.STRING,
+    "Sample hash",
+    "Hash of the size and head/middle/tail samples; equal files always match",
+)
 HASH_MINHASH = define_metadata(
     "fingerprint/minhash", MetadataType.JSON, "MinHash fingerprint"
 )
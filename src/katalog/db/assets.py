@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Protocol, Sequence, TYPE_CHECKING
 
+from katalog.constants.metadata import FILE_PATH, MetadataKey
 from katalog.db.sqlspec.assets import SqlspecAssetRepo
 from katalog.models.assets import Asset
 from katalog.models.query import AssetQuery
@@ -45,6 +46,24 @@ class AssetRepo(Protocol):
         actor_ids: Sequence[int],
         seen_asset_ids: Sequence[int] | None = None,
     ) -> int: ...
+    async def mark_assets_lost(
+        self,
+        *,
+        changeset: Any,
+        actor_id: int,
+        asset_ids: Sequence[int],
+    ) -> int: ...
+    async def delete_assets(self, asset_ids: Sequence[int]) -> int: ...
+    async def release_external_id(self, asset_id: int) -> None:
+        """Move the asset to a retired external id so a new asset can claim its own."""
+        ...
+    async def list_asset_ids_for_paths(
+        self,
+        *,
+        actor_id: int,
+        paths: Sequence[str],
+        key: MetadataKey = FILE_PATH,
+    ) -> list[int]: ...
     async def count_assets_for_query(
         self,
         *,
@@ -56,6 +75,12 @@ class AssetRepo(Protocol):
         query: AssetQuery,
     ) -> list[int]: ...
     async def existing_asset_ids(self, asset_ids: Sequence[int]) -> set[int]: ...
+    async def list_boost_signals(
+        self,
+        asset_ids: Sequence[int],
+        *,
+        modified_key_id: int,
+    ) -> dict[int, dict[str, Any]]: ...
     async def list_assets_for_view_db(
         self,
         view: ViewSpec,
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import Any, Collection, Protocol, Sequence
+
+
+class CanonicalRepo(Protocol):
+    """Merge sets of assets, resolved to one flat asset -> root mapping.
+
+    The first asset of a merged group is its canonical asset; merging into a
+    group that is already merged joins the whole set to the root of the
+    first asset's set, so chains never form.
+    """
+
+    async def merge_groups(
+        self, groups: Sequence[Sequence[int]], *, session: Any | None = None
+    ) -> int:
+        """Merge each group of asset ids; returns the number of assets whose root changed."""
+        ...
+
+    async def unmerge(
+        self, asset_ids: Collection[int], *, session: Any | None = None
+    ) -> int:
+        """Detach assets from their merge sets; the rest of each set stays merged."""
+        ...
+
+    async def remove_assets(self, asset_ids: Collection[int], *, session: Any) -> None:
+        """Detach assets that are about to be deleted."""
+        ...
+
+    async def sync_asset(
+        self, asset_id: int, canonical_asset_id: int | None, *, session: Any
+    ) -> None:
+        """Follow a `canonical_asset_id` written directly on an asset row."""
+        ...
+
+    async def effective_ids(self, asset_ids: Collection[int]) -> dict[int, int]: ...
+
+    async def members(self, asset_id: int) -> list[int]:
+        """All assets of an asset's merge set, root first."""
+        ...
+
+    async def has_merges(self, *, session: Any | None = None) -> bool: ...
+
+    async def rebuild(self) -> int:
+        """Resolve `assets.canonical_asset_id` links from scratch. Returns merged assets."""
+        ...
+
+    async def ensure_backfilled(self) -> bool: ...
+
+
+def get_canonical_repo() -> CanonicalRepo:
+    from katalog.db.sqlspec.canonical import SqlspecCanonicalRepo
+
+    return SqlspecCanonicalRepo()
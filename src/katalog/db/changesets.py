@@ -18,6 +18,12 @@ class ChangesetRepo(Protocol):
         **filters: Any,
     ) -> list[Changeset]: ...
     async def list_for_actor(self, actor_id: int) -> list[Changeset]: ...
+    async def latest_source_state(self, actor_id: int) -> dict[str, Any] | None:
+        """Return the source state committed by the actor's latest completed changeset."""
+        ...
+    async def latest_analyzer_state(self, actor_id: int) -> dict[str, Any] | None:
+        """Return the analyzer state committed by the actor's latest completed changeset."""
+        ...
     async def begin(
         self,
         *,
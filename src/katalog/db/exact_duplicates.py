@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Collection, Mapping, Protocol
+
+
+@dataclass(frozen=True)
+class IndexedHash:
+    md5: str
+    # Actors whose current hash/md5 value is `md5`.
+    actor_ids: tuple[int, ...] = ()
+
+
+@dataclass(frozen=True)
+class HashGroup:
+    md5: str
+    asset_ids: list[int] = field(default_factory=list)
+    actor_ids: list[int] = field(default_factory=list)
+
+
+class ExactDuplicateRepo(Protocol):
+    async def clear(self, *, actor_id: int) -> None:
+        """Drop the whole index of an analyzer actor before a full rebuild."""
+        ...
+
+    async def hashes_for(
+        self, *, actor_id: int, asset_ids: Collection[int]
+    ) -> dict[int, IndexedHash]: ...
+
+    async def replace(
+        self, *, actor_id: int, hashes: Mapping[int, IndexedHash | None]
+    ) -> None:
+        """Store the current hash of each asset; `None` removes the asset from the index."""
+        ...
+
+    async def group_sizes(
+        self, *, actor_id: int, md5s: Collection[str]
+    ) -> dict[str, int]: ...
+
+    async def groups(
+        self,
+        *,
+        actor_id: int,
+        md5s: Collection[str] | None = None,
+        min_size: int = 2,
+        limit: int | None = None,
+    ) -> list[HashGroup]:
+        """Assets by hash, largest groups first.
+
+        Without `md5s` every hash shared by at least `min_size` assets is
+        returned.
+        """
+        ...
+
+
+def get_exact_duplicate_repo() -> ExactDuplicateRepo:
+    from katalog.db.sqlspec.exact_duplicates import SqlspecExactDuplicateRepo
+
+    return SqlspecExactDuplicateRepo()
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Collection, Protocol, Sequence
+
+
+@dataclass(frozen=True)
+class AssetFingerprint:
+    actor_id: int
+    asset_id: int
+    # Source-defined 64-bit digest of cheap change signals (size, mtime, ...).
+    fingerprint: int
+    # Digest of the processor pipeline that last processed the asset without errors.
+    pipeline_key: int = 0
+
+
+class FingerprintRepo(Protocol):
+    async def load(self, *, actor_id: int, namespace: str) -> dict[str, tuple[int, int]]:
+        """Return external_id -> (asset_id, fingerprint) for one actor and namespace."""
+        ...
+
+    async def record(self, fingerprints: Sequence[AssetFingerprint]) -> None: ...
+
+    async def settled(self, asset_ids: Collection[int], *, pipeline_key: int) -> set[int]:
+        """Return the assets last processed by the pipeline `pipeline_key`."""
+        ...
+
+    async def settle(self, asset_ids: Collection[int], *, pipeline_key: int) -> None:
+        """Record that unchanged assets were processed by the pipeline `pipeline_key`."""
+        ...
+
+    async def forget(self, asset_ids: Collection[int]) -> None: ...
+
+    async def forget_unseen(self, *, actor_id: int, seen_asset_ids: Collection[int]) -> int:
+        """Drop fingerprints of assets not seen in a scan, so they take the full path next time."""
+        ...
+
+
+def get_fingerprint_repo() -> FingerprintRepo:
+    from katalog.db.sqlspec.fingerprints import SqlspecFingerprintRepo
+
+    return SqlspecFingerprintRepo()
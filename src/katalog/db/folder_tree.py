@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Collection, Protocol, Sequence
+
+
+@dataclass(frozen=True)
+class SourceFolder:
+    """One folder of a source's remote tree (e.g. a Google Drive folder)."""
+
+    folder_id: str
+    name: str
+    # None for a root; sources with multi-parent folders store the first parent.
+    parent_id: str | None = None
+
+
+@dataclass(frozen=True)
+class FolderPath:
+    # "/"-joined names and ids from the root down to and including the folder.
+    name_path: str
+    id_path: str
+
+
+@dataclass
+class FolderPathResolution:
+    paths: dict[str, FolderPath] = field(default_factory=dict)
+    # Folder ids (requested or ancestors) not stored yet; fetch, save and resolve again.
+    missing: set[str] = field(default_factory=set)
+
+
+class FolderTreeRepo(Protocol):
+    async def save(self, *, actor_id: int, folders: Sequence[SourceFolder]) -> set[str]:
+        """Insert or update folders.
+
+        Returns the ids of stored folders that were renamed or moved; the
+        memoized paths of their whole subtree are reset.
+        """
+        ...
+
+    async def resolve_paths(
+        self, *, actor_id: int, folder_ids: Collection[str]
+    ) -> FolderPathResolution:
+        """Return folder paths, walking up level by level only until a memoized ancestor.
+
+        Newly computed paths are memoized for the folders and their ancestors.
+        """
+        ...
+
+    async def delete(self, *, actor_id: int, folder_ids: Collection[str]) -> None:
+        """Drop folders together with every memoized folder below them."""
+        ...
+
+    async def count(self, *, actor_id: int) -> int: ...
+
+
+def get_folder_tree_repo() -> FolderTreeRepo:
+    from katalog.db.sqlspec.folder_tree import SqlspecFolderTreeRepo
+
+    return SqlspecFolderTreeRepo()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Protocol, Sequence
 
 
@@ -19,6 +19,19 @@ class FtsSearchHit:
     rank: float | None
 
 
+@dataclass(frozen=True)
+class FtsTableStats:
+    """Segment layout of one FTS5 table, decoded from its structure record."""
+
+    table: str
+    segments_per_level: list[int] = field(default_factory=list)
+    segments: int = 0
+    pages: int = 0
+    data_bytes: int = 0
+    write_counter: int = 0
+    settings: dict[str, int] = field(default_factory=dict)
+
+
 class FtsRepo(Protocol):
     async def is_ready(self) -> tuple[bool, str | None]: ...
 
@@ -42,8 +55,26 @@ class FtsRepo(Protocol):
         offset: int = 0,
         asset_ids: Sequence[int] | None = None,
         metadata_key_ids: Sequence[int] | None = None,
+        with_total: bool = True,
     ) -> tuple[list[FtsSearchHit], int]: ...
 
+    async def list_index_tables(self) -> list[str]: ...
+
+    async def table_stats(self, table: str) -> FtsTableStats: ...
+
+    async def configure_merge(
+        self,
+        table: str,
+        *,
+        automerge: int | None = None,
+        crisismerge: int | None = None,
+        usermerge: int | None = None,
+    ) -> None: ...
+
+    async def merge_step(self, table: str, *, pages: int) -> bool: ...
+
+    async def optimize(self, table: str) -> None: ...
+
 
 def get_fts_repo() -> FtsRepo:
     from katalog.db.sqlspec.fts import SqlspecFtsRepo
@@ -46,6 +46,11 @@ class MetadataRepo(Protocol):
         *,
         session: Any | None = None,
     ) -> tuple[int, int, int]: ...
+    async def changeset_changes(
+        self, changeset_id: int
+    ) -> tuple[list[int], list[int]]:
+        """Asset ids and metadata key ids written by a changeset, both sorted."""
+        ...
     async def list_active_collection_asset_ids(
         self,
         *,
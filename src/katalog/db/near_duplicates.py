@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Collection, Protocol, Sequence
+
+
+@dataclass(frozen=True)
+class NearDuplicateSignature:
+    asset_id: int
+    minhash: tuple[int, ...] | None = None
+    simhash: int | None = None
+    # LSH keys `(kind, band, bucket)`; assets sharing a key are candidate pairs.
+    bands: Sequence[tuple[str, int, int]] = field(default=(), compare=False)
+
+
+@dataclass(frozen=True)
+class NearDuplicatePair:
+    # Stored once per pair, with asset_id > other_id.
+    asset_id: int
+    other_id: int
+    similarity: float
+
+
+class NearDuplicateRepo(Protocol):
+    async def index(
+        self, *, actor_id: int, signatures: Sequence[NearDuplicateSignature]
+    ) -> None:
+        """Replace the stored signatures and bands of these assets and mark them dirty."""
+        ...
+
+    async def remove(
+        self, *, actor_id: int, asset_ids: Collection[int]
+    ) -> list[NearDuplicatePair]:
+        """Drop assets from the index and return the pairs that involved them."""
+        ...
+
+    async def dirty_asset_ids(self, *, actor_id: int) -> list[int]:
+        """Assets indexed by a run that did not finish verifying their pairs."""
+        ...
+
+    async def candidate_pairs(
+        self, *, actor_id: int, asset_ids: Collection[int], max_bucket_size: int
+    ) -> set[tuple[int, int]]:
+        """Return `(asset_id, other_id)` pairs sharing a band with one of `asset_ids`.
+
+        Each pair is reported for exactly one of its dirty assets (the other
+        side is clean, or the larger id), so probing every dirty asset once
+        visits every affected pair once. Buckets with more than
+        `max_bucket_size` members are skipped.
+        """
+        ...
+
+    async def pairs_for(
+        self, *, actor_id: int, asset_ids: Collection[int]
+    ) -> dict[tuple[int, int], float]:
+        """Stored pairs owned by `asset_ids` under the `candidate_pairs` rule.
+
+        Keys are `(probe, other)` as `candidate_pairs` would report them.
+        """
+        ...
+
+    async def signatures(
+        self, *, actor_id: int, asset_ids: Collection[int]
+    ) -> dict[int, NearDuplicateSignature]: ...
+
+    async def save_pairs(
+        self,
+        *,
+        actor_id: int,
+        added: Sequence[NearDuplicatePair],
+        removed: Collection[tuple[int, int]],
+        verified_asset_ids: Collection[int],
+    ) -> None:
+        """Apply pair changes and clear the dirty flag of the verified assets."""
+        ...
+
+
+def get_near_duplicate_repo() -> NearDuplicateRepo:
+    from katalog.db.sqlspec.near_duplicates import SqlspecNearDuplicateRepo
+
+    return SqlspecNearDuplicateRepo()
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Collection, Literal, Protocol, Sequence
+
+if TYPE_CHECKING:
+    from katalog.models.metadata import Metadata
+
+RelationDirection = Literal["out", "in", "both"]
+
+# Traversals stop here even when callers ask for more; relation graphs may
+# contain cycles and dense hubs.
+MAX_TRAVERSAL_DEPTH = 10
+MAX_TRAVERSAL_RESULTS = 10_000
+# Upper bound on rows the recursive walk may generate before it is cut off.
+MAX_TRAVERSAL_ROWS = 200_000
+
+
+@dataclass(frozen=True)
+class RelationEdge:
+    from_asset_id: int
+    metadata_key_id: int
+    to_asset_id: int
+    # Actors currently asserting the edge.
+    actor_ids: tuple[int, ...] = ()
+
+
+@dataclass(frozen=True)
+class RelatedAsset:
+    asset_id: int
+    # Fewest hops from the start asset; None for component members.
+    depth: int | None = None
+
+
+@dataclass(frozen=True)
+class Traversal:
+    assets: list[RelatedAsset]
+    # True when a result or row limit cut the walk short.
+    truncated: bool = False
+
+
+class RelationRepo(Protocol):
+    async def apply(self, metadata: Sequence["Metadata"], *, session: Any) -> int:
+        """Apply relation metadata rows, in write order, to the edge table."""
+        ...
+
+    async def remove_assets(self, asset_ids: Sequence[int], *, session: Any) -> None: ...
+
+    async def rebuild(self) -> int:
+        """Recreate all edges from the metadata history. Returns the edge count."""
+        ...
+
+    async def ensure_backfilled(self) -> bool:
+        """Rebuild once when relations exist in metadata but not as edges."""
+        ...
+
+    async def count(self) -> int: ...
+
+    async def neighbors(
+        self,
+        asset_id: int,
+        *,
+        direction: RelationDirection = "both",
+        key_ids: Collection[int] | None = None,
+        limit: int = 100,
+    ) -> list[RelationEdge]: ...
+
+    async def traverse(
+        self,
+        asset_id: int,
+        *,
+        max_depth: int,
+        direction: RelationDirection = "both",
+        key_ids: Collection[int] | None = None,
+        limit: int = 1000,
+    ) -> Traversal:
+        """Assets reachable within `max_depth` hops, nearest first; excludes the start."""
+        ...
+
+    async def component(
+        self,
+        asset_id: int,
+        *,
+        key_ids: Collection[int] | None = None,
+        limit: int = 1000,
+    ) -> Traversal:
+        """The connected component of an asset, ignoring edge direction."""
+        ...
+
+
+def get_relation_repo() -> RelationRepo:
+    from katalog.db.sqlspec.relations import SqlspecRelationRepo
+
+    return SqlspecRelationRepo()
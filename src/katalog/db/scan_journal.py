@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Collection, Literal, Protocol
+
+ScanSessionStatus = Literal["scanning", "scanned"]
+
+
+@dataclass
+class ScanSession:
+    """Journal entry for one source actor's unfinished full scan."""
+
+    id: int
+    actor_id: int
+    changeset_id: int | None
+    # "scanned" once the source iterator was exhausted; only finalization is left.
+    status: ScanSessionStatus
+    # Source-defined resume cursor from the last checkpoint (None: start over).
+    cursor: dict[str, Any] | None
+    started_at: datetime | None = None
+    updated_at: datetime | None = None
+    # actor_id -> asset ids already persisted by this scan, including recursion.
+    seen_asset_ids: dict[int, set[int]] = field(default_factory=dict)
+    # True when the session was left behind by an interrupted run.
+    resumed: bool = False
+
+
+class ScanJournalRepo(Protocol):
+    async def open(
+        self,
+        *,
+        actor_id: int,
+        changeset_id: int | None,
+        max_age_seconds: float | None = None,
+    ) -> ScanSession:
+        """Resume the actor's unfinished scan session, or start a new one.
+
+        Sessions not updated for `max_age_seconds` are discarded, since their
+        seen assets no longer say much about what exists now.
+        """
+        ...
+
+    async def checkpoint(
+        self,
+        session_id: int,
+        *,
+        cursor: dict[str, Any] | None,
+        seen: Collection[tuple[int, int]],
+        status: ScanSessionStatus = "scanning",
+    ) -> None:
+        """Store the resume cursor with the (actor_id, asset_id) pairs seen since the last checkpoint."""
+        ...
+
+    async def complete(self, session_id: int) -> None:
+        """Drop a finished session and its seen assets."""
+        ...
+
+    async def discard(self, *, actor_id: int) -> bool:
+        """Drop any unfinished session for the actor, so its next scan starts over."""
+        ...
+
+    async def get(self, *, actor_id: int) -> ScanSession | None:
+        """Return the actor's unfinished session without loading its seen assets."""
+        ...
+
+
+def get_scan_journal_repo() -> ScanJournalRepo:
+    from katalog.db.sqlspec.scan_journal import SqlspecScanJournalRepo
+
+    return SqlspecScanJournalRepo()
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Collection, Mapping, Protocol, Sequence
+
+
+@dataclass(frozen=True)
+class SidecarLookup:
+    target_name: str
+    # Normalized candidate keys, most specific first.
+    keys: tuple[str, ...] = field(default_factory=tuple)
+
+
+@dataclass(frozen=True)
+class SidecarLink:
+    sidecar_asset_id: int
+    # None when the asset is no longer a sidecar.
+    target_name: str | None
+    target_asset_id: int | None
+    previous_target_id: int | None = None
+
+
+class SidecarIndexRepo(Protocol):
+    async def clear(self, *, actor_id: int) -> None:
+        """Drop the whole index of an analyzer actor before a full rebuild."""
+        ...
+
+    async def changed_asset_ids(
+        self, *, key_ids: Collection[int], since_changeset_id: int | None
+    ) -> list[int]:
+        """Assets with metadata for these keys, written after the changeset if given."""
+        ...
+
+    async def current_values(
+        self, *, asset_ids: Collection[int], key_ids: Collection[int]
+    ) -> dict[int, dict[int, str]]:
+        """Latest non-removed text value per asset and key."""
+        ...
+
+    async def reindex(
+        self,
+        *,
+        actor_id: int,
+        asset_ids: Sequence[int],
+        target_keys: Mapping[int, Sequence[str]],
+        lookups: Mapping[int, SidecarLookup],
+    ) -> set[int]:
+        """Replace the index entries of `asset_ids`.
+
+        Assets missing from `target_keys` are no longer targets and assets
+        missing from `lookups` are no longer sidecars. Returns the sidecars
+        whose link may have changed.
+        """
+        ...
+
+    async def stale_sidecar_ids(self, *, actor_id: int) -> list[int]:
+        """Sidecars that were deleted or are linked to a deleted target."""
+        ...
+
+    async def resolve(
+        self, *, actor_id: int, sidecar_ids: Collection[int]
+    ) -> list[SidecarLink]:
+        """Match sidecars against the target index and store the result.
+
+        Deleted sidecars are dropped silently.
+        """
+        ...
+
+    async def counts(self, *, actor_id: int) -> tuple[int, int]:
+        """Number of linked and unresolved sidecars."""
+        ...
+
+
+def get_sidecar_index_repo() -> SidecarIndexRepo:
+    from katalog.db.sqlspec.sidecars import SqlspecSidecarIndexRepo
+
+    return SqlspecSidecarIndexRepo()
@@ -24,6 +24,10 @@ _DB_ACCESS_MODE: ContextVar[str] = ContextVar(
     "sqlspec_db_access_mode",
     default=_DB_ACCESS_ALLOWED,
 )
+_READ_ONLY_ANALYSIS: ContextVar[bool] = ContextVar(
+    "sqlspec_read_only_analysis",
+    default=False,
+)
 
 
 @contextmanager
@@ -36,6 +40,16 @@ def forbid_db_access() -> Any:
         _DB_ACCESS_MODE.reset(token)
 
 
+@contextmanager
+def read_only_analysis() -> Any:
+    """Serve `session_scope(analysis=True)` from a read-only connection pool."""
+    token: Token[bool] = _READ_ONLY_ANALYSIS.set(True)
+    try:
+        yield
+    finally:
+        _READ_ONLY_ANALYSIS.reset(token)
+
+
 def _assert_db_access_allowed() -> None:
     mode = _DB_ACCESS_MODE.get()
     if mode == _DB_ACCESS_FORBIDDEN:
@@ -106,13 +120,31 @@ def configure_sqlspec(db_url: str | None = None) -> None:
 def reset_sqlspec_config() -> None:
     state = app_config.current_app_context().state
     state.pop("sqlspec_config", None)
+    state.pop("sqlspec_analysis_config", None)
     loaded_extensions = state.get("sqlspec_loaded_extensions")
     if loaded_extensions is not None:
         loaded_extensions.clear()
 
 
+def _is_memory_database(database: str) -> bool:
+    return database == ":memory:" or "mode=memory" in database
+
+
+def _get_analysis_config(config: AiosqliteConfig) -> AiosqliteConfig:
+    """A read-only pool next to `config`; memory and read-only databases share `config`."""
+    context = app_config.current_app_context()
+    db_url = _default_db_url()
+    if context.read_only_effective or _is_memory_database(_sqlite_database_from_url(db_url)):
+        # A read-only URI would replace `mode=memory`; keep the main pool.
+        return config
+    analysis_config = context.state.get("sqlspec_analysis_config")
+    if analysis_config is None:
+        analysis_config = _build_config(db_url, read_only=True)
+        context.state["sqlspec_analysis_config"] = analysis_config
+    return analysis_config
+
+
 def _get_config(*, analysis: bool = False) -> AiosqliteConfig:
-    _ = analysis
     config, _ = _sqlspec_state()
     if config is None:
         config = _build_config(
@@ -120,6 +152,8 @@ def _get_config(*, analysis: bool = False) -> AiosqliteConfig:
             read_only=app_config.current_app_context().read_only_effective,
         )
         app_config.current_app_context().state["sqlspec_config"] = config
+    if analysis and _READ_ONLY_ANALYSIS.get():
+        return _get_analysis_config(config)
     return config
 
 
@@ -169,6 +203,13 @@ async def init_db() -> None:
     async with session_scope() as session:
         await session.execute_script(schema_sql)
 
+    from katalog.db.canonical import get_canonical_repo
+    from katalog.db.relations import get_relation_repo
+
+    if await get_relation_repo().ensure_backfilled():
+        logger.info("Backfilled relation edges from metadata")
+    if await get_canonical_repo().ensure_backfilled():
+        logger.info("Resolved canonical asset merges")
     logger.info("Initialized SQLSpec database schema")
 
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import time
-from typing import Any, Mapping, Sequence
+from typing import Any, Collection, Mapping, Sequence
 
 from katalog.constants.metadata import (
     ASSET_ACTOR_ID,
@@ -10,6 +10,7 @@ from katalog.constants.metadata import (
     ASSET_ID,
     ASSET_LOST,
     ASSET_NAMESPACE,
+    FILE_PATH,
     REL_LINK_TO,
     SIDECAR_TARGET_NAME,
     SIDECAR_TYPE,
@@ -21,7 +22,12 @@ from katalog.constants.metadata import (
 )
 from katalog.db.sqlspec.sql_helpers import execute, scalar, select, select_one_or_none
 from katalog.db.sqlspec import session_scope
-from katalog.db.sqlspec.tables import ASSET_TABLE, METADATA_TABLE
+from katalog.db.sqlspec.tables import (
+    ASSET_CANONICAL_TABLE,
+    ASSET_TABLE,
+    METADATA_TABLE,
+    RELATION_EDGE_TABLE,
+)
 from katalog.db.utils import build_where
 
 from katalog.models.assets import Asset
@@ -29,7 +35,10 @@ from katalog.models.metadata import Metadata
 from katalog.models.query import AssetQuery
 from katalog.models.query import AssetsListResponse, GroupedAssetsResponse
 from katalog.models.views import ViewSpec
+from katalog.db.canonical import get_canonical_repo
 from katalog.db.metadata import get_metadata_repo
+from katalog.db.relations import get_relation_repo
+from katalog.db.trigram import get_trigram_repo
 from katalog.db.sqlspec.query_fields import asset_filter_fields, asset_sort_fields
 from katalog.db.sqlspec.query_filters import filter_conditions
 from katalog.db.sqlspec.query_search import fts5_query_from_user_text
@@ -38,6 +47,10 @@ from katalog.db.sqlspec.query_sort import sort_conditions
 from katalog.db.sqlspec.query_values import decode_metadata_value
 
 
+# Each path binds three parameters; stay well below SQLite's bound-parameter limit.
+_PATH_LOOKUP_CHUNK = 200
+
+
 def _build_assets_where(
     *,
     actor_id: int | None,
@@ -46,8 +59,11 @@ def _build_assets_where(
     search_mode: str | None,
     search_index: int | None,
     include_lost_assets: bool,
+    trigram_key_ids: Collection[int] = (),
 ) -> tuple[str, list[Any]]:
-    conditions, filter_params = filter_conditions(filters)
+    conditions, filter_params = filter_conditions(
+        filters, trigram_key_ids=trigram_key_ids
+    )
 
     if actor_id is not None:
         conditions.append(
@@ -96,20 +112,24 @@ def _build_assets_where(
     return where_sql, filter_params
 
 
+async def _trigram_key_ids_for(filters: list[Any] | None) -> frozenset[int]:
+    """Load trigram-indexed key ids only when a filter could use them."""
+    if not any(_is_substring_filter(filt) for filt in filters or []):
+        return frozenset()
+    return await get_trigram_repo().indexed_key_ids()
+
+
+def _is_substring_filter(filt: Any) -> bool:
+    op = filt.get("op") if isinstance(filt, Mapping) else getattr(filt, "op", None)
+    return op in {"contains", "startsWith", "endsWith"}
+
+
 def _resolve_group_field(group_by: str) -> tuple[str, str]:
     if group_by in asset_filter_fields:
         return asset_filter_fields[group_by][0], "asset"
     return group_by, "metadata"
 
 
-async def _has_canonical_merges(session, asset_table: str) -> bool:
-    rows = await select(
-        session,
-        f"SELECT 1 FROM {asset_table} WHERE canonical_asset_id IS NOT NULL LIMIT 1",
-    )
-    return bool(rows)
-
-
 class SqlspecAssetRepo:
     async def get_or_none(self, **filters: Any) -> Asset | None:
         rows = await self.list_rows(limit=1, **filters)
@@ -201,13 +221,16 @@ class SqlspecAssetRepo:
                     asset.id = int(
                         await scalar(active_session, "SELECT last_insert_rowid() AS id")
                     )
+                    if asset.canonical_asset_id is not None:
+                        await get_canonical_repo().sync_asset(
+                            asset.id, asset.canonical_asset_id, session=active_session
+                        )
             else:
                 await execute(
                     active_session,
                     f"""
                     UPDATE {ASSET_TABLE}
-                    SET canonical_asset_id = :canonical_asset_id,
-                        actor_id = :actor_id,
+                    SET actor_id = :actor_id,
                         namespace = :namespace,
                         external_id = :external_id,
                         canonical_uri = :canonical_uri
@@ -215,13 +238,27 @@ class SqlspecAssetRepo:
                     """,
                     {
                         "id": int(asset.id),
-                        "canonical_asset_id": asset.canonical_asset_id,
                         "actor_id": asset.actor_id,
                         "namespace": asset.namespace,
                         "external_id": asset.external_id,
                         "canonical_uri": asset.canonical_uri,
                     },
                 )
+                # Only a changed canonical link touches the merge mapping.
+                relinked = await select(
+                    active_session,
+                    f"""
+                    UPDATE {ASSET_TABLE}
+                    SET canonical_asset_id = :canonical_asset_id
+                    WHERE id = :id AND canonical_asset_id IS NOT :canonical_asset_id
+                    RETURNING id
+                    """,
+                    {"id": int(asset.id), "canonical_asset_id": asset.canonical_asset_id},
+                )
+                if relinked:
+                    await get_canonical_repo().sync_asset(
+                        int(asset.id), asset.canonical_asset_id, session=active_session
+                    )
             if commit:
                 await active_session.commit()
             return was_created
@@ -287,7 +324,6 @@ class SqlspecAssetRepo:
             return 0
 
         affected = 0
-        md_db = get_metadata_repo()
         seen_set = {int(a) for a in (seen_asset_ids or [])}
 
         async with session_scope() as session:
@@ -299,25 +335,56 @@ class SqlspecAssetRepo:
                 )
                 if not asset_ids:
                     continue
+                affected += await self._insert_lost_rows(
+                    session=session,
+                    changeset=changeset,
+                    actor_id=int(pid),
+                    asset_ids=asset_ids,
+                )
 
-                lost_key_id = get_metadata_id(ASSET_LOST)
-                now_rows = []
-                for aid in asset_ids:
-                    md = Metadata(
-                        asset_id=aid,
-                        actor_id=pid,
-                        changeset_id=changeset.id,
-                        metadata_key_id=lost_key_id,
-                        value_type=MetadataType.INT,
-                        value_int=1,
-                        removed=False,
-                    )
-                    now_rows.append(md)
+        return affected
+
+    async def mark_assets_lost(
+        self,
+        *,
+        changeset: Any,
+        actor_id: int,
+        asset_ids: Sequence[int],
+    ) -> int:
+        if not asset_ids:
+            return 0
+        async with session_scope() as session:
+            return await self._insert_lost_rows(
+                session=session,
+                changeset=changeset,
+                actor_id=int(actor_id),
+                asset_ids=[int(a) for a in asset_ids],
+            )
 
-                await md_db.bulk_create(now_rows, session=session)
-                affected += len(now_rows)
+    @staticmethod
+    async def _insert_lost_rows(
+        *,
+        session: Any,
+        changeset: Any,
+        actor_id: int,
+        asset_ids: Sequence[int],
+    ) -> int:
+        lost_key_id = get_metadata_id(ASSET_LOST)
+        now_rows = []
+        for aid in asset_ids:
+            md = Metadata(
+                asset_id=aid,
+                actor_id=actor_id,
+                changeset_id=changeset.id,
+                metadata_key_id=lost_key_id,
+                value_type=MetadataType.INT,
+                value_int=1,
+                removed=False,
+            )
+            now_rows.append(md)
 
-        return affected
+        await get_metadata_repo().bulk_create(now_rows, session=session)
+        return len(now_rows)
 
     async def delete_unseen_assets(
         self,
@@ -340,41 +407,115 @@ class SqlspecAssetRepo:
                 )
                 if not asset_ids:
                     continue
+                affected += await self._delete_asset_rows(session=session, asset_ids=asset_ids)
 
-                params = {f"asset_{idx}": int(asset_id) for idx, asset_id in enumerate(asset_ids)}
-                placeholders = ", ".join(f":asset_{idx}" for idx, _ in enumerate(asset_ids))
+        return affected
 
-                # Break canonical references from remaining assets before deleting.
-                await execute(
-                    session,
-                    f"""
-                    UPDATE {ASSET_TABLE}
-                    SET canonical_asset_id = NULL
-                    WHERE canonical_asset_id IN ({placeholders})
-                      AND id NOT IN ({placeholders})
-                    """,
-                    params,
-                )
+    async def delete_assets(self, asset_ids: Sequence[int]) -> int:
+        if not asset_ids:
+            return 0
+        async with session_scope() as session:
+            return await self._delete_asset_rows(
+                session=session, asset_ids=[int(a) for a in asset_ids]
+            )
 
-                await execute(
-                    session,
-                    f"""
-                    DELETE FROM {METADATA_TABLE}
-                    WHERE asset_id IN ({placeholders})
-                    """,
-                    params,
+    @staticmethod
+    async def _delete_asset_rows(*, session: Any, asset_ids: Sequence[int]) -> int:
+        params = {f"asset_{idx}": int(asset_id) for idx, asset_id in enumerate(asset_ids)}
+        placeholders = ", ".join(f":asset_{idx}" for idx, _ in enumerate(asset_ids))
+
+        # Hand merge sets rooted at deleted assets to a remaining member, then
+        # break any canonical references left over.
+        await get_canonical_repo().remove_assets(asset_ids, session=session)
+        await execute(
+            session,
+            f"""
+            UPDATE {ASSET_TABLE}
+            SET canonical_asset_id = NULL
+            WHERE canonical_asset_id IN ({placeholders})
+              AND id NOT IN ({placeholders})
+            """,
+            params,
+        )
+
+        await execute(
+            session,
+            f"""
+            DELETE FROM {METADATA_TABLE}
+            WHERE asset_id IN ({placeholders})
+            """,
+            params,
+        )
+        await get_relation_repo().remove_assets(asset_ids, session=session)
+        await execute(
+            session,
+            f"""
+            DELETE FROM {ASSET_TABLE}
+            WHERE id IN ({placeholders})
+            """,
+            params,
+        )
+        return len(asset_ids)
+
+    async def release_external_id(self, asset_id: int) -> None:
+        async with session_scope() as session:
+            await execute(
+                session,
+                f"""
+                UPDATE {ASSET_TABLE}
+                SET external_id = 'retired:' || id || ':' || external_id
+                WHERE id = ?
+                """,
+                [int(asset_id)],
+            )
+            await session.commit()
+
+    async def list_asset_ids_for_paths(
+        self,
+        *,
+        actor_id: int,
+        paths: Sequence[str],
+        key: MetadataKey = FILE_PATH,
+    ) -> list[int]:
+        """Return assets whose current `key` path (default `file/path`) from the actor
+        is, or lies below, a path."""
+        if not paths:
+            return []
+        path_key_id = get_metadata_id(key)
+        found: set[int] = set()
+        async with session_scope() as session:
+            for start in range(0, len(paths), _PATH_LOOKUP_CHUNK):
+                chunk = [
+                    str(path).rstrip("/") or "/"
+                    for path in paths[start : start + _PATH_LOOKUP_CHUNK]
+                ]
+                matches = " OR ".join(
+                    "(m.value_text = ? OR substr(m.value_text, 1, ?) = ?)" for _ in chunk
                 )
-                await execute(
+                params: list[Any] = [int(actor_id), path_key_id]
+                for path in chunk:
+                    prefix = path if path == "/" else f"{path}/"
+                    params.extend([path, len(prefix), prefix])
+                rows = await select(
                     session,
                     f"""
-                    DELETE FROM {ASSET_TABLE}
-                    WHERE id IN ({placeholders})
+                    SELECT DISTINCT m.asset_id
+                    FROM {METADATA_TABLE} m
+                    WHERE m.actor_id = ?
+                      AND m.metadata_key_id = ?
+                      AND m.removed = 0
+                      AND m.changeset_id = (
+                          SELECT MAX(m2.changeset_id) FROM {METADATA_TABLE} m2
+                          WHERE m2.asset_id = m.asset_id
+                            AND m2.metadata_key_id = m.metadata_key_id
+                            AND m2.removed = 0
+                      )
+                      AND ({matches})
                     """,
                     params,
                 )
-                affected += len(asset_ids)
-
-        return affected
+                found.update(int(row["asset_id"]) for row in rows)
+        return sorted(found)
 
     async def count_assets_for_query(
         self,
@@ -389,15 +530,19 @@ class SqlspecAssetRepo:
             search_mode=query.search_mode,
             search_index=query.search_index,
             include_lost_assets=query.include_lost_assets,
+            trigram_key_ids=await _trigram_key_ids_for(query.filters),
         )
 
         async with session_scope() as session:
-            count_rows = await select(
-                session,
-                "SELECT COUNT(DISTINCT COALESCE(a.canonical_asset_id, a.id)) as cnt "
-                f"FROM {asset_table} a {where_sql}",
-                filter_params,
-            )
+            if await get_canonical_repo().has_merges(session=session):
+                count_sql = (
+                    "SELECT COUNT(DISTINCT COALESCE(ac.effective_asset_id, a.id)) as cnt "
+                    f"FROM {asset_table} a "
+                    f"LEFT JOIN {ASSET_CANONICAL_TABLE} ac ON ac.asset_id = a.id {where_sql}"
+                )
+            else:
+                count_sql = f"SELECT COUNT(*) as cnt FROM {asset_table} a {where_sql}"
+            count_rows = await select(session, count_sql, filter_params)
         return int(count_rows[0]["cnt"]) if count_rows else 0
 
     async def list_asset_ids_for_query(
@@ -418,6 +563,7 @@ class SqlspecAssetRepo:
             search_mode=query.search_mode,
             search_index=query.search_index,
             include_lost_assets=query.include_lost_assets,
+            trigram_key_ids=await _trigram_key_ids_for(query.filters),
         )
 
         async with session_scope() as session:
@@ -425,8 +571,9 @@ class SqlspecAssetRepo:
                 session,
                 f"""
                 WITH effective AS (
-                    SELECT DISTINCT COALESCE(a.canonical_asset_id, a.id) AS effective_id
+                    SELECT DISTINCT COALESCE(ac.effective_asset_id, a.id) AS effective_id
                     FROM {asset_table} a
+                    LEFT JOIN {ASSET_CANONICAL_TABLE} ac ON ac.asset_id = a.id
                     {where_sql}
                 )
                 SELECT a.id AS asset_id
@@ -451,6 +598,44 @@ class SqlspecAssetRepo:
             rows = await select(session, sql, unique_asset_ids)
         return {int(row["id"]) for row in rows}
 
+    async def list_boost_signals(
+        self,
+        asset_ids: Sequence[int],
+        *,
+        modified_key_id: int,
+    ) -> dict[int, dict[str, Any]]:
+        """Return source actor id and modified-age (days) per asset for ranking boosts."""
+        if not asset_ids:
+            return {}
+
+        unique_asset_ids = sorted({int(asset_id) for asset_id in asset_ids})
+        placeholders = ", ".join("?" for _ in unique_asset_ids)
+        sql = f"""
+            SELECT
+                a.id AS asset_id,
+                a.actor_id,
+                (
+                    SELECT julianday('now') - julianday(m.value_datetime)
+                    FROM {METADATA_TABLE} m
+                    WHERE m.asset_id = a.id
+                      AND m.metadata_key_id = ?
+                      AND m.removed = 0
+                    ORDER BY m.changeset_id DESC, m.id DESC
+                    LIMIT 1
+                ) AS age_days
+            FROM {ASSET_TABLE} a
+            WHERE a.id IN ({placeholders})
+        """
+        async with session_scope(analysis=True) as session:
+            rows = await select(session, sql, [int(modified_key_id), *unique_asset_ids])
+        return {
+            int(row["asset_id"]): {
+                "actor_id": row.get("actor_id"),
+                "age_days": row.get("age_days"),
+            }
+            for row in rows
+        }
+
     async def list_assets_for_view_db(
         self,
         view: "ViewSpec",
@@ -508,6 +693,7 @@ class SqlspecAssetRepo:
             search_mode=query.search_mode,
             search_index=query.search_index,
             include_lost_assets=query.include_lost_assets,
+            trigram_key_ids=await _trigram_key_ids_for(query.filters),
         )
         metadata_keys = [
             col_id
@@ -517,13 +703,14 @@ class SqlspecAssetRepo:
         metadata_ids = [get_metadata_id(MetadataKey(key)) for key in metadata_keys]
 
         async with session_scope() as session:
-            has_merges = await _has_canonical_merges(session, asset_table)
+            has_merges = await get_canonical_repo().has_merges(session=session)
 
             if has_merges:
                 assets_sql = f"""
                 WITH effective AS (
-                    SELECT DISTINCT COALESCE(a.canonical_asset_id, a.id) AS effective_id
+                    SELECT DISTINCT COALESCE(ac.effective_asset_id, a.id) AS effective_id
                     FROM {asset_table} a
+                    LEFT JOIN {ASSET_CANONICAL_TABLE} ac ON ac.asset_id = a.id
                     {where_sql}
                 )
                 SELECT
@@ -603,12 +790,13 @@ class SqlspecAssetRepo:
                 if has_merges:
                     metadata_sql = f"""
                     WITH group_assets AS (
-                        SELECT
-                            a.id AS asset_id,
-                            COALESCE(a.canonical_asset_id, a.id) AS effective_id
+                        SELECT a.id AS asset_id, a.id AS effective_id
                         FROM {asset_table} a
                         WHERE a.id IN ({asset_placeholders})
-                           OR a.canonical_asset_id IN ({asset_placeholders})
+                        UNION ALL
+                        SELECT ac.asset_id, ac.effective_asset_id AS effective_id
+                        FROM {ASSET_CANONICAL_TABLE} ac
+                        WHERE ac.effective_asset_id IN ({asset_placeholders})
                     ),
                     latest_snap AS (
                         SELECT
@@ -748,8 +936,9 @@ class SqlspecAssetRepo:
             if query.metadata_include_counts:
                 if has_merges:
                     count_sql = (
-                        "SELECT COUNT(DISTINCT COALESCE(a.canonical_asset_id, a.id)) as cnt "
-                        f"FROM {asset_table} a {where_sql}"
+                        "SELECT COUNT(DISTINCT COALESCE(ac.effective_asset_id, a.id)) as cnt "
+                        f"FROM {asset_table} a "
+                        f"LEFT JOIN {ASSET_CANONICAL_TABLE} ac ON ac.asset_id = a.id {where_sql}"
                     )
                 else:
                     count_sql = (
@@ -791,8 +980,18 @@ class SqlspecAssetRepo:
         metadata_placeholders = ", ".join("?" for _ in metadata_key_ids)
         link_key_id = int(get_metadata_id(REL_LINK_TO))
         sidecar_type_key_id = int(get_metadata_id(SIDECAR_TYPE))
+        # Links come from the edge table's reverse index, so only the linked
+        # sidecars' metadata is ranked.
         sql = f"""
-            WITH latest AS (
+            WITH links AS (
+                SELECT DISTINCT
+                    e.from_asset_id AS sidecar_asset_id,
+                    e.to_asset_id AS target_asset_id
+                FROM {RELATION_EDGE_TABLE} e
+                WHERE e.to_asset_id IN ({target_placeholders})
+                  AND e.metadata_key_id = ?
+            ),
+            latest AS (
                 SELECT
                     m.asset_id,
                     m.metadata_key_id,
@@ -809,23 +1008,14 @@ class SqlspecAssetRepo:
                         ORDER BY m.changeset_id DESC, m.id DESC
                     ) AS rn
                 FROM {METADATA_TABLE} m
-                WHERE m.metadata_key_id IN ({metadata_placeholders}, ?, ?)
+                WHERE m.asset_id IN (SELECT sidecar_asset_id FROM links)
+                  AND m.metadata_key_id IN ({metadata_placeholders}, ?)
                   AND m.removed = 0
             ),
             sidecars AS (
                 SELECT asset_id
                 FROM latest
                 WHERE metadata_key_id = ? AND rn = 1
-            ),
-            links AS (
-                SELECT
-                    l.asset_id AS sidecar_asset_id,
-                    l.value_relation_id AS target_asset_id
-                FROM latest l
-                JOIN sidecars s ON s.asset_id = l.asset_id
-                WHERE l.metadata_key_id = ?
-                  AND l.rn = 1
-                  AND l.value_relation_id IN ({target_placeholders})
             )
             SELECT
                 links.target_asset_id AS asset_id,
@@ -839,17 +1029,17 @@ class SqlspecAssetRepo:
                 m.value_relation_id,
                 m.value_collection_id
             FROM links
+            JOIN sidecars s ON s.asset_id = links.sidecar_asset_id
             JOIN latest m ON m.asset_id = links.sidecar_asset_id
             WHERE m.metadata_key_id IN ({metadata_placeholders})
               AND m.rn = 1
         """
         params: list[Any] = [
+            *target_asset_ids,
+            link_key_id,
             *metadata_key_ids,
             sidecar_type_key_id,
-            link_key_id,
             sidecar_type_key_id,
-            link_key_id,
-            *target_asset_ids,
             *metadata_key_ids,
         ]
         return await select(session, sql, params)
@@ -876,6 +1066,7 @@ class SqlspecAssetRepo:
             search_mode=query.search_mode,
             search_index=query.search_index,
             include_lost_assets=query.include_lost_assets,
+            trigram_key_ids=await _trigram_key_ids_for(query.filters),
         )
 
         if field_type == "asset":
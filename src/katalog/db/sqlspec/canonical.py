@@ -0,0 +1,380 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Collection, Sequence
+from typing import Any, TypeVar
+
+from katalog.db.sqlspec import session_scope
+from katalog.db.sqlspec.sql_helpers import execute, scalar, select, select_one_or_none
+from katalog.db.sqlspec.tables import ASSET_CANONICAL_TABLE, ASSET_TABLE
+
+# Keep IN (...) lists below SQLite's bound-parameter limit.
+_LOOKUP_CHUNK = 500
+
+T = TypeVar("T")
+
+
+def _chunks(values: Sequence[int]) -> list[list[int]]:
+    return [
+        list(values[start : start + _LOOKUP_CHUNK])
+        for start in range(0, len(values), _LOOKUP_CHUNK)
+    ]
+
+
+def _placeholders(values: Sequence[Any]) -> str:
+    return ", ".join("?" for _ in values)
+
+
+class _UnionFind:
+    def __init__(self) -> None:
+        self.parent: dict[int, int] = {}
+
+    def find(self, node: int) -> int:
+        root = node
+        while self.parent.get(root, root) != root:
+            root = self.parent[root]
+        # Path compression keeps later lookups flat.
+        while node != root:
+            self.parent[node], node = root, self.parent[node]
+        return root
+
+    def union(self, child: int, parent: int) -> None:
+        child_root = self.find(child)
+        parent_root = self.find(parent)
+        if child_root != parent_root:
+            self.parent[child_root] = parent_root
+
+
+async def _in_session(session: Any | None, work: Callable[[Any], Awaitable[T]]) -> T:
+    if session is not None:
+        return await work(session)
+    async with session_scope() as active:
+        result = await work(active)
+        await active.commit()
+        return result
+
+
+class SqlspecCanonicalRepo:
+    async def merge_groups(
+        self, groups: Sequence[Sequence[int]], *, session: Any | None = None
+    ) -> int:
+        cleaned = [[int(asset_id) for asset_id in group] for group in groups]
+        cleaned = [group for group in cleaned if len(set(group)) > 1]
+        if not cleaned:
+            return 0
+        return await _in_session(session, lambda active: self._merge(active, cleaned))
+
+    async def _merge(self, session: Any, groups: list[list[int]]) -> int:
+        ids = sorted({asset_id for group in groups for asset_id in group})
+        existing: set[int] = set()
+        roots: dict[int, int] = {}
+        for chunk in _chunks(ids):
+            rows = await select(
+                session,
+                f"""
+                SELECT a.id, c.effective_asset_id
+                FROM {ASSET_TABLE} a
+                LEFT JOIN {ASSET_CANONICAL_TABLE} c ON c.asset_id = a.id
+                WHERE a.id IN ({_placeholders(chunk)})
+                """,
+                chunk,
+            )
+            for row in rows:
+                existing.add(int(row["id"]))
+                if row["effective_asset_id"] is not None:
+                    roots[int(row["id"])] = int(row["effective_asset_id"])
+
+        sets = _UnionFind()
+        for group in groups:
+            members = [asset_id for asset_id in group if asset_id in existing]
+            if len(members) < 2:
+                continue
+            head = roots.get(members[0], members[0])
+            for asset_id in members[1:]:
+                sets.union(roots.get(asset_id, asset_id), head)
+        # Only old roots are ever re-parented, and new roots never move.
+        moves = [
+            {"old_root": old_root, "new_root": sets.find(old_root)}
+            for old_root in sorted(sets.parent)
+            if sets.find(old_root) != old_root
+        ]
+        if not moves:
+            return 0
+
+        old_roots = [move["old_root"] for move in moves]
+        moved = len(old_roots)
+        for chunk in _chunks(old_roots):
+            moved += int(
+                await scalar(
+                    session,
+                    f"""
+                    SELECT COUNT(*) FROM {ASSET_CANONICAL_TABLE}
+                    WHERE effective_asset_id IN ({_placeholders(chunk)})
+                    """,
+                    chunk,
+                )
+                or 0
+            )
+        await session.execute_many(
+            f"""
+            UPDATE {ASSET_TABLE}
+            SET canonical_asset_id = :new_root
+            WHERE id = :old_root
+               OR id IN (
+                   SELECT asset_id FROM {ASSET_CANONICAL_TABLE}
+                   WHERE effective_asset_id = :old_root
+               )
+            """,
+            moves,
+        )
+        await session.execute_many(
+            f"""
+            UPDATE {ASSET_CANONICAL_TABLE}
+            SET effective_asset_id = :new_root
+            WHERE effective_asset_id = :old_root
+            """,
+            moves,
+        )
+        await session.execute_many(
+            f"""
+            INSERT INTO {ASSET_CANONICAL_TABLE} (asset_id, effective_asset_id)
+            VALUES (:old_root, :new_root)
+            """,
+            moves,
+        )
+        return moved
+
+    async def unmerge(
+        self, asset_ids: Collection[int], *, session: Any | None = None
+    ) -> int:
+        ids = sorted({int(asset_id) for asset_id in asset_ids})
+        if not ids:
+            return 0
+        return await _in_session(session, lambda active: self._detach(active, ids))
+
+    async def remove_assets(self, asset_ids: Collection[int], *, session: Any) -> None:
+        ids = sorted({int(asset_id) for asset_id in asset_ids})
+        if ids:
+            await self._detach(session, ids)
+
+    async def _detach(self, session: Any, ids: list[int]) -> int:
+        detached = 0
+        # Members leave first, so a root never hands its set to a leaving asset.
+        for chunk in _chunks(ids):
+            members = [
+                int(row["asset_id"])
+                for row in await select(
+                    session,
+                    f"""
+                    SELECT asset_id FROM {ASSET_CANONICAL_TABLE}
+                    WHERE asset_id IN ({_placeholders(chunk)})
+                    """,
+                    chunk,
+                )
+            ]
+            if not members:
+                continue
+            detached += len(members)
+            await execute(
+                session,
+                f"DELETE FROM {ASSET_CANONICAL_TABLE} WHERE asset_id IN ({_placeholders(members)})",
+                members,
+            )
+            await execute(
+                session,
+                f"UPDATE {ASSET_TABLE} SET canonical_asset_id = NULL WHERE id IN ({_placeholders(members)})",
+                members,
+            )
+
+        # A leaving root hands its set to the oldest remaining member.
+        handovers: list[dict[str, int]] = []
+        for chunk in _chunks(ids):
+            rows = await select(
+                session,
+                f"""
+                SELECT effective_asset_id AS old_root, MIN(asset_id) AS new_root
+                FROM {ASSET_CANONICAL_TABLE}
+                WHERE effective_asset_id IN ({_placeholders(chunk)})
+                GROUP BY effective_asset_id
+                """,
+                chunk,
+            )
+            handovers.extend(
+                {"old_root": int(row["old_root"]), "new_root": int(row["new_root"])}
+                for row in rows
+            )
+        if handovers:
+            detached += len(handovers)
+            new_roots = [{"new_root": handover["new_root"]} for handover in handovers]
+            await session.execute_many(
+                f"DELETE FROM {ASSET_CANONICAL_TABLE} WHERE asset_id = :new_root",
+                new_roots,
+            )
+            await session.execute_many(
+                f"""
+                UPDATE {ASSET_TABLE}
+                SET canonical_asset_id = :new_root
+                WHERE id IN (
+                    SELECT asset_id FROM {ASSET_CANONICAL_TABLE}
+                    WHERE effective_asset_id = :old_root
+                )
+                """,
+                handovers,
+            )
+            await session.execute_many(
+                f"""
+                UPDATE {ASSET_CANONICAL_TABLE}
+                SET effective_asset_id = :new_root
+                WHERE effective_asset_id = :old_root
+                """,
+                handovers,
+            )
+            await session.execute_many(
+                f"UPDATE {ASSET_TABLE} SET canonical_asset_id = NULL WHERE id = :new_root",
+                new_roots,
+            )
+        return detached
+
+    async def sync_asset(
+        self, asset_id: int, canonical_asset_id: int | None, *, session: Any
+    ) -> None:
+        asset_id = int(asset_id)
+        current = await select_one_or_none(
+            session,
+            f"SELECT effective_asset_id FROM {ASSET_CANONICAL_TABLE} WHERE asset_id = ?",
+            [asset_id],
+        )
+        current_root = int(current["effective_asset_id"]) if current else None
+        if canonical_asset_id is None or int(canonical_asset_id) == asset_id:
+            if current_root is not None:
+                await self._detach(session, [asset_id])
+            return
+        target = await select_one_or_none(
+            session,
+            f"SELECT effective_asset_id FROM {ASSET_CANONICAL_TABLE} WHERE asset_id = ?",
+            [int(canonical_asset_id)],
+        )
+        target_root = int(target["effective_asset_id"]) if target else int(canonical_asset_id)
+        if target_root in (current_root, asset_id):
+            return
+        if current_root is not None:
+            await self._detach(session, [asset_id])
+        await self._merge(session, [[int(canonical_asset_id), asset_id]])
+
+    async def effective_ids(self, asset_ids: Collection[int]) -> dict[int, int]:
+        ids = sorted({int(asset_id) for asset_id in asset_ids})
+        resolved = {asset_id: asset_id for asset_id in ids}
+        async with session_scope(analysis=True) as session:
+            for chunk in _chunks(ids):
+                rows = await select(
+                    session,
+                    f"""
+                    SELECT asset_id, effective_asset_id FROM {ASSET_CANONICAL_TABLE}
+                    WHERE asset_id IN ({_placeholders(chunk)})
+                    """,
+                    chunk,
+                )
+                for row in rows:
+                    resolved[int(row["asset_id"])] = int(row["effective_asset_id"])
+        return resolved
+
+    async def members(self, asset_id: int) -> list[int]:
+        async with session_scope(analysis=True) as session:
+            row = await select_one_or_none(
+                session,
+                f"SELECT effective_asset_id FROM {ASSET_CANONICAL_TABLE} WHERE asset_id = ?",
+                [int(asset_id)],
+            )
+            root = int(row["effective_asset_id"]) if row else int(asset_id)
+            rows = await select(
+                session,
+                f"""
+                SELECT asset_id FROM {ASSET_CANONICAL_TABLE}
+                WHERE effective_asset_id = ?
+                ORDER BY asset_id
+                """,
+                [root],
+            )
+        return [root, *(int(row["asset_id"]) for row in rows)]
+
+    async def has_merges(self, *, session: Any | None = None) -> bool:
+        sql = f"SELECT EXISTS (SELECT 1 FROM {ASSET_CANONICAL_TABLE})"
+        if session is not None:
+            return bool(await scalar(session, sql))
+        async with session_scope(analysis=True) as active:
+            return bool(await scalar(active, sql))
+
+    async def rebuild(self) -> int:
+        async with session_scope() as session:
+            rows = await select(
+                session,
+                f"""
+                SELECT a.id, a.canonical_asset_id
+                FROM {ASSET_TABLE} a
+                JOIN {ASSET_TABLE} p ON p.id = a.canonical_asset_id
+                WHERE a.canonical_asset_id IS NOT NULL
+                """,
+            )
+            sets = _UnionFind()
+            for row in rows:
+                sets.union(int(row["id"]), int(row["canonical_asset_id"]))
+            nodes = sorted(
+                {int(row["id"]) for row in rows}
+                | {int(row["canonical_asset_id"]) for row in rows}
+            )
+            mapping = [
+                {"asset_id": node, "root": sets.find(node)}
+                for node in nodes
+                if sets.find(node) != node
+            ]
+            roots = [{"asset_id": node} for node in nodes if sets.find(node) == node]
+
+            await execute(session, f"DELETE FROM {ASSET_CANONICAL_TABLE}")
+            if mapping:
+                await session.execute_many(
+                    f"""
+                    INSERT INTO {ASSET_CANONICAL_TABLE} (asset_id, effective_asset_id)
+                    VALUES (:asset_id, :root)
+                    """,
+                    mapping,
+                )
+                # Flatten chains so every member points straight at its root.
+                await session.execute_many(
+                    f"""
+                    UPDATE {ASSET_TABLE} SET canonical_asset_id = :root
+                    WHERE id = :asset_id AND canonical_asset_id IS NOT :root
+                    """,
+                    mapping,
+                )
+            if roots:
+                # Roots of cyclic links keep no canonical pointer.
+                await session.execute_many(
+                    f"""
+                    UPDATE {ASSET_TABLE} SET canonical_asset_id = NULL
+                    WHERE id = :asset_id AND canonical_asset_id IS NOT NULL
+                    """,
+                    roots,
+                )
+            # Links to assets that no longer exist are dropped.
+            await execute(
+                session,
+                f"""
+                UPDATE {ASSET_TABLE} SET canonical_asset_id = NULL
+                WHERE canonical_asset_id IS NOT NULL
+                  AND canonical_asset_id NOT IN (SELECT id FROM {ASSET_TABLE})
+                """,
+            )
+            await session.commit()
+        return len(mapping)
+
+    async def ensure_backfilled(self) -> bool:
+        async with session_scope(analysis=True) as session:
+            if await self.has_merges(session=session):
+                return False
+            has_links = await scalar(
+                session,
+                f"SELECT EXISTS (SELECT 1 FROM {ASSET_TABLE} WHERE canonical_asset_id IS NOT NULL)",
+            )
+        if not has_links:
+            return False
+        await self.rebuild()
+        return True
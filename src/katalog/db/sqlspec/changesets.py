@@ -7,7 +7,7 @@ from typing import Any, Iterable, Mapping
 from katalog.constants.metadata import get_metadata_def_by_id
 from katalog.db.errors import ChangesetInProgressError
 from katalog.db.utils import build_where
-from katalog.db.sqlspec.sql_helpers import execute, select
+from katalog.db.sqlspec.sql_helpers import execute, select, select_one_or_none
 from katalog.db.sqlspec import session_scope
 from katalog.db.sqlspec.tables import (
     CHANGESET_ACTOR_TABLE,
@@ -81,6 +81,38 @@ class SqlspecChangesetRepo:
             rows = await select(session, sql, {"actor_id": int(actor_id)})
         return [Changeset.model_validate(_normalize_changeset_row(row)) for row in rows]
 
+    async def latest_source_state(self, actor_id: int) -> dict[str, Any] | None:
+        return await self._latest_actor_state(actor_id, "source_state")
+
+    async def latest_analyzer_state(self, actor_id: int) -> dict[str, Any] | None:
+        return await self._latest_actor_state(actor_id, "analyzer_state")
+
+    async def _latest_actor_state(self, actor_id: int, section: str) -> dict[str, Any] | None:
+        sql = f"""
+        SELECT json_extract(c.data, :path) AS state
+        FROM {CHANGESET_TABLE} c
+        JOIN {CHANGESET_ACTOR_TABLE} ca ON ca.changeset_id = c.id
+        WHERE ca.actor_id = :actor_id
+          AND c.status = :status
+          AND json_extract(c.data, :path) IS NOT NULL
+        ORDER BY c.id DESC
+        LIMIT 1
+        """
+        async with session_scope() as session:
+            row = await select_one_or_none(
+                session,
+                sql,
+                {
+                    "actor_id": int(actor_id),
+                    "status": OpStatus.COMPLETED.value,
+                    "path": f'$.{section}."{int(actor_id)}"',
+                },
+            )
+        if row is None:
+            return None
+        state = row["state"]
+        return json.loads(state) if isinstance(state, str) else state
+
     async def begin(
         self,
         *,
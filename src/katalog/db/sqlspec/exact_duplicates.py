@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from collections.abc import Collection, Mapping, Sequence
+from typing import Any
+
+from katalog.db.exact_duplicates import HashGroup, IndexedHash
+from katalog.db.sqlspec import session_scope
+from katalog.db.sqlspec.sql_helpers import execute, select
+from katalog.db.sqlspec.tables import EXACT_DUPLICATE_HASH_TABLE
+
+# Keep IN (...) lists below SQLite's bound-parameter limit.
+_LOOKUP_CHUNK = 500
+
+
+def _chunks(values: Collection[Any]) -> list[list[Any]]:
+    ordered = sorted(set(values))
+    return [ordered[start : start + _LOOKUP_CHUNK] for start in range(0, len(ordered), _LOOKUP_CHUNK)]
+
+
+def _placeholders(values: Sequence[Any]) -> str:
+    return ", ".join("?" for _ in values)
+
+
+def _split_ids(value: Any) -> list[int]:
+    return sorted({int(part) for part in str(value or "").split(",") if part})
+
+
+class SqlspecExactDuplicateRepo:
+    async def clear(self, *, actor_id: int) -> None:
+        async with session_scope() as session:
+            await execute(
+                session,
+                f"DELETE FROM {EXACT_DUPLICATE_HASH_TABLE} WHERE actor_id = ?",
+                [int(actor_id)],
+            )
+            await session.commit()
+
+    async def hashes_for(
+        self, *, actor_id: int, asset_ids: Collection[int]
+    ) -> dict[int, IndexedHash]:
+        found: dict[int, IndexedHash] = {}
+        async with session_scope(analysis=True) as session:
+            for chunk in _chunks({int(asset_id) for asset_id in asset_ids}):
+                rows = await select(
+                    session,
+                    f"""
+                    SELECT asset_id, md5, hash_actor_ids
+                    FROM {EXACT_DUPLICATE_HASH_TABLE}
+                    WHERE actor_id = ? AND asset_id IN ({_placeholders(chunk)})
+                    """,
+                    [int(actor_id), *chunk],
+                )
+                for row in rows:
+                    found[int(row["asset_id"])] = IndexedHash(
+                        md5=str(row["md5"]),
+                        actor_ids=tuple(_split_ids(row["hash_actor_ids"])),
+                    )
+        return found
+
+    async def replace(
+        self, *, actor_id: int, hashes: Mapping[int, IndexedHash | None]
+    ) -> None:
+        removed = [int(asset_id) for asset_id, value in hashes.items() if value is None]
+        rows = [
+            {
+                "actor_id": int(actor_id),
+                "asset_id": int(asset_id),
+                "md5": value.md5,
+                "hash_actor_ids": ",".join(str(a) for a in sorted(value.actor_ids)),
+            }
+            for asset_id, value in hashes.items()
+            if value is not None
+        ]
+        if not removed and not rows:
+            return
+        async with session_scope() as session:
+            for chunk in _chunks(removed):
+                await execute(
+                    session,
+                    f"DELETE FROM {EXACT_DUPLICATE_HASH_TABLE} "
+                    f"WHERE actor_id = ? AND asset_id IN ({_placeholders(chunk)})",
+                    [int(actor_id), *chunk],
+                )
+            if rows:
+                await session.execute_many(
+                    f"""
+                    INSERT INTO {EXACT_DUPLICATE_HASH_TABLE} (actor_id, asset_id, md5, hash_actor_ids)
+                    VALUES (:actor_id, :asset_id, :md5, :hash_actor_ids)
+                    ON CONFLICT(actor_id, asset_id) DO UPDATE SET
+                        md5 = excluded.md5,
+                        hash_actor_ids = excluded.hash_actor_ids
+                    """,
+                    rows,
+                )
+            await session.commit()
+
+    async def group_sizes(
+        self, *, actor_id: int, md5s: Collection[str]
+    ) -> dict[str, int]:
+        sizes: dict[str, int] = {}
+        async with session_scope(analysis=True) as session:
+            for chunk in _chunks(md5s):
+                rows = await select(
+                    session,
+                    f"""
+                    SELECT md5, COUNT(*) AS file_count
+                    FROM {EXACT_DUPLICATE_HASH_TABLE}
+                    WHERE actor_id = ? AND md5 IN ({_placeholders(chunk)})
+                    GROUP BY md5
+                    """,
+                    [int(actor_id), *chunk],
+                )
+                sizes.update({str(row["md5"]): int(row["file_count"]) for row in rows})
+        return sizes
+
+    async def groups(
+        self,
+        *,
+        actor_id: int,
+        md5s: Collection[str] | None = None,
+        min_size: int = 2,
+        limit: int | None = None,
+    ) -> list[HashGroup]:
+        if md5s is not None and not md5s:
+            return []
+        select_sql = f"""
+            SELECT
+                md5,
+                COUNT(*) AS file_count,
+                GROUP_CONCAT(asset_id) AS asset_ids,
+                GROUP_CONCAT(hash_actor_ids) AS actor_ids
+            FROM {EXACT_DUPLICATE_HASH_TABLE}
+        """
+        rows: list[dict[str, Any]] = []
+        async with session_scope(analysis=True) as session:
+            if md5s is None:
+                sql = f"""
+                    {select_sql}
+                    WHERE actor_id = ?
+                    GROUP BY md5
+                    HAVING COUNT(*) >= ?
+                    ORDER BY file_count DESC, md5
+                """
+                params: list[Any] = [int(actor_id), int(min_size)]
+                if limit is not None:
+                    sql += " LIMIT ?"
+                    params.append(int(limit))
+                rows = await select(session, sql, params)
+            else:
+                for chunk in _chunks(md5s):
+                    rows.extend(
+                        await select(
+                            session,
+                            f"""
+                            {select_sql}
+                            WHERE actor_id = ? AND md5 IN ({_placeholders(chunk)})
+                            GROUP BY md5
+                            HAVING COUNT(*) >= ?
+                            """,
+                            [int(actor_id), *chunk, int(min_size)],
+                        )
+                    )
+                rows.sort(key=lambda row: (-int(row["file_count"]), str(row["md5"])))
+                if limit is not None:
+                    rows = rows[: int(limit)]
+        return [
+            HashGroup(
+                md5=str(row["md5"]),
+                asset_ids=_split_ids(row["asset_ids"]),
+                actor_ids=_split_ids(row["actor_ids"]),
+            )
+            for row in rows
+        ]
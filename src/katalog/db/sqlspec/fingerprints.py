@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from collections.abc import Collection, Sequence
+from typing import Any
+
+from katalog.db.fingerprints import AssetFingerprint
+from katalog.db.sqlspec import session_scope
+from katalog.db.sqlspec.sql_helpers import execute, select
+from katalog.db.sqlspec.tables import ASSET_FINGERPRINT_TABLE, ASSET_TABLE
+
+# Keep ... IN (...) lists below SQLite's bound-parameter limit.
+_DELETE_CHUNK = 500
+
+
+class SqlspecFingerprintRepo:
+    async def load(self, *, actor_id: int, namespace: str) -> dict[str, tuple[int, int]]:
+        async with session_scope() as session:
+            rows = await select(
+                session,
+                f"""
+                SELECT a.external_id, f.asset_id, f.fingerprint
+                FROM {ASSET_FINGERPRINT_TABLE} f
+                JOIN {ASSET_TABLE} a ON a.id = f.asset_id
+                WHERE f.actor_id = ? AND a.namespace = ?
+                """,
+                [int(actor_id), namespace],
+            )
+        return {
+            str(row["external_id"]): (int(row["asset_id"]), int(row["fingerprint"]))
+            for row in rows
+        }
+
+    async def record(self, fingerprints: Sequence[AssetFingerprint]) -> None:
+        if not fingerprints:
+            return
+        async with session_scope() as session:
+            await session.execute_many(
+                f"""
+                INSERT INTO {ASSET_FINGERPRINT_TABLE} (asset_id, actor_id, fingerprint, pipeline_key)
+                VALUES (:asset_id, :actor_id, :fingerprint, :pipeline_key)
+                ON CONFLICT(asset_id) DO UPDATE SET
+                    actor_id = excluded.actor_id,
+                    fingerprint = excluded.fingerprint,
+                    pipeline_key = excluded.pipeline_key
+                """,
+                [
+                    {
+                        "asset_id": int(entry.asset_id),
+                        "actor_id": int(entry.actor_id),
+                        "fingerprint": int(entry.fingerprint),
+                        "pipeline_key": int(entry.pipeline_key),
+                    }
+                    for entry in fingerprints
+                ],
+            )
+            await session.commit()
+
+    async def settled(self, asset_ids: Collection[int], *, pipeline_key: int) -> set[int]:
+        ids = sorted({int(asset_id) for asset_id in asset_ids})
+        found: set[int] = set()
+        if not ids:
+            return found
+        async with session_scope(analysis=True) as session:
+            for start in range(0, len(ids), _DELETE_CHUNK):
+                chunk = ids[start : start + _DELETE_CHUNK]
+                placeholders = ", ".join("?" for _ in chunk)
+                rows = await select(
+                    session,
+                    f"""
+                    SELECT asset_id FROM {ASSET_FINGERPRINT_TABLE}
+                    WHERE pipeline_key = ? AND asset_id IN ({placeholders})
+                    """,
+                    [int(pipeline_key), *chunk],
+                )
+                found.update(int(row["asset_id"]) for row in rows)
+        return found
+
+    async def settle(self, asset_ids: Collection[int], *, pipeline_key: int) -> None:
+        ids = sorted({int(asset_id) for asset_id in asset_ids})
+        if not ids:
+            return
+        async with session_scope() as session:
+            for start in range(0, len(ids), _DELETE_CHUNK):
+                chunk = ids[start : start + _DELETE_CHUNK]
+                placeholders = ", ".join("?" for _ in chunk)
+                await execute(
+                    session,
+                    f"""
+                    UPDATE {ASSET_FINGERPRINT_TABLE} SET pipeline_key = ?
+                    WHERE asset_id IN ({placeholders})
+                    """,
+                    [int(pipeline_key), *chunk],
+                )
+            await session.commit()
+
+    async def forget(self, asset_ids: Collection[int]) -> None:
+        ids = [int(asset_id) for asset_id in asset_ids]
+        if not ids:
+            return
+        async with session_scope() as session:
+            await _delete_chunked(session, ids)
+            await session.commit()
+
+    async def forget_unseen(self, *, actor_id: int, seen_asset_ids: Collection[int]) -> int:
+        seen = {int(asset_id) for asset_id in seen_asset_ids}
+        async with session_scope() as session:
+            rows = await select(
+                session,
+                f"SELECT asset_id FROM {ASSET_FINGERPRINT_TABLE} WHERE actor_id = ?",
+                [int(actor_id)],
+            )
+            stale = [int(row["asset_id"]) for row in rows if int(row["asset_id"]) not in seen]
+            await _delete_chunked(session, stale)
+            await session.commit()
+        return len(stale)
+
+
+async def _delete_chunked(session: Any, asset_ids: Sequence[int]) -> None:
+    for start in range(0, len(asset_ids), _DELETE_CHUNK):
+        chunk = list(asset_ids[start : start + _DELETE_CHUNK])
+        placeholders = ", ".join("?" for _ in chunk)
+        await execute(
+            session,
+            f"DELETE FROM {ASSET_FINGERPRINT_TABLE} WHERE asset_id IN ({placeholders})",
+            chunk,
+        )
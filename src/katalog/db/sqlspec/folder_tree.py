@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+from collections.abc import Collection, Sequence
+from typing import Any
+
+from katalog.db.folder_tree import FolderPath, FolderPathResolution, SourceFolder
+from katalog.db.sqlspec import session_scope
+from katalog.db.sqlspec.sql_helpers import execute, scalar, select
+from katalog.db.sqlspec.tables import SOURCE_FOLDER_TABLE
+
+# Keep IN (...) lists below SQLite's bound-parameter limit.
+_LOOKUP_CHUNK = 500
+# Give up walking up after this many levels; guards against corrupt parent chains.
+_MAX_DEPTH = 256
+
+
+def _subtree_bounds(id_path: str) -> tuple[str, str]:
+    # Every id path below `p` sorts within ["p/", "p0"), since "0" follows "/";
+    # a range keeps the lookup on the (actor_id, id_path) index.
+    return f"{id_path}/", f"{id_path}0"
+
+
+class SqlspecFolderTreeRepo:
+    async def save(self, *, actor_id: int, folders: Sequence[SourceFolder]) -> set[str]:
+        unique = {folder.folder_id: folder for folder in folders if folder.folder_id}
+        if not unique:
+            return set()
+        async with session_scope() as session:
+            existing = await _load_rows(session, actor_id, unique.keys())
+            changed: set[str] = set()
+            for folder_id, folder in unique.items():
+                row = existing.get(folder_id)
+                if row is None:
+                    continue
+                if row["name"] == folder.name and row["parent_id"] == folder.parent_id:
+                    continue
+                changed.add(folder_id)
+                if row["id_path"] is not None:
+                    await _reset_subtree(session, actor_id, str(row["id_path"]))
+            await session.execute_many(
+                f"""
+                INSERT INTO {SOURCE_FOLDER_TABLE} (actor_id, folder_id, name, parent_id)
+                VALUES (:actor_id, :folder_id, :name, :parent_id)
+                ON CONFLICT(actor_id, folder_id) DO UPDATE SET
+                    name = excluded.name,
+                    parent_id = excluded.parent_id
+                """,
+                [
+                    {
+                        "actor_id": int(actor_id),
+                        "folder_id": folder.folder_id,
+                        "name": folder.name,
+                        "parent_id": folder.parent_id,
+                    }
+                    for folder in unique.values()
+                ],
+            )
+            await session.commit()
+        return changed
+
+    async def resolve_paths(
+        self, *, actor_id: int, folder_ids: Collection[str]
+    ) -> FolderPathResolution:
+        resolution = FolderPathResolution()
+        wanted = {str(folder_id) for folder_id in folder_ids if folder_id}
+        if not wanted:
+            return resolution
+
+        async with session_scope() as session:
+            nodes: dict[str, dict[str, Any]] = {}
+            frontier = set(wanted)
+            for _ in range(_MAX_DEPTH):
+                if not frontier:
+                    break
+                found = await _load_rows(session, actor_id, frontier)
+                resolution.missing |= frontier - found.keys()
+                nodes.update(found)
+                # Memoized folders already carry their ancestry; stop climbing there.
+                frontier = {
+                    str(row["parent_id"])
+                    for row in found.values()
+                    if row["id_path"] is None
+                    and row["parent_id"]
+                    and row["parent_id"] not in nodes
+                }
+
+            computed: dict[str, FolderPath] = {}
+            fresh: dict[str, FolderPath] = {}
+
+            def path_of(folder_id: str) -> FolderPath | None:
+                chain: list[dict[str, Any]] = []
+                seen: set[str] = set()
+                base: FolderPath | None = None
+                current: str | None = folder_id
+                while current is not None and current not in seen:
+                    if current in computed:
+                        base = computed[current]
+                        break
+                    node = nodes.get(current)
+                    if node is None:
+                        return None
+                    if node["id_path"] is not None:
+                        base = FolderPath(str(node["name_path"]), str(node["id_path"]))
+                        computed[current] = base
+                        break
+                    seen.add(current)
+                    chain.append(node)
+                    current = node["parent_id"]
+                for node in reversed(chain):
+                    name, node_id = str(node["name"]), str(node["folder_id"])
+                    if base is None:
+                        base = FolderPath(name, node_id)
+                    else:
+                        base = FolderPath(f"{base.name_path}/{name}", f"{base.id_path}/{node_id}")
+                    computed[node_id] = base
+                    fresh[node_id] = base
+                return base
+
+            for folder_id in wanted:
+                path = path_of(folder_id)
+                if path is not None:
+                    resolution.paths[folder_id] = path
+
+            if fresh:
+                await session.execute_many(
+                    f"""
+                    UPDATE {SOURCE_FOLDER_TABLE}
+                    SET name_path = :name_path, id_path = :id_path
+                    WHERE actor_id = :actor_id AND folder_id = :folder_id
+                    """,
+                    [
+                        {
+                            "actor_id": int(actor_id),
+                            "folder_id": folder_id,
+                            "name_path": path.name_path,
+                            "id_path": path.id_path,
+                        }
+                        for folder_id, path in fresh.items()
+                    ],
+                )
+                await session.commit()
+        return resolution
+
+    async def delete(self, *, actor_id: int, folder_ids: Collection[str]) -> None:
+        ids = [str(folder_id) for folder_id in folder_ids if folder_id]
+        if not ids:
+            return
+        async with session_scope() as session:
+            existing = await _load_rows(session, actor_id, ids)
+            for row in existing.values():
+                if row["id_path"] is None:
+                    continue
+                lower, upper = _subtree_bounds(str(row["id_path"]))
+                await execute(
+                    session,
+                    f"""
+                    DELETE FROM {SOURCE_FOLDER_TABLE}
+                    WHERE actor_id = ? AND id_path >= ? AND id_path < ?
+                    """,
+                    [int(actor_id), lower, upper],
+                )
+            for start in range(0, len(ids), _LOOKUP_CHUNK):
+                chunk = ids[start : start + _LOOKUP_CHUNK]
+                placeholders = ", ".join("?" for _ in chunk)
+                await execute(
+                    session,
+                    f"DELETE FROM {SOURCE_FOLDER_TABLE} WHERE actor_id = ? AND folder_id IN ({placeholders})",
+                    [int(actor_id), *chunk],
+                )
+            await session.commit()
+
+    async def count(self, *, actor_id: int) -> int:
+        async with session_scope() as session:
+            total = await scalar(
+                session,
+                f"SELECT COUNT(*) AS total FROM {SOURCE_FOLDER_TABLE} WHERE actor_id = ?",
+                [int(actor_id)],
+            )
+        return int(total or 0)
+
+
+async def _load_rows(
+    session: Any, actor_id: int, folder_ids: Collection[str]
+) -> dict[str, dict[str, Any]]:
+    ids = list(folder_ids)
+    rows: dict[str, dict[str, Any]] = {}
+    for start in range(0, len(ids), _LOOKUP_CHUNK):
+        chunk = ids[start : start + _LOOKUP_CHUNK]
+        placeholders = ", ".join("?" for _ in chunk)
+        for row in await select(
+            session,
+            f"""
+            SELECT folder_id, name, parent_id, name_path, id_path
+            FROM {SOURCE_FOLDER_TABLE}
+            WHERE actor_id = ? AND folder_id IN ({placeholders})
+            """,
+            [int(actor_id), *chunk],
+        ):
+            rows[str(row["folder_id"])] = row
+    return rows
+
+
+async def _reset_subtree(session: Any, actor_id: int, id_path: str) -> None:
+    lower, upper = _subtree_bounds(id_path)
+    await execute(
+        session,
+        f"""
+        UPDATE {SOURCE_FOLDER_TABLE}
+        SET name_path = NULL, id_path = NULL
+        WHERE actor_id = ? AND (id_path = ? OR (id_path >= ? AND id_path < ?))
+        """,
+        [int(actor_id), id_path, lower, upper],
+    )
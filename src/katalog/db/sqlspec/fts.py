@@ -7,13 +7,58 @@ from katalog.db.sqlspec import session_scope
 from katalog.db.sqlspec.query_search import fts5_query_from_user_text
 from katalog.db.sqlspec.sql_helpers import execute, scalar, select
 from katalog.db.sqlspec.tables import METADATA_TABLE
-from katalog.db.fts import FtsPoint, FtsSearchHit
+from katalog.db.fts import FtsPoint, FtsSearchHit, FtsTableStats
+
+# Row id of the FTS5 structure record in the %_data shadow table.
+_FTS5_STRUCTURE_ROWID = 10
+_FTS5_STRUCTURE_V2 = b"\xff\x00\x00\x01"
+_FTS5_MERGE_SETTINGS = ("automerge", "crisismerge", "usermerge", "pgsz")
 
 
 def fts_table_name(actor_id: int) -> str:
     return f"fts_index_actor_{int(actor_id)}"
 
 
+def _read_varint(buf: bytes, offset: int) -> tuple[int, int]:
+    """Decode one SQLite varint, returning (value, next offset)."""
+    value = 0
+    for index in range(8):
+        byte = buf[offset + index]
+        value = (value << 7) | (byte & 0x7F)
+        if byte < 0x80:
+            return value, offset + index + 1
+    return (value << 8) | buf[offset + 8], offset + 9
+
+
+def parse_fts5_structure(blob: bytes | None) -> tuple[list[int], int, int]:
+    """Return (segments per level, total pages, write counter) from a structure record."""
+    if not blob or len(blob) < 4:
+        return [], 0, 0
+    offset = 4  # Skip the 32-bit configuration cookie.
+    is_v2 = blob[offset : offset + 4] == _FTS5_STRUCTURE_V2
+    if is_v2:
+        offset += 4
+    level_count, offset = _read_varint(blob, offset)
+    _segment_count, offset = _read_varint(blob, offset)
+    write_counter, offset = _read_varint(blob, offset)
+    segments_per_level: list[int] = []
+    pages = 0
+    for _ in range(level_count):
+        _merge, offset = _read_varint(blob, offset)
+        level_segments, offset = _read_varint(blob, offset)
+        segments_per_level.append(level_segments)
+        for _ in range(level_segments):
+            _segid, offset = _read_varint(blob, offset)
+            first_page, offset = _read_varint(blob, offset)
+            last_page, offset = _read_varint(blob, offset)
+            pages += max(0, last_page - first_page + 1)
+            if is_v2:
+                # origin1, origin2, tombstone pages, tombstone entries, entries
+                for _ in range(5):
+                    _value, offset = _read_varint(blob, offset)
+    return segments_per_level, pages, write_counter
+
+
 class SqlspecFtsRepo:
     INSERT_BATCH_SIZE = 200
 
@@ -47,7 +92,7 @@ class SqlspecFtsRepo:
         points: Sequence[FtsPoint],
     ) -> int:
         table = fts_table_name(actor_id)
-        async with session_scope(analysis=True) as session:
+        async with session_scope() as session:
             await self._ensure_table(session, actor_id=actor_id)
             if metadata_key_ids:
                 key_placeholders = ", ".join("?" for _ in metadata_key_ids)
@@ -108,7 +153,13 @@ class SqlspecFtsRepo:
         offset: int = 0,
         asset_ids: Sequence[int] | None = None,
         metadata_key_ids: Sequence[int] | None = None,
+        with_total: bool = True,
     ) -> tuple[list[FtsSearchHit], int]:
+        """Return ranked hits and the total match count.
+
+        With `with_total=False` the COUNT query is skipped (useful for bounded
+        candidate pools) and the returned total is the number of hits.
+        """
         if limit <= 0:
             return [], 0
         if asset_ids is not None and len(asset_ids) == 0:
@@ -142,19 +193,21 @@ class SqlspecFtsRepo:
                 params.extend(int(value) for value in metadata_key_ids)
             where_sql = " AND ".join(clauses)
 
-            total = int(
-                await scalar(
-                    session,
-                    f"""
-                    SELECT COUNT(*) AS cnt
-                    FROM "{table}" f
-                    JOIN {METADATA_TABLE} m ON m.id = f.rowid
-                    WHERE {where_sql}
-                    """,
-                    params,
+            total: int | None = None
+            if with_total:
+                total = int(
+                    await scalar(
+                        session,
+                        f"""
+                        SELECT COUNT(*) AS cnt
+                        FROM "{table}" f
+                        JOIN {METADATA_TABLE} m ON m.id = f.rowid
+                        WHERE {where_sql}
+                        """,
+                        params,
+                    )
+                    or 0
                 )
-                or 0
-            )
 
             rows = await select(
                 session,
@@ -183,7 +236,93 @@ class SqlspecFtsRepo:
                 )
                 for row in rows
             ]
-            return hits, total
+            return hits, total if total is not None else len(hits)
+
+    async def list_index_tables(self) -> list[str]:
+        async with session_scope(analysis=True) as session:
+            rows = await select(
+                session,
+                """
+                SELECT name FROM sqlite_master
+                WHERE type = 'table' AND sql LIKE 'CREATE VIRTUAL TABLE%USING fts5%'
+                ORDER BY name
+                """,
+            )
+        return [str(row["name"]) for row in rows]
+
+    async def table_stats(self, table: str) -> FtsTableStats:
+        async with session_scope(analysis=True) as session:
+            structure = await select(
+                session,
+                f'SELECT block FROM "{table}_data" WHERE id = ?',
+                [_FTS5_STRUCTURE_ROWID],
+            )
+            data_bytes = await scalar(
+                session,
+                f'SELECT COALESCE(SUM(LENGTH(block)), 0) FROM "{table}_data"',
+            )
+            config_rows = await select(session, f'SELECT k, v FROM "{table}_config"')
+        segments_per_level, pages, write_counter = parse_fts5_structure(
+            structure[0]["block"] if structure else None
+        )
+        settings = {
+            str(row["k"]): int(row["v"])
+            for row in config_rows
+            if str(row["k"]) in _FTS5_MERGE_SETTINGS
+        }
+        return FtsTableStats(
+            table=table,
+            segments_per_level=segments_per_level,
+            segments=sum(segments_per_level),
+            pages=pages,
+            data_bytes=int(data_bytes or 0),
+            write_counter=write_counter,
+            settings=settings,
+        )
+
+    async def configure_merge(
+        self,
+        table: str,
+        *,
+        automerge: int | None = None,
+        crisismerge: int | None = None,
+        usermerge: int | None = None,
+    ) -> None:
+        """Persist FTS5 merge settings for `table` (stored in its %_config table)."""
+        settings = {
+            "automerge": automerge,
+            "crisismerge": crisismerge,
+            "usermerge": usermerge,
+        }
+        async with session_scope() as session:
+            for name, value in settings.items():
+                if value is None:
+                    continue
+                await execute(
+                    session,
+                    f'INSERT INTO "{table}"("{table}", rank) VALUES (?, ?)',
+                    [name, int(value)],
+                )
+            await session.commit()
+
+    async def merge_step(self, table: str, *, pages: int) -> bool:
+        """Run one incremental merge of up to `pages` pages; return True if work was done."""
+        async with session_scope() as session:
+            before = await scalar(session, "SELECT total_changes()")
+            await execute(
+                session,
+                f'INSERT INTO "{table}"("{table}", rank) VALUES (\'merge\', ?)',
+                [int(pages)],
+            )
+            after = await scalar(session, "SELECT total_changes()")
+            await session.commit()
+        # The command row itself counts as one change; anything beyond is merge work.
+        return int(after or 0) - int(before or 0) > 1
+
+    async def optimize(self, table: str) -> None:
+        async with session_scope() as session:
+            await execute(session, f'INSERT INTO "{table}"("{table}") VALUES (\'optimize\')')
+            await session.commit()
 
     async def _ensure_table(self, session: Any, *, actor_id: int) -> str:
         table = fts_table_name(actor_id)
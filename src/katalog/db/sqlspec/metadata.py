@@ -15,6 +15,7 @@ from katalog.constants.metadata import (
     get_metadata_id,
 )
 from katalog.db.fts import FtsPoint, get_fts_repo
+from katalog.db.relations import get_relation_repo
 from katalog.db.vectors import VectorPoint, get_vector_repo
 from katalog.db.sqlspec import session_scope
 from katalog.db.sqlspec.tables import METADATA_TABLE
@@ -122,6 +123,7 @@ class SqlspecMetadataRepo:
 
         async def _insert(active_session: Any, *, commit: bool) -> None:
             await active_session.execute_many(sql, rows)
+            await get_relation_repo().apply(metadata, session=active_session)
             if commit:
                 await active_session.commit()
 
@@ -313,6 +315,25 @@ class SqlspecMetadataRepo:
             await self.bulk_create(indexed_count_entries)
         return total_indexed
 
+    async def changeset_changes(
+        self, changeset_id: int
+    ) -> tuple[list[int], list[int]]:
+        async with session_scope(analysis=True) as session:
+            asset_rows = await select(
+                session,
+                f"SELECT DISTINCT asset_id FROM {METADATA_TABLE} WHERE changeset_id = ?",
+                [int(changeset_id)],
+            )
+            key_rows = await select(
+                session,
+                f"SELECT DISTINCT metadata_key_id FROM {METADATA_TABLE} WHERE changeset_id = ?",
+                [int(changeset_id)],
+            )
+        return (
+            sorted(int(row["asset_id"]) for row in asset_rows),
+            sorted(int(row["metadata_key_id"]) for row in key_rows),
+        )
+
 
 def _searchable_metadata_key_ids() -> set[int]:
     key_ids: set[int] = set()
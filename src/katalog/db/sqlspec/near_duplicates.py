@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Collection, Sequence
+from typing import Any
+
+from katalog.db.near_duplicates import NearDuplicatePair, NearDuplicateSignature
+from katalog.db.sqlspec import session_scope
+from katalog.db.sqlspec.sql_helpers import execute, select
+from katalog.db.sqlspec.tables import (
+    NEAR_DUPLICATE_BAND_TABLE,
+    NEAR_DUPLICATE_PAIR_TABLE,
+    NEAR_DUPLICATE_SIGNATURE_TABLE,
+)
+
+# Keep IN (...) lists below SQLite's bound-parameter limit.
+_LOOKUP_CHUNK = 500
+_UINT64 = 1 << 64
+
+
+def _to_signed(value: int | None) -> int | None:
+    # SimHashes are unsigned 64-bit; SQLite integers are signed.
+    if value is None:
+        return None
+    return value - _UINT64 if value >= 1 << 63 else value
+
+
+def _to_unsigned(value: int | None) -> int | None:
+    if value is None:
+        return None
+    return value + _UINT64 if value < 0 else value
+
+
+def _chunks(ids: Collection[int]) -> list[list[int]]:
+    values = sorted({int(value) for value in ids})
+    return [values[start : start + _LOOKUP_CHUNK] for start in range(0, len(values), _LOOKUP_CHUNK)]
+
+
+def _placeholders(values: Sequence[Any]) -> str:
+    return ", ".join("?" for _ in values)
+
+
+class SqlspecNearDuplicateRepo:
+    async def index(
+        self, *, actor_id: int, signatures: Sequence[NearDuplicateSignature]
+    ) -> None:
+        unique = {int(signature.asset_id): signature for signature in signatures}
+        if not unique:
+            return
+        async with session_scope() as session:
+            for chunk in _chunks(unique.keys()):
+                await execute(
+                    session,
+                    f"DELETE FROM {NEAR_DUPLICATE_BAND_TABLE} "
+                    f"WHERE actor_id = ? AND asset_id IN ({_placeholders(chunk)})",
+                    [int(actor_id), *chunk],
+                )
+            await session.execute_many(
+                f"""
+                INSERT INTO {NEAR_DUPLICATE_SIGNATURE_TABLE} (actor_id, asset_id, minhash, simhash, dirty)
+                VALUES (:actor_id, :asset_id, :minhash, :simhash, 1)
+                ON CONFLICT(actor_id, asset_id) DO UPDATE SET
+                    minhash = excluded.minhash,
+                    simhash = excluded.simhash,
+                    dirty = 1
+                """,
+                [
+                    {
+                        "actor_id": int(actor_id),
+                        "asset_id": asset_id,
+                        "minhash": (
+                            json.dumps(list(signature.minhash))
+                            if signature.minhash is not None
+                            else None
+                        ),
+                        "simhash": _to_signed(signature.simhash),
+                    }
+                    for asset_id, signature in unique.items()
+                ],
+            )
+            band_rows = [
+                {
+                    "actor_id": int(actor_id),
+                    "kind": kind,
+                    "band": int(band),
+                    "bucket": int(bucket),
+                    "asset_id": asset_id,
+                }
+                for asset_id, signature in unique.items()
+                for kind, band, bucket in signature.bands
+            ]
+            if band_rows:
+                await session.execute_many(
+                    f"""
+                    INSERT OR IGNORE INTO {NEAR_DUPLICATE_BAND_TABLE} (actor_id, kind, band, bucket, asset_id)
+                    VALUES (:actor_id, :kind, :band, :bucket, :asset_id)
+                    """,
+                    band_rows,
+                )
+            await session.commit()
+
+    async def remove(
+        self, *, actor_id: int, asset_ids: Collection[int]
+    ) -> list[NearDuplicatePair]:
+        chunks = _chunks(asset_ids)
+        if not chunks:
+            return []
+        pairs: dict[tuple[int, int], NearDuplicatePair] = {}
+        async with session_scope() as session:
+            for chunk in chunks:
+                for column in ("asset_id", "other_id"):
+                    rows = await select(
+                        session,
+                        f"""
+                        SELECT asset_id, other_id, similarity
+                        FROM {NEAR_DUPLICATE_PAIR_TABLE}
+                        WHERE actor_id = ? AND {column} IN ({_placeholders(chunk)})
+                        """,
+                        [int(actor_id), *chunk],
+                    )
+                    for row in rows:
+                        pair = NearDuplicatePair(
+                            int(row["asset_id"]), int(row["other_id"]), float(row["similarity"])
+                        )
+                        pairs[(pair.asset_id, pair.other_id)] = pair
+                    await execute(
+                        session,
+                        f"DELETE FROM {NEAR_DUPLICATE_PAIR_TABLE} "
+                        f"WHERE actor_id = ? AND {column} IN ({_placeholders(chunk)})",
+                        [int(actor_id), *chunk],
+                    )
+                for table in (NEAR_DUPLICATE_BAND_TABLE, NEAR_DUPLICATE_SIGNATURE_TABLE):
+                    await execute(
+                        session,
+                        f"DELETE FROM {table} WHERE actor_id = ? AND asset_id IN ({_placeholders(chunk)})",
+                        [int(actor_id), *chunk],
+                    )
+            await session.commit()
+        return list(pairs.values())
+
+    async def dirty_asset_ids(self, *, actor_id: int) -> list[int]:
+        async with session_scope() as session:
+            rows = await select(
+                session,
+                f"SELECT asset_id FROM {NEAR_DUPLICATE_SIGNATURE_TABLE} WHERE actor_id = ? AND dirty = 1",
+                [int(actor_id)],
+            )
+        return [int(row["asset_id"]) for row in rows]
+
+    async def candidate_pairs(
+        self, *, actor_id: int, asset_ids: Collection[int], max_bucket_size: int
+    ) -> set[tuple[int, int]]:
+        pairs: set[tuple[int, int]] = set()
+        async with session_scope(analysis=True) as session:
+            for chunk in _chunks(asset_ids):
+                rows = await select(
+                    session,
+                    f"""
+                    SELECT DISTINCT p.asset_id AS probe, q.asset_id AS other
+                    FROM {NEAR_DUPLICATE_BAND_TABLE} p
+                    JOIN {NEAR_DUPLICATE_BAND_TABLE} q
+                      ON q.actor_id = p.actor_id
+                     AND q.kind = p.kind
+                     AND q.band = p.band
+                     AND q.bucket = p.bucket
+                     AND q.asset_id != p.asset_id
+                    JOIN {NEAR_DUPLICATE_SIGNATURE_TABLE} s
+                      ON s.actor_id = q.actor_id
+                     AND s.asset_id = q.asset_id
+                    WHERE p.actor_id = ?
+                      AND p.asset_id IN ({_placeholders(chunk)})
+                      AND (s.dirty = 0 OR q.asset_id > p.asset_id)
+                      AND (
+                          SELECT COUNT(*) FROM (
+                              SELECT 1 FROM {NEAR_DUPLICATE_BAND_TABLE} c
+                              WHERE c.actor_id = p.actor_id
+                                AND c.kind = p.kind
+                                AND c.band = p.band
+                                AND c.bucket = p.bucket
+                              LIMIT ?
+                          )
+                      ) <= ?
+                    """,
+                    [int(actor_id), *chunk, int(max_bucket_size) + 1, int(max_bucket_size)],
+                )
+                pairs.update((int(row["probe"]), int(row["other"])) for row in rows)
+        return pairs
+
+    async def pairs_for(
+        self, *, actor_id: int, asset_ids: Collection[int]
+    ) -> dict[tuple[int, int], float]:
+        pairs: dict[tuple[int, int], float] = {}
+        async with session_scope(analysis=True) as session:
+            for chunk in _chunks(asset_ids):
+                # The larger id owns a pair only while its partner is clean;
+                # the smaller id owns it always (see candidate_pairs).
+                rows = await select(
+                    session,
+                    f"""
+                    SELECT np.asset_id AS probe, np.other_id AS other, np.similarity
+                    FROM {NEAR_DUPLICATE_PAIR_TABLE} np
+                    JOIN {NEAR_DUPLICATE_SIGNATURE_TABLE} s
+                      ON s.actor_id = np.actor_id
+                     AND s.asset_id = np.other_id
+                    WHERE np.actor_id = ?
+                      AND np.asset_id IN ({_placeholders(chunk)})
+                      AND s.dirty = 0
+                    UNION ALL
+                    SELECT np.other_id AS probe, np.asset_id AS other, np.similarity
+                    FROM {NEAR_DUPLICATE_PAIR_TABLE} np
+                    WHERE np.actor_id = ?
+                      AND np.other_id IN ({_placeholders(chunk)})
+                    """,
+                    [int(actor_id), *chunk, int(actor_id), *chunk],
+                )
+                for row in rows:
+                    pairs[(int(row["probe"]), int(row["other"]))] = float(row["similarity"])
+        return pairs
+
+    async def signatures(
+        self, *, actor_id: int, asset_ids: Collection[int]
+    ) -> dict[int, NearDuplicateSignature]:
+        found: dict[int, NearDuplicateSignature] = {}
+        async with session_scope(analysis=True) as session:
+            for chunk in _chunks(asset_ids):
+                rows = await select(
+                    session,
+                    f"""
+                    SELECT asset_id, minhash, simhash
+                    FROM {NEAR_DUPLICATE_SIGNATURE_TABLE}
+                    WHERE actor_id = ? AND asset_id IN ({_placeholders(chunk)})
+                    """,
+                    [int(actor_id), *chunk],
+                )
+                for row in rows:
+                    minhash = row["minhash"]
+                    if isinstance(minhash, str):
+                        minhash = json.loads(minhash)
+                    found[int(row["asset_id"])] = NearDuplicateSignature(
+                        asset_id=int(row["asset_id"]),
+                        minhash=tuple(minhash) if minhash else None,
+                        simhash=_to_unsigned(row["simhash"]),
+                    )
+        return found
+
+    async def save_pairs(
+        self,
+        *,
+        actor_id: int,
+        added: Sequence[NearDuplicatePair],
+        removed: Collection[tuple[int, int]],
+        verified_asset_ids: Collection[int],
+    ) -> None:
+        async with session_scope() as session:
+            if removed:
+                await session.execute_many(
+                    f"""
+                    DELETE FROM {NEAR_DUPLICATE_PAIR_TABLE}
+                    WHERE actor_id = :actor_id AND asset_id = :asset_id AND other_id = :other_id
+                    """,
+                    [
+                        {
+                            "actor_id": int(actor_id),
+                            "asset_id": max(left, right),
+                            "other_id": min(left, right),
+                        }
+                        for left, right in removed
+                    ],
+                )
+            if added:
+                await session.execute_many(
+                    f"""
+                    INSERT INTO {NEAR_DUPLICATE_PAIR_TABLE} (actor_id, asset_id, other_id, similarity)
+                    VALUES (:actor_id, :asset_id, :other_id, :similarity)
+                    ON CONFLICT(actor_id, asset_id, other_id) DO UPDATE SET
+                        similarity = excluded.similarity
+                    """,
+                    [
+                        {
+                            "actor_id": int(actor_id),
+                            "asset_id": int(pair.asset_id),
+                            "other_id": int(pair.other_id),
+                            "similarity": float(pair.similarity),
+                        }
+                        for pair in added
+                    ],
+                )
+            for chunk in _chunks(verified_asset_ids):
+                await execute(
+                    session,
+                    f"UPDATE {NEAR_DUPLICATE_SIGNATURE_TABLE} SET dirty = 0 "
+                    f"WHERE actor_id = ? AND asset_id IN ({_placeholders(chunk)})",
+                    [int(actor_id), *chunk],
+                )
+            await session.commit()
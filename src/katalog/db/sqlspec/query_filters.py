@@ -1,15 +1,24 @@
-from typing import Any, Mapping
+from typing import Any, Collection, Mapping
 
 from katalog.constants.metadata import METADATA_REGISTRY, MetadataKey, get_metadata_id
-from katalog.db.sqlspec.tables import METADATA_TABLE
+from katalog.db.sqlspec.tables import METADATA_TABLE, METADATA_TRIGRAM_TABLE
+from katalog.db.sqlspec.trigram import trigram_needle_supported
 from katalog.models import MetadataType
 from katalog.models.query import AssetFilter
 
 from katalog.db.sqlspec.query_fields import asset_filter_fields
 
 
-def _metadata_filter_condition(filt: Mapping[str, Any]) -> tuple[str, list[Any]]:
-    """Build SQL predicate + params for a metadata-based filter."""
+def _metadata_filter_condition(
+    filt: Mapping[str, Any],
+    *,
+    trigram_key_ids: Collection[int] = (),
+) -> tuple[str, list[Any]]:
+    """Build SQL predicate + params for a metadata-based filter.
+
+    Substring/prefix/suffix filters on keys in `trigram_key_ids` are narrowed
+    through the trigram index before the latest-value check.
+    """
 
     accessor = filt.get("key")
     operator = filt.get("op")
@@ -187,10 +196,29 @@ def _metadata_filter_condition(filt: Mapping[str, Any]) -> tuple[str, list[Any]]
         ")"
     )
     params = [registry_id, registry_id, *value_params]
+    if (
+        operator in {"contains", "startsWith", "endsWith"}
+        and registry_id in trigram_key_ids
+        and trigram_needle_supported(str(value))
+    ):
+        # The trigram LIKE returns a superset of assets (any historical row);
+        # the EXISTS below keeps exact latest-value semantics.
+        candidates = (
+            "a.id IN ("
+            f"SELECT m.asset_id FROM {METADATA_TRIGRAM_TABLE} t "
+            f"JOIN {metadata_table} m ON m.id = t.rowid "
+            "WHERE t.value_text LIKE ? AND m.metadata_key_id = ?"
+            ")"
+        )
+        return f"({candidates} AND {condition})", [
+            *value_params,
+            registry_id,
+            *params,
+        ]
     return condition, params
 
 
-def filter_conditions(filters):
+def filter_conditions(filters, *, trigram_key_ids: Collection[int] = ()):
     filters = filters or []
     conditions = []
     filter_params = []
@@ -287,7 +315,9 @@ def filter_conditions(filters):
             else:
                 raise ValueError(f"Unsupported filter operator: {operator}")
         else:
-            condition, params = _metadata_filter_condition(filt)
+            condition, params = _metadata_filter_condition(
+                filt, trigram_key_ids=trigram_key_ids
+            )
             conditions.append(condition)
             filter_params.extend(params)
     return conditions, filter_params
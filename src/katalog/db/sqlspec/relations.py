@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+from collections.abc import Collection, Sequence
+from typing import TYPE_CHECKING, Any
+
+from katalog.db.relations import (
+    MAX_TRAVERSAL_DEPTH,
+    MAX_TRAVERSAL_RESULTS,
+    MAX_TRAVERSAL_ROWS,
+    RelatedAsset,
+    RelationDirection,
+    RelationEdge,
+    Traversal,
+)
+from katalog.db.sqlspec import session_scope
+from katalog.db.sqlspec.sql_helpers import execute, scalar, select
+from katalog.db.sqlspec.tables import METADATA_TABLE, RELATION_EDGE_TABLE
+
+if TYPE_CHECKING:
+    from katalog.models.metadata import Metadata
+
+# Keep IN (...) lists below SQLite's bound-parameter limit.
+_LOOKUP_CHUNK = 500
+
+
+def _placeholders(values: Sequence[Any]) -> str:
+    return ", ".join("?" for _ in values)
+
+
+def _key_filter(alias: str, key_ids: Collection[int] | None) -> tuple[str, list[int]]:
+    if key_ids is None:
+        return "", []
+    keys = sorted({int(key_id) for key_id in key_ids})
+    if not keys:
+        # An explicit empty key list matches nothing.
+        return " AND 0", []
+    return f" AND {alias}.metadata_key_id IN ({_placeholders(keys)})", keys
+
+
+def _steps(
+    direction: RelationDirection,
+    key_ids: Collection[int] | None,
+    *,
+    max_depth: int | None = None,
+) -> tuple[str, list[Any]]:
+    """Recursive steps of a walk over `walk(asset_id)`, or `walk(asset_id, depth)` with a max depth."""
+    key_sql, key_params = _key_filter("e", key_ids)
+    with_depth = max_depth is not None
+    next_depth = ", w.depth + 1" if with_depth else ""
+    depth_guard = " AND w.depth < ?" if with_depth else ""
+    arms: list[tuple[str, str]] = []
+    if direction in ("out", "both"):
+        arms.append(("to_asset_id", "from_asset_id"))
+    if direction in ("in", "both"):
+        arms.append(("from_asset_id", "to_asset_id"))
+    sql = "\n".join(
+        f"""
+        UNION
+        SELECT e.{target}{next_depth}
+        FROM walk w
+        JOIN {RELATION_EDGE_TABLE} e ON e.{source} = w.asset_id
+        WHERE 1 = 1{key_sql}{depth_guard}
+        """
+        for target, source in arms
+    )
+    params: list[Any] = []
+    for _ in arms:
+        params.extend(key_params)
+        if with_depth:
+            params.append(int(max_depth))
+    return sql, params
+
+
+class SqlspecRelationRepo:
+    async def apply(self, metadata: Sequence["Metadata"], *, session: Any) -> int:
+        # Later rows win, so a removal followed by a re-add in one batch keeps the edge.
+        latest: dict[tuple[int, int, int, int], tuple[bool, int]] = {}
+        for entry in metadata:
+            if (
+                entry.value_relation_id is None
+                or entry.asset_id is None
+                or entry.metadata_key_id is None
+                or entry.actor_id is None
+            ):
+                continue
+            edge = (
+                int(entry.asset_id),
+                int(entry.metadata_key_id),
+                int(entry.value_relation_id),
+                int(entry.actor_id),
+            )
+            latest[edge] = (bool(entry.removed), int(entry.changeset_id or 0))
+        if not latest:
+            return 0
+
+        def _row(edge: tuple[int, int, int, int]) -> dict[str, int]:
+            return {
+                "from_asset_id": edge[0],
+                "metadata_key_id": edge[1],
+                "to_asset_id": edge[2],
+                "actor_id": edge[3],
+            }
+
+        removed = [_row(edge) for edge, (is_removed, _cs) in latest.items() if is_removed]
+        current = [
+            {**_row(edge), "changeset_id": changeset_id}
+            for edge, (is_removed, changeset_id) in latest.items()
+            if not is_removed
+        ]
+        if removed:
+            await session.execute_many(
+                f"""
+                DELETE FROM {RELATION_EDGE_TABLE}
+                WHERE from_asset_id = :from_asset_id
+                  AND metadata_key_id = :metadata_key_id
+                  AND to_asset_id = :to_asset_id
+                  AND actor_id = :actor_id
+                """,
+                removed,
+            )
+        if current:
+            await session.execute_many(
+                f"""
+                INSERT INTO {RELATION_EDGE_TABLE}
+                    (from_asset_id, metadata_key_id, to_asset_id, actor_id, changeset_id)
+                VALUES (:from_asset_id, :metadata_key_id, :to_asset_id, :actor_id, :changeset_id)
+                ON CONFLICT(from_asset_id, metadata_key_id, to_asset_id, actor_id) DO UPDATE SET
+                    changeset_id = excluded.changeset_id
+                """,
+                current,
+            )
+        return len(latest)
+
+    async def remove_assets(self, asset_ids: Sequence[int], *, session: Any) -> None:
+        ids = sorted({int(asset_id) for asset_id in asset_ids})
+        for start in range(0, len(ids), _LOOKUP_CHUNK):
+            chunk = ids[start : start + _LOOKUP_CHUNK]
+            await execute(
+                session,
+                f"""
+                DELETE FROM {RELATION_EDGE_TABLE}
+                WHERE from_asset_id IN ({_placeholders(chunk)})
+                   OR to_asset_id IN ({_placeholders(chunk)})
+                """,
+                [*chunk, *chunk],
+            )
+
+    async def rebuild(self) -> int:
+        async with session_scope() as session:
+            await execute(session, f"DELETE FROM {RELATION_EDGE_TABLE}")
+            await execute(
+                session,
+                f"""
+                INSERT INTO {RELATION_EDGE_TABLE}
+                    (from_asset_id, metadata_key_id, to_asset_id, actor_id, changeset_id)
+                SELECT asset_id, metadata_key_id, value_relation_id, actor_id, changeset_id
+                FROM (
+                    SELECT
+                        m.asset_id,
+                        m.metadata_key_id,
+                        m.value_relation_id,
+                        m.actor_id,
+                        m.changeset_id,
+                        m.removed,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY m.asset_id, m.metadata_key_id, m.value_relation_id, m.actor_id
+                            ORDER BY m.changeset_id DESC, m.id DESC
+                        ) AS rn
+                    FROM {METADATA_TABLE} m
+                    WHERE m.value_relation_id IS NOT NULL
+                      AND m.actor_id IS NOT NULL
+                )
+                WHERE rn = 1 AND removed = 0
+                """,
+            )
+            total = int(await scalar(session, f"SELECT COUNT(*) FROM {RELATION_EDGE_TABLE}") or 0)
+            await session.commit()
+        return total
+
+    async def ensure_backfilled(self) -> bool:
+        async with session_scope(analysis=True) as session:
+            has_edges = await scalar(session, f"SELECT EXISTS (SELECT 1 FROM {RELATION_EDGE_TABLE})")
+            if has_edges:
+                return False
+            has_relations = await scalar(
+                session,
+                f"SELECT EXISTS (SELECT 1 FROM {METADATA_TABLE} WHERE value_relation_id IS NOT NULL)",
+            )
+        if not has_relations:
+            return False
+        await self.rebuild()
+        return True
+
+    async def count(self) -> int:
+        async with session_scope(analysis=True) as session:
+            return int(await scalar(session, f"SELECT COUNT(*) FROM {RELATION_EDGE_TABLE}") or 0)
+
+    async def neighbors(
+        self,
+        asset_id: int,
+        *,
+        direction: RelationDirection = "both",
+        key_ids: Collection[int] | None = None,
+        limit: int = 100,
+    ) -> list[RelationEdge]:
+        key_sql, key_params = _key_filter("e", key_ids)
+        arms: list[str] = []
+        params: list[Any] = []
+        for column, wanted in (("from_asset_id", "out"), ("to_asset_id", "in")):
+            if direction not in (wanted, "both"):
+                continue
+            arms.append(
+                f"""
+                SELECT
+                    e.from_asset_id,
+                    e.metadata_key_id,
+                    e.to_asset_id,
+                    GROUP_CONCAT(e.actor_id) AS actor_ids
+                FROM {RELATION_EDGE_TABLE} e
+                WHERE e.{column} = ?{key_sql}
+                GROUP BY e.from_asset_id, e.metadata_key_id, e.to_asset_id
+                """
+            )
+            params.extend([int(asset_id), *key_params])
+        sql = f"""
+            SELECT * FROM ({" UNION ALL ".join(arms)})
+            ORDER BY metadata_key_id, from_asset_id, to_asset_id
+            LIMIT ?
+        """
+        async with session_scope(analysis=True) as session:
+            rows = await select(session, sql, [*params, min(int(limit), MAX_TRAVERSAL_RESULTS)])
+        return [
+            RelationEdge(
+                from_asset_id=int(row["from_asset_id"]),
+                metadata_key_id=int(row["metadata_key_id"]),
+                to_asset_id=int(row["to_asset_id"]),
+                actor_ids=tuple(
+                    sorted({int(part) for part in str(row["actor_ids"] or "").split(",") if part})
+                ),
+            )
+            for row in rows
+        ]
+
+    async def traverse(
+        self,
+        asset_id: int,
+        *,
+        max_depth: int,
+        direction: RelationDirection = "both",
+        key_ids: Collection[int] | None = None,
+        limit: int = 1000,
+    ) -> Traversal:
+        max_depth = max(0, min(int(max_depth), MAX_TRAVERSAL_DEPTH))
+        limit = max(0, min(int(limit), MAX_TRAVERSAL_RESULTS))
+        steps_sql, step_params = _steps(direction, key_ids, max_depth=max_depth)
+        # UNION over (asset_id, depth) keeps cycles finite: an asset is
+        # revisited at most once per depth level.
+        sql = f"""
+            WITH RECURSIVE walk(asset_id, depth) AS (
+                SELECT ?, 0
+                {steps_sql}
+                LIMIT ?
+            ),
+            nearest AS (
+                SELECT asset_id, MIN(depth) AS depth, COUNT(*) AS visits
+                FROM walk
+                GROUP BY asset_id
+            )
+            SELECT
+                asset_id,
+                depth,
+                COUNT(*) OVER () AS reached,
+                (SELECT SUM(visits) FROM nearest) AS generated
+            FROM nearest
+            WHERE asset_id != ?
+            ORDER BY depth, asset_id
+            LIMIT ?
+        """
+        params = [int(asset_id), *step_params, MAX_TRAVERSAL_ROWS, int(asset_id), limit]
+        async with session_scope(analysis=True) as session:
+            rows = await select(session, sql, params)
+        reached = int(rows[0]["reached"]) if rows else 0
+        generated = int(rows[0]["generated"]) if rows else 0
+        return Traversal(
+            assets=[
+                RelatedAsset(asset_id=int(row["asset_id"]), depth=int(row["depth"]))
+                for row in rows
+            ],
+            truncated=reached > limit or generated >= MAX_TRAVERSAL_ROWS,
+        )
+
+    async def component(
+        self,
+        asset_id: int,
+        *,
+        key_ids: Collection[int] | None = None,
+        limit: int = 1000,
+    ) -> Traversal:
+        limit = max(0, min(int(limit), MAX_TRAVERSAL_RESULTS))
+        steps_sql, step_params = _steps("both", key_ids)
+        # UNION over asset ids alone visits every asset once, so the walk
+        # ends at the component boundary whatever cycles it contains; one
+        # row past the limit tells that the component is larger.
+        sql = f"""
+            WITH RECURSIVE walk(asset_id) AS (
+                SELECT ?
+                {steps_sql}
+                LIMIT ?
+            )
+            SELECT asset_id
+            FROM walk
+            WHERE asset_id != ?
+            ORDER BY asset_id
+        """
+        params = [int(asset_id), *step_params, limit + 2, int(asset_id)]
+        async with session_scope(analysis=True) as session:
+            rows = await select(session, sql, params)
+        return Traversal(
+            assets=[RelatedAsset(asset_id=int(row["asset_id"])) for row in rows[:limit]],
+            truncated=len(rows) > limit,
+        )
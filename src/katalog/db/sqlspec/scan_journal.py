@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Collection
+from datetime import datetime, timezone
+from typing import Any
+
+from katalog.db.scan_journal import ScanSession, ScanSessionStatus
+from katalog.db.sqlspec import session_scope
+from katalog.db.sqlspec.sql_helpers import execute, scalar, select, select_one_or_none
+from katalog.db.sqlspec.tables import SCAN_SESSION_SEEN_TABLE, SCAN_SESSION_TABLE
+from katalog.db.utils import datetime_to_iso, to_utc_datetime
+
+_SESSION_COLUMNS = "id, actor_id, changeset_id, status, cursor, started_at, updated_at"
+
+
+class SqlspecScanJournalRepo:
+    async def open(
+        self,
+        *,
+        actor_id: int,
+        changeset_id: int | None,
+        max_age_seconds: float | None = None,
+    ) -> ScanSession:
+        now = datetime.now(timezone.utc)
+        async with session_scope() as session:
+            row = await select_one_or_none(
+                session,
+                f"SELECT {_SESSION_COLUMNS} FROM {SCAN_SESSION_TABLE} WHERE actor_id = ?",
+                [int(actor_id)],
+            )
+            existing = _row_to_session(row) if row else None
+            if existing is not None and max_age_seconds is not None:
+                updated_at = existing.updated_at or existing.started_at
+                if updated_at is None or (now - updated_at).total_seconds() > max_age_seconds:
+                    await execute(
+                        session,
+                        f"DELETE FROM {SCAN_SESSION_TABLE} WHERE id = ?",
+                        [existing.id],
+                    )
+                    existing = None
+
+            if existing is not None:
+                seen_rows = await select(
+                    session,
+                    f"SELECT actor_id, asset_id FROM {SCAN_SESSION_SEEN_TABLE} WHERE session_id = ?",
+                    [existing.id],
+                )
+                for seen_row in seen_rows:
+                    existing.seen_asset_ids.setdefault(int(seen_row["actor_id"]), set()).add(
+                        int(seen_row["asset_id"])
+                    )
+                existing.resumed = True
+                existing.changeset_id = changeset_id
+                await execute(
+                    session,
+                    f"UPDATE {SCAN_SESSION_TABLE} SET changeset_id = ?, updated_at = ? WHERE id = ?",
+                    [changeset_id, datetime_to_iso(now), existing.id],
+                )
+                await session.commit()
+                return existing
+
+            await execute(
+                session,
+                f"""
+                INSERT INTO {SCAN_SESSION_TABLE}
+                    (actor_id, changeset_id, status, cursor, started_at, updated_at)
+                VALUES (?, ?, 'scanning', NULL, ?, ?)
+                """,
+                [int(actor_id), changeset_id, datetime_to_iso(now), datetime_to_iso(now)],
+            )
+            session_id = await scalar(session, "SELECT last_insert_rowid() AS id")
+            await session.commit()
+        return ScanSession(
+            id=int(session_id),
+            actor_id=int(actor_id),
+            changeset_id=changeset_id,
+            status="scanning",
+            cursor=None,
+            started_at=now,
+            updated_at=now,
+        )
+
+    async def checkpoint(
+        self,
+        session_id: int,
+        *,
+        cursor: dict[str, Any] | None,
+        seen: Collection[tuple[int, int]],
+        status: ScanSessionStatus = "scanning",
+    ) -> None:
+        async with session_scope() as session:
+            if seen:
+                await session.execute_many(
+                    f"""
+                    INSERT OR IGNORE INTO {SCAN_SESSION_SEEN_TABLE} (session_id, asset_id, actor_id)
+                    VALUES (:session_id, :asset_id, :actor_id)
+                    """,
+                    [
+                        {
+                            "session_id": int(session_id),
+                            "asset_id": int(asset_id),
+                            "actor_id": int(actor_id),
+                        }
+                        for actor_id, asset_id in seen
+                    ],
+                )
+            # Written in the same transaction, so the cursor never runs ahead of the seen set.
+            await execute(
+                session,
+                f"""
+                UPDATE {SCAN_SESSION_TABLE}
+                SET cursor = ?, status = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                [
+                    json.dumps(cursor) if cursor is not None else None,
+                    status,
+                    datetime_to_iso(datetime.now(timezone.utc)),
+                    int(session_id),
+                ],
+            )
+            await session.commit()
+
+    async def complete(self, session_id: int) -> None:
+        async with session_scope() as session:
+            await execute(
+                session,
+                f"DELETE FROM {SCAN_SESSION_TABLE} WHERE id = ?",
+                [int(session_id)],
+            )
+            await session.commit()
+
+    async def discard(self, *, actor_id: int) -> bool:
+        async with session_scope() as session:
+            existing = await scalar(
+                session,
+                f"SELECT COUNT(*) FROM {SCAN_SESSION_TABLE} WHERE actor_id = ?",
+                [int(actor_id)],
+            )
+            await execute(
+                session,
+                f"DELETE FROM {SCAN_SESSION_TABLE} WHERE actor_id = ?",
+                [int(actor_id)],
+            )
+            await session.commit()
+        return bool(existing)
+
+    async def get(self, *, actor_id: int) -> ScanSession | None:
+        async with session_scope() as session:
+            row = await select_one_or_none(
+                session,
+                f"SELECT {_SESSION_COLUMNS} FROM {SCAN_SESSION_TABLE} WHERE actor_id = ?",
+                [int(actor_id)],
+            )
+        return _row_to_session(row) if row else None
+
+
+def _row_to_session(row: dict[str, Any]) -> ScanSession:
+    cursor = row.get("cursor")
+    if isinstance(cursor, str):
+        cursor = json.loads(cursor)
+    return ScanSession(
+        id=int(row["id"]),
+        actor_id=int(row["actor_id"]),
+        changeset_id=int(row["changeset_id"]) if row.get("changeset_id") is not None else None,
+        status=str(row["status"]),  # type: ignore[arg-type]
+        cursor=cursor,
+        started_at=to_utc_datetime(row.get("started_at")),
+        updated_at=to_utc_datetime(row.get("updated_at")),
+    )
@@ -0,0 +1,390 @@
+from __future__ import annotations
+
+from collections.abc import Collection, Mapping, Sequence
+from typing import Any
+
+from katalog.db.sidecars import SidecarLink, SidecarLookup
+from katalog.db.sqlspec import session_scope
+from katalog.db.sqlspec.sql_helpers import execute, select
+from katalog.db.sqlspec.tables import (
+    ASSET_TABLE,
+    METADATA_TABLE,
+    SIDECAR_LINK_TABLE,
+    SIDECAR_LOOKUP_KEY_TABLE,
+    SIDECAR_TARGET_KEY_TABLE,
+)
+
+# Keep IN (...) lists below SQLite's bound-parameter limit.
+_LOOKUP_CHUNK = 500
+
+
+def _chunks(values: Collection[Any]) -> list[list[Any]]:
+    ordered = sorted(set(values))
+    return [ordered[start : start + _LOOKUP_CHUNK] for start in range(0, len(ordered), _LOOKUP_CHUNK)]
+
+
+def _placeholders(values: Sequence[Any]) -> str:
+    return ", ".join("?" for _ in values)
+
+
+class SqlspecSidecarIndexRepo:
+    async def clear(self, *, actor_id: int) -> None:
+        async with session_scope() as session:
+            for table in (SIDECAR_TARGET_KEY_TABLE, SIDECAR_LOOKUP_KEY_TABLE, SIDECAR_LINK_TABLE):
+                await execute(session, f"DELETE FROM {table} WHERE actor_id = ?", [int(actor_id)])
+            await session.commit()
+
+    async def changed_asset_ids(
+        self, *, key_ids: Collection[int], since_changeset_id: int | None
+    ) -> list[int]:
+        keys = sorted({int(key_id) for key_id in key_ids})
+        sql = f"""
+            SELECT DISTINCT asset_id
+            FROM {METADATA_TABLE}
+            WHERE metadata_key_id IN ({_placeholders(keys)})
+        """
+        params: list[Any] = list(keys)
+        if since_changeset_id is not None:
+            sql += " AND changeset_id > ?"
+            params.append(int(since_changeset_id))
+        async with session_scope(analysis=True) as session:
+            rows = await select(session, f"{sql} ORDER BY asset_id", params)
+        return [int(row["asset_id"]) for row in rows]
+
+    async def current_values(
+        self, *, asset_ids: Collection[int], key_ids: Collection[int]
+    ) -> dict[int, dict[int, str]]:
+        keys = sorted({int(key_id) for key_id in key_ids})
+        values: dict[int, dict[int, str]] = {}
+        async with session_scope(analysis=True) as session:
+            for chunk in _chunks({int(asset_id) for asset_id in asset_ids}):
+                rows = await select(
+                    session,
+                    f"""
+                    WITH latest AS (
+                        SELECT
+                            m.asset_id,
+                            m.metadata_key_id,
+                            m.value_text,
+                            ROW_NUMBER() OVER (
+                                PARTITION BY m.asset_id, m.metadata_key_id
+                                ORDER BY m.changeset_id DESC, m.id DESC
+                            ) AS rn
+                        FROM {METADATA_TABLE} m
+                        WHERE m.asset_id IN ({_placeholders(chunk)})
+                          AND m.metadata_key_id IN ({_placeholders(keys)})
+                          AND m.removed = 0
+                    )
+                    SELECT asset_id, metadata_key_id, value_text
+                    FROM latest
+                    WHERE rn = 1 AND value_text IS NOT NULL
+                    """,
+                    [*chunk, *keys],
+                )
+                for row in rows:
+                    values.setdefault(int(row["asset_id"]), {})[
+                        int(row["metadata_key_id"])
+                    ] = str(row["value_text"])
+        return values
+
+    async def reindex(
+        self,
+        *,
+        actor_id: int,
+        asset_ids: Sequence[int],
+        target_keys: Mapping[int, Sequence[str]],
+        lookups: Mapping[int, SidecarLookup],
+    ) -> set[int]:
+        actor_id = int(actor_id)
+        affected: set[int] = set()
+        async with session_scope() as session:
+            for chunk in _chunks({int(asset_id) for asset_id in asset_ids}):
+                in_chunk = _placeholders(chunk)
+                old_keys: dict[int, set[str]] = {}
+                for row in await select(
+                    session,
+                    f"""
+                    SELECT asset_id, candidate_key
+                    FROM {SIDECAR_TARGET_KEY_TABLE}
+                    WHERE actor_id = ? AND asset_id IN ({in_chunk})
+                    """,
+                    [actor_id, *chunk],
+                ):
+                    old_keys.setdefault(int(row["asset_id"]), set()).add(str(row["candidate_key"]))
+                old_sidecars = {
+                    int(row["sidecar_asset_id"])
+                    for row in await select(
+                        session,
+                        f"""
+                        SELECT sidecar_asset_id
+                        FROM {SIDECAR_LINK_TABLE}
+                        WHERE actor_id = ? AND sidecar_asset_id IN ({in_chunk})
+                        """,
+                        [actor_id, *chunk],
+                    )
+                }
+
+                # Keys that appeared or disappeared can change any sidecar looking them up.
+                touched_keys: set[str] = set()
+                for asset_id in chunk:
+                    touched_keys |= old_keys.get(asset_id, set()) ^ set(target_keys.get(asset_id, ()))
+
+                for table, column in (
+                    (SIDECAR_TARGET_KEY_TABLE, "asset_id"),
+                    (SIDECAR_LOOKUP_KEY_TABLE, "sidecar_asset_id"),
+                ):
+                    await execute(
+                        session,
+                        f"DELETE FROM {table} WHERE actor_id = ? AND {column} IN ({in_chunk})",
+                        [actor_id, *chunk],
+                    )
+                target_rows = [
+                    {"actor_id": actor_id, "candidate_key": key, "asset_id": asset_id}
+                    for asset_id in chunk
+                    for key in dict.fromkeys(target_keys.get(asset_id, ()))
+                ]
+                if target_rows:
+                    await session.execute_many(
+                        f"""
+                        INSERT INTO {SIDECAR_TARGET_KEY_TABLE} (actor_id, candidate_key, asset_id)
+                        VALUES (:actor_id, :candidate_key, :asset_id)
+                        """,
+                        target_rows,
+                    )
+                chunk_lookups = {
+                    asset_id: lookups[asset_id] for asset_id in chunk if asset_id in lookups
+                }
+                lookup_rows = [
+                    {
+                        "actor_id": actor_id,
+                        "sidecar_asset_id": asset_id,
+                        "rank": rank,
+                        "candidate_key": key,
+                    }
+                    for asset_id, lookup in chunk_lookups.items()
+                    for rank, key in enumerate(lookup.keys)
+                ]
+                if lookup_rows:
+                    await session.execute_many(
+                        f"""
+                        INSERT INTO {SIDECAR_LOOKUP_KEY_TABLE}
+                            (actor_id, sidecar_asset_id, rank, candidate_key)
+                        VALUES (:actor_id, :sidecar_asset_id, :rank, :candidate_key)
+                        """,
+                        lookup_rows,
+                    )
+                if chunk_lookups:
+                    await session.execute_many(
+                        f"""
+                        INSERT INTO {SIDECAR_LINK_TABLE} (actor_id, sidecar_asset_id, target_name)
+                        VALUES (:actor_id, :sidecar_asset_id, :target_name)
+                        ON CONFLICT(actor_id, sidecar_asset_id) DO UPDATE SET
+                            target_name = excluded.target_name
+                        """,
+                        [
+                            {
+                                "actor_id": actor_id,
+                                "sidecar_asset_id": asset_id,
+                                "target_name": lookup.target_name,
+                            }
+                            for asset_id, lookup in chunk_lookups.items()
+                        ],
+                    )
+                retired = sorted(old_sidecars - set(chunk_lookups))
+                if retired:
+                    await execute(
+                        session,
+                        f"""
+                        UPDATE {SIDECAR_LINK_TABLE}
+                        SET target_name = NULL
+                        WHERE actor_id = ? AND sidecar_asset_id IN ({_placeholders(retired)})
+                        """,
+                        [actor_id, *retired],
+                    )
+
+                affected |= old_sidecars | set(chunk_lookups)
+                rows = await select(
+                    session,
+                    f"""
+                    SELECT sidecar_asset_id
+                    FROM {SIDECAR_LINK_TABLE}
+                    WHERE actor_id = ? AND target_asset_id IN ({in_chunk})
+                    """,
+                    [actor_id, *chunk],
+                )
+                affected.update(int(row["sidecar_asset_id"]) for row in rows)
+                for key_chunk in _chunks(touched_keys):
+                    rows = await select(
+                        session,
+                        f"""
+                        SELECT DISTINCT sidecar_asset_id
+                        FROM {SIDECAR_LOOKUP_KEY_TABLE}
+                        WHERE actor_id = ? AND candidate_key IN ({_placeholders(key_chunk)})
+                        """,
+                        [actor_id, *key_chunk],
+                    )
+                    affected.update(int(row["sidecar_asset_id"]) for row in rows)
+            await session.commit()
+        return affected
+
+    async def stale_sidecar_ids(self, *, actor_id: int) -> list[int]:
+        async with session_scope(analysis=True) as session:
+            rows = await select(
+                session,
+                f"""
+                SELECT l.sidecar_asset_id
+                FROM {SIDECAR_LINK_TABLE} l
+                WHERE l.actor_id = ?
+                  AND (
+                    NOT EXISTS (SELECT 1 FROM {ASSET_TABLE} a WHERE a.id = l.sidecar_asset_id)
+                    OR (
+                        l.target_asset_id IS NOT NULL
+                        AND NOT EXISTS (SELECT 1 FROM {ASSET_TABLE} a WHERE a.id = l.target_asset_id)
+                    )
+                  )
+                ORDER BY l.sidecar_asset_id
+                """,
+                [int(actor_id)],
+            )
+        return [int(row["sidecar_asset_id"]) for row in rows]
+
+    async def resolve(
+        self, *, actor_id: int, sidecar_ids: Collection[int]
+    ) -> list[SidecarLink]:
+        actor_id = int(actor_id)
+        links: list[SidecarLink] = []
+        async with session_scope() as session:
+            for chunk in _chunks({int(asset_id) for asset_id in sidecar_ids}):
+                in_chunk = _placeholders(chunk)
+                current = await select(
+                    session,
+                    f"""
+                    SELECT
+                        l.sidecar_asset_id,
+                        l.target_name,
+                        l.target_asset_id,
+                        EXISTS (SELECT 1 FROM {ASSET_TABLE} a WHERE a.id = l.sidecar_asset_id)
+                            AS present
+                    FROM {SIDECAR_LINK_TABLE} l
+                    WHERE l.actor_id = ? AND l.sidecar_asset_id IN ({in_chunk})
+                    """,
+                    [actor_id, *chunk],
+                )
+                # The most specific key with a live match wins; the lowest
+                # asset id breaks ties between targets sharing a key.
+                matches = await select(
+                    session,
+                    f"""
+                    WITH matched AS (
+                        SELECT
+                            s.sidecar_asset_id,
+                            s.rank,
+                            MIN(t.asset_id) AS target_asset_id
+                        FROM {SIDECAR_LOOKUP_KEY_TABLE} s
+                        JOIN {SIDECAR_TARGET_KEY_TABLE} t
+                          ON t.actor_id = s.actor_id
+                         AND t.candidate_key = s.candidate_key
+                         AND t.asset_id != s.sidecar_asset_id
+                        JOIN {ASSET_TABLE} a ON a.id = t.asset_id
+                        WHERE s.actor_id = ? AND s.sidecar_asset_id IN ({in_chunk})
+                        GROUP BY s.sidecar_asset_id, s.rank
+                    ),
+                    ranked AS (
+                        SELECT
+                            sidecar_asset_id,
+                            target_asset_id,
+                            ROW_NUMBER() OVER (
+                                PARTITION BY sidecar_asset_id ORDER BY rank
+                            ) AS rn
+                        FROM matched
+                    )
+                    SELECT sidecar_asset_id, target_asset_id FROM ranked WHERE rn = 1
+                    """,
+                    [actor_id, *chunk],
+                )
+                found = {
+                    int(row["sidecar_asset_id"]): int(row["target_asset_id"]) for row in matches
+                }
+
+                dropped: list[int] = []
+                updates: list[dict[str, Any]] = []
+                for row in current:
+                    sidecar_asset_id = int(row["sidecar_asset_id"])
+                    previous = row["target_asset_id"]
+                    previous = int(previous) if previous is not None else None
+                    if not row["present"]:
+                        dropped.append(sidecar_asset_id)
+                        continue
+                    target_name = row["target_name"]
+                    if target_name is None:
+                        dropped.append(sidecar_asset_id)
+                        links.append(
+                            SidecarLink(
+                                sidecar_asset_id=sidecar_asset_id,
+                                target_name=None,
+                                target_asset_id=None,
+                                previous_target_id=previous,
+                            )
+                        )
+                        continue
+                    target_asset_id = found.get(sidecar_asset_id)
+                    if target_asset_id != previous:
+                        updates.append(
+                            {
+                                "actor_id": actor_id,
+                                "sidecar_asset_id": sidecar_asset_id,
+                                "target_asset_id": target_asset_id,
+                            }
+                        )
+                    links.append(
+                        SidecarLink(
+                            sidecar_asset_id=sidecar_asset_id,
+                            target_name=str(target_name),
+                            target_asset_id=target_asset_id,
+                            previous_target_id=previous,
+                        )
+                    )
+
+                deleted = [
+                    int(row["sidecar_asset_id"]) for row in current if not row["present"]
+                ]
+                deletes = [
+                    (SIDECAR_LOOKUP_KEY_TABLE, "sidecar_asset_id", dropped),
+                    (SIDECAR_LINK_TABLE, "sidecar_asset_id", dropped),
+                    (SIDECAR_TARGET_KEY_TABLE, "asset_id", deleted),
+                ]
+                for table, column, ids in deletes:
+                    if ids:
+                        await execute(
+                            session,
+                            f"DELETE FROM {table} WHERE actor_id = ? AND {column} IN ({_placeholders(ids)})",
+                            [actor_id, *ids],
+                        )
+                if updates:
+                    await session.execute_many(
+                        f"""
+                        UPDATE {SIDECAR_LINK_TABLE}
+                        SET target_asset_id = :target_asset_id
+                        WHERE actor_id = :actor_id AND sidecar_asset_id = :sidecar_asset_id
+                        """,
+                        updates,
+                    )
+            await session.commit()
+        links.sort(key=lambda link: link.sidecar_asset_id)
+        return links
+
+    async def counts(self, *, actor_id: int) -> tuple[int, int]:
+        async with session_scope(analysis=True) as session:
+            rows = await select(
+                session,
+                f"""
+                SELECT
+                    COALESCE(SUM(CASE WHEN target_asset_id IS NOT NULL THEN 1 ELSE 0 END), 0) AS linked,
+                    COALESCE(SUM(CASE WHEN target_asset_id IS NULL THEN 1 ELSE 0 END), 0) AS unresolved
+                FROM {SIDECAR_LINK_TABLE}
+                WHERE actor_id = ? AND target_name IS NOT NULL
+                """,
+                [int(actor_id)],
+            )
+        row = rows[0] if rows else {}
+        return int(row.get("linked") or 0), int(row.get("unresolved") or 0)
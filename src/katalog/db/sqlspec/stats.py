@@ -0,0 +1,363 @@
+from __future__ import annotations
+
+from collections.abc import Collection, Sequence
+from typing import Any
+
+from katalog.db.sqlspec import session_scope
+from katalog.db.sqlspec.sql_helpers import execute, select
+from katalog.db.sqlspec.tables import (
+    ASSET_TABLE,
+    METADATA_TABLE,
+    STATS_CURRENT_TABLE,
+    STATS_ROLLUP_TABLE,
+    STATS_VALUE_COUNT_TABLE,
+)
+from katalog.db.stats import CurrentValue
+
+# Keep IN (...) lists below SQLite's bound-parameter limit.
+_LOOKUP_CHUNK = 500
+
+
+def _chunks(ids: Collection[int]) -> list[list[int]]:
+    values = sorted({int(value) for value in ids})
+    return [values[start : start + _LOOKUP_CHUNK] for start in range(0, len(values), _LOOKUP_CHUNK)]
+
+
+def _placeholders(values: Sequence[Any]) -> str:
+    return ", ".join("?" for _ in values)
+
+
+class SqlspecStatsRepo:
+    async def clear(self) -> None:
+        async with session_scope() as session:
+            for table in (STATS_CURRENT_TABLE, STATS_ROLLUP_TABLE, STATS_VALUE_COUNT_TABLE):
+                await execute(session, f"DELETE FROM {table}")
+            await session.commit()
+
+    async def all_asset_ids(self, *, after_id: int = 0, limit: int) -> list[int]:
+        async with session_scope(analysis=True) as session:
+            rows = await select(
+                session,
+                f"SELECT id FROM {ASSET_TABLE} WHERE id > ? ORDER BY id LIMIT ?",
+                [int(after_id), int(limit)],
+            )
+        return [int(row["id"]) for row in rows]
+
+    async def changed_asset_ids(self, *, since_changeset_id: int) -> list[int]:
+        async with session_scope(analysis=True) as session:
+            rows = await select(
+                session,
+                f"""
+                SELECT DISTINCT asset_id
+                FROM {METADATA_TABLE}
+                WHERE changeset_id > ?
+                ORDER BY asset_id
+                """,
+                [int(since_changeset_id)],
+            )
+        return [int(row["asset_id"]) for row in rows]
+
+    async def orphaned_asset_ids(self) -> list[int]:
+        async with session_scope(analysis=True) as session:
+            rows = await select(
+                session,
+                f"""
+                SELECT DISTINCT c.asset_id
+                FROM {STATS_CURRENT_TABLE} c
+                WHERE NOT EXISTS (SELECT 1 FROM {ASSET_TABLE} a WHERE a.id = c.asset_id)
+                """,
+            )
+        return [int(row["asset_id"]) for row in rows]
+
+    async def refresh(
+        self,
+        *,
+        asset_ids: Collection[int],
+        value_key_ids: Collection[int],
+        count_key_ids: Collection[int],
+    ) -> int:
+        value_keys = {int(key_id) for key_id in value_key_ids}
+        count_keys = {int(key_id) for key_id in count_key_ids}
+        value_keys |= count_keys
+        changed = 0
+        async with session_scope() as session:
+            for chunk in _chunks(asset_ids):
+                new = await self._compute_current(session, chunk, value_keys)
+                old = await self._stored_current(session, chunk)
+
+                upserts: list[dict[str, Any]] = []
+                deletes: list[dict[str, Any]] = []
+                # (source_id, key_id) -> [asset_count, int_count, int_sum]
+                rollups: dict[tuple[int, int], list[int]] = {}
+                # (source_id, key_id, value) -> asset_count
+                value_counts: dict[tuple[int, int, str], int] = {}
+                bounds: set[tuple[int, int]] = set()
+
+                def _apply(pair: tuple[int, int], value: CurrentValue, sign: int) -> None:
+                    key_id = pair[1]
+                    entry = rollups.setdefault((value.source_id, key_id), [0, 0, 0])
+                    entry[0] += sign
+                    if value.value_int is not None:
+                        entry[1] += sign
+                        entry[2] += sign * int(value.value_int)
+                    if value.value_int is not None or value.value_datetime is not None:
+                        bounds.add((value.source_id, key_id))
+                    if key_id in count_keys and value.value_text is not None:
+                        count_key = (value.source_id, key_id, value.value_text)
+                        value_counts[count_key] = value_counts.get(count_key, 0) + sign
+
+                for pair in set(old) | set(new):
+                    before = old.get(pair)
+                    after = new.get(pair)
+                    if before == after:
+                        continue
+                    changed += 1
+                    if before is not None:
+                        _apply(pair, before, -1)
+                    if after is None:
+                        deletes.append({"asset_id": pair[0], "metadata_key_id": pair[1]})
+                        continue
+                    _apply(pair, after, 1)
+                    upserts.append(
+                        {
+                            "asset_id": pair[0],
+                            "metadata_key_id": pair[1],
+                            "source_id": after.source_id,
+                            "value_int": after.value_int,
+                            "value_text": after.value_text,
+                            "value_datetime": after.value_datetime,
+                        }
+                    )
+
+                await self._write(
+                    session,
+                    upserts=upserts,
+                    deletes=deletes,
+                    rollups=rollups,
+                    value_counts=value_counts,
+                    bounds=bounds,
+                )
+            await session.commit()
+        return changed
+
+    @staticmethod
+    async def _compute_current(
+        session: Any, asset_ids: list[int], value_keys: set[int]
+    ) -> dict[tuple[int, int], CurrentValue]:
+        # Newest value among the actors whose own latest entry is not a removal.
+        rows = await select(
+            session,
+            f"""
+            WITH per_actor AS (
+                SELECT
+                    m.id,
+                    m.asset_id,
+                    m.metadata_key_id,
+                    m.changeset_id,
+                    m.removed,
+                    m.value_int,
+                    m.value_text,
+                    m.value_datetime,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY m.asset_id, m.metadata_key_id, m.actor_id
+                        ORDER BY m.changeset_id DESC, m.id DESC
+                    ) AS rn
+                FROM {METADATA_TABLE} m
+                WHERE m.asset_id IN ({_placeholders(asset_ids)})
+            ),
+            live AS (
+                SELECT
+                    *,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY asset_id, metadata_key_id
+                        ORDER BY changeset_id DESC, id DESC
+                    ) AS pick
+                FROM per_actor
+                WHERE rn = 1 AND removed = 0
+            )
+            SELECT
+                l.asset_id,
+                l.metadata_key_id,
+                COALESCE(a.actor_id, 0) AS source_id,
+                l.value_int,
+                l.value_text,
+                l.value_datetime
+            FROM live l
+            JOIN {ASSET_TABLE} a ON a.id = l.asset_id
+            WHERE l.pick = 1
+            """,
+            asset_ids,
+        )
+        current: dict[tuple[int, int], CurrentValue] = {}
+        for row in rows:
+            key_id = int(row["metadata_key_id"])
+            source_id = int(row["source_id"])
+            if key_id not in value_keys:
+                current[(int(row["asset_id"]), key_id)] = CurrentValue(source_id=source_id)
+                continue
+            text = row["value_text"]
+            current[(int(row["asset_id"]), key_id)] = CurrentValue(
+                source_id=source_id,
+                value_int=int(row["value_int"]) if row["value_int"] is not None else None,
+                value_text=str(text) if text not in (None, "") else None,
+                value_datetime=row["value_datetime"],
+            )
+        return current
+
+    @staticmethod
+    async def _stored_current(
+        session: Any, asset_ids: list[int]
+    ) -> dict[tuple[int, int], CurrentValue]:
+        rows = await select(
+            session,
+            f"""
+            SELECT asset_id, metadata_key_id, source_id, value_int, value_text, value_datetime
+            FROM {STATS_CURRENT_TABLE}
+            WHERE asset_id IN ({_placeholders(asset_ids)})
+            """,
+            asset_ids,
+        )
+        return {
+            (int(row["asset_id"]), int(row["metadata_key_id"])): CurrentValue(
+                source_id=int(row["source_id"]),
+                value_int=int(row["value_int"]) if row["value_int"] is not None else None,
+                value_text=row["value_text"],
+                value_datetime=row["value_datetime"],
+            )
+            for row in rows
+        }
+
+    @staticmethod
+    async def _write(
+        session: Any,
+        *,
+        upserts: list[dict[str, Any]],
+        deletes: list[dict[str, Any]],
+        rollups: dict[tuple[int, int], list[int]],
+        value_counts: dict[tuple[int, int, str], int],
+        bounds: set[tuple[int, int]],
+    ) -> None:
+        if deletes:
+            await session.execute_many(
+                f"""
+                DELETE FROM {STATS_CURRENT_TABLE}
+                WHERE asset_id = :asset_id AND metadata_key_id = :metadata_key_id
+                """,
+                deletes,
+            )
+        if upserts:
+            await session.execute_many(
+                f"""
+                INSERT INTO {STATS_CURRENT_TABLE}
+                    (asset_id, metadata_key_id, source_id, value_int, value_text, value_datetime)
+                VALUES
+                    (:asset_id, :metadata_key_id, :source_id, :value_int, :value_text, :value_datetime)
+                ON CONFLICT(asset_id, metadata_key_id) DO UPDATE SET
+                    source_id = excluded.source_id,
+                    value_int = excluded.value_int,
+                    value_text = excluded.value_text,
+                    value_datetime = excluded.value_datetime
+                """,
+                upserts,
+            )
+        rollup_rows = [
+            {
+                "source_id": source_id,
+                "metadata_key_id": key_id,
+                "asset_count": delta[0],
+                "int_count": delta[1],
+                "int_sum": delta[2],
+            }
+            for (source_id, key_id), delta in rollups.items()
+            if any(delta)
+        ]
+        if rollup_rows:
+            await session.execute_many(
+                f"""
+                INSERT INTO {STATS_ROLLUP_TABLE}
+                    (source_id, metadata_key_id, asset_count, int_count, int_sum)
+                VALUES (:source_id, :metadata_key_id, :asset_count, :int_count, :int_sum)
+                ON CONFLICT(source_id, metadata_key_id) DO UPDATE SET
+                    asset_count = asset_count + excluded.asset_count,
+                    int_count = int_count + excluded.int_count,
+                    int_sum = int_sum + excluded.int_sum
+                """,
+                rollup_rows,
+            )
+        count_rows = [
+            {
+                "source_id": source_id,
+                "metadata_key_id": key_id,
+                "value": value,
+                "asset_count": delta,
+            }
+            for (source_id, key_id, value), delta in value_counts.items()
+            if delta
+        ]
+        if count_rows:
+            await session.execute_many(
+                f"""
+                INSERT INTO {STATS_VALUE_COUNT_TABLE} (source_id, metadata_key_id, value, asset_count)
+                VALUES (:source_id, :metadata_key_id, :value, :asset_count)
+                ON CONFLICT(source_id, metadata_key_id, value) DO UPDATE SET
+                    asset_count = asset_count + excluded.asset_count
+                """,
+                count_rows,
+            )
+            await session.execute_many(
+                f"""
+                DELETE FROM {STATS_VALUE_COUNT_TABLE}
+                WHERE source_id = :source_id AND metadata_key_id = :metadata_key_id
+                  AND value = :value AND asset_count <= 0
+                """,
+                [
+                    {
+                        "source_id": row["source_id"],
+                        "metadata_key_id": row["metadata_key_id"],
+                        "value": row["value"],
+                    }
+                    for row in count_rows
+                ],
+            )
+        if bounds:
+            # Minimum and maximum cannot be maintained by deltas; the indexes
+            # on stats_current make recomputing them a cheap lookup.
+            await session.execute_many(
+                f"""
+                UPDATE {STATS_ROLLUP_TABLE}
+                SET
+                    int_min = (
+                        SELECT MIN(value_int) FROM {STATS_CURRENT_TABLE}
+                        WHERE metadata_key_id = :metadata_key_id AND source_id = :source_id
+                    ),
+                    int_max = (
+                        SELECT MAX(value_int) FROM {STATS_CURRENT_TABLE}
+                        WHERE metadata_key_id = :metadata_key_id AND source_id = :source_id
+                    ),
+                    datetime_min = (
+                        SELECT MIN(value_datetime) FROM {STATS_CURRENT_TABLE}
+                        WHERE metadata_key_id = :metadata_key_id AND source_id = :source_id
+                    ),
+                    datetime_max = (
+                        SELECT MAX(value_datetime) FROM {STATS_CURRENT_TABLE}
+                        WHERE metadata_key_id = :metadata_key_id AND source_id = :source_id
+                    )
+                WHERE source_id = :source_id AND metadata_key_id = :metadata_key_id
+                """,
+                [
+                    {"source_id": source_id, "metadata_key_id": key_id}
+                    for source_id, key_id in sorted(bounds)
+                ],
+            )
+        if rollup_rows:
+            await session.execute_many(
+                f"""
+                DELETE FROM {STATS_ROLLUP_TABLE}
+                WHERE source_id = :source_id AND metadata_key_id = :metadata_key_id
+                  AND asset_count <= 0
+                """,
+                [
+                    {"source_id": row["source_id"], "metadata_key_id": row["metadata_key_id"]}
+                    for row in rollup_rows
+                ],
+            )
@@ -5,3 +5,21 @@ CHANGESET_TABLE = "changesets"
 CHANGESET_ACTOR_TABLE = "changeset_actors"
 METADATA_TABLE = "metadata"
 METADATA_REGISTRY_TABLE = "metadata_registry"
+METADATA_TRIGRAM_TABLE = "metadata_trigram"
+METADATA_TRIGRAM_KEYS_TABLE = "metadata_trigram_keys"
+ASSET_FINGERPRINT_TABLE = "asset_fingerprints"
+SCAN_SESSION_TABLE = "scan_sessions"
+SCAN_SESSION_SEEN_TABLE = "scan_session_seen"
+SOURCE_FOLDER_TABLE = "source_folders"
+NEAR_DUPLICATE_SIGNATURE_TABLE = "near_duplicate_signatures"
+NEAR_DUPLICATE_BAND_TABLE = "near_duplicate_bands"
+NEAR_DUPLICATE_PAIR_TABLE = "near_duplicate_pairs"
+EXACT_DUPLICATE_HASH_TABLE = "exact_duplicate_hashes"
+STATS_CURRENT_TABLE = "stats_current"
+STATS_ROLLUP_TABLE = "stats_rollups"
+STATS_VALUE_COUNT_TABLE = "stats_value_counts"
+SIDECAR_TARGET_KEY_TABLE = "sidecar_target_keys"
+SIDECAR_LOOKUP_KEY_TABLE = "sidecar_lookup_keys"
+SIDECAR_LINK_TABLE = "sidecar_links"
+RELATION_EDGE_TABLE = "relation_edges"
+ASSET_CANONICAL_TABLE = "asset_canonical"
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Sequence
+from typing import Any
+
+from katalog.db.sqlspec import session_scope
+from katalog.db.sqlspec.sql_helpers import execute, scalar, select
+from katalog.db.sqlspec.tables import (
+    METADATA_TABLE,
+    METADATA_TRIGRAM_KEYS_TABLE,
+    METADATA_TRIGRAM_TABLE,
+)
+from katalog.db.trigram import TrigramIndexStatus
+
+# FTS5 trigram lookups need at least one full trigram; shorter needles scan.
+MIN_TRIGRAM_NEEDLE = 3
+
+_TRIGGER_INSERT = "metadata_trigram_ai"
+_TRIGGER_DELETE = "metadata_trigram_ad"
+_TRIGGER_UPDATE = "metadata_trigram_au"
+
+
+def trigram_needle_supported(needle: str) -> bool:
+    """Return True when a LIKE needle can be answered from the trigram index."""
+    if len(needle) < MIN_TRIGRAM_NEEDLE:
+        return False
+    # Wildcards split the needle into shorter runs that may not form trigrams.
+    return "%" not in needle and "_" not in needle
+
+
+async def _table_exists(session: Any) -> bool:
+    rows = await select(
+        session,
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ? LIMIT 1",
+        [METADATA_TRIGRAM_TABLE],
+    )
+    return bool(rows)
+
+
+async def _indexed_key_ids(session: Any) -> list[int]:
+    rows = await select(
+        session,
+        f"SELECT metadata_key_id FROM {METADATA_TRIGRAM_KEYS_TABLE} ORDER BY metadata_key_id",
+    )
+    return [int(row["metadata_key_id"]) for row in rows]
+
+
+async def _ensure_table(session: Any) -> None:
+    """Create the external-content trigram table and its sync triggers."""
+    table = METADATA_TRIGRAM_TABLE
+    keys_table = METADATA_TRIGRAM_KEYS_TABLE
+    await execute(
+        session,
+        f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {table}
+        USING fts5(
+            value_text,
+            content='{METADATA_TABLE}',
+            content_rowid='id',
+            tokenize='trigram'
+        )
+        """,
+    )
+    new_selected = (
+        "NEW.value_text IS NOT NULL AND EXISTS ("
+        f"SELECT 1 FROM {keys_table} k WHERE k.metadata_key_id = NEW.metadata_key_id)"
+    )
+    old_selected = (
+        "OLD.value_text IS NOT NULL AND EXISTS ("
+        f"SELECT 1 FROM {keys_table} k WHERE k.metadata_key_id = OLD.metadata_key_id)"
+    )
+    await execute(
+        session,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {_TRIGGER_INSERT}
+        AFTER INSERT ON {METADATA_TABLE}
+        WHEN {new_selected}
+        BEGIN
+            INSERT INTO {table}(rowid, value_text) VALUES (NEW.id, NEW.value_text);
+        END
+        """,
+    )
+    await execute(
+        session,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {_TRIGGER_DELETE}
+        AFTER DELETE ON {METADATA_TABLE}
+        WHEN {old_selected}
+        BEGIN
+            INSERT INTO {table}({table}, rowid, value_text)
+            VALUES ('delete', OLD.id, OLD.value_text);
+        END
+        """,
+    )
+    await execute(
+        session,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {_TRIGGER_UPDATE}
+        AFTER UPDATE OF value_text, metadata_key_id ON {METADATA_TABLE}
+        BEGIN
+            INSERT INTO {table}({table}, rowid, value_text)
+            SELECT 'delete', OLD.id, OLD.value_text WHERE {old_selected};
+            INSERT INTO {table}(rowid, value_text)
+            SELECT NEW.id, NEW.value_text WHERE {new_selected};
+        END
+        """,
+    )
+
+
+async def _populate(session: Any, key_ids: Sequence[int]) -> None:
+    if not key_ids:
+        return
+    placeholders = ", ".join("?" for _ in key_ids)
+    await execute(
+        session,
+        f"""
+        INSERT INTO {METADATA_TRIGRAM_TABLE}(rowid, value_text)
+        SELECT id, value_text FROM {METADATA_TABLE}
+        WHERE metadata_key_id IN ({placeholders})
+          AND value_text IS NOT NULL
+        """,
+        [int(key_id) for key_id in key_ids],
+    )
+
+
+class SqlspecTrigramRepo:
+    async def indexed_key_ids(self) -> frozenset[int]:
+        async with session_scope(analysis=True) as session:
+            return frozenset(await _indexed_key_ids(session))
+
+    async def status(self) -> TrigramIndexStatus:
+        async with session_scope(analysis=True) as session:
+            key_ids = await _indexed_key_ids(session)
+            if not key_ids or not await _table_exists(session):
+                return TrigramIndexStatus(metadata_key_ids=key_ids)
+            placeholders = ", ".join("?" for _ in key_ids)
+            rows = await scalar(
+                session,
+                f"""
+                SELECT COUNT(*) FROM {METADATA_TABLE}
+                WHERE metadata_key_id IN ({placeholders})
+                  AND value_text IS NOT NULL
+                """,
+                key_ids,
+            )
+        return TrigramIndexStatus(metadata_key_ids=key_ids, indexed_rows=int(rows or 0))
+
+    async def build(
+        self,
+        *,
+        metadata_key_ids: Sequence[int],
+        rebuild: bool = False,
+    ) -> TrigramIndexStatus:
+        """Index the given keys; `rebuild` replaces the key set and re-indexes all rows."""
+        started = time.perf_counter()
+        requested = sorted({int(key_id) for key_id in metadata_key_ids})
+        async with session_scope() as session:
+            existing = await _indexed_key_ids(session)
+            table_exists = await _table_exists(session)
+            if rebuild:
+                target = requested or existing
+                await execute(session, f"DELETE FROM {METADATA_TRIGRAM_KEYS_TABLE}")
+                if table_exists:
+                    await execute(
+                        session,
+                        f"INSERT INTO {METADATA_TRIGRAM_TABLE}({METADATA_TRIGRAM_TABLE}) "
+                        "VALUES ('delete-all')",
+                    )
+                to_populate = target
+            else:
+                target = sorted({*existing, *requested})
+                to_populate = [key_id for key_id in requested if key_id not in existing]
+                if not table_exists:
+                    to_populate = target
+            for key_id in target:
+                await execute(
+                    session,
+                    f"INSERT OR IGNORE INTO {METADATA_TRIGRAM_KEYS_TABLE} (metadata_key_id) "
+                    "VALUES (?)",
+                    [key_id],
+                )
+            await _ensure_table(session)
+            await _populate(session, to_populate)
+            await execute(
+                session,
+                f"INSERT INTO {METADATA_TRIGRAM_TABLE}({METADATA_TRIGRAM_TABLE}) "
+                "VALUES ('optimize')",
+            )
+            await session.commit()
+        status = await self.status()
+        return TrigramIndexStatus(
+            metadata_key_ids=status.metadata_key_ids,
+            indexed_rows=status.indexed_rows,
+            duration_ms=int((time.perf_counter() - started) * 1000),
+        )
+
+    async def drop(self) -> None:
+        async with session_scope() as session:
+            for trigger in (_TRIGGER_INSERT, _TRIGGER_DELETE, _TRIGGER_UPDATE):
+                await execute(session, f"DROP TRIGGER IF EXISTS {trigger}")
+            await execute(session, f"DROP TABLE IF EXISTS {METADATA_TRIGRAM_TABLE}")
+            await execute(session, f"DELETE FROM {METADATA_TRIGRAM_KEYS_TABLE}")
+            await session.commit()
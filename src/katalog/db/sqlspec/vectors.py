@@ -41,7 +41,7 @@ class SqlspecVectorRepo:
         metadata_key_ids: Sequence[int],
         points: Sequence[VectorPoint],
     ) -> int:
-        async with session_scope(analysis=True) as session:
+        async with session_scope() as session:
             vec_table = await self._ensure_vec_table(
                 session,
                 actor_id=actor_id,
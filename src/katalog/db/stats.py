@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Collection, Protocol
+
+
+@dataclass(frozen=True)
+class CurrentValue:
+    """Current value of one metadata key on one asset, as kept for stats."""
+
+    source_id: int
+    value_int: int | None = None
+    value_text: str | None = None
+    value_datetime: Any = None
+
+
+class StatsRepo(Protocol):
+    async def clear(self) -> None:
+        """Drop all current values and rollups before a full rebuild."""
+        ...
+
+    async def all_asset_ids(self, *, after_id: int = 0, limit: int) -> list[int]: ...
+
+    async def changed_asset_ids(self, *, since_changeset_id: int) -> list[int]:
+        """Assets with metadata written after the given changeset."""
+        ...
+
+    async def orphaned_asset_ids(self) -> list[int]:
+        """Assets that still have current values but no longer exist."""
+        ...
+
+    async def refresh(
+        self,
+        *,
+        asset_ids: Collection[int],
+        value_key_ids: Collection[int],
+        count_key_ids: Collection[int],
+    ) -> int:
+        """Recompute the current values of these assets and apply the difference to the rollups.
+
+        Values are kept for `value_key_ids`; `count_key_ids` additionally get
+        per-value asset counts. Returns the number of changed (asset, key) entries.
+        """
+        ...
+
+
+def get_stats_repo() -> StatsRepo:
+    from katalog.db.sqlspec.stats import SqlspecStatsRepo
+
+    return SqlspecStatsRepo()
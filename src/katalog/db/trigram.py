@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Protocol, Sequence
+
+
+@dataclass(frozen=True)
+class TrigramIndexStatus:
+    metadata_key_ids: list[int] = field(default_factory=list)
+    indexed_rows: int = 0
+    duration_ms: int | None = None
+
+
+class TrigramRepo(Protocol):
+    async def indexed_key_ids(self) -> frozenset[int]: ...
+
+    async def status(self) -> TrigramIndexStatus: ...
+
+    async def build(
+        self,
+        *,
+        metadata_key_ids: Sequence[int],
+        rebuild: bool = False,
+    ) -> TrigramIndexStatus: ...
+
+    async def drop(self) -> None: ...
+
+
+def get_trigram_repo() -> TrigramRepo:
+    from katalog.db.sqlspec.trigram import SqlspecTrigramRepo
+
+    return SqlspecTrigramRepo()
@@ -27,6 +27,9 @@ METADATA_GROUP_HELP = (
     "Search asset properties (metadata), e.g. path, MIME type, and timestamps."
 )
 VIEWS_GROUP_HELP = "List and inspect asset views, including runtime/plugin-defined views."
+RELATIONS_GROUP_HELP = (
+    "Explore links between assets (relations), e.g. sidecars and their targets."
+)
 
 MCP_INSTRUCTIONS = (
     "Read-only access to katalog workspace data. "
@@ -46,6 +49,15 @@ MCP_ASSETS_GET_DESC = (
 MCP_COLLECTIONS_LIST_DESC = "List saved asset groups (collections)."
 MCP_COLLECTIONS_GET_DESC = "Get collection details by id."
 MCP_COLLECTIONS_LIST_ASSETS_DESC = "List assets that belong to a collection."
+MCP_RELATIONS_NEIGHBORS_DESC = (
+    "List current relation edges of one asset, outgoing, incoming, or both."
+)
+MCP_RELATIONS_TRAVERSE_DESC = (
+    "List assets within a number of relation hops of an asset, nearest first."
+)
+MCP_RELATIONS_COMPONENT_DESC = (
+    "List every asset connected to an asset through relations, ignoring direction."
+)
 MCP_ACTORS_LIST_DESC = "List data connectors (actors)."
 MCP_ACTORS_GET_DESC = (
     "Get data connector (actor) details by id, including related changesets."
@@ -39,6 +39,18 @@ def _resolve_runtime_mode(
     return "read_write"
 
 
+async def _warm_embeddings() -> None:
+    """Load query embedding models in the background so first searches are fast."""
+    from katalog.api.search import warm_search_embeddings
+
+    try:
+        await warm_search_embeddings()
+    except asyncio.CancelledError:
+        raise
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Embedding warmup failed: {}", exc)
+
+
 @asynccontextmanager
 async def app_lifespan(
     app: Any = None,
@@ -47,6 +59,8 @@ async def app_lifespan(
     init_mode: InitMode | None = None,
     read_only_requested: bool | None = None,
     log_discovered_plugins: bool = False,
+    warm_embeddings: bool = False,
+    idle_fts_maintenance: bool = False,
     workspace: str | Path | None = None,
     db_url: str | None = None,
 ) -> AsyncIterator[None]:
@@ -55,6 +69,7 @@ async def app_lifespan(
     from katalog.db.sqlspec import close_db
     from katalog.plugins.registry import close_instance_cache
     from katalog.utils.blob_cache import close_blob_caches
+    from katalog.utils.embedding_cache import close_embedding_caches
 
     app_context = build_app_context(workspace=workspace, db_url=db_url)
     legacy_runtime_mode = _runtime_mode_from_legacy(init_mode)
@@ -127,16 +142,40 @@ async def app_lifespan(
 
         event_manager.bind_loop(asyncio.get_running_loop())
         event_manager.ensure_sink()
+        background_tasks: list[asyncio.Task[None]] = []
+        if warm_embeddings:
+            background_tasks.append(asyncio.create_task(_warm_embeddings()))
+        if idle_fts_maintenance and app_context.runtime_mode == "read_write":
+            from katalog.runtime.fts_maintenance import run_idle_fts_maintenance
+
+            background_tasks.append(
+                asyncio.create_task(
+                    run_idle_fts_maintenance(lambda: not running_changesets)
+                )
+            )
         try:
             yield
         finally:
+            for task in background_tasks:
+                if task.done():
+                    continue
+                task.cancel()
+                try:
+                    await task
+                except BaseException:  # noqa: BLE001
+                    pass
             for snap in list(running_changesets.values()):
                 snap.cancel()
             for snap in list(running_changesets.values()):
                 await snap.wait_cancelled(timeout=5)
             running_changesets.clear()
+            if app_context.state.get("workflow_analyzer_tasks"):
+                from katalog.workflows.runtime import wait_for_workflow_analyzers
+
+                await wait_for_workflow_analyzers(cancel=True)
             event_manager.close()
             await close_instance_cache()
             close_blob_caches()
+            close_embedding_caches()
             clear_metadata_registry_cache()
             await close_db()
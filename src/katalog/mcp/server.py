@@ -11,6 +11,7 @@ from katalog.api import (
     collections,
     metadata,
     plugins,
+    relations,
     system,
     views,
     workflows,
@@ -36,6 +37,9 @@ from katalog.help_texts import (
     MCP_METADATA_SCHEMA_EDITABLE_DESC,
     MCP_PLUGINS_GET_CONFIG_SCHEMA_DESC,
     MCP_PLUGINS_LIST_DESC,
+    MCP_RELATIONS_COMPONENT_DESC,
+    MCP_RELATIONS_NEIGHBORS_DESC,
+    MCP_RELATIONS_TRAVERSE_DESC,
     MCP_SYSTEM_STATS_DESC,
     MCP_VIEWS_GET_DESC,
     MCP_VIEWS_LIST_DESC,
@@ -112,6 +116,14 @@ def create_mcp_server() -> FastMCP:
         search_dimension: int | None = None,
         search_embedding_model: str | None = None,
         search_embedding_backend: Literal["preset", "fastembed"] | None = None,
+        search_fts_index: int | None = None,
+        search_fusion: Literal["rrf", "weighted"] | None = None,
+        search_lexical_weight: float | None = None,
+        search_semantic_weight: float | None = None,
+        search_rrf_k: int | None = None,
+        search_candidate_pool: int | None = None,
+        search_recency_boost: float | None = None,
+        search_source_boosts: list[str] | None = None,
         metadata_actor_ids: list[int] | None = None,
         metadata_include_removed: bool = False,
         metadata_aggregation: Literal["latest", "current", "object"] | None = None,
@@ -121,7 +133,10 @@ def create_mcp_server() -> FastMCP:
         include_schema: bool = False,
         include_lost_assets: bool = False,
     ) -> dict[str, Any]:
-        """Use `sort` as `key:asc|desc` and `filters` as `<key> <op> <value>` strings."""
+        """Use `sort` as `key:asc|desc` and `filters` as `<key> <op> <value>` strings.
+
+        `search_source_boosts` entries are `actor_id:factor` strings (hybrid mode).
+        """
         _validate_pagination(offset=offset, limit=limit)
         try:
             query = build_asset_query(
@@ -140,6 +155,14 @@ def create_mcp_server() -> FastMCP:
                 search_dimension=search_dimension,
                 search_embedding_model=search_embedding_model,
                 search_embedding_backend=search_embedding_backend,
+                search_fts_index=search_fts_index,
+                search_fusion=search_fusion,
+                search_lexical_weight=search_lexical_weight,
+                search_semantic_weight=search_semantic_weight,
+                search_rrf_k=search_rrf_k,
+                search_candidate_pool=search_candidate_pool,
+                search_recency_boost=search_recency_boost,
+                search_source_boosts=search_source_boosts,
                 metadata_actor_ids=metadata_actor_ids,
                 metadata_include_removed=metadata_include_removed,
                 metadata_aggregation=metadata_aggregation,
@@ -283,6 +306,72 @@ def create_mcp_server() -> FastMCP:
             raise ValueError(str(exc)) from exc
         return _jsonable(response)
 
+    @mcp.tool(
+        name="relations.neighbors",
+        description=MCP_RELATIONS_NEIGHBORS_DESC,
+    )
+    async def list_relation_neighbors(
+        asset_id: int,
+        direction: Literal["out", "in", "both"] = "both",
+        metadata_keys: list[str] | None = None,
+        limit: int = 100,
+    ) -> dict[str, Any]:
+        _validate_pagination(offset=0, limit=limit)
+        try:
+            response = await relations.list_relation_neighbors(
+                asset_id,
+                direction=direction,
+                metadata_keys=metadata_keys,
+                limit=limit,
+            )
+        except ApiError as exc:
+            raise _tool_error(exc) from exc
+        return _jsonable(response)
+
+    @mcp.tool(
+        name="relations.traverse",
+        description=MCP_RELATIONS_TRAVERSE_DESC,
+    )
+    async def traverse_relations(
+        asset_id: int,
+        max_depth: int = 2,
+        direction: Literal["out", "in", "both"] = "both",
+        metadata_keys: list[str] | None = None,
+        limit: int = 1000,
+    ) -> dict[str, Any]:
+        _validate_pagination(offset=0, limit=limit)
+        try:
+            response = await relations.traverse_relations(
+                asset_id,
+                max_depth=max_depth,
+                direction=direction,
+                metadata_keys=metadata_keys,
+                limit=limit,
+            )
+        except ApiError as exc:
+            raise _tool_error(exc) from exc
+        return _jsonable(response)
+
+    @mcp.tool(
+        name="relations.component",
+        description=MCP_RELATIONS_COMPONENT_DESC,
+    )
+    async def relation_component(
+        asset_id: int,
+        metadata_keys: list[str] | None = None,
+        limit: int = 1000,
+    ) -> dict[str, Any]:
+        _validate_pagination(offset=0, limit=limit)
+        try:
+            response = await relations.relation_component(
+                asset_id,
+                metadata_keys=metadata_keys,
+                limit=limit,
+            )
+        except ApiError as exc:
+            raise _tool_error(exc) from exc
+        return _jsonable(response)
+
     @mcp.tool(
         name="actors.list",
         description=MCP_ACTORS_LIST_DESC,
@@ -415,6 +504,10 @@ def create_mcp_server() -> FastMCP:
         dimension: int = 64,
         embedding_model: str = "fast",
         embedding_backend: Literal["preset", "fastembed"] = "preset",
+        fts_index: int | None = None,
+        fusion: Literal["rrf", "weighted"] | None = None,
+        lexical_weight: float | None = None,
+        semantic_weight: float | None = None,
     ) -> dict[str, Any]:
         _validate_pagination(offset=offset, limit=limit, max_limit=10000)
         try:
@@ -433,6 +526,10 @@ def create_mcp_server() -> FastMCP:
                 search_dimension=dimension,
                 search_embedding_model=embedding_model,
                 search_embedding_backend=embedding_backend,
+                search_fts_index=fts_index,
+                search_fusion=fusion,
+                search_lexical_weight=lexical_weight,
+                search_semantic_weight=semantic_weight,
                 metadata_actor_ids=actor_ids,
                 metadata_include_removed=include_removed,
                 metadata_aggregation=aggregation,
@@ -16,7 +16,7 @@ from enum import Enum, IntEnum
 from time import monotonic, time
 from datetime import UTC, datetime
 import traceback
-from typing import Any, Awaitable, Callable
+from typing import Any, Awaitable, Callable, Mapping
 
 from loguru import logger
 from pydantic import BaseModel, ConfigDict, Field, field_serializer
@@ -64,6 +64,7 @@ class ChangesetStats(BaseModel):
     assets_seen: int = 0
     assets_saved: int = 0  # Assets yielded and saved/processed by the pipeline
     assets_ignored: int = 0  # Skipped during scan (e.g. filtered by actor settings)
+    assets_unchanged: int = 0  # Seen but skipped because their fingerprint matched
 
     assets_changed: int = 0  # Assets that had metadata changes
     assets_added: int = 0  # New assets seen for the first time
@@ -81,6 +82,21 @@ class ChangesetStats(BaseModel):
     processings_skipped: int = 0  # Total processing operations skipped
     processings_error: int = 0  # Total processing operations failed with error
 
+    bytes_read: int = 0  # Asset data bytes read to hash contents
+    bytes_skipped: int = 0  # Bytes a full read of every unhashed file would add on top
+
+    # Per-processor aggregates of ProcessorResult.stats, keyed by plugin id
+    processor_stats: dict[str, dict[str, float]] = Field(default_factory=dict)
+
+    def record_processor_stats(self, plugin_id: str, values: Mapping[str, float]) -> None:
+        """Fold one result's measurements into `<key>_total` / `<key>_max` aggregates."""
+        entry = self.processor_stats.setdefault(plugin_id, {"results": 0})
+        entry["results"] = entry.get("results", 0) + 1
+        for key, value in values.items():
+            number = float(value)
+            entry[f"{key}_total"] = entry.get(f"{key}_total", 0.0) + number
+            entry[f"{key}_max"] = max(entry.get(f"{key}_max", number), number)
+
 
 DEFAULT_TASK_CONCURRENCY = task_concurrency()
 
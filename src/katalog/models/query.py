@@ -25,6 +25,7 @@ class QueryStats(BaseModel):
     duration_metadata_ms: int | None = None
     duration_rows_ms: int | None = None
     duration_count_ms: int | None = None
+    stages_ms: dict[str, int] | None = None
 
 
 class ColumnSpecResponse(BaseModel):
@@ -138,6 +139,15 @@ class AssetQuery(BaseModel):
     search_dimension: int = Field(default=64, gt=0)
     search_embedding_model: str = "fast"
     search_embedding_backend: Literal["preset", "fastembed"] = "preset"
+    # Hybrid ranking overrides; unset fields fall back to the view's SearchFusionSpec.
+    search_fts_index: int | None = None
+    search_fusion: Literal["rrf", "weighted"] | None = None
+    search_lexical_weight: float | None = Field(default=None, ge=0.0)
+    search_semantic_weight: float | None = Field(default=None, ge=0.0)
+    search_rrf_k: int | None = Field(default=None, gt=0)
+    search_candidate_pool: int | None = Field(default=None, gt=0)
+    search_recency_boost: float | None = Field(default=None, ge=0.0)
+    search_source_boosts: dict[int, float] | None = None
     sort: list[tuple[str, str]] | None = None
     group_by: str | None = None
 
@@ -182,6 +192,30 @@ class AssetQuery(BaseModel):
         cleaned = [item.strip() for item in value if item and item.strip()]
         return cleaned or None
 
+    @field_validator("search_source_boosts", mode="before")
+    @classmethod
+    def _parse_search_source_boosts(cls, value: Any) -> Any:
+        """Accept `actor_id:factor` strings as used by REST/CLI parameters."""
+        if value is None:
+            return value
+        if isinstance(value, dict):
+            items = list(value.items())
+        else:
+            if isinstance(value, str):
+                value = [value]
+            items = []
+            for raw in value:
+                actor_id, sep, factor = str(raw).partition(":")
+                if not sep:
+                    raise ValueError("search_source_boosts entries must be actor_id:factor")
+                items.append((actor_id.strip(), factor.strip()))
+        parsed: dict[int, float] = {}
+        for actor_id, factor in items:
+            if float(factor) < 0:
+                raise ValueError("search_source_boosts factors must be >= 0")
+            parsed[int(actor_id)] = float(factor)
+        return parsed or None
+
     @field_validator("columns")
     @classmethod
     def _validate_columns(cls, value: list[str] | None) -> list[str] | None:
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import Sequence
+from typing import Literal, Sequence
 
-from pydantic import BaseModel, ConfigDict, computed_field, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, computed_field, field_serializer
 
 from katalog.constants.metadata import (
     ASSET_EXTERNAL_ID,
@@ -86,6 +86,27 @@ class ColumnSpec(BaseModel):
         )
 
 
+class SearchFusionSpec(BaseModel):
+    """Ranking defaults for hybrid (lexical + semantic) search.
+
+    Views may carry their own spec; per-request query fields override it.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    method: Literal["rrf", "weighted"] = "rrf"
+    lexical_weight: float = Field(default=1.0, ge=0.0)
+    semantic_weight: float = Field(default=1.0, ge=0.0)
+    rrf_k: int = Field(default=60, gt=0)
+    # Candidates fetched from each side before fusion.
+    candidate_pool: int = Field(default=200, gt=0)
+    # Multiplier strength for recently modified assets (0 disables).
+    recency_boost: float = Field(default=0.0, ge=0.0)
+    recency_half_life_days: float = Field(default=365.0, gt=0.0)
+    # Multipliers keyed by source actor id, e.g. {3: 1.5}.
+    source_boosts: dict[int, float] = Field(default_factory=dict)
+
+
 class ViewSpec(BaseModel):
     """Describe a view (set of columns + capabilities)."""
 
@@ -96,6 +117,7 @@ class ViewSpec(BaseModel):
     columns: Sequence[ColumnSpec]
     default_sort: Sequence[tuple[str, str]] = ()
     default_columns: Sequence[str] | None = None
+    search_fusion: SearchFusionSpec | None = None
 
     def column_map(self) -> dict[str, ColumnSpec]:
         return {col.id: col for col in self.columns}
@@ -26,6 +26,8 @@ class ProcessorResult(BaseModel):
     assets: list[Asset] = Field(default_factory=list)
     status: OpStatus = OpStatus.COMPLETED
     message: str | None = None
+    # Optional per-asset measurements (timings, bytes), aggregated into changeset stats.
+    stats: dict[str, float] | None = None
 
     def set_metadata(self, metadata_key: MetadataKey, value: MetadataScalar) -> None:
         """Append a metadata value produced by this processor."""
@@ -51,6 +53,7 @@ class Processor(PluginBase, ABC):
     """
     Defines the interface for a metadata processor.
     """
+    plugin_id: str = "katalog.processors.base.Processor"
     execution_mode: str = "io"
 
     @property
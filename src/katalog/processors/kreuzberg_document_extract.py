@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import mimetypes
+import tempfile
+import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, FrozenSet, Mapping, Protocol, Sequence
 
@@ -52,7 +57,7 @@ from katalog.constants.metadata import (
     TIME_MODIFIED,
     MetadataKey,
 )
-from katalog.models import MetadataChanges, OpStatus
+from katalog.models import DataReader, MetadataChanges, OpStatus
 from katalog.processors.base import Processor, ProcessorResult
 from katalog.utils.utils import parse_datetime_utc
 from kreuzberg import (
@@ -87,6 +92,17 @@ class ExtractionResult(Protocol):
     def get_metadata_field(self, field_name: str) -> Any | None: ...
 
 
+@dataclass
+class _ExtractJob:
+    idx: int
+    size: int
+    mime_type: str | None
+    path: Path | None = None
+    data: bytes | None = None
+    # True when `path` is a temp file owned by this processor.
+    spooled: bool = False
+
+
 class KreuzbergDocumentExtractProcessor(Processor):
     plugin_id = "katalog.processors.kreuzberg_document_extract.KreuzbergDocumentExtractProcessor"
     title = "Kreuzberg document extract"
@@ -146,12 +162,50 @@ class KreuzbergDocumentExtractProcessor(Processor):
             default=True,
             description="Use Kreuzberg batch extraction APIs when processing a workflow batch.",
         )
+        batch_max_files: int = Field(
+            default=64,
+            gt=0,
+            description="Maximum number of small documents per batch extraction call.",
+        )
+        batch_max_bytes: int = Field(
+            default=128 * 1024 * 1024,
+            gt=0,
+            description="Maximum total input bytes per batch extraction call.",
+        )
+        large_file_bytes: int = Field(
+            default=64 * 1024 * 1024,
+            gt=0,
+            description="Documents above this size are spooled to disk and extracted one at a time.",
+        )
+        oversized_file_bytes: int = Field(
+            default=512 * 1024 * 1024,
+            gt=0,
+            description="Documents above this size run in an isolated lane with a timeout.",
+        )
+        oversized_timeout_secs: int = Field(
+            default=600,
+            gt=0,
+            description="Extraction timeout for oversized documents.",
+        )
+        max_file_bytes: int | None = Field(
+            default=None,
+            gt=0,
+            description="Skip documents larger than this (unset means no limit).",
+        )
+        spool_chunk_bytes: int = Field(
+            default=8 * 1024 * 1024,
+            gt=0,
+            description="Read size used when streaming remote content.",
+        )
 
     config_model = ConfigModel
 
     def __init__(self, actor, **config):
         self.config = self.config_model.model_validate(config or {})
         self.extraction_config = self._build_extraction_config(self.config)
+        self.oversized_extraction_config = self._build_extraction_config(
+            self.config, oversized=True
+        )
         super().__init__(actor, **config)
 
     @property
@@ -187,62 +241,35 @@ class KreuzbergDocumentExtractProcessor(Processor):
         self,
         changes_batch: list[MetadataChanges],
     ) -> list[ProcessorResult]:
+        """Extract a batch, scheduling documents into lanes by size.
+
+        Small documents are grouped into batch extraction calls, large ones are
+        spooled to disk and extracted one at a time, and oversized ones run with
+        a dedicated config (timeout, no internal concurrency).
+        """
         if not changes_batch:
             return []
-        if not self.config.use_batch:
-            return [await self._run_single(changes) for changes in changes_batch]
         results: list[ProcessorResult | None] = [None] * len(changes_batch)
-        path_jobs: list[tuple[int, Path]] = []
-        bytes_jobs: list[tuple[int, bytes, str]] = []
-
-        for idx, changes in enumerate(changes_batch):
-            asset = changes.asset
-            if asset is None:
-                results[idx] = ProcessorResult(
-                    status=OpStatus.ERROR, message="MetadataChanges.asset is missing"
-                )
-                continue
-            reader = await changes.get_data_reader(DATA_FILE_READER)
-            if reader is None:
-                results[idx] = ProcessorResult(
-                    status=OpStatus.SKIPPED, message="Asset does not have a data accessor"
-                )
-                continue
-            mime_type = self._resolve_mime_type(changes)
-            if mime_type and not _is_supported_mime(mime_type):
-                results[idx] = ProcessorResult(
-                    status=OpStatus.SKIPPED,
-                    message=f"Unsupported mime type for kreuzberg: {mime_type}",
-                )
-                continue
-            reader_path = reader.path
-            if reader_path:
-                path_jobs.append((idx, Path(reader_path)))
-                continue
-            data = await reader.read()
-            if not data:
-                results[idx] = ProcessorResult(
-                    status=OpStatus.SKIPPED,
-                    message="Asset data reader returned empty content",
-                )
-                continue
-            inferred_mime_type = mime_type or detect_mime_type_from_bytes(data)
-            if not inferred_mime_type:
-                results[idx] = ProcessorResult(
-                    status=OpStatus.SKIPPED,
-                    message="Could not infer mime type for byte extraction",
-                )
-                continue
-            if not _is_supported_mime(inferred_mime_type):
-                results[idx] = ProcessorResult(
-                    status=OpStatus.SKIPPED,
-                    message=f"Unsupported mime type for kreuzberg: {inferred_mime_type}",
-                )
-                continue
-            bytes_jobs.append((idx, data, inferred_mime_type))
-
-        await self._run_path_jobs(path_jobs=path_jobs, results=results)
-        await self._run_bytes_jobs(bytes_jobs=bytes_jobs, results=results)
+        jobs: list[_ExtractJob] = []
+        try:
+            for idx, changes in enumerate(changes_batch):
+                job = await self._prepare_job(idx, changes, results)
+                if job is not None:
+                    jobs.append(job)
+
+            # Skipped jobs are only kept so their spool files get cleaned up.
+            pending = [job for job in jobs if results[job.idx] is None]
+            small = [job for job in pending if job.size <= self.config.large_file_bytes]
+            large = [job for job in pending if job.size > self.config.large_file_bytes]
+            large.sort(key=lambda job: job.size)
+            await asyncio.gather(
+                self._run_small_lane(small, results),
+                self._run_large_lane(large, results),
+            )
+        finally:
+            for job in jobs:
+                if job.spooled and job.path is not None:
+                    job.path.unlink(missing_ok=True)
 
         finalized: list[ProcessorResult] = []
         for result in results:
@@ -254,152 +281,287 @@ class KreuzbergDocumentExtractProcessor(Processor):
                 finalized.append(result)
         return finalized
 
-    async def _run_single(self, changes: MetadataChanges) -> ProcessorResult:
+    async def _prepare_job(
+        self,
+        idx: int,
+        changes: MetadataChanges,
+        results: list[ProcessorResult | None],
+    ) -> _ExtractJob | None:
+        """Resolve the input for one document, recording a result when it is skipped."""
         asset = changes.asset
         if asset is None:
-            return ProcessorResult(
+            results[idx] = ProcessorResult(
                 status=OpStatus.ERROR, message="MetadataChanges.asset is missing"
             )
+            return None
         reader = await changes.get_data_reader(DATA_FILE_READER)
         if reader is None:
-            return ProcessorResult(
+            results[idx] = ProcessorResult(
                 status=OpStatus.SKIPPED, message="Asset does not have a data accessor"
             )
-
+            return None
         mime_type = self._resolve_mime_type(changes)
         if mime_type and not _is_supported_mime(mime_type):
-            return ProcessorResult(
+            results[idx] = ProcessorResult(
                 status=OpStatus.SKIPPED,
                 message=f"Unsupported mime type for kreuzberg: {mime_type}",
             )
+            return None
 
-        doc: ExtractionResult
+        size = changes.latest_value(FILE_SIZE, value_type=int)
         reader_path = reader.path
-        try:
-            if reader_path:
-                doc = await extract_file(
-                    Path(reader_path),
-                    mime_type=mime_type,
-                    config=self.extraction_config,
-                )
-            else:
-                data = await reader.read()
-                if not data:
-                    return ProcessorResult(
-                        status=OpStatus.SKIPPED,
-                        message="Asset data reader returned empty content",
-                    )
-                inferred_mime_type = mime_type or detect_mime_type_from_bytes(data)
-                if not inferred_mime_type:
-                    return ProcessorResult(
-                        status=OpStatus.SKIPPED,
-                        message="Could not infer mime type for byte extraction",
-                    )
-                if not _is_supported_mime(inferred_mime_type):
-                    return ProcessorResult(
-                        status=OpStatus.SKIPPED,
-                        message=f"Unsupported mime type for kreuzberg: {inferred_mime_type}",
-                    )
-                doc = await extract_bytes(
-                    data,
-                    mime_type=inferred_mime_type,
-                    config=self.extraction_config,
-                )
-        except ValidationError as exc:
-            return ProcessorResult(
-                status=OpStatus.SKIPPED,
-                message=f"Kreuzberg validation failed: {exc}",
+        if reader_path and size is None:
+            try:
+                size = Path(reader_path).stat().st_size
+            except OSError:
+                size = None
+        if self._exceeds_max_size(size):
+            results[idx] = self._too_large_result(size)
+            return None
+
+        if reader_path:
+            return _ExtractJob(
+                idx=idx, size=size or 0, mime_type=mime_type, path=Path(reader_path)
             )
 
-        return self._build_processor_result(doc)
+        job = await self._read_remote(idx, reader, size=size, mime_type=mime_type)
+        if job.size == 0:
+            results[idx] = ProcessorResult(
+                status=OpStatus.SKIPPED,
+                message="Asset data reader returned empty content",
+            )
+            return job if job.spooled else None
+        if self._exceeds_max_size(job.size):
+            results[idx] = self._too_large_result(job.size)
+            return job if job.spooled else None
+        if not job.mime_type:
+            results[idx] = ProcessorResult(
+                status=OpStatus.SKIPPED,
+                message="Could not infer mime type for byte extraction",
+            )
+            return job if job.spooled else None
+        if not _is_supported_mime(job.mime_type):
+            results[idx] = ProcessorResult(
+                status=OpStatus.SKIPPED,
+                message=f"Unsupported mime type for kreuzberg: {job.mime_type}",
+            )
+            return job if job.spooled else None
+        return job
 
-    async def _run_path_jobs(
+    async def _read_remote(
         self,
+        idx: int,
+        reader: DataReader,
         *,
-        path_jobs: list[tuple[int, Path]],
-        results: list[ProcessorResult | None],
-    ) -> None:
-        if not path_jobs:
-            return
-        paths = [path for _idx, path in path_jobs]
+        size: int | None,
+        mime_type: str | None,
+    ) -> _ExtractJob:
+        """Stream reader content in chunks, spooling to a temp file once it is large.
+
+        Content below `large_file_bytes` stays in memory; anything bigger (known
+        up front from FILE_SIZE or discovered while reading) goes to disk so the
+        processor never holds a large document in RAM.
+        """
+        chunk_size = self.config.spool_chunk_bytes
+        threshold = self.config.large_file_bytes
+        buffer = bytearray()
+        spool: Any = None
+        offset = 0
         try:
-            docs = await batch_extract_files(paths, config=self.extraction_config)
-            for (idx, _path), doc in zip(path_jobs, docs, strict=True):
-                results[idx] = self._build_processor_result(doc)
-            return
-        except Exception as exc:  # noqa: BLE001
-            logger.warning(
-                "Kreuzberg batch_extract_files failed for {count} files, falling back to single extraction: {error}",
-                count=len(path_jobs),
-                error=str(exc),
+            while True:
+                chunk = await reader.read(offset, chunk_size)
+                if not chunk:
+                    break
+                if offset == 0 and not mime_type:
+                    mime_type = detect_mime_type_from_bytes(bytes(chunk))
+                offset += len(chunk)
+                if spool is None and (
+                    (size is not None and size > threshold) or offset > threshold
+                ):
+                    spool = tempfile.NamedTemporaryFile(
+                        prefix="katalog-extract-",
+                        suffix=_suffix_for_mime(mime_type),
+                        delete=False,
+                    )
+                    if buffer:
+                        await asyncio.to_thread(spool.write, bytes(buffer))
+                        buffer = bytearray()
+                if spool is not None:
+                    await asyncio.to_thread(spool.write, chunk)
+                else:
+                    buffer.extend(chunk)
+                if len(chunk) < chunk_size or self._exceeds_max_size(offset):
+                    break
+        except BaseException:
+            if spool is not None:
+                spool.close()
+                Path(spool.name).unlink(missing_ok=True)
+            raise
+        if spool is not None:
+            spool.close()
+            return _ExtractJob(
+                idx=idx,
+                size=offset,
+                mime_type=mime_type,
+                path=Path(spool.name),
+                spooled=True,
             )
-        for idx, path in path_jobs:
-            try:
-                doc = await extract_file(path, config=self.extraction_config)
-                results[idx] = self._build_processor_result(doc)
-            except ValidationError as exc:
-                results[idx] = ProcessorResult(
-                    status=OpStatus.SKIPPED,
-                    message=f"Kreuzberg validation failed: {exc}",
-                )
-            except Exception as exc:  # noqa: BLE001
-                results[idx] = ProcessorResult(
-                    status=OpStatus.ERROR,
-                    message=f"Kreuzberg extraction failed: {exc}",
-                )
+        return _ExtractJob(idx=idx, size=offset, mime_type=mime_type, data=bytes(buffer))
 
-    async def _run_bytes_jobs(
+    async def _run_small_lane(
         self,
-        *,
-        bytes_jobs: list[tuple[int, bytes, str]],
+        jobs: list[_ExtractJob],
         results: list[ProcessorResult | None],
     ) -> None:
-        if not bytes_jobs:
-            return
-        data_list = [data for _idx, data, _mime in bytes_jobs]
-        mime_types = [mime for _idx, _data, mime in bytes_jobs]
-        try:
-            docs = await batch_extract_bytes(
-                data_list,
-                mime_types=mime_types,
-                config=self.extraction_config,
-            )
-            for (idx, _data, _mime), doc in zip(bytes_jobs, docs, strict=True):
-                results[idx] = self._build_processor_result(doc)
-            return
-        except Exception as exc:  # noqa: BLE001
-            logger.warning(
-                "Kreuzberg batch_extract_bytes failed for {count} files, falling back to single extraction: {error}",
-                count=len(bytes_jobs),
-                error=str(exc),
-            )
-        for idx, data, mime_type in bytes_jobs:
+        for group in self._group_jobs(jobs):
+            path_jobs = [job for job in group if job.path is not None]
+            bytes_jobs = [job for job in group if job.path is None]
+            if path_jobs:
+                await self._extract_group(path_jobs, results, oversized=False)
+            if bytes_jobs:
+                await self._extract_group(bytes_jobs, results, oversized=False)
+
+    async def _run_large_lane(
+        self,
+        jobs: list[_ExtractJob],
+        results: list[ProcessorResult | None],
+    ) -> None:
+        for job in jobs:
+            oversized = job.size > self.config.oversized_file_bytes
+            await self._extract_group([job], results, oversized=oversized)
+
+    def _group_jobs(self, jobs: list[_ExtractJob]) -> list[list[_ExtractJob]]:
+        """Pack small jobs into groups bounded by file count and total bytes."""
+        if not self.config.use_batch:
+            return [[job] for job in jobs]
+        groups: list[list[_ExtractJob]] = []
+        current: list[_ExtractJob] = []
+        current_bytes = 0
+        for job in jobs:
+            if current and (
+                len(current) >= self.config.batch_max_files
+                or current_bytes + job.size > self.config.batch_max_bytes
+            ):
+                groups.append(current)
+                current = []
+                current_bytes = 0
+            current.append(job)
+            current_bytes += job.size
+        if current:
+            groups.append(current)
+        return groups
+
+    async def _extract_group(
+        self,
+        jobs: list[_ExtractJob],
+        results: list[ProcessorResult | None],
+        *,
+        oversized: bool,
+    ) -> None:
+        """Extract jobs that share an input kind, batching when there is more than one."""
+        config = self.oversized_extraction_config if oversized else self.extraction_config
+        if len(jobs) > 1:
+            started = time.perf_counter()
             try:
-                doc = await extract_bytes(
-                    data,
-                    mime_type=mime_type,
-                    config=self.extraction_config,
+                paths: list[str | Path] = [job.path for job in jobs if job.path is not None]
+                if paths:
+                    docs = await batch_extract_files(paths, config=config)
+                else:
+                    docs = await batch_extract_bytes(
+                        [job.data or b"" for job in jobs],
+                        mime_types=[job.mime_type or "" for job in jobs],
+                        config=config,
+                    )
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                for job, doc in zip(jobs, docs, strict=True):
+                    result = self._build_processor_result(doc)
+                    result.stats = self._job_stats(
+                        job,
+                        # Batch calls only expose total time; attribute it evenly.
+                        duration_ms=elapsed_ms / len(jobs),
+                        batch_size=len(jobs),
+                        oversized=oversized,
+                    )
+                    results[job.idx] = result
+                return
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(
+                    "Kreuzberg batch extraction failed for {count} files, falling back to single extraction: {error}",
+                    count=len(jobs),
+                    error=str(exc),
                 )
-                results[idx] = self._build_processor_result(doc)
+        for job in jobs:
+            started = time.perf_counter()
+            try:
+                if job.path is not None:
+                    doc = await extract_file(job.path, mime_type=job.mime_type, config=config)
+                else:
+                    doc = await extract_bytes(
+                        job.data or b"", mime_type=job.mime_type or "", config=config
+                    )
+                result = self._build_processor_result(doc)
             except ValidationError as exc:
-                results[idx] = ProcessorResult(
+                result = ProcessorResult(
                     status=OpStatus.SKIPPED,
                     message=f"Kreuzberg validation failed: {exc}",
                 )
             except Exception as exc:  # noqa: BLE001
-                results[idx] = ProcessorResult(
+                result = ProcessorResult(
                     status=OpStatus.ERROR,
                     message=f"Kreuzberg extraction failed: {exc}",
                 )
+            result.stats = self._job_stats(
+                job,
+                duration_ms=(time.perf_counter() - started) * 1000,
+                batch_size=1,
+                oversized=oversized,
+            )
+            results[job.idx] = result
+
+    def _job_stats(
+        self,
+        job: _ExtractJob,
+        *,
+        duration_ms: float,
+        batch_size: int,
+        oversized: bool,
+    ) -> dict[str, float]:
+        return {
+            "duration_ms": round(duration_ms, 3),
+            "input_bytes": float(job.size),
+            "buffered_bytes": float(len(job.data) if job.data is not None else 0),
+            "batch_size": float(batch_size),
+            "spooled": float(job.spooled),
+            "oversized": float(oversized),
+        }
+
+    def _exceeds_max_size(self, size: int | None) -> bool:
+        limit = self.config.max_file_bytes
+        return limit is not None and size is not None and size > limit
+
+    def _too_large_result(self, size: int | None) -> ProcessorResult:
+        return ProcessorResult(
+            status=OpStatus.SKIPPED,
+            message=f"Document exceeds max_file_bytes ({size} > {self.config.max_file_bytes})",
+        )
 
     def _build_extraction_config(
         self,
         config: ConfigModel,
+        *,
+        oversized: bool = False,
     ) -> ExtractionConfig:
         chunking_config = None
         if config.enable_chunking:
             # Use Kreuzberg's default chunking strategy/limits.
             chunking_config = ChunkingConfig()
+        if oversized:
+            return ExtractionConfig(
+                chunking=chunking_config,
+                language_detection=LanguageDetectionConfig(enabled=True),
+                extraction_timeout_secs=config.oversized_timeout_secs,
+                max_concurrent_extractions=1,
+            )
         extraction = ExtractionConfig(
             chunking=chunking_config,
             language_detection=LanguageDetectionConfig(enabled=True),
@@ -815,6 +977,13 @@ def _first_mapping_value(mapping: Mapping[str, Any], *keys: str) -> Any | None:
     return None
 
 
+def _suffix_for_mime(mime_type: str | None) -> str:
+    # Kreuzberg detects file types by extension, so keep one on spooled files.
+    if not mime_type:
+        return ""
+    return mimetypes.guess_extension(mime_type) or ""
+
+
 def _is_supported_mime(mime_type: str) -> bool:
     if mime_type.startswith("text/"):
         return True
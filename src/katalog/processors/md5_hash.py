@@ -71,19 +71,21 @@ class MD5HashProcessor(Processor):
 
         # If the accessor exposes a local path, hash it in a thread to leverage GIL release.
         if hasattr(reader, "path") and reader.path is not None:
-            digest = await asyncio.to_thread(
+            digest, bytes_read = await asyncio.to_thread(
                 _hash_file_path, Path(reader.path), self.config.chunk_size
             )
         else:
-            digest = await _hash_stream_async(reader, self.config.chunk_size)
+            digest, bytes_read = await _hash_stream_async(reader, self.config.chunk_size)
 
         return ProcessorResult(
-            metadata=[make_metadata(HASH_MD5, digest, self.actor.id)]
+            metadata=[make_metadata(HASH_MD5, digest, self.actor.id)],
+            stats={"bytes_read": bytes_read},
         )
 
 
-def _hash_file_path(path: Path, chunk_size: int) -> str:
+def _hash_file_path(path: Path, chunk_size: int) -> tuple[str, int]:
     hash_md5 = hashlib.md5()
+    bytes_read = 0
 
     with path.open("rb") as handle:
         while True:
@@ -91,10 +93,11 @@ def _hash_file_path(path: Path, chunk_size: int) -> str:
             if not chunk:
                 break
             hash_md5.update(chunk)
-    return hash_md5.hexdigest()
+            bytes_read += len(chunk)
+    return hash_md5.hexdigest(), bytes_read
 
 
-async def _hash_stream_async(accessor, chunk_size: int) -> str:
+async def _hash_stream_async(accessor, chunk_size: int) -> tuple[str, int]:
     hash_md5 = hashlib.md5()
     offset = 0
     while True:
@@ -104,4 +107,4 @@ async def _hash_stream_async(accessor, chunk_size: int) -> str:
         hash_md5.update(chunk)
         offset += len(chunk)
 
-    return hash_md5.hexdigest()
+    return hash_md5.hexdigest(), offset
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from katalog.constants.metadata import DOC_TEXT, HASH_MINHASH, HASH_SIMHASH
+from katalog.models import MetadataChanges, OpStatus, make_metadata
+from katalog.processors.base import Processor, ProcessorResult
+from katalog.utils.similarity import (
+    format_simhash,
+    minhash_signature,
+    shingle_hashes,
+    simhash,
+    tokenize,
+)
+
+
+class NearDuplicateFingerprintProcessor(Processor):
+    """Computes MinHash and SimHash fingerprints from extracted document text."""
+
+    plugin_id = "katalog.processors.near_duplicate_fingerprint.NearDuplicateFingerprintProcessor"
+    title = "Near-duplicate fingerprints"
+    description = "Compute MinHash signatures and SimHash fingerprints of document text."
+    execution_mode = "cpu"
+    _dependencies = frozenset({DOC_TEXT})
+    _outputs = frozenset({HASH_MINHASH, HASH_SIMHASH})
+
+    class ConfigModel(BaseModel):
+        model_config = ConfigDict(extra="ignore")
+
+        shingle_size: int = Field(
+            default=5, ge=1, description="Words per shingle for MinHash"
+        )
+        num_perm: int = Field(
+            default=128, ge=8, description="MinHash signature length"
+        )
+        min_tokens: int = Field(
+            default=20,
+            ge=1,
+            description="Skip texts with fewer words; short texts make noisy fingerprints",
+        )
+        max_chars: int = Field(
+            default=500_000,
+            gt=0,
+            description="Only the first max_chars characters of the text are fingerprinted",
+        )
+
+    config_model = ConfigModel
+
+    def __init__(self, actor, **config):
+        self.config = self.config_model.model_validate(config or {})
+        super().__init__(actor, **config)
+
+    @property
+    def dependencies(self):
+        return self._dependencies
+
+    @property
+    def outputs(self):
+        return self._outputs
+
+    def should_run(self, changes: MetadataChanges) -> bool:
+        if DOC_TEXT in changes.changed_keys():
+            return True
+        current = changes.current()
+        return DOC_TEXT in current and HASH_MINHASH not in current
+
+    async def run(self, changes: MetadataChanges) -> ProcessorResult:
+        text = changes.latest_value(DOC_TEXT, value_type=str)
+        if not text and HASH_MINHASH not in changes.current():
+            return ProcessorResult(status=OpStatus.SKIPPED, message="No document text")
+        tokens = tokenize(text[: self.config.max_chars]) if text else []
+        if len(tokens) < self.config.min_tokens:
+            # Retract fingerprints of earlier, longer text. The empty signature
+            # records that this text was seen, so it is not fingerprinted again.
+            return ProcessorResult(
+                message="Text too short" if text else "No document text",
+                metadata=[
+                    make_metadata(HASH_MINHASH, None, self.actor.id),
+                    make_metadata(HASH_MINHASH, [], self.actor.id),
+                    make_metadata(HASH_SIMHASH, None, self.actor.id),
+                ],
+            )
+
+        signature = minhash_signature(
+            shingle_hashes(tokens, self.config.shingle_size), self.config.num_perm
+        )
+        return ProcessorResult(
+            metadata=[
+                make_metadata(HASH_MINHASH, signature, self.actor.id),
+                make_metadata(HASH_SIMHASH, format_simhash(simhash(tokens)), self.actor.id),
+            ]
+        )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import time
 from datetime import UTC, datetime
 from typing import Awaitable, Sequence, cast
@@ -36,6 +37,21 @@ from katalog.config import current_db_url, current_workspace
 ProcessorStage = list[Processor]
 
 
+def processor_pipeline_key(pipeline: Sequence[Sequence[Processor]]) -> int:
+    """Digest the processors of a pipeline, and when each was last reconfigured, into an int64.
+
+    Sources store it with scan fingerprints, so an unchanged asset is only
+    skipped when this same pipeline already processed it.
+    """
+    parts = sorted(
+        f"{processor.actor.id}\0{processor.actor.plugin_id}\0{processor.actor.updated_at}"
+        for stage in pipeline
+        for processor in stage
+    )
+    digest = hashlib.blake2b("\n".join(parts).encode("utf-8"), digest_size=8)
+    return int.from_bytes(digest.digest(), "little", signed=True)
+
+
 def _coerce_utc(dt: datetime) -> datetime:
     """Normalize datetimes for safe comparisons with changeset-id timestamps."""
     if dt.tzinfo is None or dt.tzinfo.utcoffset(dt) is None:
@@ -243,6 +259,7 @@ async def _run_pipeline(
     changes: MetadataChanges,
     executors: ProcessorExecutorBundle,
     force_run: bool = False,
+    failed_asset_ids: set[int] | None = None,
 ) -> MetadataChanges:
     asset = changes.asset
     if asset is None:
@@ -267,6 +284,8 @@ async def _run_pipeline(
                     logger.exception(
                         f"Processor {processor}.should_run failed for record {asset.id}"
                     )
+                    if failed_asset_ids is not None and asset.id is not None:
+                        failed_asset_ids.add(int(asset.id))
                     continue
                 if not should_run:
                     continue
@@ -281,8 +300,10 @@ async def _run_pipeline(
                 *(coro for _, coro in coros)
             )
             stage_metadata: list[Metadata] = []
-            for result in results:
+            for (processor, _coro), result in zip(coros, results, strict=True):
                 status = result.status
+                if stats and result.stats:
+                    stats.record_processor_stats(processor.plugin_id, result.stats)
                 if stats:
                     if status == OpStatus.COMPLETED:
                         stats.processings_completed += 1
@@ -295,6 +316,8 @@ async def _run_pipeline(
                     elif status == OpStatus.ERROR:
                         stats.processings_error += 1
                 if status in (OpStatus.CANCELED, OpStatus.ERROR):
+                    if failed_asset_ids is not None and asset.id is not None:
+                        failed_asset_ids.add(int(asset.id))
                     continue
                 if status == OpStatus.SKIPPED:
                     continue
@@ -313,6 +336,7 @@ async def process_asset(
     changes: MetadataChanges,
     executors: ProcessorExecutorBundle | None = None,
     force_run: bool = False,
+    failed_asset_ids: set[int] | None = None,
 ) -> set[MetadataKey]:
     owns_executors = executors is None
     runtime_executors = executors or ProcessorExecutorBundle()
@@ -324,6 +348,7 @@ async def process_asset(
             changes=changes,
             executors=runtime_executors,
             force_run=force_run,
+            failed_asset_ids=failed_asset_ids,
         )
     except asyncio.CancelledError:
         cancelled = True
@@ -373,8 +398,12 @@ async def process_batch_collect(
     changes_batch: list[MetadataChanges],
     executors: ProcessorExecutorBundle | None = None,
     force_run: bool = False,
+    failed_asset_ids: set[int] | None = None,
 ) -> list[MetadataChanges]:
-    """Run a dependency-sorted processor pipeline over one hydrated asset batch."""
+    """Run a dependency-sorted processor pipeline over one hydrated asset batch.
+
+    Assets a processor failed or was cancelled on are added to `failed_asset_ids`.
+    """
     if not changes_batch:
         return changes_batch
     stats = changeset.stats
@@ -408,6 +437,8 @@ async def process_batch_collect(
                                 processor=processor,
                                 asset_id=asset.id,
                             )
+                            if failed_asset_ids is not None and asset.id is not None:
+                                failed_asset_ids.add(int(asset.id))
                             continue
                         if not should_run:
                             continue
@@ -455,6 +486,8 @@ async def process_batch_collect(
 
                     for idx, result in results_by_idx.items():
                         status = result.status
+                        if result.stats:
+                            stats.record_processor_stats(processor.plugin_id, result.stats)
                         if status == OpStatus.COMPLETED:
                             stats.processings_completed += 1
                         elif status == OpStatus.PARTIAL:
@@ -465,7 +498,12 @@ async def process_batch_collect(
                             stats.processings_skipped += 1
                         elif status == OpStatus.ERROR:
                             stats.processings_error += 1
-                        if status in (OpStatus.CANCELED, OpStatus.ERROR, OpStatus.SKIPPED):
+                        if status in (OpStatus.CANCELED, OpStatus.ERROR):
+                            asset = changes_batch[idx].asset
+                            if failed_asset_ids is not None and asset and asset.id is not None:
+                                failed_asset_ids.add(int(asset.id))
+                            continue
+                        if status == OpStatus.SKIPPED:
                             continue
                         changes_batch[idx].add(result.metadata)
         return changes_batch
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Sequence
+
+from loguru import logger
+
+from katalog.config import current_app_context
+from katalog.db.fts import get_fts_repo
+
+# SQLite FTS5 defaults, restored after bulk ingest for tables without own settings.
+DEFAULT_AUTOMERGE = 4
+DEFAULT_CRISISMERGE = 16
+# During bulk ingest, defer background merges and tolerate more level-0 segments.
+BULK_AUTOMERGE = 0
+BULK_CRISISMERGE = 64
+
+DEFAULT_MERGE_PAGES = 500
+DEFAULT_MERGE_BUDGET_MS = 2000
+IDLE_MERGE_INTERVAL_S = 60.0
+IDLE_MERGE_BUDGET_MS = 500
+
+
+@dataclass(frozen=True)
+class FtsMergeResult:
+    table: str
+    steps: int
+    segments_before: int
+    segments_after: int
+    duration_ms: int
+    # False when the time budget ran out before merging converged.
+    complete: bool
+
+
+async def resolve_fts_tables(tables: Sequence[str] | None = None) -> list[str]:
+    """Return existing FTS5 tables, restricted to `tables` when given."""
+    available = await get_fts_repo().list_index_tables()
+    if tables is None:
+        return available
+    unknown = sorted(set(tables) - set(available))
+    if unknown:
+        raise ValueError(f"Unknown FTS table(s): {', '.join(unknown)}")
+    return [table for table in available if table in set(tables)]
+
+
+async def configure_fts_merge(
+    *,
+    automerge: int | None = None,
+    crisismerge: int | None = None,
+    usermerge: int | None = None,
+    tables: Sequence[str] | None = None,
+) -> list[str]:
+    """Apply merge settings to the given (or all) FTS tables."""
+    repo = get_fts_repo()
+    resolved = await resolve_fts_tables(tables)
+    for table in resolved:
+        await repo.configure_merge(
+            table,
+            automerge=automerge,
+            crisismerge=crisismerge,
+            usermerge=usermerge,
+        )
+    return resolved
+
+
+async def merge_fts_indexes(
+    tables: Sequence[str] | None = None,
+    *,
+    pages: int = DEFAULT_MERGE_PAGES,
+    budget_ms: int = DEFAULT_MERGE_BUDGET_MS,
+) -> list[FtsMergeResult]:
+    """Run incremental FTS5 merge steps until no work remains or the budget is spent.
+
+    Each step is a separate short transaction, so readers and writers are only
+    blocked for one step at a time.
+    """
+    repo = get_fts_repo()
+    deadline = time.perf_counter() + max(0, budget_ms) / 1000
+    results: list[FtsMergeResult] = []
+    for table in await resolve_fts_tables(tables):
+        started = time.perf_counter()
+        before = await repo.table_stats(table)
+        steps = 0
+        complete = True
+        while True:
+            if time.perf_counter() >= deadline:
+                complete = False
+                break
+            if not await repo.merge_step(table, pages=pages):
+                break
+            steps += 1
+            await asyncio.sleep(0)
+        after = await repo.table_stats(table) if steps else before
+        results.append(
+            FtsMergeResult(
+                table=table,
+                steps=steps,
+                segments_before=before.segments,
+                segments_after=after.segments,
+                duration_ms=int((time.perf_counter() - started) * 1000),
+                complete=complete,
+            )
+        )
+    return results
+
+
+async def optimize_fts_indexes(tables: Sequence[str] | None = None) -> list[FtsMergeResult]:
+    """Merge every segment of each table into one (blocking, use when idle)."""
+    repo = get_fts_repo()
+    results: list[FtsMergeResult] = []
+    for table in await resolve_fts_tables(tables):
+        started = time.perf_counter()
+        before = await repo.table_stats(table)
+        await repo.optimize(table)
+        after = await repo.table_stats(table)
+        results.append(
+            FtsMergeResult(
+                table=table,
+                steps=1,
+                segments_before=before.segments,
+                segments_after=after.segments,
+                duration_ms=int((time.perf_counter() - started) * 1000),
+                complete=True,
+            )
+        )
+    return results
+
+
+@dataclass
+class _BulkIngestState:
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    depth: int = 0
+    previous: dict[str, dict[str, int]] = field(default_factory=dict)
+
+
+def _bulk_ingest_state() -> _BulkIngestState:
+    state = current_app_context().state
+    bulk = state.get("fts_bulk_ingest")
+    if bulk is None:
+        bulk = _BulkIngestState()
+        state["fts_bulk_ingest"] = bulk
+    return bulk
+
+
+@asynccontextmanager
+async def fts_bulk_ingest(
+    *,
+    merge_budget_ms: int = DEFAULT_MERGE_BUDGET_MS,
+) -> AsyncIterator[None]:
+    """Relax FTS merge settings for a bulk write, then restore and merge incrementally.
+
+    Nested and concurrent blocks share one relaxation: the first entry
+    snapshots each table's settings and the last exit restores them. Tables
+    created meanwhile keep SQLite defaults. Maintenance failures are logged
+    and never fail the wrapped operation.
+    """
+    repo = get_fts_repo()
+    bulk = _bulk_ingest_state()
+    async with bulk.lock:
+        bulk.depth += 1
+        if bulk.depth == 1:
+            bulk.previous = {}
+            try:
+                for table in await resolve_fts_tables():
+                    bulk.previous[table] = (await repo.table_stats(table)).settings
+                await configure_fts_merge(
+                    automerge=BULK_AUTOMERGE,
+                    crisismerge=BULK_CRISISMERGE,
+                    tables=list(bulk.previous),
+                )
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Failed to apply FTS bulk-ingest settings: {}", exc)
+    try:
+        yield
+    finally:
+        async with bulk.lock:
+            bulk.depth -= 1
+            if bulk.depth == 0:
+                previous, bulk.previous = bulk.previous, {}
+                try:
+                    for table, settings in previous.items():
+                        await repo.configure_merge(
+                            table,
+                            automerge=settings.get("automerge", DEFAULT_AUTOMERGE),
+                            crisismerge=settings.get("crisismerge", DEFAULT_CRISISMERGE),
+                        )
+                    results = await merge_fts_indexes(budget_ms=merge_budget_ms)
+                    for result in results:
+                        if result.steps:
+                            logger.info(
+                                "FTS merge {table}: segments {before} -> {after} in {ms}ms ({steps} steps)",
+                                table=result.table,
+                                before=result.segments_before,
+                                after=result.segments_after,
+                                ms=result.duration_ms,
+                                steps=result.steps,
+                            )
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning("FTS post-ingest maintenance failed: {}", exc)
+
+
+async def run_idle_fts_maintenance(
+    is_idle: Callable[[], bool],
+    *,
+    interval_s: float = IDLE_MERGE_INTERVAL_S,
+    budget_ms: int = IDLE_MERGE_BUDGET_MS,
+) -> None:
+    """Periodically run a short merge pass while `is_idle()` reports no running work."""
+    while True:
+        await asyncio.sleep(interval_s)
+        if not is_idle():
+            continue
+        try:
+            await merge_fts_indexes(budget_ms=budget_ms)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Idle FTS maintenance skipped: {}", exc)
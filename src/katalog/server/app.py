@@ -21,6 +21,7 @@ from katalog.server.routes import (
     metadata,
     operations,
     plugins,
+    relations,
     system,
     views,
     workflows,
@@ -81,7 +82,13 @@ class SPAStaticFiles(StaticFiles):
 
 
 app = FastAPI(
-    lifespan=partial(app_lifespan, runtime_mode="read_write", log_discovered_plugins=True)
+    lifespan=partial(
+        app_lifespan,
+        runtime_mode="read_write",
+        log_discovered_plugins=True,
+        warm_embeddings=True,
+        idle_fts_maintenance=True,
+    )
 )
 
 
@@ -129,6 +136,7 @@ app.include_router(changesets.router, prefix=API_PREFIX)
 app.include_router(actors.router, prefix=API_PREFIX)
 app.include_router(plugins.router, prefix=API_PREFIX)
 app.include_router(metadata.router, prefix=API_PREFIX)
+app.include_router(relations.router, prefix=API_PREFIX)
 app.include_router(system.router, prefix=API_PREFIX)
 app.include_router(workflows.router, prefix=API_PREFIX)
 
@@ -3,11 +3,16 @@ from typing import Literal, Optional
 from fastapi import APIRouter, Query, Request
 
 from katalog.api.assets import (
+    AssetMerge,
+    AssetUnmerge,
     create_asset,
+    get_asset_merge_set,
     get_asset_serialized,
     list_assets,
     list_grouped_assets,
     manual_edit_asset,
+    merge_assets,
+    unmerge_assets,
     update_asset,
 )
 from katalog.api.helpers import ApiError
@@ -33,6 +38,14 @@ async def list_assets_rest(
     search_dimension: int | None = Query(None, ge=1),
     search_embedding_model: str | None = Query(None),
     search_embedding_backend: Literal["preset", "fastembed"] | None = Query(None),
+    search_fts_index: int | None = Query(None),
+    search_fusion: Literal["rrf", "weighted"] | None = Query(None),
+    search_lexical_weight: float | None = Query(None, ge=0),
+    search_semantic_weight: float | None = Query(None, ge=0),
+    search_rrf_k: int | None = Query(None, ge=1),
+    search_candidate_pool: int | None = Query(None, ge=1),
+    search_recency_boost: float | None = Query(None, ge=0),
+    search_source_boosts: list[str] | None = Query(None),
     metadata_actor_ids: list[int] | None = Query(None),
     metadata_include_removed: bool = Query(False),
     metadata_aggregation: Optional[str] = Query(None),
@@ -59,6 +72,14 @@ async def list_assets_rest(
             search_dimension=search_dimension,
             search_embedding_model=search_embedding_model,
             search_embedding_backend=search_embedding_backend,
+            search_fts_index=search_fts_index,
+            search_fusion=search_fusion,
+            search_lexical_weight=search_lexical_weight,
+            search_semantic_weight=search_semantic_weight,
+            search_rrf_k=search_rrf_k,
+            search_candidate_pool=search_candidate_pool,
+            search_recency_boost=search_recency_boost,
+            search_source_boosts=search_source_boosts,
             metadata_actor_ids=metadata_actor_ids,
             metadata_include_removed=metadata_include_removed,
             metadata_aggregation=metadata_aggregation,
@@ -115,6 +136,23 @@ async def create_asset_rest(request: Request):
     return await create_asset()
 
 
+@router.post("/assets/merge")
+async def merge_assets_rest(request: Request):
+    payload = AssetMerge.model_validate(await request.json())
+    return await merge_assets(payload)
+
+
+@router.post("/assets/unmerge")
+async def unmerge_assets_rest(request: Request):
+    payload = AssetUnmerge.model_validate(await request.json())
+    return await unmerge_assets(payload)
+
+
+@router.get("/assets/{asset_id}/merge-set")
+async def get_asset_merge_set_rest(asset_id: int):
+    return await get_asset_merge_set(asset_id)
+
+
 @router.get("/assets/{asset_id}")
 async def get_asset_rest(
     asset_id: int,
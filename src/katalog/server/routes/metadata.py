@@ -1,9 +1,12 @@
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Query, Request
 
 from katalog.api.metadata import (
+    build_trigram_index,
+    drop_trigram_index,
     list_metadata,
     metadata_registry,
     metadata_schema_editable,
+    trigram_index_status,
 )
 from katalog.models.query import AssetQuery
 
@@ -25,3 +28,21 @@ async def list_metadata_rest(request: Request):
     payload = await request.json()
     query = AssetQuery.model_validate(payload)
     return await list_metadata(query)
+
+
+@router.get("/metadata/trigram")
+async def trigram_index_status_rest():
+    return await trigram_index_status()
+
+
+@router.post("/metadata/trigram")
+async def build_trigram_index_rest(
+    metadata_keys: list[str] | None = Query(None),
+    rebuild: bool = Query(False),
+):
+    return await build_trigram_index(metadata_keys, rebuild=rebuild)
+
+
+@router.delete("/metadata/trigram")
+async def drop_trigram_index_rest():
+    return await drop_trigram_index()
@@ -0,0 +1,56 @@
+from typing import Literal
+
+from fastapi import APIRouter, Query
+
+from katalog.api.relations import (
+    list_relation_neighbors,
+    rebuild_relations,
+    relation_component,
+    traverse_relations,
+)
+from katalog.db.relations import MAX_TRAVERSAL_DEPTH, MAX_TRAVERSAL_RESULTS
+
+router = APIRouter()
+
+
+@router.get("/assets/{asset_id}/relations")
+async def list_relation_neighbors_rest(
+    asset_id: int,
+    direction: Literal["out", "in", "both"] = Query("both"),
+    metadata_keys: list[str] | None = Query(None),
+    limit: int = Query(100, ge=1, le=MAX_TRAVERSAL_RESULTS),
+):
+    return await list_relation_neighbors(
+        asset_id, direction=direction, metadata_keys=metadata_keys, limit=limit
+    )
+
+
+@router.get("/assets/{asset_id}/relations/traverse")
+async def traverse_relations_rest(
+    asset_id: int,
+    max_depth: int = Query(2, ge=1, le=MAX_TRAVERSAL_DEPTH),
+    direction: Literal["out", "in", "both"] = Query("both"),
+    metadata_keys: list[str] | None = Query(None),
+    limit: int = Query(1000, ge=1, le=MAX_TRAVERSAL_RESULTS),
+):
+    return await traverse_relations(
+        asset_id,
+        max_depth=max_depth,
+        direction=direction,
+        metadata_keys=metadata_keys,
+        limit=limit,
+    )
+
+
+@router.get("/assets/{asset_id}/relations/component")
+async def relation_component_rest(
+    asset_id: int,
+    metadata_keys: list[str] | None = Query(None),
+    limit: int = Query(1000, ge=1, le=MAX_TRAVERSAL_RESULTS),
+):
+    return await relation_component(asset_id, metadata_keys=metadata_keys, limit=limit)
+
+
+@router.post("/relations/rebuild")
+async def rebuild_relations_rest():
+    return await rebuild_relations()
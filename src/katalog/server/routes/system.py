@@ -1,7 +1,16 @@
-from fastapi import APIRouter, Request
+from typing import Literal
+
+from fastapi import APIRouter, Query, Request
 from fastapi.responses import RedirectResponse
 
-from katalog.api.system import auth_api, sync_config, workspace_size_stats
+from katalog.api.system import (
+    auth_api,
+    fts_index_stats,
+    fts_maintenance,
+    sync_config,
+    workspace_size_stats,
+)
+from katalog.runtime.fts_maintenance import DEFAULT_MERGE_BUDGET_MS, DEFAULT_MERGE_PAGES
 
 router = APIRouter()
 
@@ -41,3 +50,29 @@ async def sync_config_rest():
 @router.get("/stats")
 async def workspace_size_stats_rest():
     return await workspace_size_stats()
+
+
+@router.get("/fts")
+async def fts_index_stats_rest(tables: list[str] | None = Query(None)):
+    return await fts_index_stats(tables)
+
+
+@router.post("/fts/{action}")
+async def fts_maintenance_rest(
+    action: Literal["merge", "optimize", "configure"],
+    tables: list[str] | None = Query(None),
+    pages: int = Query(DEFAULT_MERGE_PAGES, ge=1),
+    budget_ms: int = Query(DEFAULT_MERGE_BUDGET_MS, ge=0),
+    automerge: int | None = Query(None, ge=0, le=16),
+    crisismerge: int | None = Query(None, ge=2),
+    usermerge: int | None = Query(None, ge=2, le=16),
+):
+    return await fts_maintenance(
+        action=action,
+        tables=tables,
+        pages=pages,
+        budget_ms=budget_ms,
+        automerge=automerge,
+        crisismerge=crisismerge,
+        usermerge=usermerge,
+    )
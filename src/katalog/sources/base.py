@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, AsyncIterator, Collection, cast
+from typing import Any, AsyncIterator, Callable, Collection, Sequence, cast
 
 from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
@@ -27,6 +27,8 @@ class AssetScanResult(BaseModel):
     asset: Asset
     actor: Actor
     metadata: list[Metadata] = Field(default_factory=list)
+    # Optional cheap change digest, recorded once the asset has been persisted.
+    fingerprint: int | None = None
 
     def set_metadata(self, metadata_key: MetadataKey, value: MetadataScalar) -> None:
         """Sets e.g. replaces the metadata value on this actor for the given key with a scalar value."""
@@ -47,11 +49,27 @@ class ScanResult(BaseModel):
     iterator: AsyncIterator[AssetScanResult]
     status: OpStatus = OpStatus.IN_PROGRESS
     ignored: int = 0
+    # Source-specific counters, summed into the changeset's scan_metrics.
+    metrics: dict[str, float] = Field(default_factory=dict)
+    # Assets whose fingerprint matched; they only count as seen for lost-tracking.
+    unchanged_asset_ids: list[int] = Field(default_factory=list)
+    # Assets the source reports as deleted; the missing-assets policy applies right away.
+    removed_asset_ids: list[int] = Field(default_factory=list)
+    # Set for change-feed scans: assets that were not yielded are not missing.
+    incremental: bool = False
+    # Committed into the changeset data when the scan completes, see `load_source_state()`.
+    source_state: dict[str, Any] | None = None
+    # Returns a JSON-serializable cursor from which `resume_scan()` continues
+    # after everything yielded (or reported unchanged) so far. None if unsupported.
+    checkpoint: Callable[[], dict[str, Any] | None] | None = Field(default=None, exclude=True)
 
     @field_serializer("status")
     def _serialize_status(self, value: OpStatus) -> str:
         return value.value if isinstance(value, OpStatus) else str(value)
 
+    def resume_cursor(self) -> dict[str, Any] | None:
+        return self.checkpoint() if self.checkpoint is not None else None
+
 
 class ScanBatch(BaseModel):
     """One pull response from a source scan."""
@@ -60,6 +78,13 @@ class ScanBatch(BaseModel):
     cursor: str | None = None
     status: OpStatus = OpStatus.IN_PROGRESS
     ignored: int = 0
+    unchanged_asset_ids: list[int] = Field(default_factory=list)
+    removed_asset_ids: list[int] = Field(default_factory=list)
+    # Resume cursor covering this batch and everything before it.
+    checkpoint: dict[str, Any] | None = None
+    # Set on the final batch only.
+    incremental: bool = False
+    source_state: dict[str, Any] | None = None
 
     @field_serializer("status")
     def _serialize_status(self, value: OpStatus) -> str:
@@ -125,17 +150,36 @@ class SourcePlugin(PluginBase):
         """
         raise NotImplementedError()
 
+    async def load_source_state(self) -> dict[str, Any] | None:
+        """Return the `ScanResult.source_state` of this actor's last completed scan."""
+        if self.actor.id is None:
+            return None
+        from katalog.db.changesets import get_changeset_repo
+
+        return await get_changeset_repo().latest_source_state(int(self.actor.id))
+
+    async def resume_scan(self, cursor: dict[str, Any]) -> ScanResult:
+        """
+        Continue an interrupted scan from a cursor previously returned by
+        `ScanResult.checkpoint`. Items may be yielded again; sources that
+        cannot resume (or do not recognize the cursor) simply scan from the start.
+        """
+        _ = cursor
+        return await self.scan()
+
     async def pull_scan_batch(
         self,
         *,
         cursor: str | None,
         batch_size: int,
+        resume_from: dict[str, Any] | None = None,
     ) -> ScanBatch:
         """Pull the next scan batch by cursor.
 
-        If `cursor` is None, a new scan session is started.
+        If `cursor` is None, a new scan session is started, resumed from
+        `resume_from` when given.
         """
-        session_cursor, session = await self._get_or_create_scan_session(cursor)
+        session_cursor, session = await self._get_or_create_scan_session(cursor, resume_from)
         return await self._pull_from_session(
             sessions=self._scan_sessions,
             session_cursor=session_cursor,
@@ -167,22 +211,74 @@ class SourcePlugin(PluginBase):
         self,
         *,
         batch_size: int,
+        resume_from: dict[str, Any] | None = None,
     ) -> AsyncIterator[SourceBatch]:
         """Produce source batches in workflow runtime format."""
-        async for batch in self.scan_batches(batch_size=batch_size):
-            items: list[SourceAssetPayload] = []
-            for item in batch:
-                actor_id = item.actor.id
-                if actor_id is None:
-                    raise ValueError("AssetScanResult.actor.id is required")
-                items.append(
-                    SourceAssetPayload(
-                        asset=item.asset,
-                        actor_id=int(actor_id),
-                        metadata=list(item.metadata),
-                    )
+        if batch_size <= 0:
+            raise ValueError("batch_size must be > 0")
+        cursor: str | None = None
+        while True:
+            response = await self.pull_scan_batch(
+                cursor=cursor,
+                batch_size=batch_size,
+                resume_from=resume_from if cursor is None else None,
+            )
+            if (
+                response.items
+                or response.unchanged_asset_ids
+                or response.removed_asset_ids
+                or response.incremental
+                or response.source_state
+            ):
+                yield SourceBatch(
+                    items=_to_source_payloads(response.items),
+                    status=OpStatus.IN_PROGRESS,
+                    unchanged_asset_ids=list(response.unchanged_asset_ids),
+                    removed_asset_ids=list(response.removed_asset_ids),
+                    checkpoint=response.checkpoint,
+                    incremental=response.incremental,
+                    source_state=response.source_state,
                 )
-            yield SourceBatch(items=items, status=OpStatus.IN_PROGRESS)
+            if response.cursor is None:
+                break
+            cursor = response.cursor
+
+    async def scan_paths(self, paths: Sequence[str]) -> ScanResult:
+        """
+        Scan only the given source locations (files, or directories to walk), e.g.
+        paths reported by a change watcher.
+        """
+        _ = paths
+        raise NotImplementedError()
+
+    async def produce_path_batches(
+        self,
+        paths: Sequence[str],
+        *,
+        batch_size: int,
+    ) -> AsyncIterator[SourceBatch]:
+        """Produce source batches for `scan_paths()` in workflow runtime format."""
+        if batch_size <= 0:
+            raise ValueError("batch_size must be > 0")
+        scan_result = await self.scan_paths(paths)
+        items: list[AssetScanResult] = []
+        async for item in scan_result.iterator:
+            items.append(item)
+            if len(items) >= batch_size:
+                unchanged_asset_ids = scan_result.unchanged_asset_ids
+                scan_result.unchanged_asset_ids = []
+                yield SourceBatch(
+                    items=_to_source_payloads(items),
+                    status=OpStatus.IN_PROGRESS,
+                    unchanged_asset_ids=unchanged_asset_ids,
+                )
+                items = []
+        yield SourceBatch(
+            items=_to_source_payloads(items),
+            ignored=scan_result.ignored,
+            status=scan_result.status,
+            unchanged_asset_ids=list(scan_result.unchanged_asset_ids),
+        )
 
     def can_scan_asset(self, changes: MetadataChanges) -> int:
         """Return a score (>0) when this source can scan from the given asset state."""
@@ -250,23 +346,12 @@ class SourcePlugin(PluginBase):
             seed.changes,
             batch_size=batch_size,
         ):
-            items: list[SourceAssetPayload] = []
-            for item in batch:
-                actor_id = item.actor.id
-                if actor_id is None:
-                    raise ValueError("AssetScanResult.actor.id is required")
-                items.append(
-                    SourceAssetPayload(
-                        asset=item.asset,
-                        actor_id=int(actor_id),
-                        metadata=list(item.metadata),
-                    )
-                )
-            yield SourceBatch(items=items, status=OpStatus.IN_PROGRESS)
+            yield SourceBatch(items=_to_source_payloads(batch), status=OpStatus.IN_PROGRESS)
 
     async def _get_or_create_scan_session(
         self,
         cursor: str | None,
+        resume_from: dict[str, Any] | None = None,
     ) -> tuple[str, _ScanSession]:
         """Resolve an active scan session or lazily start one from `scan()`."""
         if cursor is not None:
@@ -275,7 +360,10 @@ class SourcePlugin(PluginBase):
                 raise ValueError(f"Invalid scan cursor: {cursor}")
             return cursor, session
 
-        scan_result = await self.scan()
+        if resume_from is not None:
+            scan_result = await self.resume_scan(resume_from)
+        else:
+            scan_result = await self.scan()
         self._next_scan_cursor += 1
         next_cursor = f"scan:{self._next_scan_cursor}"
         session = _ScanSession(iterator=scan_result.iterator, status_ref=scan_result)
@@ -325,6 +413,14 @@ class SourcePlugin(PluginBase):
                 break
             items.append(item)
 
+        # Hand over fingerprint hits reported since the previous pull.
+        unchanged_asset_ids = session.status_ref.unchanged_asset_ids
+        session.status_ref.unchanged_asset_ids = []
+        removed_asset_ids = session.status_ref.removed_asset_ids
+        session.status_ref.removed_asset_ids = []
+        # Taken while the iterator is suspended, so it matches the items above.
+        checkpoint = session.status_ref.resume_cursor()
+
         if exhausted:
             sessions.pop(session_cursor, None)
             return ScanBatch(
@@ -332,6 +428,11 @@ class SourcePlugin(PluginBase):
                 cursor=None,
                 status=session.status_ref.status,
                 ignored=session.status_ref.ignored,
+                unchanged_asset_ids=unchanged_asset_ids,
+                removed_asset_ids=removed_asset_ids,
+                checkpoint=checkpoint,
+                incremental=session.status_ref.incremental,
+                source_state=session.status_ref.source_state,
             )
 
         return ScanBatch(
@@ -339,7 +440,27 @@ class SourcePlugin(PluginBase):
             cursor=session_cursor,
             status=OpStatus.IN_PROGRESS,
             ignored=0,
+            unchanged_asset_ids=unchanged_asset_ids,
+            removed_asset_ids=removed_asset_ids,
+            checkpoint=checkpoint,
+        )
+
+
+def _to_source_payloads(batch: list[AssetScanResult]) -> list[SourceAssetPayload]:
+    items: list[SourceAssetPayload] = []
+    for item in batch:
+        actor_id = item.actor.id
+        if actor_id is None:
+            raise ValueError("AssetScanResult.actor.id is required")
+        items.append(
+            SourceAssetPayload(
+                asset=item.asset,
+                actor_id=int(actor_id),
+                metadata=list(item.metadata),
+                fingerprint=item.fingerprint,
+            )
         )
+    return items
 
 
 async def make_source_instance(source_record: Actor) -> SourcePlugin:
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-import asyncio
 import csv
 from pathlib import Path
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Iterator, TextIO
 from urllib.parse import unquote, urlparse
 
 from pydantic import Field, field_validator
@@ -11,6 +10,7 @@ from pydantic import Field, field_validator
 from katalog.config import current_workspace
 from katalog.models import Actor
 from katalog.sources.tabular import TabularRawRow, TabularSource, TabularSourceConfig
+from katalog.utils.streaming import iterate_in_thread
 
 
 class CsvSourceConfig(TabularSourceConfig):
@@ -90,28 +90,25 @@ class CsvSource(TabularSource):
         return path.exists() and path.is_file()
 
     async def iter_raw_rows(self) -> AsyncIterator[TabularRawRow]:
-        rows = await asyncio.to_thread(self._read_rows_sync)
-        for row in rows:
-            yield row
-
-    def _read_rows_sync(self) -> list[TabularRawRow]:
         if not self.csv_path.exists():
             raise FileNotFoundError(f"CSV source file not found: {self.csv_path}")
 
-        rows: list[TabularRawRow] = []
         with self.csv_path.open(
             "r",
             encoding=self.encoding,
             newline="",
         ) as handle:
-            reader = csv.reader(
-                handle,
-                delimiter=self.delimiter,
-                quotechar=self.quotechar,
-            )
-            for idx, values in enumerate(reader, start=1):
-                rows.append(TabularRawRow(row_number=idx, values=list(values)))
-        return rows
+            async for row in iterate_in_thread(self._iter_rows_sync(handle)):
+                yield row
+
+    def _iter_rows_sync(self, handle: TextIO) -> Iterator[TabularRawRow]:
+        reader = csv.reader(
+            handle,
+            delimiter=self.delimiter,
+            quotechar=self.quotechar,
+        )
+        for idx, values in enumerate(reader, start=1):
+            yield TabularRawRow(row_number=idx, values=values)
 
     @staticmethod
     def _resolve_csv_path(raw_path: str) -> Path:
@@ -1,7 +1,15 @@
+import asyncio
 import fnmatch
+import hashlib
 import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict
+from stat import S_ISDIR, S_ISLNK
+from typing import Any, Dict, Sequence
 
 from pydantic import BaseModel, Field
 from urllib.parse import unquote, urlparse
@@ -11,7 +19,9 @@ if os.name == "nt":
 
 from loguru import logger
 
+from katalog.db.fingerprints import get_fingerprint_repo
 from katalog.sources.base import AssetScanResult, ScanResult, SourcePlugin
+from katalog.sources.filesystem_watch import FilesystemWatcher, WatchBackend
 from katalog.models import (
     DataReader,
     Asset,
@@ -32,6 +42,88 @@ from katalog.constants.metadata import (
 from katalog.utils.utils import timestamp_to_utc
 
 
+# Child name used to test whether an exclude pattern covers a whole directory.
+_PRUNE_PROBE = "\x00"
+_WALK_DONE = object()
+
+
+@dataclass(frozen=True)
+class _ScannedFile:
+    path: str
+    abs_path: str
+    stat: os.stat_result
+    hidden: bool
+
+
+@dataclass(frozen=True)
+class _StatFailure:
+    path: str
+    error: str
+
+
+@dataclass
+class _DirListing:
+    files: list[_ScannedFile | _StatFailure] = field(default_factory=list)
+    subdirs: list[tuple[str, str]] = field(default_factory=list)
+    pruned: int = 0
+    error: int = 0
+
+
+@dataclass
+class _WalkMetrics:
+    dirs_scanned: int = 0
+    dirs_pruned: int = 0
+    dir_errors: int = 0
+    files_unchanged: int = 0
+
+    def as_dict(self, *, files_yielded: int, elapsed: float) -> dict[str, float]:
+        return {
+            "fs_dirs_scanned": self.dirs_scanned,
+            "fs_dirs_pruned": self.dirs_pruned,
+            "fs_dir_errors": self.dir_errors,
+            "fs_files_yielded": files_yielded,
+            "fs_files_unchanged": self.files_unchanged,
+            "fs_walk_seconds": elapsed,
+        }
+
+
+@dataclass(frozen=True)
+class _DirDone:
+    """Queued after a directory's files, so the consumer knows they all arrived."""
+
+    path: str
+
+
+@dataclass
+class _ScanFrontier:
+    """Directories whose files have not all reached the consumer yet.
+
+    A directory is `listed` once its subdirectories were added here; resuming
+    re-lists it for files only, while unlisted ones are walked in full.
+    """
+
+    open_dirs: dict[str, tuple[str, bool]] = field(default_factory=dict)
+
+    def add(self, path: str, rel_dir: str, *, listed: bool = False) -> None:
+        self.open_dirs[path] = (rel_dir, listed)
+
+    def mark_listed(self, path: str) -> None:
+        entry = self.open_dirs.get(path)
+        if entry is not None:
+            self.open_dirs[path] = (entry[0], True)
+
+    def done(self, path: str) -> None:
+        self.open_dirs.pop(path, None)
+
+    def cursor(self, root_path: str) -> dict[str, Any]:
+        return {
+            "root_path": root_path,
+            "frontier": [
+                [path, rel_dir, listed] for path, (rel_dir, listed) in self.open_dirs.items()
+            ],
+        }
+
+
 class FilesystemReader(DataReader):
     """
     Object for reading files from the local file system.
@@ -81,6 +173,47 @@ class FilesystemClient(SourcePlugin):
                 "Optional glob patterns to exclude. Matches both relative path and basename."
             ),
         )
+        scan_workers: int = Field(
+            default=8,
+            ge=1,
+            description="Number of threads listing directories concurrently",
+        )
+        scan_queue_size: int = Field(
+            default=2048,
+            ge=1,
+            description="Maximum number of scanned files buffered ahead of the consumer",
+        )
+        skip_unchanged: bool = Field(
+            default=True,
+            description=(
+                "Skip files whose size, times and path match the previous scan; "
+                "they are only marked as seen"
+            ),
+        )
+        watch_backend: WatchBackend = Field(
+            default="auto",
+            description="Change notification backend for watch mode (auto uses inotify on Linux)",
+        )
+        watch_debounce_seconds: float = Field(
+            default=1.0,
+            gt=0,
+            description="Flush a watch batch after this many quiet seconds",
+        )
+        watch_max_latency_seconds: float = Field(
+            default=10.0,
+            gt=0,
+            description="Flush a watch batch at the latest this long after its first change",
+        )
+        watch_max_pending: int = Field(
+            default=10_000,
+            ge=1,
+            description="Pending changed paths before watch mode falls back to a rescan",
+        )
+        watch_poll_seconds: float = Field(
+            default=5.0,
+            gt=0,
+            description="Snapshot interval for the polling watch backend",
+        )
 
     config_model = ConfigModel
 
@@ -93,6 +226,14 @@ class FilesystemClient(SourcePlugin):
         self.max_files = cfg.max_files
         self.include_patterns = tuple(_normalize_patterns(cfg.include_patterns))
         self.exclude_patterns = tuple(_normalize_patterns(cfg.exclude_patterns))
+        self.scan_workers = cfg.scan_workers
+        self.scan_queue_size = cfg.scan_queue_size
+        self.skip_unchanged = cfg.skip_unchanged
+        self.watch_backend: WatchBackend = cfg.watch_backend
+        self.watch_debounce_seconds = cfg.watch_debounce_seconds
+        self.watch_max_latency_seconds = cfg.watch_max_latency_seconds
+        self.watch_max_pending = cfg.watch_max_pending
+        self.watch_poll_seconds = cfg.watch_poll_seconds
         self._namespace = self._resolve_namespace()
 
     def get_info(self) -> Dict[str, Any]:
@@ -120,71 +261,123 @@ class FilesystemClient(SourcePlugin):
     def can_scan_uri(self, uri: str) -> bool:
         return os.path.exists(uri) and os.path.isdir(uri)
 
+    def watch(self) -> FilesystemWatcher:
+        """Return a watcher for `root_path` configured from this source's settings."""
+        return FilesystemWatcher(
+            self.root_path,
+            is_pruned=self._is_pruned,
+            backend=self.watch_backend,
+            debounce_seconds=self.watch_debounce_seconds,
+            max_latency_seconds=self.watch_max_latency_seconds,
+            max_pending=self.watch_max_pending,
+            poll_interval_seconds=self.watch_poll_seconds,
+        )
+
     async def scan(self) -> ScanResult:
         """
         Recursively scan the directory and yield AssetScanResults.
+
+        Directories are listed with `os.scandir` on a thread pool, several
+        subtrees at a time, and files are handed to the event loop through a
+        bounded queue so a slow consumer applies backpressure to the walk.
+        """
+        return self._start_scan(None)
+
+    async def resume_scan(self, cursor: dict[str, Any]) -> ScanResult:
+        """Continue a full scan from the directory frontier of an earlier checkpoint."""
+        frontier = _ScanFrontier()
+        raw_frontier = cursor.get("frontier")
+        if cursor.get("root_path") != self.root_path or not isinstance(raw_frontier, list):
+            logger.info(f"Ignoring scan cursor for another root; rescanning {self.root_path}")
+            return self._start_scan(None)
+        for entry in raw_frontier:
+            path, rel_dir, listed = entry
+            frontier.add(str(path), str(rel_dir), listed=bool(listed))
+        return self._start_scan(None, frontier=frontier)
+
+    async def scan_paths(self, paths: Sequence[str]) -> ScanResult:
         """
+        Scan only the given files and directory subtrees below `root_path`.
 
+        Used for watch micro-batches: `max_files` does not apply and the stored
+        fingerprint index is not loaded, but results still carry fingerprints.
+        """
+        return self._start_scan(list(paths))
+
+    def _start_scan(
+        self,
+        explicit_paths: list[str] | None,
+        *,
+        frontier: _ScanFrontier | None = None,
+    ) -> ScanResult:
+        full_scan = explicit_paths is None
+        max_files = self.max_files if full_scan else 0
         ignored = 0
         status = OpStatus.IN_PROGRESS
+        metrics = _WalkMetrics()
+        resuming = frontier is not None
+        if frontier is None:
+            frontier = _ScanFrontier()
+            if full_scan:
+                frontier.add(self.root_path, "")
 
         async def inner():
             nonlocal ignored, status
             seen = 0
             reported = 0
-            for dirpath, dirnames, filenames in os.walk(self.root_path):
-                for filename in filenames:
-                    scan_path = Path(dirpath) / filename
-                    if not self._is_included(scan_path):
+            started = time.perf_counter()
+            # external_id -> (asset_id, fingerprint) from the previous scan.
+            known: dict[str, tuple[int, int]] = {}
+            if full_scan and self.skip_unchanged and self.actor.id is not None:
+                known = await get_fingerprint_repo().load(
+                    actor_id=int(self.actor.id), namespace=self.get_namespace()
+                )
+            queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=self.scan_queue_size)
+            walk_error: BaseException | None = None
+
+            async def produce() -> None:
+                nonlocal walk_error
+                try:
+                    await self._walk(
+                        queue, metrics, frontier, explicit_paths, resuming=resuming
+                    )
+                except Exception as exc:  # noqa: BLE001
+                    walk_error = exc
+                await queue.put(_WALK_DONE)
+
+            producer = asyncio.create_task(produce())
+            try:
+                while True:
+                    item = await queue.get()
+                    if item is _WALK_DONE:
+                        break
+                    if isinstance(item, _DirDone):
+                        frontier.done(item.path)
                         continue
-
-                    if self.max_files and seen >= self.max_files:
-                        logger.info(
-                            f"Reached max_files limit of {self.max_files}, stopping scan."
+                    if isinstance(item, _StatFailure):
+                        ignored += 1
+                        logger.warning(
+                            f"Failed to stat {item.path} for source {self.actor.id}: {item.error}"
                         )
+                        continue
+
+                    if max_files and seen >= max_files:
+                        logger.info(f"Reached max_files limit of {max_files}, stopping scan.")
                         status = OpStatus.PARTIAL
                         break
                     seen += 1
 
-                    abs_path = scan_path.resolve()
-
-                    try:
-                        stat = os.stat(scan_path)
-                        modified = timestamp_to_utc(stat.st_mtime)
-                        created = timestamp_to_utc(stat.st_ctime)
-                        inode = getattr(stat, "st_ino", None)
-                        if inode:
-                            # st_ino survives renames on POSIX; namespace carries st_dev.
-                            external_id = f"inode:{inode}"
-                        else:
-                            external_id = f"path:{scan_path}"
-
-                        asset = Asset(
-                            external_id=external_id,
-                            namespace=self.get_namespace(),
-                            canonical_uri=abs_path.as_uri(),
-                            actor_id=self.actor.id,
-                        )
-
-                        result = AssetScanResult(asset=asset, actor=self.actor)
-                        # Store the fact that we can read file data, no special arguments needed.
-                        result.set_metadata(DATA_FILE_READER, {})
-
-                        result.set_metadata(FILE_NAME, abs_path.name)
-                        result.set_metadata(FILE_PATH, str(abs_path))
-                        result.set_metadata(TIME_MODIFIED, modified)
-                        result.set_metadata(TIME_CREATED, created)
-                        result.set_metadata(FILE_SIZE, int(stat.st_size))
-                        result.set_metadata(
-                            FLAG_HIDDEN, 1 if _looks_hidden(abs_path) else 0
-                        )
-                    except Exception as e:
-                        ignored += 1
-                        logger.warning(
-                            f"Failed to stat {scan_path} for source {self.actor.id}: {e}"
-                        )
-                        continue
-                    yield result
+                    external_id = _external_id(item)
+                    fingerprint = _stat_fingerprint(item)
+                    previous = known.get(external_id)
+                    if previous is not None and previous[1] == fingerprint:
+                        metrics.files_unchanged += 1
+                        scan_result.unchanged_asset_ids.append(previous[0])
+                    else:
+                        result = self._build_scan_result(item, external_id=external_id)
+                        if self.skip_unchanged:
+                            result.fingerprint = fingerprint
+                        yield result
 
                     if seen - reported >= 500:
                         reported = seen
@@ -192,23 +385,198 @@ class FilesystemClient(SourcePlugin):
                             "tasks_progress queued=None running=0 finished={finished} kind=files",
                             finished=seen,
                         )
-
-                if status == OpStatus.CANCELED:
-                    break
-                if status == OpStatus.PARTIAL:
-                    break
-
+            finally:
+                if not producer.done():
+                    producer.cancel()
+                    with suppress(asyncio.CancelledError):
+                        await producer
+                elapsed = time.perf_counter() - started
+                scan_result.metrics = metrics.as_dict(
+                    files_yielded=seen - metrics.files_unchanged, elapsed=elapsed
+                )
+
+            if walk_error is not None:
+                raise walk_error
             if status == OpStatus.IN_PROGRESS:
                 status = OpStatus.COMPLETED
             scan_result.status = status
             scan_result.ignored = ignored
 
         scan_result = ScanResult(iterator=inner(), status=status)
+        if full_scan:
+            scan_result.checkpoint = lambda: frontier.cursor(self.root_path)
         return scan_result
 
+    async def _walk(
+        self,
+        queue: asyncio.Queue[Any],
+        metrics: _WalkMetrics,
+        frontier: _ScanFrontier,
+        explicit_paths: list[str] | None = None,
+        *,
+        resuming: bool = False,
+    ) -> None:
+        """List directories concurrently, pushing files onto `queue` as they arrive.
+
+        Without `explicit_paths` the walk starts from the open directories in
+        `frontier` (the root for a fresh scan); otherwise those paths are
+        stat'ed first and only directories among them are walked. Each listing
+        is followed by a `_DirDone` marker once its files are queued.
+        """
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(
+            max_workers=self.scan_workers, thread_name_prefix="katalog-fs-scan"
+        )
+        # Cap in-flight listings so huge trees do not queue every directory at once.
+        max_in_flight = self.scan_workers * 2
+        # (dir_path, rel_dir, files_only): resumed listed directories skip subdirectories,
+        # which are open in the frontier themselves or were already finished.
+        backlog: deque[tuple[str, str, bool]] = deque()
+        pending: dict[asyncio.Future[_DirListing], tuple[str, bool]] = {}
+        try:
+            if explicit_paths is None:
+                for dir_path, (rel_dir, listed) in list(frontier.open_dirs.items()):
+                    backlog.append((dir_path, rel_dir, resuming and listed))
+            else:
+                listing = await loop.run_in_executor(
+                    executor, self._scan_explicit_paths, explicit_paths
+                )
+                metrics.dirs_pruned += listing.pruned
+                backlog.extend((path, rel, False) for path, rel in listing.subdirs)
+                for item in listing.files:
+                    await queue.put(item)
+            while backlog or pending:
+                while backlog and len(pending) < max_in_flight:
+                    dir_path, rel_dir, files_only = backlog.popleft()
+                    future = loop.run_in_executor(
+                        executor, self._scan_directory, dir_path, rel_dir
+                    )
+                    pending[future] = (dir_path, files_only)
+                done, _ = await asyncio.wait(
+                    pending.keys(), return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    dir_path, files_only = pending.pop(future)
+                    listing = future.result()
+                    metrics.dirs_scanned += 1
+                    metrics.dirs_pruned += listing.pruned
+                    metrics.dir_errors += listing.error
+                    if not files_only:
+                        for subdir, rel in listing.subdirs:
+                            frontier.add(subdir, rel)
+                            backlog.append((subdir, rel, False))
+                        frontier.mark_listed(dir_path)
+                    for item in listing.files:
+                        await queue.put(item)
+                    await queue.put(_DirDone(dir_path))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _scan_directory(self, dir_path: str, rel_dir: str) -> _DirListing:
+        """List one directory (runs on a worker thread)."""
+        listing = _DirListing()
+        try:
+            iterator = os.scandir(dir_path)
+        except OSError as exc:
+            logger.warning(f"Failed to list {dir_path} for source {self.actor.id}: {exc}")
+            listing.error = 1
+            return listing
+        with iterator:
+            for entry in iterator:
+                relative_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    # Like os.walk, do not descend into symlinked directories.
+                    if entry.is_symlink():
+                        continue
+                    if self._is_pruned(relative_path):
+                        listing.pruned += 1
+                        continue
+                    listing.subdirs.append((entry.path, relative_path))
+                    continue
+                if not self._is_included_relative(relative_path, entry.name):
+                    continue
+                try:
+                    # DirEntry caches both results; lstat is free for non-links.
+                    stat = entry.stat()
+                    link_stat = entry.stat(follow_symlinks=False)
+                except OSError as exc:
+                    listing.files.append(_StatFailure(path=entry.path, error=str(exc)))
+                    continue
+                listing.files.append(
+                    _scanned_file(entry.path, stat, link_stat, is_link=entry.is_symlink())
+                )
+        return listing
+
+    def _scan_explicit_paths(self, paths: list[str]) -> _DirListing:
+        """Stat the given paths (runs on a worker thread); missing paths are skipped."""
+        listing = _DirListing()
+        seen: set[str] = set()
+        for raw_path in paths:
+            path = os.path.abspath(raw_path)
+            if path in seen:
+                continue
+            seen.add(path)
+            relative_path = os.path.relpath(path, self.root_path).replace(os.sep, "/")
+            if relative_path == ".":
+                listing.subdirs.append((self.root_path, ""))
+                continue
+            if relative_path == ".." or relative_path.startswith("../"):
+                continue
+            try:
+                link_stat = os.lstat(path)
+                stat = os.stat(path) if _is_link(link_stat) else link_stat
+            except FileNotFoundError:
+                continue
+            except OSError as exc:
+                listing.files.append(_StatFailure(path=path, error=str(exc)))
+                continue
+            if _is_dir(stat):
+                if _is_link(link_stat):
+                    continue
+                if self._is_pruned(relative_path):
+                    listing.pruned += 1
+                    continue
+                listing.subdirs.append((path, relative_path))
+                continue
+            if not self._is_included_relative(relative_path, os.path.basename(path)):
+                continue
+            listing.files.append(
+                _scanned_file(path, stat, link_stat, is_link=_is_link(link_stat))
+            )
+        return listing
+
+    def _build_scan_result(self, item: _ScannedFile, *, external_id: str) -> AssetScanResult:
+        stat = item.stat
+        abs_path = Path(item.abs_path)
+        asset = Asset(
+            external_id=external_id,
+            namespace=self.get_namespace(),
+            canonical_uri=abs_path.as_uri(),
+            actor_id=self.actor.id,
+        )
+
+        result = AssetScanResult(asset=asset, actor=self.actor)
+        # Store the fact that we can read file data, no special arguments needed.
+        result.set_metadata(DATA_FILE_READER, {})
+
+        result.set_metadata(FILE_NAME, abs_path.name)
+        result.set_metadata(FILE_PATH, str(abs_path))
+        result.set_metadata(TIME_MODIFIED, timestamp_to_utc(stat.st_mtime))
+        result.set_metadata(TIME_CREATED, timestamp_to_utc(stat.st_ctime))
+        result.set_metadata(FILE_SIZE, int(stat.st_size))
+        result.set_metadata(FLAG_HIDDEN, 1 if item.hidden else 0)
+        return result
+
     def _is_included(self, scan_path: Path) -> bool:
-        relative_path = self._relative_scan_path(scan_path)
-        basename = scan_path.name
+        return self._is_included_relative(
+            self._relative_scan_path(scan_path), scan_path.name
+        )
+
+    def _is_included_relative(self, relative_path: str, basename: str) -> bool:
         if self.include_patterns and not _match_patterns(
             self.include_patterns,
             relative_path=relative_path,
@@ -223,6 +591,15 @@ class FilesystemClient(SourcePlugin):
             return False
         return True
 
+    def _is_pruned(self, relative_dir: str) -> bool:
+        """Return True when an exclude pattern matches every path below the directory.
+
+        Probing with a synthetic child keeps pruning equivalent to filtering each
+        file, e.g. `node_modules/*` prunes while `*.txt` never prunes `a.txt/`.
+        """
+        probe = f"{relative_dir}/{_PRUNE_PROBE}"
+        return any(fnmatch.fnmatch(probe, pattern) for pattern in self.exclude_patterns)
+
     def _relative_scan_path(self, scan_path: Path) -> str:
         try:
             return scan_path.relative_to(self.root_path_obj).as_posix()
@@ -251,6 +628,57 @@ class FilesystemClient(SourcePlugin):
         return "fs:unknown"
 
 
+def _scanned_file(
+    path: str, stat: os.stat_result, link_stat: os.stat_result, *, is_link: bool
+) -> _ScannedFile:
+    # The root is already resolved, so only links need resolving.
+    abs_path = os.path.realpath(path) if is_link else path
+    return _ScannedFile(
+        path=path,
+        abs_path=abs_path,
+        stat=stat,
+        hidden=_stat_looks_hidden(link_stat, abs_path),
+    )
+
+
+def _is_link(stat: os.stat_result) -> bool:
+    return S_ISLNK(stat.st_mode)
+
+
+def _is_dir(stat: os.stat_result) -> bool:
+    return S_ISDIR(stat.st_mode)
+
+
+def _external_id(item: _ScannedFile) -> str:
+    inode = getattr(item.stat, "st_ino", None)
+    if inode:
+        # st_ino survives renames on POSIX; namespace carries st_dev.
+        return f"inode:{inode}"
+    return f"path:{item.path}"
+
+
+def _stat_fingerprint(item: _ScannedFile) -> int:
+    """Digest everything `_build_scan_result` derives from the stat into a signed int64."""
+    stat = item.stat
+    raw = (
+        f"{item.abs_path}\0{stat.st_size}\0{stat.st_mtime_ns}\0{stat.st_ctime_ns}"
+        f"\0{int(item.hidden)}"
+    )
+    digest = hashlib.blake2b(raw.encode("utf-8", "surrogateescape"), digest_size=8)
+    return int.from_bytes(digest.digest(), "little", signed=True)
+
+
+def _stat_looks_hidden(link_stat: os.stat_result, path: str) -> bool:
+    """Like `_looks_hidden`, but reusing an lstat result already at hand."""
+    if os.name == "nt":
+        return _looks_hidden(Path(path))
+    st_flags = getattr(link_stat, "st_flags", 0)
+    if st_flags:
+        UF_HIDDEN = 0x00008000
+        return bool(st_flags & UF_HIDDEN)
+    return False
+
+
 def _looks_hidden(path: Path) -> bool:
     """Return True when filesystem metadata marks the path as hidden."""
     if os.name == "nt":
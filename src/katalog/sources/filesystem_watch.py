@@ -0,0 +1,419 @@
+"""Change watching for filesystem sources.
+
+Events from Linux inotify (or a polling fallback elsewhere) are coalesced into
+debounced `WatchBatch`es of changed and removed paths. When more paths pile up
+than `max_pending` allows, or the kernel queue overflows, the pending paths are
+dropped and the batch asks for a rescan of the whole source instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ctypes
+import ctypes.util
+import errno
+import os
+import struct
+import sys
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Literal
+
+from loguru import logger
+
+WatchBackend = Literal["auto", "inotify", "poll"]
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_DONT_FOLLOW = 0x02000000
+_IN_ISDIR = 0x40000000
+
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+    | _IN_ONLYDIR
+    | _IN_DONT_FOLLOW
+)
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class WatchBatch:
+    """One debounced set of changes below the watched root."""
+
+    changed_paths: list[str] = field(default_factory=list)
+    removed_paths: list[str] = field(default_factory=list)
+    # Events were dropped; the caller should rescan the whole source.
+    overflow: bool = False
+
+    def __bool__(self) -> bool:
+        return bool(self.changed_paths or self.removed_paths or self.overflow)
+
+
+class WatchLimitError(RuntimeError):
+    """Raised when the kernel refuses more inotify watches (fs.inotify.max_user_watches)."""
+
+
+class _Coalescer:
+    """Merge raw events per path until the watcher flushes a batch.
+
+    A later event for the same path wins, so create+delete cancels out into a
+    removal and delete+create into a change. Renames need no pairing: the old
+    path is reported removed and the new path changed, and the pipeline keeps
+    the asset because the rescanned file still has the same inode.
+    """
+
+    def __init__(self, *, max_pending: int) -> None:
+        self.max_pending = max_pending
+        self.changed: dict[str, None] = {}
+        self.removed: dict[str, None] = {}
+        self.overflow = False
+        self.first_event_at: float | None = None
+        self.last_event_at: float | None = None
+        self.wakeup = asyncio.Event()
+        # Set by the backend once changes below the root are being captured.
+        self.ready = asyncio.Event()
+
+    def changed_path(self, path: str) -> None:
+        self.removed.pop(path, None)
+        self.changed[path] = None
+        self._touch()
+
+    def removed_path(self, path: str) -> None:
+        self.changed.pop(path, None)
+        self.removed[path] = None
+        self._touch()
+
+    def overflowed(self) -> None:
+        self.overflow = True
+        self._touch()
+
+    def _touch(self) -> None:
+        if not self.overflow and len(self.changed) + len(self.removed) > self.max_pending:
+            logger.warning(
+                "Watch queue exceeded {max_pending} paths; falling back to a rescan",
+                max_pending=self.max_pending,
+            )
+            self.overflow = True
+        if self.overflow:
+            # Everything is rescanned anyway, so stop holding on to paths.
+            self.changed.clear()
+            self.removed.clear()
+        now = asyncio.get_running_loop().time()
+        if self.first_event_at is None:
+            self.first_event_at = now
+        self.last_event_at = now
+        self.wakeup.set()
+
+    def take(self) -> WatchBatch:
+        batch = WatchBatch(
+            changed_paths=list(self.changed),
+            removed_paths=list(self.removed),
+            overflow=self.overflow,
+        )
+        self.changed = {}
+        self.removed = {}
+        self.overflow = False
+        self.first_event_at = None
+        self.last_event_at = None
+        self.wakeup.clear()
+        return batch
+
+
+class FilesystemWatcher:
+    """Watch a directory tree and yield debounced micro-batches of changed paths."""
+
+    def __init__(
+        self,
+        root_path: str,
+        *,
+        is_pruned: Callable[[str], bool] | None = None,
+        backend: WatchBackend = "auto",
+        debounce_seconds: float = 1.0,
+        max_latency_seconds: float = 10.0,
+        max_pending: int = 10_000,
+        poll_interval_seconds: float = 5.0,
+    ) -> None:
+        self.root_path = root_path
+        self.is_pruned = is_pruned or (lambda _relative_dir: False)
+        self.backend = backend
+        self.debounce_seconds = debounce_seconds
+        self.max_latency_seconds = max_latency_seconds
+        self.max_pending = max_pending
+        self.poll_interval_seconds = poll_interval_seconds
+
+    async def batches(
+        self,
+        *,
+        stop_event: asyncio.Event | None = None,
+        initial_rescan: bool = False,
+    ) -> AsyncIterator[WatchBatch]:
+        """Yield batches until `stop_event` is set (or forever).
+
+        A batch is flushed once no event arrived for `debounce_seconds`, or
+        `max_latency_seconds` after its first event under a steady stream.
+        Events keep accumulating while the caller handles a batch.
+
+        Change notifications do not survive restarts, so `initial_rescan` starts
+        with an overflow batch once the backend is capturing changes.
+        """
+        coalescer = _Coalescer(max_pending=self.max_pending)
+        backend_task = asyncio.create_task(self._run_backend(coalescer))
+        stop_task = asyncio.create_task(stop_event.wait()) if stop_event else None
+        loop = asyncio.get_running_loop()
+        try:
+            if initial_rescan:
+                ready_task = asyncio.create_task(coalescer.ready.wait())
+                await asyncio.wait({ready_task, backend_task}, return_when=asyncio.FIRST_COMPLETED)
+                ready_task.cancel()
+                if coalescer.ready.is_set():
+                    coalescer.overflowed()
+            while True:
+                wakeup_task = asyncio.create_task(coalescer.wakeup.wait())
+                waiters = {wakeup_task, backend_task}
+                if stop_task is not None:
+                    waiters.add(stop_task)
+                await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+                wakeup_task.cancel()
+                if backend_task.done():
+                    # Surface backend failures; a clean exit means there is nothing to watch.
+                    backend_task.result()
+                    return
+                if stop_task is not None and stop_task.done():
+                    return
+
+                while coalescer.first_event_at is not None and coalescer.last_event_at is not None:
+                    flush_at = min(
+                        coalescer.last_event_at + self.debounce_seconds,
+                        coalescer.first_event_at + self.max_latency_seconds,
+                    )
+                    delay = flush_at - loop.time()
+                    if delay <= 0:
+                        break
+                    await asyncio.sleep(delay)
+                batch = coalescer.take()
+                if batch:
+                    yield batch
+        finally:
+            for task in (backend_task, stop_task):
+                if task is not None and not task.done():
+                    task.cancel()
+                    try:
+                        await task
+                    except asyncio.CancelledError:
+                        pass
+
+    async def _run_backend(self, coalescer: _Coalescer) -> None:
+        backend = self.backend
+        if backend == "auto":
+            backend = "inotify" if sys.platform.startswith("linux") else "poll"
+        if backend == "inotify":
+            try:
+                await _InotifyBackend(self.root_path, self.is_pruned).run(coalescer)
+                return
+            except WatchLimitError as exc:
+                if self.backend == "inotify":
+                    raise
+                logger.warning("inotify unavailable ({err}); polling instead", err=exc)
+        await _PollingBackend(
+            self.root_path, self.is_pruned, interval=self.poll_interval_seconds
+        ).run(coalescer)
+
+
+def _relative(root_path: str, path: str) -> str:
+    return os.path.relpath(path, root_path).replace(os.sep, "/")
+
+
+class _InotifyBackend:
+    def __init__(self, root_path: str, is_pruned: Callable[[str], bool]) -> None:
+        self.root_path = root_path
+        self.is_pruned = is_pruned
+        self.fd = -1
+        self.dirs_by_wd: dict[int, str] = {}
+        self._libc: ctypes.CDLL | None = None
+
+    async def run(self, coalescer: _Coalescer) -> None:
+        libc_name = ctypes.util.find_library("c")
+        try:
+            libc = ctypes.CDLL(libc_name, use_errno=True)
+            init1 = libc.inotify_init1
+        except (OSError, AttributeError) as exc:
+            raise WatchLimitError(f"inotify is not available: {exc}") from exc
+        self._libc = libc
+        self.fd = init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise WatchLimitError(f"inotify_init1 failed: {os.strerror(err)}")
+
+        loop = asyncio.get_running_loop()
+        closed = loop.create_future()
+        try:
+            # Registering a large tree walks every directory; keep it off the loop.
+            await asyncio.to_thread(self._watch_tree, self.root_path)
+            loop.add_reader(self.fd, self._on_readable, coalescer, closed)
+            coalescer.ready.set()
+            try:
+                await closed
+            finally:
+                loop.remove_reader(self.fd)
+        finally:
+            os.close(self.fd)
+            self.fd = -1
+
+    def _add_watch(self, path: str) -> None:
+        assert self._libc is not None
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), _WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err == errno.ENOSPC:
+                raise WatchLimitError(
+                    "inotify watch limit reached; raise fs.inotify.max_user_watches"
+                )
+            if err in (errno.ENOENT, errno.ENOTDIR, errno.EACCES):
+                return
+            raise OSError(err, os.strerror(err), path)
+        self.dirs_by_wd[wd] = path
+
+    def _watch_tree(self, top: str) -> None:
+        stack = [top]
+        while stack:
+            dir_path = stack.pop()
+            self._add_watch(dir_path)
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        try:
+                            if not entry.is_dir(follow_symlinks=False):
+                                continue
+                        except OSError:
+                            continue
+                        if self.is_pruned(_relative(self.root_path, entry.path)):
+                            continue
+                        stack.append(entry.path)
+            except OSError:
+                continue
+
+    def _forget_tree(self, top: str) -> None:
+        """Drop watches below a directory that moved away; a move target re-adds them."""
+        assert self._libc is not None
+        prefix = top + os.sep
+        for wd, path in list(self.dirs_by_wd.items()):
+            if path == top or path.startswith(prefix):
+                self._libc.inotify_rm_watch(self.fd, wd)
+                del self.dirs_by_wd[wd]
+
+    def _on_readable(self, coalescer: _Coalescer, closed: asyncio.Future[None]) -> None:
+        try:
+            data = os.read(self.fd, _READ_SIZE)
+        except BlockingIOError:
+            return
+        except OSError as exc:
+            if not closed.done():
+                closed.set_exception(exc)
+            return
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, name_len = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            raw_name = data[offset : offset + name_len].rstrip(b"\0")
+            offset += name_len
+            try:
+                self._handle(coalescer, wd, mask, os.fsdecode(raw_name))
+            except WatchLimitError as exc:
+                # New directories cannot be watched any more; rescan so nothing is missed.
+                logger.warning("{err}", err=exc)
+                coalescer.overflowed()
+            if not self.dirs_by_wd and not closed.done():
+                # The root itself went away.
+                closed.set_result(None)
+                return
+
+    def _handle(self, coalescer: _Coalescer, wd: int, mask: int, name: str) -> None:
+        if mask & _IN_Q_OVERFLOW:
+            coalescer.overflowed()
+            return
+        if mask & _IN_IGNORED:
+            self.dirs_by_wd.pop(wd, None)
+            return
+        dir_path = self.dirs_by_wd.get(wd)
+        if dir_path is None:
+            return
+        if mask & (_IN_DELETE_SELF | _IN_MOVE_SELF):
+            # Children report the removal through the parent's watch.
+            return
+        path = os.path.join(dir_path, name) if name else dir_path
+        is_dir = bool(mask & _IN_ISDIR)
+        if is_dir and self.is_pruned(_relative(self.root_path, path)):
+            return
+        if mask & (_IN_DELETE | _IN_MOVED_FROM):
+            if is_dir:
+                self._forget_tree(path)
+            coalescer.removed_path(path)
+            return
+        if is_dir and mask & (_IN_CREATE | _IN_MOVED_TO):
+            # Watch the new subtree first, then report the directory so it is walked
+            # and files created before the watch existed are not missed.
+            self._watch_tree(path)
+        coalescer.changed_path(path)
+
+
+class _PollingBackend:
+    """Portable fallback: diff periodic (inode, size, mtime) snapshots of the tree."""
+
+    def __init__(
+        self, root_path: str, is_pruned: Callable[[str], bool], *, interval: float
+    ) -> None:
+        self.root_path = root_path
+        self.is_pruned = is_pruned
+        self.interval = interval
+
+    async def run(self, coalescer: _Coalescer) -> None:
+        previous = await asyncio.to_thread(self._snapshot)
+        coalescer.ready.set()
+        while True:
+            await asyncio.sleep(self.interval)
+            current = await asyncio.to_thread(self._snapshot)
+            for path, signature in current.items():
+                if previous.get(path) != signature:
+                    coalescer.changed_path(path)
+            for path in previous.keys() - current.keys():
+                coalescer.removed_path(path)
+            previous = current
+
+    def _snapshot(self) -> dict[str, tuple[int, int, int]]:
+        snapshot: dict[str, tuple[int, int, int]] = {}
+        stack = [self.root_path]
+        while stack:
+            dir_path = stack.pop()
+            try:
+                entries = list(os.scandir(dir_path))
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not self.is_pruned(_relative(self.root_path, entry.path)):
+                            stack.append(entry.path)
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                snapshot[entry.path] = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        return snapshot
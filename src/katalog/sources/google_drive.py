@@ -1,4 +1,6 @@
 import asyncio
+from collections import deque
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 import json
 import os
@@ -17,6 +19,8 @@ from google.auth.transport.requests import Request as GoogleRequest
 from loguru import logger
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from katalog.config import PORT, actor_path
+from katalog.db.assets import get_asset_repo
+from katalog.db.folder_tree import FolderPath, SourceFolder, get_folder_tree_repo
 from katalog.constants.metadata import (
     ACCESS_LAST_MODIFIED_BY,
     ACCESS_OWNER,
@@ -53,7 +57,14 @@ from katalog.models import (
     Actor,
 )
 from katalog.sources.base import AssetScanResult, ScanResult, SourcePlugin
-from katalog.utils.blob_cache import get_cached_blob, put_cached_blob
+from katalog.sources.remote_reader import (
+    DEFAULT_DOWNLOAD_CONCURRENCY,
+    RangeResponse,
+    RemoteDataReader,
+    RemoteReadPool,
+    parse_range_response,
+    range_header,
+)
 from katalog.utils.utils import (
     TimeSlice,
     coerce_int,
@@ -96,6 +107,11 @@ API_FIELDS = {
 
 # Google Drive folder MIME type.
 GOOGLE_DRIVE_FOLDER_MIME = "application/vnd.google-apps.folder"
+DRIVE_API_BASE_URL = "https://www.googleapis.com"
+# Parent folders looked up at once when some are missing from the folder tree.
+FOLDER_FETCH_CONCURRENCY = 8
+# Statuses changes.list answers with when a stored page token is no longer valid.
+EXPIRED_PAGE_TOKEN_STATUSES = {400, 404, 410}
 
 # Available metadata in Google drive API:
 # https://developers.google.com/workspace/drive/api/reference/rest/v3/files#File
@@ -123,8 +139,8 @@ def _canonical_uri_for_file(file_id: str, mime_type: str | None) -> str:
     return f"https://drive.google.com/file/d/{file_id}"
 
 
-class GoogleDriveDataReader(DataReader):
-    """Drive reader backed by OAuth API calls with optional md5 content cache."""
+class GoogleDriveDataReader(RemoteDataReader):
+    """Drive reader issuing ranged `alt=media` downloads, cached in md5-keyed chunks."""
 
     def __init__(
         self,
@@ -132,35 +148,31 @@ class GoogleDriveDataReader(DataReader):
         source: "GoogleDriveClient",
         file_id: str,
         hash_md5: str | None = None,
+        size: int | None = None,
     ) -> None:
         self.source = source
         self.file_id = file_id
         self.hash_md5 = (hash_md5 or "").strip().lower() or None
-        self._cached_content: bytes | None = None
+        super().__init__(
+            pool=source.read_pool,
+            fetch_range=self._fetch_range,
+            object_key=f"gdrive:{file_id}",
+            cache_type="md5" if self.hash_md5 else None,
+            cache_digest=self.hash_md5,
+            size=size,
+        )
 
-    async def read(
-        self, offset: int = 0, length: int | None = None, no_cache: bool = False
-    ) -> bytes:
-        if offset < 0:
-            offset = 0
-        if length is not None and length <= 0:
-            return b""
+    async def _fetch_range(self, start: int, end: int | None) -> RangeResponse:
+        return await self.source._download_file_range(self.file_id, start, end)
 
-        if self._cached_content is None and not no_cache and self.hash_md5:
-            cached = get_cached_blob(hash_type="md5", digest=self.hash_md5)
-            if cached is not None:
-                self._cached_content = cached
 
-        if self._cached_content is None or no_cache:
-            data = await self.source._download_file_bytes(self.file_id)
-            self._cached_content = data
-            if not no_cache and self.hash_md5:
-                put_cached_blob(hash_type="md5", digest=self.hash_md5, data=data)
+@dataclass(frozen=True)
+class _PageDone:
+    """Marks that all files of one listing page were handed to the consumer."""
 
-        data = self._cached_content or b""
-        if length is None:
-            return data[offset:]
-        return data[offset : offset + length]
+    request_key: int
+    # request_key -> resume entry for the requests this page queued next.
+    follow_ups: dict[int, dict[str, Any]]
 
 
 class GoogleDriveClient(SourcePlugin):
@@ -177,6 +189,8 @@ class GoogleDriveClient(SourcePlugin):
     - Supports exclude/include_path filters to skip (ignore) files that don't have matching name or ID paths
     - Supports restricting scan range with modified_from/modified_to (applied to Drive modifiedTime)
     - Supports max_files limit to stop scans early when enough files have been yielded
+    - With allow_incremental, pages through the Changes API from the start page token committed
+    by the last completed scan, applying additions, modifications, trashing and folder moves
 
     """
 
@@ -195,7 +209,11 @@ class GoogleDriveClient(SourcePlugin):
             description='Drive corpus: "user" (no Shared Drives), "allDrives" (user + Shared Drives), "domain", or "drive"',
         )
         allow_incremental: bool = Field(
-            default=False, description="Enable incremental scanning using checkpoints"
+            default=False,
+            description=(
+                "Scan only what changed since the last completed scan, using the Drive "
+                "Changes API (falls back to a full scan when no valid token exists)"
+            ),
         )
         concurrency: int = Field(
             default=10,
@@ -233,6 +251,15 @@ class GoogleDriveClient(SourcePlugin):
         drive_id: str | None = Field(
             default=None, description="Required when corpora=drive"
         )
+        download_concurrency: int = Field(
+            default=DEFAULT_DOWNLOAD_CONCURRENCY,
+            ge=1,
+            description="Parallel range downloads when processors read file contents",
+        )
+        api_base_url: str = Field(
+            default=DRIVE_API_BASE_URL,
+            description="Drive API endpoint (override to point at a local fake server)",
+        )
 
         @field_validator("include_paths", "exclude_paths", mode="before")
         @classmethod
@@ -281,24 +308,27 @@ class GoogleDriveClient(SourcePlugin):
 
         self.modified_from = parse_datetime_utc(cfg.modified_from, strict=False)
         self.modified_to = parse_datetime_utc(cfg.modified_to, strict=False)
-        self.http = httpx.AsyncClient(
-            base_url="https://www.googleapis.com", timeout=5.0
-        )
-
-        # Folder cache state used to reconstruct canonical paths lazily.
-        self._folder_cache: Dict[str, Dict[str, Any]] = {}
+        self.api_base_url = cfg.api_base_url.rstrip("/")
+        self.http = httpx.AsyncClient(base_url=self.api_base_url, timeout=5.0)
+        self.read_pool = RemoteReadPool(cfg.download_concurrency)
+
+        # Folders live in the workspace database with memoized paths; this keeps
+        # the paths resolved during this run and is dropped when a folder moves.
+        self.folder_repo = get_folder_tree_repo()
+        self._folder_paths: Dict[str, FolderPath] = {}
         self._oauth_state = None
         self._credentials: Credentials | None = None
         actor_id = self.actor.id
         if actor_id is None:
             raise ValueError("GoogleDriveSource actor is missing id")
+        self.actor_id = int(actor_id)
         self.token_path = actor_path(actor_id) / "token.json"
         if cfg.client_secret_path:
             self.client_secret_path = Path(cfg.client_secret_path).expanduser()
         else:
             self.client_secret_path = actor_path(actor_id) / "client_secret.json"
-        self.folder_cache_path = actor_path(actor_id) / "folder_cache.json"
-        self.start_page_token_path = actor_path(actor_id) / "start_page_token.json"
+        # Folder map written by earlier versions; imported into the folder tree once.
+        self.legacy_folder_cache_path = actor_path(actor_id) / "folder_cache.json"
 
     def get_info(self) -> Dict[str, Any]:
         return {
@@ -327,7 +357,12 @@ class GoogleDriveClient(SourcePlugin):
         raw_hash = changes.latest_value(HASH_MD5, value_type=str)
         if raw_hash and raw_hash.strip():
             hash_md5 = raw_hash.strip().lower()
-        return GoogleDriveDataReader(source=self, file_id=file_id, hash_md5=hash_md5)
+        return GoogleDriveDataReader(
+            source=self,
+            file_id=file_id,
+            hash_md5=hash_md5,
+            size=changes.latest_value(FILE_SIZE, value_type=int),
+        )
 
     async def close(self) -> None:
         await self.http.aclose()
@@ -441,30 +476,101 @@ class GoogleDriveClient(SourcePlugin):
         return result
 
     async def scan(self) -> ScanResult:
-        """Scan Google Drive using HttpCrawler with simple nextPageToken pagination."""
+        """Scan Google Drive, incrementally through the Changes API when enabled and possible."""
+        if self.allow_incremental:
+            state = await self.load_source_state() or {}
+            token = state.get("start_page_token")
+            if (
+                token
+                and state.get("corpora") == self.corpora
+                and state.get("drive_id") == self.drive_id
+            ):
+                return await self._start_changes_scan(str(token))
+            logger.info("No usable Drive start page token; running a full scan")
+        return await self._start_full_scan()
+
+    async def resume_scan(self, cursor: dict[str, Any]) -> ScanResult:
+        """Continue from the change page, or the time slices and page tokens, open at the last checkpoint."""
+        if (
+            cursor.get("corpora") != self.corpora
+            or cursor.get("drive_id") != self.drive_id
+        ):
+            logger.info("Ignoring scan cursor for another corpus; rescanning Google Drive")
+            return await self.scan()
+        if cursor.get("mode") == "changes" and cursor.get("page_token"):
+            return await self._start_changes_scan(str(cursor["page_token"]), resumed=True)
+        raw_requests = cursor.get("requests")
+        if not isinstance(raw_requests, list):
+            return await self.scan()
+        pending: list[tuple[TimeSlice, str | None]] = []
+        for entry in raw_requests:
+            ts = TimeSlice.from_dict(entry.get("time_slice"))
+            if ts is not None:
+                pending.append((ts, entry.get("page_token")))
+        return await self._start_full_scan(pending, cursor.get("start_page_token"))
+
+    async def _start_full_scan(
+        self,
+        start_requests: list[tuple[TimeSlice, str | None]] | None = None,
+        start_page_token: str | None = None,
+    ) -> ScanResult:
+        """List all files using HttpCrawler with time slices and nextPageToken pagination."""
         await self._load_credentials()
-        await self._store_start_page_token()
-        await self._load_folder_cache()
+        if start_requests is None:
+            time_slice = TimeSlice(start=self.modified_from, end=self.modified_to)
+            start_requests = [(time_slice, None)]
+        # Taken before listing, so changes made during the scan are replayed next time.
+        if start_page_token is None:
+            start_page_token = await self._get_start_page_token()
+        await self._import_legacy_folder_cache()
 
         scan_status = OpStatus.IN_PROGRESS
-        time_slice = TimeSlice(start=self.modified_from, end=self.modified_to)
+        # Requests whose files have not all reached the consumer, keyed by request number.
+        # Only the consumer side updates this, so it always matches what was yielded.
+        open_requests: dict[int, dict[str, Any]] = {}
+        next_request_key = 0
+
+        def file_request(ts: TimeSlice, page_token: str | None = None) -> Request:
+            nonlocal next_request_key
+            next_request_key += 1
+            return self.make_request(
+                "file",
+                params={"pageToken": page_token} if page_token else None,
+                time_slice=ts,
+                request_key=next_request_key,
+                page_token=page_token,
+            )
+
+        def request_key_of(request: Request) -> int:
+            key = request.user_data.get("request_key")
+            if not isinstance(key, int):
+                raise ValueError(f"Drive request is missing its request key: {request.url}")
+            return key
+
+        def cursor_entry(request: Request) -> tuple[int, dict[str, Any]]:
+            user_data = request.user_data
+            return request_key_of(request), {
+                "time_slice": user_data.get("time_slice"),
+                "page_token": user_data.get("page_token"),
+            }
 
         async def iterator() -> AsyncIterator[AssetScanResult]:
             nonlocal scan_status
             yielded = 0
             ignored = 0
-            concurrent = 1
+            concurrent = max(1, len(start_requests))
             seen_ids: set[str] = set()
 
-            result_queue: asyncio.Queue[AssetScanResult | BaseException | None] = (
-                asyncio.Queue()
-            )
+            result_queue: asyncio.Queue[
+                AssetScanResult | _PageDone | BaseException | None
+            ] = asyncio.Queue()
 
             crawler = await make_crawler()
 
             @crawler.router.default_handler
             async def request_handler(context: HttpCrawlingContext) -> None:
                 nonlocal yielded, ignored, scan_status, concurrent
+                follow_ups: list[Request] = []
                 try:
                     data = await context.http_response.read()
                     payload: dict = json.loads(data)
@@ -483,7 +589,11 @@ class GoogleDriveClient(SourcePlugin):
                     if files:
                         earliest = files[-1].get("modifiedTime")
 
-                    for file in files:
+                    # Listings include folders; keep the tree current before resolving paths.
+                    await self._save_folders(files)
+                    resolved = await self._resolve_paths_many(files)
+
+                    for file, (name_paths, id_paths) in zip(files, resolved):
                         if self.max_files and (yielded + ignored) >= self.max_files:
                             scan_status = OpStatus.PARTIAL
                             break
@@ -505,7 +615,6 @@ class GoogleDriveClient(SourcePlugin):
                             # across time slices, so track seen IDs to skip them.
                             seen_ids.add(file_id)
 
-                        name_paths, id_paths = await self._resolve_paths(file)
                         if not self._passes_filters(name_paths, id_paths):
                             ignored += 1
                             continue
@@ -535,10 +644,8 @@ class GoogleDriveClient(SourcePlugin):
                         logger.debug(
                             f"Exhausted time slice {ts}, concurrent={concurrent}"
                         )
-                        return
-
                     # If we a next_page, if we can instead split query slice into two for higher concurrency
-                    if ts.splittable() and concurrent < self.concurrency:
+                    elif ts.splittable() and concurrent < self.concurrency:
                         earliest_dt = parse_google_drive_datetime(earliest)
                         if earliest_dt:
                             earliest_dt += timedelta(milliseconds=1)
@@ -547,34 +654,31 @@ class GoogleDriveClient(SourcePlugin):
                         logger.debug(
                             f"Split time slice {ts} into {ts1} and {ts2}, concurrent={concurrent}"
                         )
-                        await context.add_requests(
-                            [self.make_request("file", time_slice=ts1)]
-                        )
-                        await context.add_requests(
-                            [self.make_request("file", time_slice=ts2)]
-                        )
+                        follow_ups = [file_request(ts1), file_request(ts2)]
                     # Otherwise, continue paginating within the same query slice
                     else:
-                        await context.add_requests(
-                            [
-                                self.make_request(
-                                    "file",
-                                    params={"pageToken": next_page},
-                                    time_slice=ts,
-                                )
-                            ]
+                        follow_ups = [file_request(ts, next_page)]
+
+                    # Queued behind this page's files: the page counts as consumed only after them.
+                    await result_queue.put(
+                        _PageDone(
+                            request_key=request_key_of(context.request),
+                            follow_ups=dict(cursor_entry(r) for r in follow_ups),
                         )
+                    )
+                    if follow_ups:
+                        await context.add_requests(follow_ups)
 
                 except BaseException as exc:  # noqa: BLE001
                     await result_queue.put(exc)
 
             async def run_crawler() -> None:
                 try:
-                    if not self._folder_cache:
+                    if not await self.folder_repo.count(actor_id=self.actor_id):
                         await self._prefetch_folders()
-                    await crawler.run(
-                        requests=[self.make_request("file", time_slice=time_slice)]
-                    )
+                    requests = [file_request(ts, token) for ts, token in start_requests]
+                    open_requests.update(cursor_entry(r) for r in requests)
+                    await crawler.run(requests=requests)
                 except BaseException as exc:  # noqa: BLE001
                     await result_queue.put(exc)
                 finally:
@@ -602,20 +706,245 @@ class GoogleDriveClient(SourcePlugin):
                         break
                     if isinstance(item, BaseException):
                         raise item
+                    if isinstance(item, _PageDone):
+                        open_requests.pop(item.request_key, None)
+                        open_requests.update(item.follow_ups)
+                        continue
                     yield item
             finally:
                 producer.cancel()
                 await asyncio.gather(producer, return_exceptions=True)
-                await self._persist_folder_cache()
                 if scan_status == OpStatus.IN_PROGRESS:
                     scan_status = OpStatus.COMPLETED
                 scan_result.status = scan_status
                 scan_result.ignored = ignored
+                if scan_status == OpStatus.COMPLETED and start_page_token:
+                    scan_result.source_state = self._source_state(start_page_token)
 
         scan_result = ScanResult(iterator=iterator(), status=scan_status)
+        scan_result.checkpoint = lambda: {
+            "corpora": self.corpora,
+            "drive_id": self.drive_id,
+            "start_page_token": start_page_token,
+            "requests": list(open_requests.values()),
+        }
+
+        return scan_result
+
+    async def _start_changes_scan(
+        self, page_token: str, *, resumed: bool = False
+    ) -> ScanResult:
+        """Apply the changes recorded since `page_token` instead of listing every file.
+
+        Changed files are yielded with freshly resolved paths; removed, trashed or
+        filtered-out files are reported through `removed_asset_ids`. A renamed or
+        moved folder is relisted so its descendants get their new paths. Falls back
+        to a full scan when Drive no longer accepts the token.
+        """
+        await self._load_credentials()
+        await self._import_legacy_folder_cache()
+
+        scan_status = OpStatus.IN_PROGRESS
+        # Token of the change page being applied; a page is re-applied whole on resume.
+        current_token = page_token
+        fallback: ScanResult | None = None
+
+        async def iterator() -> AsyncIterator[AssetScanResult]:
+            nonlocal scan_status, current_token, fallback
+            yielded = 0
+            ignored = 0
+            new_start_token: str | None = None
+            token: str | None = page_token
+            first_page = True
+
+            def limit_reached() -> bool:
+                return bool(self.max_files) and (yielded + ignored) >= self.max_files
+
+            try:
+                while token and scan_status == OpStatus.IN_PROGRESS:
+                    response = await self.http.get(
+                        "/drive/v3/changes",
+                        params=self._changes_params(token),
+                        headers=self._auth_headers(),
+                    )
+                    if first_page and response.status_code in EXPIRED_PAGE_TOKEN_STATUSES:
+                        logger.warning(
+                            f"Drive rejected page token {token!r} ({response.status_code}); running a full scan"
+                        )
+                        fallback = await self._start_full_scan()
+                        scan_result.checkpoint = fallback.checkpoint
+                        break
+                    response.raise_for_status()
+                    first_page = False
+                    payload: dict = response.json()
+                    changes = payload.get("changes", [])
+
+                    for change in changes:
+                        if limit_reached():
+                            scan_status = OpStatus.PARTIAL
+                            break
+                        if change.get("changeType", "file") != "file":
+                            continue
+                        file_id = change.get("fileId")
+                        if not file_id:
+                            ignored += 1
+                            continue
+                        file = change.get("file") or {}
+                        if change.get("removed") or file.get("trashed"):
+                            scan_result.removed_asset_ids.extend(
+                                await self._known_asset_ids_below(file_id)
+                            )
+                            await self.folder_repo.delete(
+                                actor_id=self.actor_id, folder_ids=[file_id]
+                            )
+                            self._folder_paths.clear()
+                            continue
 
+                        name_paths, id_paths = await self._resolve_paths(file)
+                        passes = self._passes_filters(name_paths, id_paths)
+                        if not passes:
+                            # Moved out of the included paths: forget what the old location held.
+                            scan_result.removed_asset_ids.extend(
+                                await self._known_asset_ids_below(file_id)
+                            )
+                        relist = False
+                        if file.get("mimeType") == GOOGLE_DRIVE_FOLDER_MIME:
+                            moved = await self._save_folders([file])
+                            relist = resumed or file_id in moved
+                        if not passes:
+                            ignored += 1
+                            continue
+                        yielded += 1
+                        yield await self.build_scan_result(file, name_paths, id_paths)
+
+                        if relist:
+                            async for child, child_names, child_ids in self._walk_folder(
+                                file_id
+                            ):
+                                if limit_reached():
+                                    scan_status = OpStatus.PARTIAL
+                                    break
+                                if not self._passes_filters(child_names, child_ids):
+                                    ignored += 1
+                                    continue
+                                yielded += 1
+                                yield await self.build_scan_result(
+                                    child, child_names, child_ids
+                                )
+                            if scan_status != OpStatus.IN_PROGRESS:
+                                break
+
+                    logger.info(
+                        f"Applied {len(changes)} Drive changes (total {yielded} yielded, {ignored} ignored)"
+                    )
+                    if scan_status != OpStatus.IN_PROGRESS:
+                        break
+                    new_start_token = payload.get("newStartPageToken") or new_start_token
+                    token = payload.get("nextPageToken")
+                    if token:
+                        current_token = token
+
+                if fallback is not None:
+                    async for item in fallback.iterator:
+                        yield item
+            finally:
+                if fallback is not None:
+                    scan_result.incremental = False
+                    scan_result.status = fallback.status
+                    scan_result.ignored = fallback.ignored
+                    scan_result.source_state = fallback.source_state
+                else:
+                    if scan_status == OpStatus.IN_PROGRESS:
+                        scan_status = OpStatus.COMPLETED
+                    scan_result.status = scan_status
+                    scan_result.ignored = ignored
+                    if scan_status == OpStatus.COMPLETED and new_start_token:
+                        scan_result.source_state = self._source_state(new_start_token)
+
+        scan_result = ScanResult(iterator=iterator(), status=scan_status, incremental=True)
+        scan_result.checkpoint = lambda: {
+            "corpora": self.corpora,
+            "drive_id": self.drive_id,
+            "mode": "changes",
+            "page_token": current_token,
+        }
         return scan_result
 
+    def _changes_params(self, page_token: str) -> Dict[str, Any]:
+        params: Dict[str, Any] = {
+            "pageToken": page_token,
+            "pageSize": 1000,
+            "includeRemoved": True,
+            "spaces": "drive",
+            "supportsAllDrives": self.supports_all_drives,
+            "includeItemsFromAllDrives": self.supports_all_drives,
+            "fields": (
+                "nextPageToken,newStartPageToken,"
+                f"changes(fileId,removed,changeType,file({','.join(sorted(API_FIELDS))}))"
+            ),
+        }
+        if self.drive_id:
+            params["driveId"] = self.drive_id
+        return params
+
+    async def _walk_folder(
+        self, folder_id: str
+    ) -> AsyncIterator[tuple[Dict[str, Any], list[str], list[str]]]:
+        """Yield every file below a folder, breadth first, with its resolved paths."""
+        params = self._base_file_list_params()
+        params.pop("orderBy", None)
+        pending = deque([folder_id])
+        visited: set[str] = set()
+        while pending:
+            parent_id = pending.popleft()
+            if parent_id in visited:
+                continue
+            visited.add(parent_id)
+            page_token: str | None = None
+            while True:
+                query = {**params, "q": f"'{parent_id}' in parents and trashed = false"}
+                if page_token:
+                    query["pageToken"] = page_token
+                response = await self.http.get(
+                    "/drive/v3/files", params=query, headers=self._auth_headers()
+                )
+                response.raise_for_status()
+                payload: dict = response.json()
+                files = [file for file in payload.get("files", []) if file.get("id")]
+                await self._save_folders(files)
+                resolved = await self._resolve_paths_many(files)
+                for file, (name_paths, id_paths) in zip(files, resolved):
+                    if file.get("mimeType") == GOOGLE_DRIVE_FOLDER_MIME:
+                        pending.append(file["id"])
+                    yield file, name_paths, id_paths
+                page_token = payload.get("nextPageToken")
+                if not page_token:
+                    break
+
+    async def _known_asset_ids_below(self, file_id: str) -> list[int]:
+        """Return the stored asset for a Drive file and, for a known folder, everything below it."""
+        asset_repo = get_asset_repo()
+        rows = await asset_repo.list_rows(
+            namespace=self.get_namespace(),
+            actor_id=self.actor.id,
+            external_id=file_id,
+        )
+        found = {int(row.id) for row in rows if row.id is not None}
+        # Paths as stored, i.e. where the folder was before the change being applied.
+        resolution = await self.folder_repo.resolve_paths(
+            actor_id=self.actor_id, folder_ids=[file_id]
+        )
+        folder_path = resolution.paths.get(file_id)
+        if folder_path is not None:
+            found.update(
+                await asset_repo.list_asset_ids_for_paths(
+                    actor_id=self.actor_id,
+                    paths=[folder_path.id_path],
+                    key=FILE_ID_PATH,
+                )
+            )
+        return sorted(found)
+
     def authorize(self, **kwargs) -> str:
         creds = None
         _allow_insecure_local_oauth_transport()
@@ -768,7 +1097,7 @@ class GoogleDriveClient(SourcePlugin):
 
         url = str(
             httpx.URL(
-                "https://www.googleapis.com/drive/v3/files",
+                f"{self.api_base_url}/drive/v3/files",
                 params=params,
             )
         )
@@ -796,23 +1125,36 @@ class GoogleDriveClient(SourcePlugin):
             paths=paths, include=self.include_paths, exclude=self.exclude_paths
         )
 
-    async def _load_folder_cache(self) -> None:
-        if self._folder_cache:
+    async def _import_legacy_folder_cache(self) -> None:
+        path = self.legacy_folder_cache_path
+        if not path.exists():
             return
-        path = self.folder_cache_path
-        if path.exists():
-            try:
-                self._folder_cache = json.loads(path.read_text())
-            except Exception as exc:
-                logger.warning(f"Failed to load folder cache {path}: {exc}")
-                self._folder_cache = {}
-
-    async def _persist_folder_cache(self) -> None:
-        path = self.folder_cache_path
         try:
-            path.write_text(json.dumps(self._folder_cache))
+            legacy: Dict[str, Dict[str, Any]] = json.loads(path.read_text())
+            await self.folder_repo.save(
+                actor_id=self.actor_id,
+                folders=[
+                    _folder_from_payload({"id": folder_id, **info})
+                    for folder_id, info in legacy.items()
+                ],
+            )
+            path.unlink()
         except Exception as exc:
-            logger.warning(f"Failed to persist folder cache {path}: {exc}")
+            logger.warning(f"Failed to import legacy folder cache {path}: {exc}")
+
+    async def _save_folders(self, files: list[Dict[str, Any]]) -> set[str]:
+        """Store the folders among Drive payloads; return those that were renamed or moved."""
+        folders = [
+            _folder_from_payload(file)
+            for file in files
+            if file.get("id") and file.get("mimeType") == GOOGLE_DRIVE_FOLDER_MIME
+        ]
+        if not folders:
+            return set()
+        moved = await self.folder_repo.save(actor_id=self.actor_id, folders=folders)
+        if moved:
+            self._folder_paths.clear()
+        return moved
 
     async def _prefetch_folders(self) -> None:
         crawler = await make_crawler()
@@ -829,13 +1171,12 @@ class GoogleDriveClient(SourcePlugin):
             if files:
                 earliest = files[-1].get("modifiedTime")
             total_folders += len(files)
-            for file in files:
-                folder_id = file.get("id")
-                if folder_id:
-                    self._folder_cache[folder_id] = {
-                        "name": file.get("name", ""),
-                        "parents": file.get("parents") or [],
-                    }
+            moved = await self.folder_repo.save(
+                actor_id=self.actor_id,
+                folders=[_folder_from_payload(file) for file in files if file.get("id")],
+            )
+            if moved:
+                self._folder_paths.clear()
 
             logger.info(
                 f"Prefetched {len(files)} folders into cache (total fetched {total_folders})"
@@ -890,26 +1231,27 @@ class GoogleDriveClient(SourcePlugin):
             ]
         )
 
-    async def _get_folder(self, folder_id: str) -> Dict[str, Any]:
-        cached = self._folder_cache.get(folder_id)
-        if cached:
-            return cached
-        return await self._fetch_folder_by_id(folder_id)
-
-    async def _download_file_bytes(self, file_id: str) -> bytes:
+    async def _download_file_range(
+        self, file_id: str, start: int, end: int | None
+    ) -> RangeResponse:
         await self._load_credentials()
+        headers = self._auth_headers()
+        headers["Range"] = range_header(start, end)
         response = await self.http.get(
             f"/drive/v3/files/{file_id}",
             params={
                 "alt": "media",
                 "supportsAllDrives": self.supports_all_drives,
             },
-            headers=self._auth_headers(),
+            headers=headers,
         )
+        if response.status_code == 416:
+            # Range starts at or past the end of the file.
+            return RangeResponse(data=b"", start=start)
         response.raise_for_status()
-        return bytes(response.content)
+        return parse_range_response(bytes(response.content), response.headers)
 
-    async def _fetch_folder_by_id(self, folder_id: str) -> Dict[str, Any]:
+    async def _fetch_folder_by_id(self, folder_id: str) -> SourceFolder:
         response = await self.http.get(
             f"/drive/v3/files/{folder_id}",
             params={
@@ -928,9 +1270,7 @@ class GoogleDriveClient(SourcePlugin):
             drive_name = await self._resolve_drive_name(drive_id)
             if drive_name:
                 name = drive_name
-        info = {"name": name, "parents": payload.get("parents") or []}
-        self._folder_cache[folder_id] = info
-        return info
+        return _folder_from_payload({**payload, "id": folder_id, "name": name})
 
     async def _resolve_drive_name(self, drive_id: str) -> Optional[str]:
         response = await self.http.get(
@@ -947,23 +1287,25 @@ class GoogleDriveClient(SourcePlugin):
         payload = response.json()
         return payload.get("name")
 
-    async def _store_start_page_token(self) -> None:
+    async def _get_start_page_token(self) -> str | None:
         try:
             payload = await self._fetch_start_page_token()
-            token = payload.get("startPageToken")
-            if not token:
-                logger.warning("Missing startPageToken in Google Drive response")
-                return
-            data = {
-                "startPageToken": token,
-                "kind": payload.get("kind"),
-                "driveId": self.drive_id,
-                "corpora": self.corpora,
-                "fetchedAt": datetime.now(tz=UTC).isoformat(),
-            }
-            self.start_page_token_path.write_text(json.dumps(data))
         except Exception as exc:
-            logger.warning(f"Failed to store startPageToken: {exc}")
+            logger.warning(f"Failed to fetch startPageToken: {exc}")
+            return None
+        token = payload.get("startPageToken")
+        if not token:
+            logger.warning("Missing startPageToken in Google Drive response")
+            return None
+        return str(token)
+
+    def _source_state(self, start_page_token: str) -> Dict[str, Any]:
+        return {
+            "start_page_token": start_page_token,
+            "corpora": self.corpora,
+            "drive_id": self.drive_id,
+            "fetched_at": datetime.now(tz=UTC).isoformat(),
+        }
 
     async def _fetch_start_page_token(self) -> Dict[str, Any]:
         params: Dict[str, Any] = {
@@ -980,31 +1322,67 @@ class GoogleDriveClient(SourcePlugin):
         return response.json()
 
     async def _resolve_paths(self, file: Dict[str, Any]) -> tuple[list[str], list[str]]:
-        file_name = file.get("name", file.get("originalFilename", ""))
-        file_id = file.get("id", "")
-        parents = file.get("parents") or []
-        if not parents:
-            return [file_name], [file_id]
-
-        name_paths: list[str] = []
-        id_paths: list[str] = []
-        for parent_id in parents:
-            names: list[str] = []
-            ids: list[str] = []
-            current = parent_id
-            seen: set[str] = set()
-            while current and current not in seen:
-                seen.add(current)
-                folder_info = await self._get_folder(current)
-                names.append(folder_info.get("name", ""))
-                ids.append(current)
-                parent_list = folder_info.get("parents") or []
-                current = parent_list[0] if parent_list else None
-            names.reverse()
-            ids.reverse()
-            name_paths.append("/".join(names + [file_name]))
-            id_paths.append("/".join(ids + [file_id]))
-        return name_paths, id_paths
+        return (await self._resolve_paths_many([file]))[0]
+
+    async def _resolve_paths_many(
+        self, files: list[Dict[str, Any]]
+    ) -> list[tuple[list[str], list[str]]]:
+        """Return (name_paths, id_paths) per file, one path per parent folder."""
+        parent_ids = {parent for file in files for parent in file.get("parents") or []}
+        folder_paths = await self._resolve_folder_paths(parent_ids)
+        resolved: list[tuple[list[str], list[str]]] = []
+        for file in files:
+            file_name = file.get("name", file.get("originalFilename", ""))
+            file_id = file.get("id", "")
+            name_paths: list[str] = []
+            id_paths: list[str] = []
+            for parent_id in file.get("parents") or []:
+                folder_path = folder_paths.get(parent_id)
+                if folder_path is None:
+                    continue
+                name_paths.append(f"{folder_path.name_path}/{file_name}")
+                id_paths.append(f"{folder_path.id_path}/{file_id}")
+            if not name_paths:
+                name_paths, id_paths = [file_name], [file_id]
+            resolved.append((name_paths, id_paths))
+        return resolved
+
+    async def _resolve_folder_paths(self, folder_ids: set[str]) -> Dict[str, FolderPath]:
+        """Resolve folder paths in batches, fetching folders missing from the tree level by level."""
+        pending = {folder_id for folder_id in folder_ids if folder_id not in self._folder_paths}
+        fetched: set[str] = set()
+        while pending:
+            resolution = await self.folder_repo.resolve_paths(
+                actor_id=self.actor_id, folder_ids=pending
+            )
+            self._folder_paths.update(resolution.paths)
+            pending -= resolution.paths.keys()
+            to_fetch = resolution.missing - fetched
+            if not pending or not to_fetch:
+                break
+            fetched |= to_fetch
+            semaphore = asyncio.Semaphore(FOLDER_FETCH_CONCURRENCY)
+
+            async def fetch(folder_id: str) -> SourceFolder:
+                async with semaphore:
+                    return await self._fetch_folder_by_id(folder_id)
+
+            folders = await asyncio.gather(*(fetch(folder_id) for folder_id in to_fetch))
+            await self.folder_repo.save(actor_id=self.actor_id, folders=folders)
+        return {
+            folder_id: self._folder_paths[folder_id]
+            for folder_id in folder_ids
+            if folder_id in self._folder_paths
+        }
+
+
+def _folder_from_payload(file: Dict[str, Any]) -> SourceFolder:
+    parents = file.get("parents") or []
+    return SourceFolder(
+        folder_id=str(file["id"]),
+        name=file.get("name", ""),
+        parent_id=str(parents[0]) if parents else None,
+    )
 
 
 def get_user_email(user_like_object: Any) -> Optional[str]:
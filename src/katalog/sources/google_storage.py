@@ -2,11 +2,15 @@ from __future__ import annotations
 
 import asyncio
 import base64
+from collections import deque
+from contextlib import aclosing
+from dataclasses import dataclass, field
 from pathlib import PurePosixPath
 from typing import Any
 from urllib.parse import urlparse
 
 from google.auth import default as google_auth_default
+from google.auth.credentials import AnonymousCredentials
 from google.cloud import storage
 from loguru import logger
 from pydantic import BaseModel, ConfigDict, Field, model_validator
@@ -23,9 +27,17 @@ from katalog.constants.metadata import (
 )
 from katalog.models import Asset, Actor, DataReader, MetadataChanges, MetadataKey, OpStatus
 from katalog.sources.base import AssetScanResult, ScanResult, SourcePlugin
-from katalog.utils.blob_cache import get_cached_blob, put_cached_blob
+from katalog.sources.remote_reader import (
+    DEFAULT_DOWNLOAD_CONCURRENCY,
+    RangeResponse,
+    RemoteDataReader,
+    RemoteReadPool,
+)
 from katalog.utils.utils import match_paths, normalize_glob_patterns
 
+# Shards listed concurrently; each shard is one paged list_blobs call.
+DEFAULT_LISTING_CONCURRENCY = 8
+
 
 def parse_gcs_url(value: str) -> tuple[str, str]:
     raw = value.strip()
@@ -69,7 +81,50 @@ def _safe_md5_hex(md5_hash_b64: str | None) -> str | None:
         return None
 
 
-class GoogleStorageDataReader(DataReader):
+@dataclass
+class _ListingShard:
+    """One [start, end) key range of a bucket listing and its paging progress."""
+
+    start: str | None = None
+    end: str | None = None
+    # Token for the next page to request.
+    page_token: str | None = None
+    listed: bool = False
+    done: bool = False
+    # Tokens of pages handed to the consumer but not fully yielded yet, oldest first.
+    pending: deque[str | None] = field(default_factory=deque)
+
+    @classmethod
+    def from_cursor(cls, data: dict[str, Any]) -> "_ListingShard":
+        return cls(
+            start=data.get("start"),
+            end=data.get("end"),
+            page_token=data.get("page_token"),
+            done=bool(data.get("done")),
+        )
+
+    def fetched(self, page_token: str | None, next_page_token: str | None) -> None:
+        self.pending.append(page_token)
+        self.page_token = next_page_token
+
+    def consumed(self) -> None:
+        self.pending.popleft()
+        if self.listed and not self.pending:
+            self.done = True
+
+    def to_cursor(self) -> dict[str, Any]:
+        # Resuming refetches the oldest page not fully yielded.
+        return {
+            "start": self.start,
+            "end": self.end,
+            "page_token": self.pending[0] if self.pending else self.page_token,
+            "done": self.done or (self.listed and not self.pending),
+        }
+
+
+class GoogleStorageDataReader(RemoteDataReader):
+    """GCS reader issuing ranged object downloads, cached in md5-keyed chunks."""
+
     def __init__(
         self,
         *,
@@ -77,44 +132,30 @@ class GoogleStorageDataReader(DataReader):
         bucket: str,
         object_name: str,
         hash_md5: str | None = None,
+        size: int | None = None,
     ):
         self.source = source
         self.bucket = bucket
         self.object_name = object_name
         self.hash_md5 = (hash_md5 or "").strip().lower() or None
+        super().__init__(
+            pool=source.read_pool,
+            fetch_range=self._fetch_range,
+            object_key=f"gcs:{bucket}/{object_name}",
+            cache_type="md5" if self.hash_md5 else None,
+            cache_digest=self.hash_md5,
+            size=size,
+        )
 
-    async def read(
-        self, offset: int = 0, length: int | None = None, no_cache: bool = False
-    ) -> bytes:
-        if offset < 0:
-            offset = 0
-        if length is not None and length <= 0:
-            return b""
-
-        # Resolve cache by stable content hash when available.
-        if not no_cache and self.hash_md5:
-            cached = get_cached_blob(hash_type="md5", digest=self.hash_md5)
-            if cached is not None:
-                if length is None:
-                    return cached[offset:]
-                return cached[offset : offset + length]
-
+    async def _fetch_range(self, start: int, end: int | None) -> RangeResponse:
         data = await asyncio.to_thread(
             self.source._read_object_sync,
             self.bucket,
             self.object_name,
-            offset,
-            length,
+            start,
+            None if end is None else end - start,
         )
-        if (
-            not no_cache
-            and self.hash_md5
-            and offset == 0
-            and length is None
-            and isinstance(data, bytes)
-        ):
-            put_cached_blob(hash_type="md5", digest=self.hash_md5, data=data)
-        return data
+        return RangeResponse(data=data, start=start, total_size=self.size)
 
 
 class GoogleStorageSource(SourcePlugin):
@@ -134,6 +175,27 @@ class GoogleStorageSource(SourcePlugin):
         include_paths: list[str] = Field(default_factory=list)
         exclude_paths: list[str] = Field(default_factory=list)
         project: str | None = Field(default=None)
+        download_concurrency: int = Field(
+            default=DEFAULT_DOWNLOAD_CONCURRENCY,
+            ge=1,
+            description="Parallel range downloads when processors read object contents",
+        )
+        listing_concurrency: int = Field(
+            default=DEFAULT_LISTING_CONCURRENCY,
+            ge=1,
+            description="Key-range shards listed in parallel during recursive scans",
+        )
+        shard_prefixes: list[str] = Field(
+            default_factory=list,
+            description=(
+                "Prefixes (relative to gcs_url) used as shard boundaries. "
+                "Defaults to the first-level folders under gcs_url."
+            ),
+        )
+        api_endpoint: str | None = Field(
+            default=None,
+            description="Override the GCS endpoint, e.g. a local emulator (uses anonymous credentials)",
+        )
 
         @model_validator(mode="after")
         def _validate_gcs_url(self) -> "GoogleStorageSource.ConfigModel":
@@ -153,6 +215,12 @@ class GoogleStorageSource(SourcePlugin):
         self.include_paths = normalize_glob_patterns(cfg.include_paths)
         self.exclude_paths = normalize_glob_patterns(cfg.exclude_paths)
         self.project = cfg.project
+        self.read_pool = RemoteReadPool(cfg.download_concurrency)
+        self.listing_concurrency = cfg.listing_concurrency
+        self.shard_prefixes = [
+            prefix.strip("/") + "/" for prefix in cfg.shard_prefixes if prefix.strip("/")
+        ]
+        self.api_endpoint = (cfg.api_endpoint or "").rstrip("/") or None
         self._client: storage.Client | None = None
 
     def get_info(self) -> dict[str, Any]:
@@ -205,57 +273,78 @@ class GoogleStorageSource(SourcePlugin):
             bucket=bucket,
             object_name=object_name,
             hash_md5=hash_md5,
+            size=changes.latest_value(FILE_SIZE, value_type=int),
         )
 
     async def scan(self) -> ScanResult:
+        return self._start_scan(None)
+
+    async def resume_scan(self, cursor: dict[str, Any]) -> ScanResult:
+        """Continue each shard from the page that was being consumed at the last checkpoint."""
+        if cursor.get("bucket") != self.bucket or cursor.get("prefix") != self.prefix:
+            logger.info(f"Ignoring scan cursor for another location; rescanning gs://{self.bucket}")
+            return self._start_scan(None)
+        if "shards" in cursor:
+            shards = [_ListingShard.from_cursor(item) for item in cursor["shards"] or []]
+            return self._start_scan(shards or None)
+        # Cursor written before listings were sharded: one unbounded listing.
+        return self._start_scan([_ListingShard(page_token=cursor.get("page_token"))])
+
+    def _start_scan(self, shards: list[_ListingShard] | None) -> ScanResult:
         ignored = 0
         status = OpStatus.IN_PROGRESS
+        # Planned on the first iteration when not resuming; until then a
+        # checkpoint restarts the listing from scratch.
+        listing: dict[str, list[_ListingShard] | None] = {"shards": shards}
 
         async def iterator():
             nonlocal ignored, status
             seen = 0
-            async for blob in self._iterate_blobs():
-                object_name = str(blob.name or "")
-                if not object_name:
-                    ignored += 1
-                    continue
-                file_name = PurePosixPath(object_name).name
-                if not match_paths(
-                    paths=(object_name, file_name),
-                    include=self.include_paths,
-                    exclude=self.exclude_paths,
-                ):
-                    ignored += 1
-                    continue
-                canonical_uri = _canonical_object_uri(self.bucket, object_name)
-                asset = Asset(
-                    external_id=object_name,
-                    namespace=self.get_namespace(),
-                    canonical_uri=canonical_uri,
-                    actor_id=self.actor.id,
-                )
-                result = AssetScanResult(asset=asset, actor=self.actor)
-                result.set_metadata(FILE_URI, _gcs_object_uri(self.bucket, object_name))
-                result.set_metadata(FILE_PATH, object_name)
-                result.set_metadata(FILE_NAME, file_name)
-                result.set_metadata(
-                    DATA_FILE_READER,
-                    {},
-                )
-                if blob.size is not None:
-                    result.set_metadata(FILE_SIZE, int(blob.size))
-                if blob.content_type:
-                    result.set_metadata(FILE_TYPE, str(blob.content_type))
-                if blob.updated is not None:
-                    result.set_metadata(TIME_MODIFIED, blob.updated)
-                md5_hex = _safe_md5_hex(blob.md5_hash)
-                if md5_hex:
-                    result.set_metadata(HASH_MD5, md5_hex)
-                yield result
-                seen += 1
-                if self.max_files and seen >= self.max_files:
-                    status = OpStatus.PARTIAL
-                    break
+            if listing["shards"] is None:
+                listing["shards"] = await self._plan_shards()
+            async with aclosing(self._iterate_blobs(listing["shards"])) as blobs:
+                async for blob in blobs:
+                    object_name = str(blob.name or "")
+                    if not object_name:
+                        ignored += 1
+                        continue
+                    file_name = PurePosixPath(object_name).name
+                    if not match_paths(
+                        paths=(object_name, file_name),
+                        include=self.include_paths,
+                        exclude=self.exclude_paths,
+                    ):
+                        ignored += 1
+                        continue
+                    canonical_uri = _canonical_object_uri(self.bucket, object_name)
+                    asset = Asset(
+                        external_id=object_name,
+                        namespace=self.get_namespace(),
+                        canonical_uri=canonical_uri,
+                        actor_id=self.actor.id,
+                    )
+                    result = AssetScanResult(asset=asset, actor=self.actor)
+                    result.set_metadata(FILE_URI, _gcs_object_uri(self.bucket, object_name))
+                    result.set_metadata(FILE_PATH, object_name)
+                    result.set_metadata(FILE_NAME, file_name)
+                    result.set_metadata(
+                        DATA_FILE_READER,
+                        {},
+                    )
+                    if blob.size is not None:
+                        result.set_metadata(FILE_SIZE, int(blob.size))
+                    if blob.content_type:
+                        result.set_metadata(FILE_TYPE, str(blob.content_type))
+                    if blob.updated is not None:
+                        result.set_metadata(TIME_MODIFIED, blob.updated)
+                    md5_hex = _safe_md5_hex(blob.md5_hash)
+                    if md5_hex:
+                        result.set_metadata(HASH_MD5, md5_hex)
+                    yield result
+                    seen += 1
+                    if self.max_files and seen >= self.max_files:
+                        status = OpStatus.PARTIAL
+                        break
 
             if status == OpStatus.IN_PROGRESS:
                 status = OpStatus.COMPLETED
@@ -263,26 +352,128 @@ class GoogleStorageSource(SourcePlugin):
             scan_result.ignored = ignored
 
         scan_result = ScanResult(iterator=iterator(), status=status, ignored=ignored)
+        scan_result.checkpoint = lambda: {
+            "bucket": self.bucket,
+            "prefix": self.prefix,
+            "shards": (
+                [shard.to_cursor() for shard in listing["shards"]]
+                if listing["shards"] is not None
+                else None
+            ),
+        }
         return scan_result
 
-    async def _iterate_blobs(self):
-        pages = await asyncio.to_thread(self._open_blob_pages_sync)
+    async def _plan_shards(self) -> list[_ListingShard]:
+        """Split the listing into key ranges that can be listed concurrently.
+
+        Boundaries are the configured `shard_prefixes`, or else the first-level
+        "folders" found by a delimiter listing of the root. Consecutive
+        boundaries form half-open [start, end) ranges, so objects that sort
+        between or outside the prefixes are still covered by exactly one shard.
+        """
+        if not self.recursive or self.listing_concurrency <= 1:
+            return [_ListingShard()]
+        if self.shard_prefixes:
+            root = f"{self.prefix.rstrip('/')}/" if self.prefix else ""
+            boundaries = sorted({f"{root}{prefix}" for prefix in self.shard_prefixes})
+        else:
+            boundaries = await asyncio.to_thread(self._discover_prefixes_sync)
+        if not boundaries:
+            return [_ListingShard()]
+        edges: list[str | None] = [None, *boundaries, None]
+        return [
+            _ListingShard(start=edges[idx], end=edges[idx + 1])
+            for idx in range(len(edges) - 1)
+        ]
+
+    async def _iterate_blobs(self, shards: list[_ListingShard]):
+        """Yield blobs from all unfinished shards, listed by a bounded set of workers."""
+        todo: asyncio.Queue[_ListingShard] = asyncio.Queue()
+        for shard in shards:
+            if not shard.done:
+                todo.put_nowait(shard)
+        remaining = todo.qsize()
+        if not remaining:
+            return
+        # Bounded so listing runs at most a few pages ahead of the consumer.
+        pages: asyncio.Queue[tuple[_ListingShard, list[Any] | None] | BaseException] = (
+            asyncio.Queue(maxsize=self.listing_concurrency * 2)
+        )
+
+        async def worker() -> None:
+            try:
+                while not todo.empty():
+                    shard = todo.get_nowait()
+                    await self._list_shard(shard, pages)
+            except Exception as exc:  # noqa: BLE001
+                await pages.put(exc)
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(self.listing_concurrency, remaining))
+        ]
+        try:
+            while remaining:
+                item = await pages.get()
+                if isinstance(item, BaseException):
+                    raise item
+                shard, blobs = item
+                if blobs is None:
+                    remaining -= 1
+                    continue
+                for blob in blobs:
+                    yield blob
+                shard.consumed()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _list_shard(
+        self,
+        shard: _ListingShard,
+        pages: asyncio.Queue[tuple[_ListingShard, list[Any] | None] | BaseException],
+    ) -> None:
+        blob_iterator = await asyncio.to_thread(self._open_blob_iterator_sync, shard)
+        page_iter = blob_iterator.pages
         while True:
-            page = await asyncio.to_thread(_next_page_or_none, pages)
+            # The token the upcoming page is requested with (the initial one for page 1).
+            page_token = blob_iterator.next_page_token
+            page = await asyncio.to_thread(_next_page_or_none, page_iter)
             if page is None:
                 break
             blobs = await asyncio.to_thread(lambda: list(page))
-            for blob in blobs:
-                yield blob
+            shard.fetched(page_token, blob_iterator.next_page_token)
+            await pages.put((shard, blobs))
+        shard.listed = True
+        await pages.put((shard, None))
 
-    def _open_blob_pages_sync(self):
-        client = self._get_client_sync()
+    def _list_kwargs(self) -> dict[str, Any]:
         kwargs: dict[str, Any] = {}
         if self.prefix:
             kwargs["prefix"] = f"{self.prefix.rstrip('/')}/"
+        return kwargs
+
+    def _open_blob_iterator_sync(self, shard: _ListingShard):
+        client = self._get_client_sync()
+        kwargs = self._list_kwargs()
         if not self.recursive:
             kwargs["delimiter"] = "/"
-        return client.list_blobs(self.bucket, **kwargs).pages
+        if shard.start:
+            kwargs["start_offset"] = shard.start
+        if shard.end:
+            kwargs["end_offset"] = shard.end
+        if shard.page_token:
+            kwargs["page_token"] = shard.page_token
+        return client.list_blobs(self.bucket, **kwargs)
+
+    def _discover_prefixes_sync(self) -> list[str]:
+        client = self._get_client_sync()
+        blob_iterator = client.list_blobs(self.bucket, delimiter="/", **self._list_kwargs())
+        prefixes: set[str] = set()
+        for page in blob_iterator.pages:
+            prefixes.update(page.prefixes)
+        return sorted(prefixes)
 
     def _probe_access_sync(self) -> None:
         client = self._get_client_sync()
@@ -297,7 +488,15 @@ class GoogleStorageSource(SourcePlugin):
     def _get_client_sync(self) -> storage.Client:
         if self._client is not None:
             return self._client
-        self._client = storage.Client(project=self.project)
+        if self.api_endpoint:
+            # Emulators and fake endpoints accept unauthenticated requests.
+            self._client = storage.Client(
+                project=self.project,
+                credentials=AnonymousCredentials(),
+                client_options={"api_endpoint": self.api_endpoint},
+            )
+        else:
+            self._client = storage.Client(project=self.project)
         return self._client
 
     def _asset_object_name(self, asset: Asset) -> str:
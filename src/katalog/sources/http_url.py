@@ -1,17 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import email.utils as email_utils
 import hashlib
-import logging
 from dataclasses import dataclass
-from datetime import timedelta, timezone
+from datetime import timezone
 from typing import Any, Literal
-import secrets
 
-from crawlee import Request
-from crawlee.crawlers import HttpCrawler, HttpCrawlingContext
-from crawlee.storage_clients import MemoryStorageClient
-from crawlee.storages import RequestQueue
+import httpx
 from loguru import logger
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -20,12 +16,21 @@ from katalog.constants.metadata import (
     FILE_SIZE,
     FILE_TYPE,
     FILE_URI,
+    HTTP_ETAG,
+    HTTP_LAST_MODIFIED,
     TIME_MODIFIED,
 )
 from katalog.models import Asset, Actor, DataReader, MetadataChanges, OpStatus
 from katalog.models import MetadataKey
 from katalog.sources.base import AssetScanResult, ScanResult, SourcePlugin
-from katalog.utils.blob_cache import get_cached_blob, put_cached_blob
+from katalog.sources.remote_reader import (
+    DEFAULT_DOWNLOAD_CONCURRENCY,
+    RangeResponse,
+    RemoteDataReader,
+    RemoteReadPool,
+    parse_range_response,
+    range_header,
+)
 from katalog.utils.url import canonicalize_web_url
 
 
@@ -34,49 +39,43 @@ class CrawlResponse:
     loaded_url: str
     headers: dict[str, str]
     content: bytes
+    status_code: int = 200
 
 
-class HttpDataReader(DataReader):
-    """HTTP reader that fetches content through Crawlee and caches by URL digest."""
+class HttpDataReader(RemoteDataReader):
+    """HTTP reader issuing ranged GETs, cached in chunks by URL and validator digest."""
 
-    def __init__(self, source: "HttpUrlSource", url: str):
+    def __init__(self, source: "HttpUrlSource", url: str, validator: str | None = None):
         self.source = source
         self.url = url
-        self._cache_digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
-        self._cached_content: bytes | None = None
-
-    async def read(
-        self, offset: int = 0, length: int | None = None, no_cache: bool = False
-    ) -> bytes:
-        if self._cached_content is None and not no_cache:
-            cached = get_cached_blob(hash_type="url", digest=self._cache_digest)
-            if cached is not None:
-                self._cached_content = cached
-
-        if self._cached_content is None or no_cache:
-            response = await self.source._crawl_once(self.url, method="GET")
-            if response is None:
-                self._cached_content = b""
-            else:
-                self._cached_content = response.content
-                if not no_cache:
-                    put_cached_blob(
-                        hash_type="url",
-                        digest=self._cache_digest,
-                        data=self._cached_content,
-                    )
-        data = self._cached_content
-        if data is None:
-            return b""
-        if offset < 0:
-            offset = 0
-        if length is None:
-            return data[offset:]
-        return data[offset : offset + length]
+        # The ETag (or Last-Modified) seen by the last scan keys the cache, so
+        # chunks of an older version of the resource are never served.
+        identity = url if not validator else f"{url}\n{validator}"
+        digest = hashlib.sha256(identity.encode("utf-8")).hexdigest()
+        super().__init__(
+            pool=source.read_pool,
+            fetch_range=self._fetch_range,
+            object_key=f"url:{digest}",
+            cache_type="url",
+            cache_digest=digest,
+        )
+
+    async def _fetch_range(self, start: int, end: int | None) -> RangeResponse:
+        response = await self.source._crawl_once(
+            self.url, method="GET", headers={"Range": range_header(start, end)}
+        )
+        if response is None:
+            return RangeResponse(data=b"", start=start)
+        return parse_range_response(response.content, response.headers)
 
 
 class HttpUrlSource(SourcePlugin):
-    """Source that can recurse into HTTP/HTTPS URL assets."""
+    """Source that can recurse into HTTP/HTTPS URL assets.
+
+    Rescans send the stored ETag/Last-Modified as conditional HEAD requests and
+    report 304 responses as unchanged. Requests share one pooled client and are
+    limited per host.
+    """
 
     plugin_id = "katalog.sources.http_url.HttpUrlSource"
     title = "HTTP URL"
@@ -87,9 +86,16 @@ class HttpUrlSource(SourcePlugin):
         timeout_seconds: float = Field(default=30.0, gt=0)
         user_agent: str = Field(default="katalog/0.1")
         max_request_retries: int = Field(default=1, ge=0)
-        verbose_crawler_logs: bool = Field(
-            default=False,
-            description="Enable verbose Crawlee retry/failure logs for HTTP requests.",
+        max_connections: int = Field(
+            default=64, ge=1, description="Pooled connections shared by all hosts"
+        )
+        max_connections_per_host: int = Field(
+            default=4, ge=1, description="Concurrent requests to any single host"
+        )
+        download_concurrency: int = Field(
+            default=DEFAULT_DOWNLOAD_CONCURRENCY,
+            ge=1,
+            description="Parallel range downloads when processors read URL contents",
         )
 
     config_model = ConfigModel
@@ -100,7 +106,11 @@ class HttpUrlSource(SourcePlugin):
         self.timeout_seconds = cfg.timeout_seconds
         self.user_agent = cfg.user_agent
         self.max_request_retries = cfg.max_request_retries
-        self.verbose_crawler_logs = cfg.verbose_crawler_logs
+        self.max_connections = cfg.max_connections
+        self.max_connections_per_host = cfg.max_connections_per_host
+        self.read_pool = RemoteReadPool(cfg.download_concurrency)
+        self._client: httpx.AsyncClient | None = None
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
 
     def get_info(self) -> dict[str, Any]:
         return {
@@ -122,7 +132,15 @@ class HttpUrlSource(SourcePlugin):
         url = self._asset_url(asset)
         if not url:
             return None
-        return HttpDataReader(source=self, url=url)
+        validator = changes.latest_value(HTTP_ETAG, value_type=str) or changes.latest_value(
+            HTTP_LAST_MODIFIED, value_type=str
+        )
+        return HttpDataReader(source=self, url=url, validator=validator)
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     def get_namespace(self) -> str:
         return "web"
@@ -154,8 +172,30 @@ class HttpUrlSource(SourcePlugin):
         if not url:
             return await self.scan()
 
+        etag = changes.latest_value(HTTP_ETAG, value_type=str)
+        last_modified = changes.latest_value(HTTP_LAST_MODIFIED, value_type=str)
+        conditional: dict[str, str] = {}
+        if etag:
+            conditional["If-None-Match"] = etag
+        if last_modified:
+            conditional["If-Modified-Since"] = last_modified
+
         async def _iterator():
-            response = await self._crawl_once(url, method="HEAD")
+            if conditional:
+                response = await self._crawl_once(url, method="HEAD", headers=conditional)
+            else:
+                response = await self._crawl_once(url, method="HEAD")
+            if (
+                response is not None
+                and asset.id is not None
+                and (
+                    response.status_code == 304
+                    or (etag and response.headers.get("etag") == etag)
+                )
+            ):
+                # Not modified since the last scan: keep the stored metadata as is.
+                scan_result.unchanged_asset_ids.append(int(asset.id))
+                return
             final_url = (
                 canonicalize_web_url(response.loaded_url)
                 if response is not None
@@ -182,83 +222,76 @@ class HttpUrlSource(SourcePlugin):
                 modified = self._parse_http_datetime(response.headers.get("last-modified"))
                 if modified is not None:
                     result.set_metadata(TIME_MODIFIED, modified)
+                result.set_metadata(HTTP_ETAG, response.headers.get("etag"))
+                result.set_metadata(HTTP_LAST_MODIFIED, response.headers.get("last-modified"))
+                # Recorded once processed, so a later 304 is only skipped for a URL the
+                # current processor pipeline already handled.
+                result.fingerprint = _validator_fingerprint(
+                    response.headers.get("etag"), response.headers.get("last-modified")
+                )
             yield result
 
-        return ScanResult(iterator=_iterator(), status=OpStatus.COMPLETED, ignored=0)
-
-    async def _crawl_once(
-        self, url: str, *, method: Literal["GET", "HEAD"]
-    ) -> CrawlResponse | None:
-        result: CrawlResponse | None = None
-
-        request = Request.from_url(
-            url,
-            method=method,
-            headers={"User-Agent": self.user_agent},
-        )
-        storage_client = MemoryStorageClient()
-        request_queue = await RequestQueue.open(
-            alias=f"http-url-{secrets.token_hex(4)}",
-            storage_client=storage_client,
-        )
-        crawler_logger: logging.Logger | None = None
-        if not self.verbose_crawler_logs:
-            crawler_logger = logging.getLogger(
-                f"katalog.sources.http_url.crawler.{self.actor.id or 'unknown'}"
+        scan_result = ScanResult(iterator=_iterator(), status=OpStatus.COMPLETED, ignored=0)
+        return scan_result
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                follow_redirects=True,
+                timeout=self.timeout_seconds,
+                headers={"User-Agent": self.user_agent},
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
             )
-            crawler_logger.disabled = False
-            crawler_logger.setLevel(logging.CRITICAL + 1)
-            crawler_logger.propagate = False
-        crawler = HttpCrawler(
-            storage_client=storage_client,
-            request_manager=request_queue,
-            max_request_retries=self.max_request_retries,
-            use_session_pool=False,
-            retry_on_blocked=False,
-            configure_logging=self.verbose_crawler_logs,
-            navigation_timeout=timedelta(seconds=self.timeout_seconds),
-            _logger=crawler_logger,
-        )
+        return self._client
 
-        @crawler.router.default_handler
-        async def request_handler(context: HttpCrawlingContext) -> None:
-            nonlocal result
-            response = context.http_response
-            headers = {str(k).lower(): str(v) for k, v in response.headers.items()}
-            loaded_url = context.request.loaded_url or context.request.url
-            content = b""
-            if method != "HEAD":
-                content = await response.read()
-            result = CrawlResponse(
-                loaded_url=str(loaded_url),
-                headers=headers,
-                content=content,
-            )
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        host = httpx.URL(url).host
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = asyncio.Semaphore(self.max_connections_per_host)
+            self._host_slots[host] = slot
+        return slot
 
-        try:
-            await crawler.run([request])
-        except Exception as exc:  # noqa: BLE001
-            logger.warning(
-                "HTTP crawl failed method={method} url={url} error={error}",
-                method=method,
-                url=url,
-                error=str(exc),
-            )
-            return None
-        finally:
+    async def _crawl_once(
+        self,
+        url: str,
+        *,
+        method: Literal["GET", "HEAD"],
+        headers: dict[str, str] | None = None,
+    ) -> CrawlResponse | None:
+        """Send one request over the pooled client; None when it fails after retries."""
+        client = self._get_client()
+        attempts = self.max_request_retries + 1
+        error: str | None = None
+        for attempt in range(attempts):
             try:
-                request_manager = await crawler.get_request_manager()
-                await request_manager.drop()
-            except Exception:
-                # Request queue cleanup should not break processing.
-                pass
-        if result is None:
-            logger.warning(
-                "HTTP crawl returned no response method={method} url={url}",
-                method=method,
-                url=url,
+                async with self._host_slot(url):
+                    response = await client.request(method, url, headers=headers)
+            except httpx.HTTPError as exc:
+                error = str(exc) or type(exc).__name__
+                continue
+            if response.status_code >= 500 and attempt + 1 < attempts:
+                error = f"status {response.status_code}"
+                continue
+            if response.status_code >= 400:
+                error = f"status {response.status_code}"
+                break
+            return CrawlResponse(
+                loaded_url=str(response.url),
+                headers={str(k).lower(): str(v) for k, v in response.headers.items()},
+                content=b"" if method == "HEAD" else response.content,
+                status_code=response.status_code,
             )
-        return result
+        logger.warning(
+            "HTTP request failed method={method} url={url} error={error}",
+            method=method,
+            url=url,
+            error=error,
+        )
+        return None
 
     @staticmethod
     def _changes_url(changes: MetadataChanges) -> str | None:
@@ -292,3 +325,11 @@ class HttpUrlSource(SourcePlugin):
         if dt.tzinfo is None:
             return dt.replace(tzinfo=timezone.utc)
         return dt.astimezone(timezone.utc)
+
+
+def _validator_fingerprint(etag: str | None, last_modified: str | None) -> int | None:
+    if not etag and not last_modified:
+        return None
+    raw = f"{etag or ''}\0{last_modified or ''}"
+    digest = hashlib.blake2b(raw.encode("utf-8"), digest_size=8)
+    return int.from_bytes(digest.digest(), "little", signed=True)
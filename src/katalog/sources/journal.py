@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Iterable
+
+from loguru import logger
+
+from katalog.db.scan_journal import ScanJournalRepo, ScanSession, get_scan_journal_repo
+
+# Checkpoint at most this often; each one is a single small transaction.
+CHECKPOINT_INTERVAL_SECONDS = 15.0
+# Interrupted sessions older than this start over instead of resuming.
+RESUME_MAX_AGE_SECONDS = 7 * 24 * 3600.0
+
+
+class ScanCheckpointer:
+    """Journal one source actor's full scan so an interrupted run can resume it.
+
+    Callers report every asset they persisted through `mark_seen()` and, once
+    `due()`, call `checkpoint()` at a point where everything the source yielded
+    so far has been persisted; the cursor passed there must cover exactly that.
+    """
+
+    def __init__(
+        self,
+        session: ScanSession,
+        *,
+        repo: ScanJournalRepo,
+        interval_seconds: float | None = None,
+    ) -> None:
+        self.session = session
+        self.repo = repo
+        self.interval_seconds = (
+            CHECKPOINT_INTERVAL_SECONDS if interval_seconds is None else interval_seconds
+        )
+        self._pending_seen: list[tuple[int, int]] = []
+        self._last_checkpoint = time.monotonic()
+
+    @classmethod
+    async def open(
+        cls,
+        *,
+        actor_id: int,
+        changeset_id: int | None,
+        repo: ScanJournalRepo | None = None,
+    ) -> ScanCheckpointer:
+        repo = repo or get_scan_journal_repo()
+        session = await repo.open(
+            actor_id=actor_id,
+            changeset_id=changeset_id,
+            max_age_seconds=RESUME_MAX_AGE_SECONDS,
+        )
+        if session.resumed:
+            seen_count = sum(len(ids) for ids in session.seen_asset_ids.values())
+            logger.info(
+                "Resuming interrupted scan for actor {actor_id} (status={status}, seen={seen})",
+                actor_id=actor_id,
+                status=session.status,
+                seen=seen_count,
+            )
+        return cls(session, repo=repo)
+
+    @property
+    def resume_cursor(self) -> dict[str, Any] | None:
+        return self.session.cursor if self.session.resumed else None
+
+    @property
+    def already_scanned(self) -> bool:
+        """True when the interrupted run had already exhausted the source."""
+        return self.session.resumed and self.session.status == "scanned"
+
+    def mark_seen(self, actor_id: int, asset_ids: Iterable[int]) -> None:
+        self._pending_seen.extend((int(actor_id), int(asset_id)) for asset_id in asset_ids)
+
+    def due(self) -> bool:
+        return time.monotonic() - self._last_checkpoint >= self.interval_seconds
+
+    async def checkpoint(self, cursor: dict[str, Any] | None) -> None:
+        """Persist `cursor`; None means a resumed run rescans from the start."""
+        await self.repo.checkpoint(self.session.id, cursor=cursor, seen=self._pending_seen)
+        self.session.cursor = cursor
+        self._pending_seen = []
+        self._last_checkpoint = time.monotonic()
+
+    async def mark_scanned(self) -> None:
+        """Record that the source was exhausted; a resumed run skips straight to finalization."""
+        await self.repo.checkpoint(
+            self.session.id,
+            cursor=self.session.cursor,
+            seen=self._pending_seen,
+            status="scanned",
+        )
+        self.session.status = "scanned"
+        self._pending_seen = []
+        self._last_checkpoint = time.monotonic()
+
+    async def complete(self) -> None:
+        await self.repo.complete(self.session.id)
+        self._pending_seen = []
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import json
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
@@ -17,6 +17,7 @@ from katalog.constants.metadata import (
 )
 from katalog.models import Actor, Asset, DataReader, MetadataChanges, OpStatus
 from katalog.sources.base import AssetScanResult, ScanResult, SourcePlugin
+from katalog.utils.streaming import iter_json_records, iterate_in_thread
 from katalog.utils.url import canonicalize_web_url
 from katalog.utils.utils import parse_datetime_utc
 
@@ -131,45 +132,60 @@ class JsonListSource(SourcePlugin):
         return self.namespace
 
     async def scan(self) -> ScanResult:
-        records = self._load_records()
-        if self.max_records > 0:
-            records = records[: self.max_records]
-
-        valid_rows: list[tuple[str, str, dict[str, Any]]] = []
-        ignored = 0
-        for external_id, row in records:
-            if not isinstance(row, dict):
-                ignored += 1
-                continue
-            url_candidate = _read_path(row, self.url_field)
-            if not isinstance(url_candidate, str):
-                ignored += 1
-                continue
-            url = canonicalize_web_url(url_candidate)
-            if not (url.startswith("http://") or url.startswith("https://")):
-                ignored += 1
-                continue
-            resolved_external_id = (
-                str(external_id).strip() if external_id is not None else ""
-            ) or url
-            valid_rows.append((resolved_external_id, url, row))
+        json_path = self._resolve_json_file_path()
+        if not json_path.exists():
+            raise FileNotFoundError(f"JSON source file not found: {json_path}")
 
         async def iterator():
-            for external_id, url, row in valid_rows:
-                asset = Asset(
-                    namespace=self.namespace,
-                    external_id=external_id,
-                    canonical_uri=url,
-                    actor_id=self.actor.id,
-                )
-                result = AssetScanResult(asset=asset, actor=self.actor)
-                result.set_metadata(FILE_URI, url)
-                if self.emit_record_json:
-                    result.set_metadata(self.record_metadata_key, row)
-                self._emit_mapped_metadata(result, row)
-                yield result
-
-        return ScanResult(iterator=iterator(), status=OpStatus.COMPLETED, ignored=ignored)
+            ignored = 0
+            try:
+                with json_path.open("r", encoding="utf-8") as handle:
+                    records = iter_json_records(
+                        handle,
+                        records_field=self.records_field,
+                        records_are_map=self.records_are_map,
+                    )
+                    if self.max_records > 0:
+                        records = islice(records, self.max_records)
+                    async for external_id, row in iterate_in_thread(records):
+                        resolved = self._resolve_record(external_id, row)
+                        if resolved is None:
+                            ignored += 1
+                            continue
+                        resolved_external_id, url = resolved
+                        asset = Asset(
+                            namespace=self.namespace,
+                            external_id=resolved_external_id,
+                            canonical_uri=url,
+                            actor_id=self.actor.id,
+                        )
+                        result = AssetScanResult(asset=asset, actor=self.actor)
+                        result.set_metadata(FILE_URI, url)
+                        if self.emit_record_json:
+                            result.set_metadata(self.record_metadata_key, row)
+                        self._emit_mapped_metadata(result, row)
+                        yield result
+            except ValueError as exc:
+                raise ValueError(f"{exc} in {json_path}") from exc
+            finally:
+                scan_result.ignored = ignored
+
+        scan_result = ScanResult(iterator=iterator(), status=OpStatus.COMPLETED)
+        return scan_result
+
+    def _resolve_record(self, external_id: str | None, row: Any) -> tuple[str, str] | None:
+        if not isinstance(row, dict):
+            return None
+        url_candidate = _read_path(row, self.url_field)
+        if not isinstance(url_candidate, str):
+            return None
+        url = canonicalize_web_url(url_candidate)
+        if not (url.startswith("http://") or url.startswith("https://")):
+            return None
+        resolved_external_id = (
+            str(external_id).strip() if external_id is not None else ""
+        ) or url
+        return resolved_external_id, url
 
     def _emit_mapped_metadata(self, result: AssetScanResult, row: dict[str, Any]) -> None:
         for field_path, metadata_def in self._mapping_defs.items():
@@ -183,34 +199,6 @@ class JsonListSource(SourcePlugin):
                 value=value,
             )
 
-    def _load_records(self) -> list[tuple[str | None, Any]]:
-        json_path = self._resolve_json_file_path()
-        if not json_path.exists():
-            raise FileNotFoundError(f"JSON source file not found: {json_path}")
-
-        payload = json.loads(json_path.read_text(encoding="utf-8"))
-        if isinstance(payload, list):
-            return [(None, row) for row in payload]
-        if isinstance(payload, dict):
-            if self.records_field:
-                records = payload.get(self.records_field)
-                if isinstance(records, list):
-                    return [(None, row) for row in records]
-                if self.records_are_map and isinstance(records, dict):
-                    return [(str(key), value) for key, value in records.items()]
-                expected = "list or object map" if self.records_are_map else "list"
-                raise ValueError(
-                    f"JSON records_field '{self.records_field}' is not a {expected} in {json_path}"
-                )
-            if isinstance(payload.get("records"), list):
-                return [(None, row) for row in payload["records"]]
-            if isinstance(payload.get("documents"), list):
-                return [(None, row) for row in payload["documents"]]
-            return [(None, payload)]
-        raise ValueError(
-            f"JSON source root must be an array or object, got {type(payload).__name__}"
-        )
-
     def _resolve_json_file_path(self) -> Path:
         path = Path(self.json_file).expanduser()
         if path.is_absolute():
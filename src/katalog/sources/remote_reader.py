@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import asyncio
+import re
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Iterable, Mapping
+
+from katalog.models import DataReader
+from katalog.utils.blob_cache import get_cached_chunk, put_cached_chunk
+
+# Remote objects are fetched and cached in aligned chunks of this size.
+CHUNK_SIZE = 1024 * 1024
+# Longest run of chunks fetched by one range request; longer reads are split
+# into parts that are downloaded in parallel.
+PART_CHUNKS = 8
+DEFAULT_DOWNLOAD_CONCURRENCY = 4
+
+_CONTENT_RANGE_RE = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+|\*)")
+
+
+@dataclass(frozen=True)
+class RangeResponse:
+    data: bytes
+    # Object offset of data[0]; 0 when the server ignored the range and sent everything.
+    start: int
+    # Full object size, when the response tells.
+    total_size: int | None = None
+
+    def slice(self, offset: int, length: int | None) -> bytes:
+        data = self.data[max(0, offset - self.start) :]
+        return data if length is None else data[:length]
+
+
+# fetch(start, end) returns the bytes in [start, end), or from start to the end
+# of the object when end is None.
+RangeFetcher = Callable[[int, int | None], Awaitable[RangeResponse]]
+
+
+def range_header(start: int, end: int | None) -> str:
+    return f"bytes={start}-" if end is None else f"bytes={start}-{end - 1}"
+
+
+def parse_range_response(data: bytes, headers: Mapping[str, str]) -> RangeResponse:
+    """Build a RangeResponse from an HTTP body and its (case-insensitive) headers."""
+    match = _CONTENT_RANGE_RE.match(headers.get("content-range") or "")
+    if match is None:
+        return RangeResponse(data=data, start=0, total_size=len(data))
+    total = match.group(3)
+    return RangeResponse(
+        data=data,
+        start=int(match.group(1)),
+        total_size=None if total == "*" else int(total),
+    )
+
+
+class RemoteReadPool:
+    """Per-source download slots, shared by all of the source's readers.
+
+    Chunks already being downloaded by one reader are awaited by the others
+    instead of being requested again. Downloads run as their own tasks, so a
+    reader that is cancelled does not take the chunks others wait for with it.
+    """
+
+    def __init__(self, concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY) -> None:
+        self.concurrency = max(1, int(concurrency))
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        self._inflight: dict[tuple[str, int], asyncio.Future[bytes]] = {}
+        self._downloads: set[asyncio.Task[dict[int, bytes]]] = set()
+
+    async def fetch_chunks(
+        self,
+        object_key: str,
+        indexes: Iterable[int],
+        fetch_run: Callable[[int, int], Awaitable[dict[int, bytes]]],
+    ) -> dict[int, bytes]:
+        loop = asyncio.get_running_loop()
+        waiting: dict[int, asyncio.Future[bytes]] = {}
+        owned: list[int] = []
+        for index in sorted(set(indexes)):
+            future = self._inflight.get((object_key, index))
+            if future is not None:
+                waiting[index] = future
+                continue
+            self._inflight[(object_key, index)] = loop.create_future()
+            owned.append(index)
+
+        async def run(first: int, last: int) -> dict[int, bytes]:
+            try:
+                async with self.semaphore:
+                    fetched = await fetch_run(first, last)
+            except BaseException as exc:
+                for index in range(first, last + 1):
+                    future = self._inflight.pop((object_key, index), None)
+                    if future is None or future.done():
+                        continue
+                    if isinstance(exc, asyncio.CancelledError):
+                        future.cancel()
+                    else:
+                        future.set_exception(exc)
+                raise
+            for index in range(first, last + 1):
+                future = self._inflight.pop((object_key, index), None)
+                if future is not None and not future.done():
+                    future.set_result(fetched.get(index, b""))
+            return fetched
+
+        downloads = [
+            loop.create_task(run(first, last)) for first, last in _runs(owned, PART_CHUNKS)
+        ]
+        for download in downloads:
+            self._downloads.add(download)
+            download.add_done_callback(self._forget)
+        chunks: dict[int, bytes] = {}
+        for download in downloads:
+            chunks.update(await asyncio.shield(download))
+        for index, future in waiting.items():
+            chunks[index] = await asyncio.shield(future)
+        return chunks
+
+    def _forget(self, download: asyncio.Task[dict[int, bytes]]) -> None:
+        self._downloads.discard(download)
+        # Consume the outcome of downloads whose reader went away; waiters got it already.
+        if not download.cancelled():
+            download.exception()
+
+
+class RemoteDataReader(DataReader):
+    """DataReader that reads remote objects with range requests through a chunk cache.
+
+    Chunks are cached in the blob cache under the object's content digest, so
+    sniffing the first bytes of a large file downloads one chunk, not the file.
+    Without a digest nothing is cached, but reads are still ranged and shared.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool: RemoteReadPool,
+        fetch_range: RangeFetcher,
+        object_key: str,
+        cache_type: str | None = None,
+        cache_digest: str | None = None,
+        size: int | None = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        self.pool = pool
+        self.fetch_range = fetch_range
+        self.object_key = object_key
+        self.cache_type = cache_type
+        self.cache_digest = cache_digest
+        self.size = size
+        self.chunk_size = chunk_size
+        # Whether the server honors range requests, unknown until the first response.
+        # Until then parts are fetched one at a time; a server that ignores ranges
+        # sends the whole object, which is kept and serves every later part.
+        self._ranges_honored: bool | None = None
+        self._probe = asyncio.Lock()
+        self._whole: RangeResponse | None = None
+
+    async def read(
+        self, offset: int = 0, length: int | None = None, no_cache: bool = False
+    ) -> bytes:
+        offset = max(0, offset)
+        if length is not None and length <= 0:
+            return b""
+        end = None if length is None else offset + length
+        if no_cache:
+            async with self.pool.semaphore:
+                response = await self.fetch_range(offset, end)
+            return response.slice(offset, length)
+        if self.size is not None and offset >= self.size:
+            return b""
+
+        chunk_size = self.chunk_size
+        first = offset // chunk_size
+        parts: list[bytes] = []
+        index = first
+        while True:
+            stop = end
+            if self.size is not None:
+                stop = self.size if stop is None else min(stop, self.size)
+            if stop is not None:
+                last = max(index, (stop - 1) // chunk_size)
+            else:
+                # Size unknown: read one part at a time until a short chunk.
+                last = index + PART_CHUNKS - 1
+            chunks = await self._chunks(index, last)
+            exhausted = False
+            for current in range(index, last + 1):
+                chunk = chunks.get(current, b"")
+                parts.append(chunk)
+                if len(chunk) < chunk_size:
+                    exhausted = True
+                    break
+            if exhausted or stop is not None:
+                break
+            index = last + 1
+
+        data = b"".join(parts)[offset - first * chunk_size :]
+        return data if length is None else data[:length]
+
+    async def _chunks(self, first: int, last: int) -> dict[int, bytes]:
+        found: dict[int, bytes] = {}
+        missing: list[int] = []
+        for index in range(first, last + 1):
+            cached = None
+            if self.cache_type and self.cache_digest:
+                cached = get_cached_chunk(
+                    hash_type=self.cache_type,
+                    digest=self.cache_digest,
+                    chunk_size=self.chunk_size,
+                    index=index,
+                )
+            if cached is None:
+                missing.append(index)
+            else:
+                found[index] = cached
+        if missing:
+            found.update(
+                await self.pool.fetch_chunks(self.object_key, missing, self._fetch_run)
+            )
+        return found
+
+    async def _fetch_run(self, first: int, last: int) -> dict[int, bytes]:
+        chunk_size = self.chunk_size
+        start = first * chunk_size
+        end = (last + 1) * chunk_size
+        if self.size is not None:
+            end = min(end, self.size)
+        if end <= start:
+            return {}
+        response = await self._fetch(start, end)
+        if response.total_size is not None:
+            self.size = response.total_size
+        chunks: dict[int, bytes] = {}
+        base_index = response.start // chunk_size
+        for position in range(0, len(response.data), chunk_size):
+            index = base_index + position // chunk_size
+            chunk = response.data[position : position + chunk_size]
+            chunks[index] = chunk
+            # A short chunk is only final, and safe to cache, at the known end of the object.
+            complete = len(chunk) == chunk_size or (
+                self.size is not None and index * chunk_size + len(chunk) == self.size
+            )
+            if complete and self.cache_type and self.cache_digest:
+                put_cached_chunk(
+                    hash_type=self.cache_type,
+                    digest=self.cache_digest,
+                    chunk_size=chunk_size,
+                    index=index,
+                    data=chunk,
+                )
+        return chunks
+
+    async def _fetch(self, start: int, end: int) -> RangeResponse:
+        if self._ranges_honored is None:
+            async with self._probe:
+                if self._ranges_honored is None:
+                    response = await self.fetch_range(start, end)
+                    ignored = response.start != start or len(response.data) > end - start
+                    self._ranges_honored = not ignored
+                    if ignored:
+                        self._whole = response
+                    return response
+        if self._whole is not None:
+            return self._whole
+        return await self.fetch_range(start, end)
+
+
+def _runs(indexes: list[int], max_length: int) -> list[tuple[int, int]]:
+    """Group sorted chunk indexes into contiguous (first, last) runs of bounded length."""
+    runs: list[tuple[int, int]] = []
+    for index in indexes:
+        if runs and runs[-1][1] == index - 1 and index - runs[-1][0] < max_length:
+            runs[-1] = (runs[-1][0], index)
+        else:
+            runs.append((index, index))
+    return runs
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import time
-from typing import Literal
+from typing import Any, Literal
 from typing import cast
 
 from loguru import logger
@@ -9,6 +10,7 @@ from loguru import logger
 from katalog.constants.metadata import ASSET_LOST
 from katalog.db.actors import get_actor_repo
 from katalog.db.assets import get_asset_repo
+from katalog.db.fingerprints import AssetFingerprint, get_fingerprint_repo
 from katalog.db.metadata import get_metadata_repo
 from katalog.db.sqlspec import session_scope
 from katalog.db.sqlspec.sql_helpers import select
@@ -24,8 +26,13 @@ from katalog.models import (
 )
 from katalog.models.core import OpStatus
 from katalog.plugins.registry import get_actor_instance
-from katalog.processors.runtime import process_asset, sort_processors
+from katalog.processors.runtime import (
+    process_asset,
+    processor_pipeline_key,
+    sort_processors,
+)
 from katalog.sources.base import AssetScanResult, ScanResult, SourcePlugin
+from katalog.sources.journal import ScanCheckpointer
 
 
 async def run_sources(
@@ -36,13 +43,19 @@ async def run_sources(
     max_recursion_depth: int = 2,
     missing_assets_policy: Literal["lost", "delete"] = "lost",
 ) -> OpStatus:
-    """Run source scans, optionally recurse into discovered assets, and persist results."""
+    """Run source scans, optionally recurse into discovered assets, and persist results.
+
+    Each top-level source scan is checkpointed into the scan journal, so a run
+    that dies halfway resumes from the last cursor and still knows which assets
+    the interrupted run saw when it applies the missing-assets policy.
+    """
 
     if run_processors:
         processor_pipeline, _processor_actors = await sort_processors()
     else:
         processor_pipeline = []
     has_processors = bool(processor_pipeline)
+    pipeline_key = processor_pipeline_key(processor_pipeline)
 
     final_status = OpStatus.COMPLETED
     stats = changeset.stats
@@ -53,6 +66,7 @@ async def run_sources(
     scan_started = time.perf_counter()
     asset_repo = get_asset_repo()
     metadata_repo = get_metadata_repo()
+    fingerprint_repo = get_fingerprint_repo()
 
     source_db = get_actor_repo()
     all_source_actors = await source_db.list_rows(
@@ -83,7 +97,90 @@ async def run_sources(
             actor_has_metadata[actor_id] = bool(rows)
 
     seen_assets_by_actor: dict[int, set[int]] = {}
+    pending_fingerprints: list[AssetFingerprint] = []
+    # Unchanged assets re-processed because this pipeline had not processed them yet.
+    pending_settled: list[int] = []
+    failed_asset_ids: set[int] = set()
+    source_metrics: dict[str, float] = {}
     recursion_visited: set[tuple[int, str, str]] = set()
+    checkpointers: list[ScanCheckpointer] = []
+    # Actors scanned through a change feed: unseen assets are not missing.
+    incremental_actor_ids: set[int] = set()
+    source_states: dict[str, dict[str, Any]] = {}
+    # Journal of the top-level source scan currently running, if any.
+    active_checkpointer: ScanCheckpointer | None = None
+    # Processor tasks enqueued since the last settle; awaited before fingerprints are recorded.
+    inflight_tasks: list[asyncio.Task] = []
+
+    def _mark_seen(actor_id: int, asset_ids: list[int]) -> None:
+        seen_assets_by_actor.setdefault(actor_id, set()).update(asset_ids)
+        if active_checkpointer is not None:
+            active_checkpointer.mark_seen(actor_id, asset_ids)
+
+    def _enqueue_processing(changes: MetadataChanges) -> None:
+        task = changeset.enqueue(
+            process_asset(
+                changeset=changeset,
+                pipeline=processor_pipeline,
+                changes=changes,
+                failed_asset_ids=failed_asset_ids,
+            )
+        )
+        inflight_tasks.append(task)
+
+    async def _absorb_reported(source_actor: Actor, scan_result: ScanResult) -> None:
+        """Account for assets the source reported as unchanged or removed instead of yielding."""
+        if source_actor.id is None:
+            return
+        actor_id = int(source_actor.id)
+        if scan_result.unchanged_asset_ids:
+            unchanged = scan_result.unchanged_asset_ids
+            scan_result.unchanged_asset_ids = []
+            stats.assets_seen += len(unchanged)
+            stats.assets_unchanged += len(unchanged)
+            _mark_seen(actor_id, unchanged)
+            if has_processors:
+                # Unchanged for the source, but not necessarily processed by this pipeline.
+                settled = await fingerprint_repo.settled(unchanged, pipeline_key=pipeline_key)
+                unprocessed = sorted(set(unchanged) - settled)
+                for asset in (
+                    await asset_repo.list_rows(order_by="id", id__in=unprocessed)
+                    if unprocessed
+                    else []
+                ):
+                    loaded = list(await asset_repo.load_metadata(asset, include_removed=True))
+                    _enqueue_processing(MetadataChanges(asset=asset, loaded=loaded, staged=[]))
+                pending_settled.extend(unprocessed)
+        if scan_result.removed_asset_ids:
+            removed = sorted(set(scan_result.removed_asset_ids))
+            scan_result.removed_asset_ids = []
+            await fingerprint_repo.forget(removed)
+            if missing_assets_policy == "delete":
+                affected = await asset_repo.delete_assets(removed)
+            else:
+                affected = await asset_repo.mark_assets_lost(
+                    changeset=changeset, actor_id=actor_id, asset_ids=removed
+                )
+            stats.assets_lost += affected
+            stats.assets_changed += affected
+
+    async def _settle() -> None:
+        """Wait until everything handed to processors so far is persisted."""
+        nonlocal inflight_tasks
+        if inflight_tasks:
+            await asyncio.gather(*inflight_tasks, return_exceptions=True)
+            inflight_tasks = []
+        # Safe now: every fingerprinted asset has its metadata written. Failed
+        # assets keep their previous fingerprint, so the next scan retries them.
+        await fingerprint_repo.record(
+            [entry for entry in pending_fingerprints if entry.asset_id not in failed_asset_ids]
+        )
+        pending_fingerprints.clear()
+        await fingerprint_repo.settle(
+            [asset_id for asset_id in pending_settled if asset_id not in failed_asset_ids],
+            pipeline_key=pipeline_key,
+        )
+        pending_settled.clear()
 
     def _pick_recursive_source(changes: MetadataChanges) -> tuple[Actor, SourcePlugin] | None:
         candidates: list[tuple[int, int]] = []
@@ -112,9 +209,16 @@ async def run_sources(
             result.asset, changeset=changeset, actor=source_actor
         )
         if result.asset.id is not None:
-            seen_assets_by_actor.setdefault(int(source_actor.id), set()).add(
-                int(result.asset.id)
-            )
+            _mark_seen(int(source_actor.id), [int(result.asset.id)])
+            if result.fingerprint is not None:
+                pending_fingerprints.append(
+                    AssetFingerprint(
+                        actor_id=int(source_actor.id),
+                        asset_id=int(result.asset.id),
+                        fingerprint=result.fingerprint,
+                        pipeline_key=pipeline_key,
+                    )
+                )
 
         if was_created:
             stats.assets_added += 1
@@ -135,13 +239,7 @@ async def run_sources(
         )
 
         if has_processors:
-            changeset.enqueue(
-                process_asset(
-                    changeset=changeset,
-                    pipeline=processor_pipeline,
-                    changes=changes,
-                )
-            )
+            _enqueue_processing(changes)
         else:
             # Preview persistence to keep stats in sync with metadata rows
             # that will be written for this changeset.
@@ -162,22 +260,58 @@ async def run_sources(
 
         return loaded_metadata, changes
 
+    async def _recurse_from(
+        source_actor: Actor,
+        result: AssetScanResult,
+        loaded_metadata: list[Metadata],
+        depth: int,
+    ) -> None:
+        recurse_changes = MetadataChanges(
+            asset=result.asset,
+            loaded=loaded_metadata,
+            staged=result.metadata,
+        )
+        picked = _pick_recursive_source(recurse_changes)
+        if picked is None:
+            return
+        recurse_actor, recurse_plugin = picked
+        if recurse_actor.id is None:
+            return
+        recurse_key = (
+            int(recurse_actor.id),
+            str(result.asset.namespace),
+            str(result.asset.external_id),
+        )
+        if recurse_key in recursion_visited:
+            return
+        recursion_visited.add(recurse_key)
+        await _scan_branch(
+            source_actor=recurse_actor,
+            source_plugin=recurse_plugin,
+            depth=depth + 1,
+            seed_changes=recurse_changes,
+        )
+
     async def _scan_branch(
         *,
         source_actor: Actor,
         source_plugin: SourcePlugin,
         depth: int,
         seed_changes: MetadataChanges | None = None,
-    ) -> OpStatus:
+        checkpointer: ScanCheckpointer | None = None,
+    ) -> ScanResult | None:
         if depth > max_recursion_depth:
-            return OpStatus.COMPLETED
+            return None
         if source_actor.id is not None:
             seen_assets_by_actor.setdefault(int(source_actor.id), set())
 
-        if seed_changes is None:
-            scan_result: ScanResult = await source_plugin.scan()
-        else:
+        scan_result: ScanResult
+        if seed_changes is not None:
             scan_result = await source_plugin.scan_from_asset(seed_changes)
+        elif checkpointer is not None and checkpointer.resume_cursor is not None:
+            scan_result = await source_plugin.resume_scan(checkpointer.resume_cursor)
+        else:
+            scan_result = await source_plugin.scan()
 
         if scan_result.ignored:
             stats.assets_seen += int(scan_result.ignored)
@@ -187,37 +321,21 @@ async def run_sources(
             loaded_metadata, _persisted_changes = await _persist_scan_result(
                 source_actor, result
             )
+            if depth < max_recursion_depth:
+                await _recurse_from(source_actor, result, loaded_metadata, depth)
 
-            if depth >= max_recursion_depth:
-                continue
+            if checkpointer is not None and checkpointer.due():
+                # The iterator is suspended right after `result` (whose recursion is
+                # done), so the cursor covers exactly what was persisted.
+                await _absorb_reported(source_actor, scan_result)
+                await _settle()
+                await checkpointer.checkpoint(scan_result.resume_cursor())
 
-            recurse_changes = MetadataChanges(
-                asset=result.asset,
-                loaded=loaded_metadata,
-                staged=result.metadata,
-            )
-            picked = _pick_recursive_source(recurse_changes)
-            if picked is None:
-                continue
-            recurse_actor, recurse_plugin = picked
-            if recurse_actor.id is None:
-                continue
-            recurse_key = (
-                int(recurse_actor.id),
-                str(result.asset.namespace),
-                str(result.asset.external_id),
-            )
-            if recurse_key in recursion_visited:
-                continue
-            recursion_visited.add(recurse_key)
-            await _scan_branch(
-                source_actor=recurse_actor,
-                source_plugin=recurse_plugin,
-                depth=depth + 1,
-                seed_changes=recurse_changes,
-            )
+        await _absorb_reported(source_actor, scan_result)
 
-        return scan_result.status
+        for key, value in scan_result.metrics.items():
+            source_metrics[key] = source_metrics.get(key, 0) + value
+        return scan_result
 
     for source in sources:
         if source.id is None:
@@ -236,17 +354,44 @@ async def run_sources(
         source_plugin = plugin_by_actor_id.get(int(source.id))
         if source_plugin is None:
             source_plugin = cast(SourcePlugin, await get_actor_instance(source))
-        status = await _scan_branch(
+        checkpointer = await ScanCheckpointer.open(
+            actor_id=int(source.id), changeset_id=changeset.id
+        )
+        checkpointers.append(checkpointer)
+        for seen_actor_id, seen_ids in checkpointer.session.seen_asset_ids.items():
+            seen_assets_by_actor.setdefault(seen_actor_id, set()).update(seen_ids)
+        if checkpointer.session.resumed:
+            source_metrics["scan_sessions_resumed"] = (
+                source_metrics.get("scan_sessions_resumed", 0) + 1
+            )
+        if checkpointer.already_scanned:
+            logger.info(
+                "Source {actor_id} finished scanning in an interrupted run; skipping to finalization",
+                actor_id=source.id,
+            )
+            continue
+        active_checkpointer = checkpointer
+        scan_result = await _scan_branch(
             source_actor=source,
             source_plugin=source_plugin,
             depth=0,
             seed_changes=None,
+            checkpointer=checkpointer,
         )
+        await _settle()
+        await checkpointer.mark_scanned()
+        active_checkpointer = None
+        if scan_result is None:
+            continue
+        if scan_result.incremental:
+            incremental_actor_ids.add(int(source.id))
+        if scan_result.status == OpStatus.COMPLETED and scan_result.source_state is not None:
+            source_states[str(source.id)] = scan_result.source_state
         if len(sources) == 1:
-            final_status = status
+            final_status = scan_result.status
 
     for actor_id, seen_asset_ids in seen_assets_by_actor.items():
-        if not actor_has_metadata.get(actor_id):
+        if not actor_has_metadata.get(actor_id) or actor_id in incremental_actor_ids:
             continue
         if missing_assets_policy == "delete":
             deleted_count = await asset_repo.delete_unseen_assets(
@@ -265,18 +410,35 @@ async def run_sources(
             if lost_count:
                 stats.assets_lost += lost_count
                 stats.assets_changed += lost_count
+        # Unseen assets must take the full path if they ever come back.
+        await fingerprint_repo.forget_unseen(actor_id=actor_id, seen_asset_ids=seen_asset_ids)
+
+    # Recorded last, so an interrupted scan never marks unpersisted files as unchanged.
+    await _settle()
+    for checkpointer in checkpointers:
+        await checkpointer.complete()
 
     scan_finished = time.perf_counter()
+    scan_seconds = scan_finished - scan_started
     data_payload = dict(changeset.data or {})
     data_payload["scan_metrics"] = {
-        "scan_seconds": scan_finished - scan_started,
+        "scan_seconds": scan_seconds,
+        "files_per_second": stats.assets_seen / scan_seconds if scan_seconds > 0 else None,
         "assets_seen": stats.assets_seen,
         "assets_saved": stats.assets_saved,
         "assets_added": stats.assets_added,
         "assets_changed": stats.assets_changed,
         "assets_ignored": stats.assets_ignored,
+        "assets_unchanged": stats.assets_unchanged,
         "assets_lost": stats.assets_lost,
+        **source_metrics,
     }
+    if source_states:
+        # Saved with the changeset status, so a failed run never advances source state.
+        data_payload["source_state"] = {
+            **dict(data_payload.get("source_state") or {}),
+            **source_states,
+        }
     changeset.data = data_payload
 
     return final_status
@@ -101,6 +101,10 @@ CREATE INDEX IF NOT EXISTS idx_metadata_asset_key_changeset
     ON metadata (asset_id, metadata_key_id, changeset_id);
 CREATE INDEX IF NOT EXISTS idx_metadata_key_collection
     ON metadata (metadata_key_id, value_collection_id);
+-- Lets incremental analyzers find the assets whose values of a key changed
+-- after a given changeset without scanning the whole table.
+CREATE INDEX IF NOT EXISTS idx_metadata_key_changeset
+    ON metadata (metadata_key_id, changeset_id);
 
 -- name: create_asset_indexes
 CREATE INDEX IF NOT EXISTS idx_asset_canonical_asset_id
@@ -109,3 +113,241 @@ CREATE INDEX IF NOT EXISTS idx_asset_canonical_asset_id
 -- name: create_asset_search
 CREATE VIRTUAL TABLE IF NOT EXISTS asset_search
 USING fts5(doc, tokenize='unicode61', detail='none');
+
+-- name: create_metadata_trigram_keys
+CREATE TABLE IF NOT EXISTS metadata_trigram_keys (
+    metadata_key_id INTEGER PRIMARY KEY REFERENCES metadata_registry(id) ON DELETE CASCADE
+);
+
+-- name: create_asset_fingerprints
+CREATE TABLE IF NOT EXISTS asset_fingerprints (
+    asset_id INTEGER PRIMARY KEY REFERENCES assets(id) ON DELETE CASCADE,
+    actor_id INTEGER NOT NULL REFERENCES actors(id) ON DELETE CASCADE,
+    fingerprint INTEGER NOT NULL,
+    pipeline_key INTEGER NOT NULL DEFAULT 0
+);
+
+-- name: create_asset_fingerprint_indexes
+CREATE INDEX IF NOT EXISTS idx_asset_fingerprints_actor
+    ON asset_fingerprints (actor_id);
+
+-- name: create_scan_sessions
+CREATE TABLE IF NOT EXISTS scan_sessions (
+    id INTEGER PRIMARY KEY,
+    actor_id INTEGER NOT NULL UNIQUE REFERENCES actors(id) ON DELETE CASCADE,
+    changeset_id INTEGER REFERENCES changesets(id) ON DELETE SET NULL,
+    status TEXT NOT NULL,
+    cursor JSON,
+    started_at DATETIME,
+    updated_at DATETIME
+);
+
+-- name: create_scan_session_seen
+CREATE TABLE IF NOT EXISTS scan_session_seen (
+    session_id INTEGER NOT NULL REFERENCES scan_sessions(id) ON DELETE CASCADE,
+    asset_id INTEGER NOT NULL,
+    actor_id INTEGER NOT NULL,
+    PRIMARY KEY (session_id, asset_id)
+) WITHOUT ROWID;
+
+-- name: create_source_folders
+CREATE TABLE IF NOT EXISTS source_folders (
+    actor_id INTEGER NOT NULL REFERENCES actors(id) ON DELETE CASCADE,
+    folder_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    parent_id TEXT,
+    -- Memoized paths from the root, including the folder itself; NULL until
+    -- resolved, and reset when the folder or one of its ancestors moves.
+    name_path TEXT,
+    id_path TEXT,
+    PRIMARY KEY (actor_id, folder_id)
+) WITHOUT ROWID;
+
+-- name: create_source_folder_indexes
+CREATE INDEX IF NOT EXISTS idx_source_folders_id_path
+    ON source_folders (actor_id, id_path);
+
+-- name: create_near_duplicate_signatures
+CREATE TABLE IF NOT EXISTS near_duplicate_signatures (
+    -- The analyzer actor that indexed the signature.
+    actor_id INTEGER NOT NULL REFERENCES actors(id) ON DELETE CASCADE,
+    asset_id INTEGER NOT NULL REFERENCES assets(id) ON DELETE CASCADE,
+    minhash JSON,
+    simhash INTEGER,
+    -- Set while the asset is re-indexed but its pairs are not verified yet.
+    dirty BOOLEAN NOT NULL DEFAULT 0,
+    PRIMARY KEY (actor_id, asset_id)
+) WITHOUT ROWID;
+
+-- name: create_near_duplicate_bands
+CREATE TABLE IF NOT EXISTS near_duplicate_bands (
+    actor_id INTEGER NOT NULL REFERENCES actors(id) ON DELETE CASCADE,
+    -- 'minhash' LSH band or 'simhash' block.
+    kind TEXT NOT NULL,
+    band INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    asset_id INTEGER NOT NULL REFERENCES assets(id) ON DELETE CASCADE,
+    PRIMARY KEY (actor_id, kind, band, bucket, asset_id)
+) WITHOUT ROWID;
+
+-- name: create_near_duplicate_band_indexes
+CREATE INDEX IF NOT EXISTS idx_near_duplicate_bands_asset
+    ON near_duplicate_bands (actor_id, asset_id);
+
+-- name: create_near_duplicate_pairs
+CREATE TABLE IF NOT EXISTS near_duplicate_pairs (
+    actor_id INTEGER NOT NULL REFERENCES actors(id) ON DELETE CASCADE,
+    -- Verified pair, stored once with asset_id > other_id.
+    asset_id INTEGER NOT NULL REFERENCES assets(id) ON DELETE CASCADE,
+    other_id INTEGER NOT NULL REFERENCES assets(id) ON DELETE CASCADE,
+    similarity REAL NOT NULL,
+    PRIMARY KEY (actor_id, asset_id, other_id)
+) WITHOUT ROWID;
+
+-- name: create_near_duplicate_pair_indexes
+CREATE INDEX IF NOT EXISTS idx_near_duplicate_pairs_other
+    ON near_duplicate_pairs (actor_id, other_id);
+
+-- name: create_exact_duplicate_hashes
+CREATE TABLE IF NOT EXISTS exact_duplicate_hashes (
+    -- The analyzer actor that maintains the index.
+    actor_id INTEGER NOT NULL REFERENCES actors(id) ON DELETE CASCADE,
+    asset_id INTEGER NOT NULL REFERENCES assets(id) ON DELETE CASCADE,
+    -- Current normalized hash/md5; assets without one, or with conflicting
+    -- values from different actors, have no row.
+    md5 TEXT NOT NULL,
+    -- Comma separated ids of the actors that reported the hash.
+    hash_actor_ids TEXT NOT NULL,
+    PRIMARY KEY (actor_id, asset_id)
+) WITHOUT ROWID;
+
+-- name: create_exact_duplicate_hash_indexes
+CREATE INDEX IF NOT EXISTS idx_exact_duplicate_hashes_md5
+    ON exact_duplicate_hashes (actor_id, md5);
+
+-- name: create_metadata_changeset_index
+-- Lets incremental analyzers find every asset touched after a changeset.
+CREATE INDEX IF NOT EXISTS idx_metadata_changeset
+    ON metadata (changeset_id);
+
+-- name: create_stats_current
+CREATE TABLE IF NOT EXISTS stats_current (
+    -- No foreign key: rows of deleted assets must outlive them until the
+    -- stats analyzer subtracts them from the rollups.
+    asset_id INTEGER NOT NULL,
+    metadata_key_id INTEGER NOT NULL,
+    -- The asset's source actor, 0 when it has none.
+    source_id INTEGER NOT NULL,
+    -- Values are only kept for the keys the stats analyzer aggregates.
+    value_int INTEGER,
+    value_text TEXT,
+    value_datetime DATETIME,
+    PRIMARY KEY (asset_id, metadata_key_id)
+) WITHOUT ROWID;
+
+-- name: create_stats_current_indexes
+CREATE INDEX IF NOT EXISTS idx_stats_current_int
+    ON stats_current (metadata_key_id, source_id, value_int);
+CREATE INDEX IF NOT EXISTS idx_stats_current_datetime
+    ON stats_current (metadata_key_id, source_id, value_datetime);
+
+-- name: create_stats_rollups
+CREATE TABLE IF NOT EXISTS stats_rollups (
+    source_id INTEGER NOT NULL,
+    metadata_key_id INTEGER NOT NULL,
+    -- Assets with a current value for the key.
+    asset_count INTEGER NOT NULL DEFAULT 0,
+    int_count INTEGER NOT NULL DEFAULT 0,
+    int_sum INTEGER NOT NULL DEFAULT 0,
+    int_min INTEGER,
+    int_max INTEGER,
+    datetime_min DATETIME,
+    datetime_max DATETIME,
+    PRIMARY KEY (source_id, metadata_key_id)
+) WITHOUT ROWID;
+
+-- name: create_stats_value_counts
+CREATE TABLE IF NOT EXISTS stats_value_counts (
+    source_id INTEGER NOT NULL,
+    metadata_key_id INTEGER NOT NULL,
+    value TEXT NOT NULL,
+    asset_count INTEGER NOT NULL,
+    PRIMARY KEY (source_id, metadata_key_id, value)
+) WITHOUT ROWID;
+
+-- name: create_sidecar_target_keys
+CREATE TABLE IF NOT EXISTS sidecar_target_keys (
+    -- The analyzer actor that maintains the index.
+    actor_id INTEGER NOT NULL REFERENCES actors(id) ON DELETE CASCADE,
+    -- Normalized path, file name or base name of a non-sidecar asset.
+    candidate_key TEXT NOT NULL,
+    asset_id INTEGER NOT NULL REFERENCES assets(id) ON DELETE CASCADE,
+    PRIMARY KEY (actor_id, candidate_key, asset_id)
+) WITHOUT ROWID;
+
+-- name: create_sidecar_target_key_indexes
+CREATE INDEX IF NOT EXISTS idx_sidecar_target_keys_asset
+    ON sidecar_target_keys (actor_id, asset_id);
+
+-- name: create_sidecar_lookup_keys
+CREATE TABLE IF NOT EXISTS sidecar_lookup_keys (
+    actor_id INTEGER NOT NULL REFERENCES actors(id) ON DELETE CASCADE,
+    sidecar_asset_id INTEGER NOT NULL REFERENCES assets(id) ON DELETE CASCADE,
+    -- Keys derived from the sidecar target name, tried in rank order.
+    rank INTEGER NOT NULL,
+    candidate_key TEXT NOT NULL,
+    PRIMARY KEY (actor_id, sidecar_asset_id, rank)
+) WITHOUT ROWID;
+
+-- name: create_sidecar_lookup_key_indexes
+CREATE INDEX IF NOT EXISTS idx_sidecar_lookup_keys_key
+    ON sidecar_lookup_keys (actor_id, candidate_key);
+
+-- name: create_sidecar_links
+CREATE TABLE IF NOT EXISTS sidecar_links (
+    actor_id INTEGER NOT NULL REFERENCES actors(id) ON DELETE CASCADE,
+    sidecar_asset_id INTEGER NOT NULL REFERENCES assets(id) ON DELETE CASCADE,
+    -- NULL once the asset is no longer a sidecar; the row is dropped when
+    -- the analyzer retracts its link.
+    target_name TEXT,
+    -- No foreign key: a deleted target must be noticed to relink the sidecar.
+    target_asset_id INTEGER,
+    PRIMARY KEY (actor_id, sidecar_asset_id)
+) WITHOUT ROWID;
+
+-- name: create_sidecar_link_indexes
+CREATE INDEX IF NOT EXISTS idx_sidecar_links_target
+    ON sidecar_links (actor_id, target_asset_id);
+
+-- name: create_metadata_relation_index
+CREATE INDEX IF NOT EXISTS idx_metadata_relation
+    ON metadata (value_relation_id)
+    WHERE value_relation_id IS NOT NULL;
+
+-- name: create_relation_edges
+CREATE TABLE IF NOT EXISTS relation_edges (
+    -- Current relation metadata: one row per asserting actor, kept in step
+    -- with metadata writes.
+    from_asset_id INTEGER NOT NULL REFERENCES assets(id) ON DELETE CASCADE,
+    metadata_key_id INTEGER NOT NULL,
+    to_asset_id INTEGER NOT NULL REFERENCES assets(id) ON DELETE CASCADE,
+    actor_id INTEGER NOT NULL,
+    changeset_id INTEGER NOT NULL,
+    PRIMARY KEY (from_asset_id, metadata_key_id, to_asset_id, actor_id)
+) WITHOUT ROWID;
+
+-- name: create_relation_edge_indexes
+CREATE INDEX IF NOT EXISTS idx_relation_edges_to
+    ON relation_edges (to_asset_id, metadata_key_id, from_asset_id);
+
+-- name: create_asset_canonical
+CREATE TABLE IF NOT EXISTS asset_canonical (
+    -- Resolved merge sets: one row per merged asset pointing at the root of
+    -- its set. Roots and unmerged assets have no row.
+    asset_id INTEGER PRIMARY KEY REFERENCES assets(id) ON DELETE CASCADE,
+    effective_asset_id INTEGER NOT NULL REFERENCES assets(id) ON DELETE CASCADE
+) WITHOUT ROWID;
+
+-- name: create_asset_canonical_indexes
+CREATE INDEX IF NOT EXISTS idx_asset_canonical_effective
+    ON asset_canonical (effective_asset_id, asset_id);
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from diskcache import Cache
+from loguru import logger
+
+from katalog.config import current_app_context, current_workspace
+
+
+class WorkspaceDiskCache:
+    """A diskcache under the current workspace, opened lazily per directory.
+
+    Open caches and directories that failed to initialize are tracked in the
+    app context state, so each app context opens its own caches. Reads and
+    writes degrade to misses/no-ops when the cache is unavailable.
+    """
+
+    def __init__(self, name: str, *, subdir: str, size_limit: int) -> None:
+        self.name = name
+        self.subdir = subdir
+        self.size_limit = size_limit
+
+    def _state(self) -> tuple[dict[Path, Cache], set[Path]]:
+        state = current_app_context().state
+        cache_by_dir = state.get(f"{self.name}_cache_by_dir")
+        init_failed = state.get(f"{self.name}_cache_init_failed")
+        if cache_by_dir is None:
+            cache_by_dir = {}
+            state[f"{self.name}_cache_by_dir"] = cache_by_dir
+        if init_failed is None:
+            init_failed = set()
+            state[f"{self.name}_cache_init_failed"] = init_failed
+        return cache_by_dir, init_failed
+
+    def _cache_dir(self) -> Path:
+        return current_workspace() / "cache" / self.subdir
+
+    def open(self) -> Cache | None:
+        cache_by_dir, init_failed = self._state()
+        cache_dir = self._cache_dir()
+        cached = cache_by_dir.get(cache_dir)
+        if cached is not None:
+            return cached
+        if cache_dir in init_failed:
+            return None
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            cache = Cache(str(cache_dir), size_limit=self.size_limit)
+            cache_by_dir[cache_dir] = cache
+            return cache
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(
+                "Failed to initialize {name} cache at {path}: {err}",
+                name=self.name,
+                path=cache_dir,
+                err=exc,
+            )
+            init_failed.add(cache_dir)
+            return None
+
+    def get(self, key: str) -> Any:
+        cache = self.open()
+        if cache is None:
+            return None
+        try:
+            return cache.get(key)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(
+                "{name} cache read failed key={key}: {err}",
+                name=self.name.capitalize(),
+                key=key,
+                err=exc,
+            )
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        cache = self.open()
+        if cache is None:
+            return
+        try:
+            cache.set(key, value)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(
+                "{name} cache write failed key={key}: {err}",
+                name=self.name.capitalize(),
+                key=key,
+                err=exc,
+            )
+
+    def close(self) -> None:
+        cache_by_dir, init_failed = self._state()
+        for cache_dir in list(cache_by_dir.keys()):
+            cache = cache_by_dir.pop(cache_dir, None)
+            if cache is None:
+                continue
+            try:
+                cache.close()
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(
+                    "{name} cache close failed path={path}: {err}",
+                    name=self.name.capitalize(),
+                    path=cache_dir,
+                    err=exc,
+                )
+            init_failed.discard(cache_dir)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from array import array
+from hashlib import sha256
+from typing import Final
+
+from diskcache import Cache
+
+from katalog.utils.disk_cache import WorkspaceDiskCache
+
+_MAX_CACHE_BYTES: Final[int] = 512 * 1024 * 1024  # 512 MiB
+_EMBEDDING_CACHE: Final = WorkspaceDiskCache(
+    "embedding", subdir="query_embeddings", size_limit=_MAX_CACHE_BYTES
+)
+
+
+def get_embedding_cache() -> Cache | None:
+    return _EMBEDDING_CACHE.open()
+
+
+def _cache_key(*, backend: str, model: str, dim: int | None, text: str) -> str:
+    digest = sha256(text.encode("utf-8")).hexdigest()
+    return f"{backend}:{model}:{dim or 0}:{digest}"
+
+
+def get_cached_embedding(
+    *, backend: str, model: str, dim: int | None, text: str
+) -> list[float] | None:
+    value = _EMBEDDING_CACHE.get(_cache_key(backend=backend, model=model, dim=dim, text=text))
+    if not isinstance(value, bytes):
+        return None
+    return array("d", value).tolist()
+
+
+def put_cached_embedding(
+    *, backend: str, model: str, dim: int | None, text: str, vector: list[float]
+) -> None:
+    _EMBEDDING_CACHE.set(
+        _cache_key(backend=backend, model=model, dim=dim, text=text),
+        array("d", vector).tobytes(),
+    )
+
+
+def close_embedding_caches() -> None:
+    _EMBEDDING_CACHE.close()
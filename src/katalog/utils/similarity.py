@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import Counter
+from random import Random
+from typing import Iterable, Sequence
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+SIMHASH_BITS = 64
+
+# (a, b) coefficients of the universal hash permutations, generated once per
+# signature length from a fixed seed so signatures stay comparable across runs.
+_PERMUTATIONS: dict[int, list[tuple[int, int]]] = {}
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _hash64(value: str | bytes) -> int:
+    data = value.encode("utf-8") if isinstance(value, str) else value
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+
+def shingle_hashes(tokens: Sequence[str], size: int) -> set[int]:
+    """Hash the distinct word n-grams of `tokens` (all tokens when fewer than `size`)."""
+    if not tokens:
+        return set()
+    if len(tokens) <= size:
+        return {_hash64(" ".join(tokens))}
+    return {
+        _hash64(" ".join(tokens[idx : idx + size]))
+        for idx in range(len(tokens) - size + 1)
+    }
+
+
+def _permutations(num_perm: int) -> list[tuple[int, int]]:
+    permutations = _PERMUTATIONS.get(num_perm)
+    if permutations is None:
+        rng = Random(1)
+        permutations = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+        _PERMUTATIONS[num_perm] = permutations
+    return permutations
+
+
+def minhash_signature(hashes: Iterable[int], num_perm: int) -> list[int]:
+    """MinHash signature of a set of 64-bit element hashes, as 32-bit values."""
+    values = list(hashes)
+    if not values:
+        return []
+    return [
+        min((a * value + b) % _MERSENNE_PRIME for value in values) & _MAX_HASH
+        for a, b in _permutations(num_perm)
+    ]
+
+
+def simhash(tokens: Sequence[str]) -> int:
+    """64-bit SimHash of term-frequency weighted tokens."""
+    weights = [0] * SIMHASH_BITS
+    for token, count in Counter(tokens).items():
+        value = _hash64(token)
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += count if value >> bit & 1 else -count
+    result = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            result |= 1 << bit
+    return result
+
+
+def format_simhash(value: int) -> str:
+    return f"{value:016x}"
+
+
+def parse_simhash(value: object) -> int | None:
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = int(value.strip(), 16)
+    except ValueError:
+        return None
+    return parsed if 0 <= parsed < 1 << SIMHASH_BITS else None
+
+
+def parse_minhash(value: object) -> tuple[int, ...] | None:
+    if not isinstance(value, list) or not value:
+        return None
+    if not all(isinstance(item, int) and not isinstance(item, bool) for item in value):
+        return None
+    return tuple(value)
+
+
+def minhash_similarity(left: Sequence[int], right: Sequence[int]) -> float | None:
+    """Estimated Jaccard similarity; None when the signatures are not comparable."""
+    if not left or len(left) != len(right):
+        return None
+    return sum(1 for a, b in zip(left, right) if a == b) / len(left)
+
+
+def hamming_distance(left: int, right: int) -> int:
+    return (left ^ right).bit_count()
+
+
+def _bucket(parts: Sequence[int]) -> int:
+    digest = hashlib.blake2b(
+        b"".join(int(part).to_bytes(8, "big", signed=True) for part in parts),
+        digest_size=8,
+    ).digest()
+    # Signed, so the value fits an SQLite INTEGER.
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def minhash_bands(signature: Sequence[int], bands: int) -> list[tuple[int, int]]:
+    """LSH band keys `(band, bucket)`; signatures sharing any key are candidates.
+
+    With `r = len(signature) // bands` rows per band, a pair with Jaccard
+    similarity `s` becomes a candidate with probability `1 - (1 - s**r)**bands`.
+    """
+    rows = len(signature) // bands if bands > 0 else 0
+    if rows <= 0:
+        return []
+    return [
+        (band, _bucket(signature[band * rows : (band + 1) * rows]))
+        for band in range(bands)
+    ]
+
+
+def simhash_blocks(value: int, max_distance: int) -> list[tuple[int, int]]:
+    """Split a SimHash into `max_distance + 1` blocks `(block, bits)`.
+
+    Two fingerprints within `max_distance` bits agree on at least one block
+    (pigeonhole), so exact block matches find every pair within the threshold.
+    """
+    blocks = max(1, min(SIMHASH_BITS, max_distance + 1))
+    keys: list[tuple[int, int]] = []
+    start = 0
+    for block in range(blocks):
+        width = SIMHASH_BITS // blocks + (1 if block < SIMHASH_BITS % blocks else 0)
+        keys.append((block, value >> start & ((1 << width) - 1)))
+        start += width
+    return keys
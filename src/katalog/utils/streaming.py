@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from itertools import islice
+from typing import Any, AsyncIterator, Iterator, TextIO, TypeVar
+
+T = TypeVar("T")
+
+# Characters read from a JSON file per refill of the parse buffer.
+JSON_READ_SIZE = 64 * 1024
+# Items handed from a parsing thread to the event loop per hop.
+THREAD_BATCH_SIZE = 1000
+
+_WHITESPACE = " \t\r\n"
+_NUMBER_END = _WHITESPACE + ",]}"
+
+
+async def iterate_in_thread(
+    items: Iterator[T], *, batch_size: int = THREAD_BATCH_SIZE
+) -> AsyncIterator[T]:
+    """Drain a blocking iterator from a worker thread, one batch at a time.
+
+    Only one batch is held in memory, so a parser streaming a large file keeps
+    its footprint constant while the event loop stays responsive.
+    """
+    while True:
+        batch = await asyncio.to_thread(lambda: list(islice(items, batch_size)))
+        if not batch:
+            return
+        for item in batch:
+            yield item
+
+
+class JsonStream:
+    """Pull parser over a text file that decodes one JSON value at a time.
+
+    Containers can be entered with `iter_array()` / `iter_object()` so their
+    members are decoded individually; everything else is decoded whole with
+    the stdlib decoder. Only the unread tail of the file is buffered.
+    """
+
+    def __init__(self, handle: TextIO, *, read_size: int = JSON_READ_SIZE) -> None:
+        self.handle = handle
+        self.read_size = read_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.handle.read(self.read_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ("" at EOF)."""
+        while True:
+            buffer, pos = self.buffer, self.pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Malformed JSON: expected '{char}', found '{found or 'EOF'}'")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        if not self.peek():
+            raise ValueError("Malformed JSON: unexpected end of file")
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # Most likely the value continues past the buffer; a real
+                # syntax error is re-raised once the file is exhausted.
+                if self._fill():
+                    continue
+                raise
+            # A number cut off by the buffer edge decodes as a shorter number
+            # ("2." -> 2), so it only counts once a delimiter follows it.
+            if (
+                isinstance(value, (int, float))
+                and not isinstance(value, bool)
+                and (end == len(self.buffer) or self.buffer[end] not in _NUMBER_END)
+                and self._fill()
+            ):
+                continue
+            self.pos = end
+            return value
+
+    def iter_array(self) -> Iterator[Any]:
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self._end_of_member("]"):
+                return
+
+    def iter_object(self) -> Iterator[str]:
+        """Yield each member key; the caller must consume the value before resuming."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise ValueError("Malformed JSON: object keys must be strings")
+            self.expect(":")
+            yield key
+            if self._end_of_member("}"):
+                return
+
+    def _end_of_member(self, closing: str) -> bool:
+        found = self.peek()
+        self.pos += 1
+        if found == ",":
+            return False
+        if found == closing:
+            return True
+        raise ValueError(f"Malformed JSON: expected ',' or '{closing}', found '{found or 'EOF'}'")
+
+
+def iter_json_records(
+    handle: TextIO,
+    *,
+    records_field: str | None = None,
+    records_are_map: bool = False,
+    read_size: int = JSON_READ_SIZE,
+) -> Iterator[tuple[str | None, Any]]:
+    """Stream `(external_id, record)` pairs from a JSON document.
+
+    Accepts a root array, an array (or, with `records_are_map`, an object map)
+    under the top-level `records_field`, or without a field the conventional
+    `records` / `documents` arrays. Any other root object is a single record.
+    """
+    stream = JsonStream(handle, read_size=read_size)
+    first = stream.peek()
+    if first == "[":
+        for row in stream.iter_array():
+            yield None, row
+        return
+    if first != "{":
+        payload = stream.value()
+        raise ValueError(
+            f"JSON source root must be an array or object, got {type(payload).__name__}"
+        )
+
+    # Members are only kept when no records_field is set, for the fallbacks below.
+    members: dict[str, Any] = {}
+    for key in stream.iter_object():
+        if records_field:
+            if key != records_field:
+                stream.value()
+                continue
+            found = stream.peek()
+            if found == "[":
+                for row in stream.iter_array():
+                    yield None, row
+                return
+            if records_are_map and found == "{":
+                for record_key in stream.iter_object():
+                    yield record_key, stream.value()
+                return
+            break
+        if key == "records" and stream.peek() == "[":
+            for row in stream.iter_array():
+                yield None, row
+            return
+        members[key] = stream.value()
+
+    if records_field:
+        expected = "list or object map" if records_are_map else "list"
+        raise ValueError(f"JSON records_field '{records_field}' is not a {expected}")
+    documents = members.get("documents")
+    if isinstance(documents, list):
+        for row in documents:
+            yield None, row
+        return
+    yield None, members
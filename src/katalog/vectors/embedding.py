@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import math
-from typing import Literal
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Literal
 
 
 DEFAULT_EMBEDDING_MODEL = "fast"
 EmbeddingBackend = Literal["preset", "fastembed"]
+QUERY_EMBEDDING_CACHE_SIZE = 2048
+
+QueryEmbeddingKey = tuple[int | None, str, str, int | None, str]
 
 
 class EmbeddingError(RuntimeError):
@@ -88,3 +94,142 @@ def _normalize_vector(vector: list[float]) -> list[float]:
     if norm <= 0.0:
         return vector
     return [v / norm for v in vector]
+
+
+def normalize_query_text(text: str) -> str:
+    """Normalize query text for cache keys (Unicode NFKC, collapsed whitespace)."""
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+class QueryEmbeddingCache:
+    """Process-wide LRU of query embeddings.
+
+    Concurrent lookups for the same key share one in-flight embedding call, so
+    bursts of identical queries (UI keystroke pauses, MCP retries) embed once.
+    """
+
+    def __init__(self, max_entries: int = QUERY_EMBEDDING_CACHE_SIZE) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._entries: OrderedDict[QueryEmbeddingKey, tuple[float, ...]] = OrderedDict()
+        self._inflight: dict[QueryEmbeddingKey, asyncio.Future[tuple[float, ...]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get_or_embed(
+        self,
+        key: QueryEmbeddingKey,
+        factory: Callable[[], Awaitable[list[float]]],
+    ) -> list[float]:
+        cached = self._entries.get(key)
+        if cached is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return list(cached)
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.hits += 1
+            return list(await asyncio.shield(pending))
+
+        self.misses += 1
+        future: asyncio.Future[tuple[float, ...]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[key] = future
+        try:
+            vector = tuple(await factory())
+        except BaseException as exc:
+            if not future.done():
+                future.set_exception(exc)
+                # Mark retrieved so waiter-less failures are not logged as unhandled.
+                future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        future.set_result(vector)
+        self._entries[key] = vector
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return list(vector)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+_QUERY_EMBEDDING_CACHE = QueryEmbeddingCache()
+
+
+def query_embedding_cache() -> QueryEmbeddingCache:
+    return _QUERY_EMBEDDING_CACHE
+
+
+async def embed_query_cached(
+    text: str,
+    *,
+    actor_id: int | None,
+    model: str = DEFAULT_EMBEDDING_MODEL,
+    backend: EmbeddingBackend = "preset",
+    dim: int | None = None,
+    persist: bool = False,
+) -> list[float]:
+    """Embed a search query, reusing cached vectors for repeated queries.
+
+    Uses the same embedding call as indexing so query vectors stay comparable
+    with stored points. With `persist`, vectors are also kept in the workspace
+    cache so they survive restarts.
+    """
+    normalized = normalize_query_text(text)
+    key: QueryEmbeddingKey = (
+        int(actor_id) if actor_id is not None else None,
+        str(backend),
+        str(model),
+        int(dim) if dim is not None else None,
+        normalized,
+    )
+
+    async def _embed() -> list[float]:
+        if not persist:
+            return await embed_text_kreuzberg(
+                normalized,
+                model=model,
+                backend=backend,
+                dim=dim,
+            )
+
+        from katalog.utils.embedding_cache import get_cached_embedding, put_cached_embedding
+
+        cache_key = {"backend": str(backend), "model": str(model), "dim": dim, "text": normalized}
+        vector = get_cached_embedding(**cache_key)
+        if vector is None:
+            vector = await embed_text_kreuzberg(
+                normalized,
+                model=model,
+                backend=backend,
+                dim=dim,
+            )
+            put_cached_embedding(**cache_key, vector=vector)
+        return vector
+
+    return await _QUERY_EMBEDDING_CACHE.get_or_embed(key, _embed)
+
+
+async def warm_embedding_model(
+    *,
+    model: str = DEFAULT_EMBEDDING_MODEL,
+    backend: EmbeddingBackend = "preset",
+    dim: int | None = None,
+) -> None:
+    """Load an embedding model by embedding a short probe text."""
+    await embed_text_kreuzberg("warmup", model=model, backend=backend, dim=dim)
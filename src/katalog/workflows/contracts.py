@@ -37,11 +37,27 @@ class WorkflowAssetIdsInput:
     asset_ids: list[int] = field(default_factory=list)
 
 
+@dataclass(frozen=True)
+class WorkflowSourcePathsInput:
+    """Rescan only the given paths of source actors, e.g. changes reported by a watcher.
+
+    Directories in `paths` are walked. Assets currently at or below `removed_paths`
+    are treated as missing unless the same run saw them again (a rename keeps the
+    inode, so it also keeps the asset).
+    """
+
+    kind: Literal["source_paths"] = "source_paths"
+    actor_ids: list[int] = field(default_factory=list)
+    paths: list[str] = field(default_factory=list)
+    removed_paths: list[str] = field(default_factory=list)
+
+
 WorkflowInputSpec = Union[
     WorkflowSourceActorsInput,
     WorkflowAllAssetsInput,
     WorkflowCollectionInput,
     WorkflowAssetIdsInput,
+    WorkflowSourcePathsInput,
 ]
 
 
@@ -56,6 +72,7 @@ def parse_workflow_input_payload(
             WorkflowAllAssetsInput,
             WorkflowCollectionInput,
             WorkflowAssetIdsInput,
+            WorkflowSourcePathsInput,
         ),
     ):
         return payload
@@ -77,8 +94,22 @@ def parse_workflow_input_payload(
         if not isinstance(raw_asset_ids, list):
             raise ValueError("input.asset_ids must be a list of integers")
         return WorkflowAssetIdsInput(asset_ids=[int(value) for value in raw_asset_ids])
+    if kind == "source_paths":
+        raw_actor_ids = payload.get("actor_ids") or []
+        raw_paths = payload.get("paths") or []
+        raw_removed = payload.get("removed_paths") or []
+        if not isinstance(raw_actor_ids, list):
+            raise ValueError("input.actor_ids must be a list of integers")
+        if not isinstance(raw_paths, list) or not isinstance(raw_removed, list):
+            raise ValueError("input.paths and input.removed_paths must be lists of strings")
+        return WorkflowSourcePathsInput(
+            actor_ids=[int(value) for value in raw_actor_ids],
+            paths=[str(value) for value in raw_paths],
+            removed_paths=[str(value) for value in raw_removed],
+        )
     raise ValueError(
-        "input.kind must be one of: source_actors, all_assets, collection, asset_ids"
+        "input.kind must be one of: source_actors, all_assets, collection, asset_ids, "
+        "source_paths"
     )
 
 
@@ -90,6 +121,13 @@ def workflow_input_to_payload(workflow_input: WorkflowInputSpec) -> dict[str, An
         return {"kind": "collection", "collection_id": int(workflow_input.collection_id)}
     if isinstance(workflow_input, WorkflowAssetIdsInput):
         return {"kind": "asset_ids", "asset_ids": list(workflow_input.asset_ids)}
+    if isinstance(workflow_input, WorkflowSourcePathsInput):
+        return {
+            "kind": "source_paths",
+            "actor_ids": list(workflow_input.actor_ids),
+            "paths": list(workflow_input.paths),
+            "removed_paths": list(workflow_input.removed_paths),
+        }
     return {"kind": "all_assets"}
 
 
@@ -100,6 +138,7 @@ class SourceAssetPayload:
     asset: Asset
     actor_id: int
     metadata: list[Metadata] = field(default_factory=list)
+    fingerprint: int | None = None
 
 
 @dataclass(frozen=True)
@@ -119,6 +158,15 @@ class SourceBatch:
     ignored: int = 0
     status: OpStatus = OpStatus.IN_PROGRESS
     recursion_seeds: list[RecursionSeed] = field(default_factory=list)
+    # Assets the source skipped because their fingerprint was unchanged.
+    unchanged_asset_ids: list[int] = field(default_factory=list)
+    # Assets the source reports as deleted.
+    removed_asset_ids: list[int] = field(default_factory=list)
+    # Source resume cursor covering this batch and everything before it.
+    checkpoint: dict[str, Any] | None = None
+    # Final-batch scan outcome: change-feed scan flag and state to commit.
+    incremental: bool = False
+    source_state: dict[str, Any] | None = None
 
 
 @dataclass(frozen=True)
@@ -3,12 +3,20 @@ from __future__ import annotations
 import asyncio
 from collections import deque
 from dataclasses import dataclass, field
-from typing import AsyncIterator, Protocol, Sequence, cast
+from typing import Any, AsyncIterator, Protocol, Sequence, cast
 
 from loguru import logger
 
-from katalog.constants.metadata import ASSET_LOST, COLLECTION_MEMBER, MetadataKey
+from katalog.constants.metadata import (
+    ASSET_LOST,
+    COLLECTION_MEMBER,
+    FILE_PATH,
+    FILE_SIZE,
+    TIME_MODIFIED,
+    MetadataKey,
+)
 from katalog.db.assets import get_asset_repo
+from katalog.db.fingerprints import AssetFingerprint, get_fingerprint_repo
 from katalog.db.metadata import get_metadata_repo
 from katalog.models import (
     Actor,
@@ -26,11 +34,13 @@ from katalog.models.core import OpStatus
 from katalog.plugins.registry import get_actor_instance
 from katalog.processors.base import Processor
 from katalog.processors.executors import ProcessorExecutorBundle
-from katalog.processors.runtime import process_batch_collect
+from katalog.processors.runtime import process_batch_collect, processor_pipeline_key
 from katalog.runtime.batch import get_batch_size
 from katalog.sources.base import SourcePlugin
+from katalog.sources.journal import ScanCheckpointer
 from katalog.workflows.contracts import (
     RecursionSeed,
+    SourceAssetPayload,
     SourceBatch,
     StageBatchEnvelope,
     WorkflowAllAssetsInput,
@@ -38,6 +48,7 @@ from katalog.workflows.contracts import (
     WorkflowCollectionInput,
     WorkflowInputSpec,
     WorkflowSourceActorsInput,
+    WorkflowSourcePathsInput,
 )
 from katalog.runtime.state import get_event_manager
 
@@ -64,6 +75,17 @@ class WorkflowPipelineState:
     recursion_queue: deque[RecursionSeed] = field(default_factory=deque)
     seen_assets_by_actor: dict[int, set[int]] = field(default_factory=dict)
     actor_has_seen_rows: dict[int, bool] = field(default_factory=dict)
+    pending_fingerprints: list[AssetFingerprint] = field(default_factory=list)
+    # Unchanged assets the current pipeline has now processed without errors.
+    pending_settled: list[int] = field(default_factory=list)
+    # Set for path-scoped runs, where unseen assets are not missing.
+    partial_scan: bool = False
+    removed_paths_by_actor: dict[int, list[str]] = field(default_factory=dict)
+    # Scan journal per top-level source actor, completed on finalize.
+    checkpointers: dict[int, ScanCheckpointer] = field(default_factory=dict)
+    # Actors scanned through a change feed: unseen assets are not missing.
+    incremental_actor_ids: set[int] = field(default_factory=set)
+    source_states: dict[int, dict[str, Any]] = field(default_factory=dict)
 
 
 @dataclass
@@ -73,6 +95,10 @@ class LoadedBatch:
     batch_id: int
     changes_list: list[MetadataChanges]
     existing_metadata_by_asset: dict[int, list[Metadata]]
+    # Recorded once the batch is processed and persisted, minus failed assets.
+    fingerprints: list[AssetFingerprint] = field(default_factory=list)
+    settle_asset_ids: list[int] = field(default_factory=list)
+    failed_asset_ids: set[int] = field(default_factory=set)
 
 
 class LoadStage(Protocol):
@@ -126,17 +152,24 @@ class SourceLoadStage:
         source_actors: Sequence[Actor],
         settings: WorkflowPipelineSettings,
         missing_assets_policy: str,
+        processor_pipeline: ProcessorPipeline = (),
+        always_process: bool = False,
     ) -> None:
         self.changeset = changeset
         self.source_actors = [a for a in source_actors if a.id is not None and not a.disabled]
         self.settings = settings
         self.missing_assets_policy = missing_assets_policy
+        self.processor_pipeline = processor_pipeline
+        self.always_process = always_process
+        self.pipeline_key = processor_pipeline_key(processor_pipeline)
         self.state = WorkflowPipelineState()
         self.asset_repo = get_asset_repo()
         self.metadata_repo = get_metadata_repo()
+        self.fingerprint_repo = get_fingerprint_repo()
         self._actors_by_id: dict[int, Actor] = {}
         self._plugins_by_actor_id: dict[int, SourcePlugin] = {}
         self._data_reader_resolver = SourceDataReaderResolver(self._plugins_by_actor_id)
+        self._active_checkpointer: ScanCheckpointer | None = None
 
     async def _prepare_sources(self) -> None:
         """Resolve and readiness-check all source plugins participating in this run."""
@@ -156,6 +189,52 @@ class SourceLoadStage:
             self.state.seen_assets_by_actor.setdefault(actor_id, set())
             self.state.actor_has_seen_rows.setdefault(actor_id, False)
 
+    def _mark_seen(self, actor_id: int, asset_ids: Sequence[int]) -> None:
+        self.state.seen_assets_by_actor.setdefault(actor_id, set()).update(asset_ids)
+        self.state.actor_has_seen_rows[actor_id] = True
+        if self._active_checkpointer is not None:
+            self._active_checkpointer.mark_seen(actor_id, asset_ids)
+
+    async def _open_checkpointer(self, actor_id: int) -> ScanCheckpointer:
+        """Open the actor's scan journal and fold in what an interrupted run already saw."""
+        checkpointer = await ScanCheckpointer.open(
+            actor_id=actor_id, changeset_id=self.changeset.id
+        )
+        self.state.checkpointers[actor_id] = checkpointer
+        for seen_actor_id, seen_ids in checkpointer.session.seen_asset_ids.items():
+            self.state.seen_assets_by_actor.setdefault(seen_actor_id, set()).update(seen_ids)
+            self.state.actor_has_seen_rows[seen_actor_id] = True
+        return checkpointer
+
+    async def _checkpoint(self, cursor: dict[str, Any] | None, *, force: bool = False) -> None:
+        checkpointer = self._active_checkpointer
+        if checkpointer is None or not (force or checkpointer.due()):
+            return
+        # Everything produced so far is persisted, so its fingerprints can be trusted.
+        await self._flush_fingerprints()
+        await checkpointer.checkpoint(cursor)
+
+    def _accept_processed(self, batch: LoadedBatch) -> None:
+        """Queue fingerprints of a processed and persisted batch, except failed assets.
+
+        A failed asset keeps its previous fingerprint, so the next scan retries it.
+        """
+        failed = batch.failed_asset_ids
+        self.state.pending_fingerprints.extend(
+            entry for entry in batch.fingerprints if entry.asset_id not in failed
+        )
+        self.state.pending_settled.extend(
+            asset_id for asset_id in batch.settle_asset_ids if asset_id not in failed
+        )
+
+    async def _flush_fingerprints(self) -> None:
+        await self.fingerprint_repo.record(self.state.pending_fingerprints)
+        self.state.pending_fingerprints.clear()
+        await self.fingerprint_repo.settle(
+            self.state.pending_settled, pipeline_key=self.pipeline_key
+        )
+        self.state.pending_settled.clear()
+
     def _pick_recursive_source(self, changes: MetadataChanges) -> tuple[Actor, SourcePlugin] | None:
         """Pick the highest-scoring source that can recurse from current asset state."""
         candidates: list[tuple[int, int]] = []
@@ -184,11 +263,16 @@ class SourceLoadStage:
 
         changes_list: list[MetadataChanges] = []
         existing_by_asset: dict[int, list[Metadata]] = {}
+        fingerprints: list[AssetFingerprint] = []
+        settle_asset_ids: list[int] = []
 
+        removed_paths = self.state.removed_paths_by_actor.get(int(source_actor.id or 0))
         for payload in source_batch.items:
             stats.assets_seen += 1
             stats.assets_saved += 1
 
+            if removed_paths:
+                await self._release_reused_identity(payload, removed_paths)
             was_created = await self.asset_repo.save_record(
                 payload.asset,
                 changeset=self.changeset,
@@ -215,8 +299,16 @@ class SourceLoadStage:
             asset_id = payload.asset.id
             if asset_id is not None:
                 existing_by_asset[int(asset_id)] = loaded_metadata
-                self.state.seen_assets_by_actor.setdefault(actor_id, set()).add(int(asset_id))
-                self.state.actor_has_seen_rows[actor_id] = True
+                self._mark_seen(actor_id, [int(asset_id)])
+                if payload.fingerprint is not None:
+                    fingerprints.append(
+                        AssetFingerprint(
+                            actor_id=actor_id,
+                            asset_id=int(asset_id),
+                            fingerprint=payload.fingerprint,
+                            pipeline_key=self.pipeline_key,
+                        )
+                    )
 
             if depth < self.settings.max_recursion_depth:
                 picked = self._pick_recursive_source(changes)
@@ -234,6 +326,34 @@ class SourceLoadStage:
         if source_batch.ignored:
             stats.assets_seen += int(source_batch.ignored)
             stats.assets_ignored += int(source_batch.ignored)
+        if source_batch.unchanged_asset_ids:
+            actor_id = int(source_actor.id or 0)
+            unchanged = len(source_batch.unchanged_asset_ids)
+            stats.assets_seen += unchanged
+            stats.assets_unchanged += unchanged
+            self._mark_seen(actor_id, source_batch.unchanged_asset_ids)
+            # Unchanged for the source, but not necessarily processed by this pipeline.
+            unprocessed = await self._unprocessed(source_batch.unchanged_asset_ids)
+            if unprocessed:
+                for asset in await self.asset_repo.list_rows(order_by="id", id__in=unprocessed):
+                    loaded_metadata = list(
+                        await self.asset_repo.load_metadata(asset, include_removed=True)
+                    )
+                    changes_list.append(
+                        self._build_changes(
+                            asset=asset, loaded_metadata=loaded_metadata, staged_metadata=[]
+                        )
+                    )
+                    existing_by_asset[int(asset.id or 0)] = loaded_metadata
+                settle_asset_ids.extend(unprocessed)
+        if source_batch.removed_asset_ids:
+            await self._apply_missing(
+                int(source_actor.id or 0), sorted(set(source_batch.removed_asset_ids)), stats
+            )
+        if source_batch.incremental:
+            self.state.incremental_actor_ids.add(int(source_actor.id or 0))
+        if source_batch.source_state is not None:
+            self.state.source_states[int(source_actor.id or 0)] = source_batch.source_state
 
         batch_id = self.state.next_batch_id
         self.state.next_batch_id += 1
@@ -241,7 +361,68 @@ class SourceLoadStage:
             batch_id=batch_id,
             changes_list=changes_list,
             existing_metadata_by_asset=existing_by_asset,
+            fingerprints=fingerprints,
+            settle_asset_ids=settle_asset_ids,
+        )
+
+    async def _unprocessed(self, asset_ids: Sequence[int]) -> list[int]:
+        """Return the unchanged assets the configured pipeline still has to process."""
+        if not self.processor_pipeline:
+            return []
+        if self.always_process:
+            return sorted(set(asset_ids))
+        settled = await self.fingerprint_repo.settled(asset_ids, pipeline_key=self.pipeline_key)
+        return sorted(set(asset_ids) - settled)
+
+    async def _release_reused_identity(
+        self, payload: SourceAssetPayload, removed_paths: list[str]
+    ) -> None:
+        """Split a new file from a removed asset whose external id it inherited.
+
+        Filesystem ids are inode based and a freed inode is reused right away, so
+        a file created after a delete can look like a rename of the deleted one.
+        It is taken as a rename only if the old path was reported removed and
+        size and modification time, which a rename keeps, still match.
+        Otherwise the old asset releases its external id and stays behind at its
+        removed path for `_finalize_removed_paths`.
+        """
+        asset = payload.asset
+        if asset.id is not None:
+            return
+        existing = await self.asset_repo.get_or_none(
+            namespace=asset.namespace, external_id=asset.external_id
+        )
+        if existing is None or existing.id is None:
+            return
+        loaded = await self.asset_repo.load_metadata(existing, include_removed=False)
+        tracked = (FILE_PATH, FILE_SIZE, TIME_MODIFIED)
+        latest: dict[MetadataKey, Metadata] = {}
+        for entry in loaded:
+            if entry.actor_id != asset.actor_id or entry.key not in tracked:
+                continue
+            current = latest.get(entry.key)
+            if current is None or int(entry.changeset_id or 0) >= int(current.changeset_id or 0):
+                latest[entry.key] = entry
+        staged = {entry.key: entry for entry in payload.metadata if entry.key in tracked}
+        old_path = latest.get(FILE_PATH)
+        new_path = staged.get(FILE_PATH)
+        if old_path is None or new_path is None or old_path.value == new_path.value:
+            return
+        if not any(_path_is_within(str(old_path.value), path) for path in removed_paths):
+            return
+        if all(
+            key in latest and key in staged
+            and latest[key].fingerprint() == staged[key].fingerprint()
+            for key in (FILE_SIZE, TIME_MODIFIED)
+        ):
+            return
+        logger.info(
+            "Inode reused by {new_path}; keeping asset {asset_id} at removed path {old_path}",
+            new_path=new_path.value,
+            asset_id=existing.id,
+            old_path=old_path.value,
         )
+        await self.asset_repo.release_external_id(int(existing.id))
 
     def _build_changes(
         self,
@@ -272,6 +453,10 @@ class SourceLoadStage:
             async for batch in self._produce_from_asset_ids(workflow_input.asset_ids):
                 yield batch
             return
+        if isinstance(workflow_input, WorkflowSourcePathsInput):
+            async for batch in self._produce_from_source_paths(workflow_input):
+                yield batch
+            return
         if not isinstance(workflow_input, WorkflowSourceActorsInput):
             raise NotImplementedError(f"Unsupported workflow input type: {type(workflow_input)}")
 
@@ -289,12 +474,32 @@ class SourceLoadStage:
             plugin = self._plugins_by_actor_id.get(source_id)
             if plugin is None:
                 continue
-            async for source_batch in plugin.produce_batches(batch_size=self.settings.batch_size):
-                yield await self._hydrate_source_batch(
+            checkpointer = await self._open_checkpointer(source_id)
+            if checkpointer.already_scanned:
+                logger.info(
+                    "Source {actor_id} finished scanning in an interrupted run; skipping to finalization",
+                    actor_id=source_id,
+                )
+                continue
+            self._active_checkpointer = checkpointer
+            cursor = checkpointer.resume_cursor
+            async for source_batch in plugin.produce_batches(
+                batch_size=self.settings.batch_size,
+                resume_from=cursor,
+            ):
+                batch = await self._hydrate_source_batch(
                     source_actor=source_actor,
                     source_batch=source_batch,
                     depth=0,
                 )
+                yield batch
+                # Back here only after the batch went through process and persist.
+                self._accept_processed(batch)
+                cursor = source_batch.checkpoint
+                await self._checkpoint(cursor)
+            await self._checkpoint(cursor, force=True)
+            await checkpointer.mark_scanned()
+            self._active_checkpointer = None
 
         while self.state.recursion_queue:
             seed = self.state.recursion_queue.popleft()
@@ -308,11 +513,42 @@ class SourceLoadStage:
                 seed,
                 batch_size=self.settings.batch_size,
             ):
-                yield await self._hydrate_source_batch(
+                batch = await self._hydrate_source_batch(
                     source_actor=recurse_actor,
                     source_batch=source_batch,
                     depth=seed.depth,
                 )
+                yield batch
+                self._accept_processed(batch)
+
+    async def _produce_from_source_paths(
+        self, workflow_input: WorkflowSourcePathsInput
+    ) -> AsyncIterator[LoadedBatch]:
+        await self._prepare_sources()
+        self.state.partial_scan = True
+        selected_actor_ids = set(int(actor_id) for actor_id in workflow_input.actor_ids)
+        for source_actor in self.source_actors:
+            source_id = int(source_actor.id or 0)
+            if selected_actor_ids and source_id not in selected_actor_ids:
+                continue
+            plugin = self._plugins_by_actor_id.get(source_id)
+            if plugin is None:
+                continue
+            if workflow_input.removed_paths:
+                self.state.removed_paths_by_actor[source_id] = list(workflow_input.removed_paths)
+            if not workflow_input.paths:
+                continue
+            async for source_batch in plugin.produce_path_batches(
+                workflow_input.paths,
+                batch_size=self.settings.batch_size,
+            ):
+                batch = await self._hydrate_source_batch(
+                    source_actor=source_actor,
+                    source_batch=source_batch,
+                    depth=0,
+                )
+                yield batch
+                self._accept_processed(batch)
 
     async def _hydrate_db_assets_batch(self, assets: list[Asset]) -> LoadedBatch:
         """Build one loaded batch from already-persisted asset rows."""
@@ -394,14 +630,29 @@ class SourceLoadStage:
                 yield await self._hydrate_db_assets_batch(assets)
 
     async def finalize(self) -> None:
-        """Apply missing-assets policy after scan completion per source actor."""
+        """Apply missing-assets policy and store scan fingerprints per source actor."""
         stats = self.changeset.stats
         if stats is None:
             stats = ChangesetStats()
             self.changeset.stats = stats
+        if self.state.partial_scan:
+            await self._finalize_removed_paths(stats)
+            await self._flush_fingerprints()
+            return
+        resumed = any(cp.session.resumed for cp in self.state.checkpointers.values())
         for actor_id, seen_ids in self.state.seen_assets_by_actor.items():
             if not self.state.actor_has_seen_rows.get(actor_id):
                 continue
+            if actor_id in self.state.incremental_actor_ids:
+                continue
+            if resumed and actor_id not in self.state.checkpointers:
+                # Recursion seeds are not journaled, so after a resume an actor reached
+                # only through recursion may not have been seen in full.
+                logger.info(
+                    "Skipping missing-assets policy for actor {actor_id} in resumed scan",
+                    actor_id=actor_id,
+                )
+                continue
             if self.missing_assets_policy == "delete":
                 deleted = await self.asset_repo.delete_unseen_assets(
                     actor_ids=[actor_id],
@@ -419,6 +670,55 @@ class SourceLoadStage:
                 if lost:
                     stats.assets_lost += lost
                     stats.assets_changed += lost
+            # Unseen assets must take the full path if they ever come back.
+            await self.fingerprint_repo.forget_unseen(actor_id=actor_id, seen_asset_ids=seen_ids)
+        # Batches are persisted by now, so the recorded fingerprints are safe to trust.
+        await self._flush_fingerprints()
+        if self.state.source_states:
+            # Saved with the changeset status, so a failed run never advances source state.
+            data = dict(self.changeset.data or {})
+            data["source_state"] = {
+                **dict(data.get("source_state") or {}),
+                **{str(actor_id): state for actor_id, state in self.state.source_states.items()},
+            }
+            self.changeset.data = data
+        for checkpointer in self.state.checkpointers.values():
+            await checkpointer.complete()
+
+    async def _finalize_removed_paths(self, stats: ChangesetStats) -> None:
+        """Apply the missing-assets policy to assets whose path was reported removed."""
+        for actor_id, removed_paths in self.state.removed_paths_by_actor.items():
+            candidates = await self.asset_repo.list_asset_ids_for_paths(
+                actor_id=actor_id,
+                paths=removed_paths,
+            )
+            # A renamed file keeps its inode and was seen again under the new path.
+            seen_ids = self.state.seen_assets_by_actor.get(actor_id, set())
+            missing = [asset_id for asset_id in candidates if asset_id not in seen_ids]
+            if missing:
+                await self._apply_missing(actor_id, missing, stats)
+
+    async def _apply_missing(
+        self, actor_id: int, asset_ids: list[int], stats: ChangesetStats
+    ) -> None:
+        """Mark lost (or delete) assets known to be gone, per the missing-assets policy."""
+        await self.fingerprint_repo.forget(asset_ids)
+        if self.missing_assets_policy == "delete":
+            affected = await self.asset_repo.delete_assets(asset_ids)
+        else:
+            affected = await self.asset_repo.mark_assets_lost(
+                changeset=self.changeset,
+                actor_id=actor_id,
+                asset_ids=asset_ids,
+            )
+        stats.assets_lost += affected
+        stats.assets_changed += affected
+
+
+def _path_is_within(path: str, root: str) -> bool:
+    root = root.rstrip("/") or "/"
+    prefix = root if root == "/" else f"{root}/"
+    return path == root or path.startswith(prefix)
 
 
 class ProcessorPipelineStage:
@@ -445,6 +745,7 @@ class ProcessorPipelineStage:
             changes_batch=batch.changes_list,
             executors=self.executors,
             force_run=self.always_process,
+            failed_asset_ids=batch.failed_asset_ids,
         )
         return batch
 
@@ -502,6 +803,8 @@ class WorkflowPipelineRunner:
             source_actors=source_actors,
             settings=self.settings,
             missing_assets_policy=missing_assets_policy,
+            processor_pipeline=processor_pipeline,
+            always_process=always_process,
         )
         process_stage: ProcessStage = self._process_stage_factory(
             changeset=changeset,
@@ -2,21 +2,20 @@ from __future__ import annotations
 
 import asyncio
 import pathlib
-import traceback
 from typing import Any
 
 from loguru import logger
 
-from katalog.analyzers.base import AnalyzerScope
-from katalog.analyzers.runtime import do_run_analyzer
+from katalog.analyzers.scheduler import run_scheduled_analyzers
 from katalog.api.actors import ActorCreate, create_actor
 from katalog.api.helpers import actor_identity_key
+from katalog.config import current_app_context
 from katalog.constants.metadata import COLLECTION_MEMBER
 from katalog.db.actors import get_actor_repo
 from katalog.db.assets import get_asset_repo
 from katalog.db.changesets import get_changeset_repo
 from katalog.db.sqlspec.query_metadata_registry import sync_metadata_registry
-from katalog.models import Actor, ActorType, OpStatus
+from katalog.models import Actor, ActorType, Changeset, OpStatus
 from katalog.models.query import AssetFilter, AssetQuery
 from katalog.plugins.config_metadata import (
     collect_config_metadata_definitions,
@@ -25,6 +24,7 @@ from katalog.plugins.config_metadata import (
 from katalog.plugins.registry import get_plugin_class
 from katalog.plugins.registry import get_actor_instance
 from katalog.processors.runtime import sort_processors
+from katalog.runtime.fts_maintenance import fts_bulk_ingest
 from katalog.runtime.state import get_running_changesets
 from katalog.workflows.contracts import WorkflowInputSpec, workflow_input_to_payload
 from katalog.workflows.pipeline import WorkflowPipelineRunner, WorkflowPipelineSettings
@@ -250,39 +250,49 @@ async def _resolve_workflow_actors(
     return resolved
 
 
-async def _run_workflow_analyzers(analyzers: list[Actor]) -> list[WorkflowChangesetResult]:
-    if not analyzers:
-        return []
-    changeset_db = get_changeset_repo()
-    analyzer_changesets: list[WorkflowChangesetResult] = []
-    for analyzer in analyzers:
-        if analyzer.id is None:
-            continue
-        changeset = await changeset_db.begin(
-            message=f"Analyzer run: {analyzer.name}",
-            actors=[analyzer],
-            status=OpStatus.IN_PROGRESS,
-        )
-        try:
-            await do_run_analyzer(
-                analyzer,
-                changeset=changeset,
-                scope=AnalyzerScope.all(),
-            )
-            await changeset.finalize(status=OpStatus.COMPLETED)
-        except Exception as exc:  # noqa: BLE001
-            logger.exception(
-                "Workflow analyzer failed analyzer_id={analyzer_id}",
-                analyzer_id=analyzer.id,
+def _workflow_analyzer_tasks() -> set[asyncio.Task]:
+    return current_app_context().state.setdefault("workflow_analyzer_tasks", set())
+
+
+async def wait_for_workflow_analyzers(*, cancel: bool = False) -> None:
+    """Wait for background analyzer runs of started workflows, cancelling them first if asked.
+
+    Each run holds its own changeset open, so a new changeset cannot begin until
+    it is done.
+    """
+
+    tasks = list(_workflow_analyzer_tasks())
+    if not tasks:
+        return
+    if cancel:
+        for task in tasks:
+            task.cancel()
+    else:
+        logger.info("Waiting for {count} background analyzer run(s)", count=len(tasks))
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _schedule_workflow_analyzers(changeset: Changeset, analyzers: list[Actor]) -> None:
+    """Run scheduled analyzers in the background once a started workflow completed."""
+
+    if changeset.status != OpStatus.COMPLETED:
+        return
+    tasks = _workflow_analyzer_tasks()
+    task = asyncio.create_task(run_scheduled_analyzers(analyzers, trigger=changeset))
+    tasks.add(task)
+
+    def _done(_task: asyncio.Task) -> None:
+        tasks.discard(_task)
+        if _task.cancelled():
+            return
+        exc = _task.exception()
+        if exc is not None:
+            logger.opt(exception=exc).error(
+                "Scheduled analyzers failed changeset_id={changeset_id}",
+                changeset_id=changeset.id,
             )
-            data = dict(changeset.data or {})
-            data["error_message"] = str(exc)
-            data["error_traceback"] = traceback.format_exc()
-            changeset.data = data
-            await changeset.finalize(status=OpStatus.ERROR)
-            raise
-        analyzer_changesets.append(WorkflowChangesetResult.from_changeset(changeset))
-    return analyzer_changesets
+
+    task.add_done_callback(_done)
 
 
 def _selected_sources_for_input(
@@ -338,6 +348,9 @@ async def _estimate_total_assets(
             include_lost_assets=True,
         )
         return await get_asset_repo().count_assets_for_query(query=query)
+    if getattr(workflow_input, "kind", None) == "source_paths":
+        # Directories are walked, so the path count is not an asset count.
+        return None
     if getattr(workflow_input, "kind", None) == "all_assets":
         query = AssetQuery(include_lost_assets=True)
         return await get_asset_repo().count_assets_for_query(query=query)
@@ -373,10 +386,6 @@ async def run_workflow_file(
     source_actors = [a for a in actors if a.type == ActorType.SOURCE and not a.disabled]
     processor_actors = [a for a in actors if a.type == ActorType.PROCESSOR and not a.disabled]
     analyzer_actors = [a for a in actors if a.type == ActorType.ANALYZER and not a.disabled]
-    if analyzer_actors:
-        logger.warning(
-            "Workflow analyzers are currently out of scope for the modular pipeline runtime; analyzers will be skipped."
-        )
 
     processor_ids = [int(actor.id) for actor in processor_actors if actor.id is not None]
     if processor_ids:
@@ -400,6 +409,7 @@ async def run_workflow_file(
     )
     changeset_db = get_changeset_repo()
     changeset_actors = [*source_actors, *pipeline_actors]
+    await wait_for_workflow_analyzers()
     changeset = await changeset_db.begin(
         message=f"Workflow run: {spec.name}",
         actors=changeset_actors,
@@ -420,17 +430,24 @@ async def run_workflow_file(
         else WorkflowPipelineSettings()
     )
     runner = WorkflowPipelineRunner(settings=settings)
-    status = await runner.run(
-        changeset=changeset,
-        workflow_input=effective_workflow_input,
-        source_actors=source_actors,
-        processor_pipeline=pipeline,
-        missing_assets_policy=spec.missing_assets_policy,
-        always_process=effective_always_process,
-        expected_total_assets=expected_total_assets,
-    )
+    async with fts_bulk_ingest():
+        status = await runner.run(
+            changeset=changeset,
+            workflow_input=effective_workflow_input,
+            source_actors=source_actors,
+            processor_pipeline=pipeline,
+            missing_assets_policy=spec.missing_assets_policy,
+            always_process=effective_always_process,
+            expected_total_assets=expected_total_assets,
+        )
     await changeset.finalize(status=status)
 
+    analyzer_results: list[WorkflowChangesetResult] = []
+    if analyzer_actors and status == OpStatus.COMPLETED:
+        analyzer_changeset = await run_scheduled_analyzers(analyzer_actors, trigger=changeset)
+        if analyzer_changeset is not None:
+            analyzer_results.append(WorkflowChangesetResult.from_changeset(analyzer_changeset))
+
     source_results: list[WorkflowChangesetResult]
     processor_result: WorkflowChangesetResult | None
     if processor_actors:
@@ -439,7 +456,6 @@ async def run_workflow_file(
     else:
         source_results = [WorkflowChangesetResult.from_changeset(changeset)]
         processor_result = None
-    analyzer_results: list[WorkflowChangesetResult] = []
 
     return WorkflowRunResult.build(
         workflow_file=spec.file_path,
@@ -470,10 +486,6 @@ async def start_workflow_file(
     source_actors = [a for a in actors if a.type == ActorType.SOURCE and not a.disabled]
     processor_actors = [a for a in actors if a.type == ActorType.PROCESSOR and not a.disabled]
     analyzer_actors = [a for a in actors if a.type == ActorType.ANALYZER and not a.disabled]
-    if analyzer_actors:
-        logger.warning(
-            "Workflow analyzers are currently out of scope for the modular pipeline runtime; analyzers will be skipped."
-        )
 
     processor_ids = [int(actor.id) for actor in processor_actors if actor.id is not None]
     if processor_ids:
@@ -497,6 +509,7 @@ async def start_workflow_file(
     )
     changeset_db = get_changeset_repo()
     changeset_actors = [*source_actors, *pipeline_actors]
+    await wait_for_workflow_analyzers()
     changeset = await changeset_db.begin(
         message=f"Workflow run: {spec.name}",
         actors=changeset_actors,
@@ -522,15 +535,16 @@ async def start_workflow_file(
     running_changesets[changeset.id] = changeset
 
     async def _run_pipeline() -> OpStatus:
-        return await runner.run(
-            changeset=changeset,
-            workflow_input=effective_workflow_input,
-            source_actors=source_actors,
-            processor_pipeline=pipeline,
-            missing_assets_policy=spec.missing_assets_policy,
-            always_process=effective_always_process,
-            expected_total_assets=expected_total_assets,
-        )
+        async with fts_bulk_ingest():
+            return await runner.run(
+                changeset=changeset,
+                workflow_input=effective_workflow_input,
+                source_actors=source_actors,
+                processor_pipeline=pipeline,
+                missing_assets_policy=spec.missing_assets_policy,
+                always_process=effective_always_process,
+                expected_total_assets=expected_total_assets,
+            )
 
     task = changeset.start_operation(_run_pipeline)
 
@@ -543,6 +557,8 @@ async def start_workflow_file(
             pass
         finally:
             running_changesets.pop(changeset.id, None)
+        if analyzer_actors and not _task.cancelled() and _task.exception() is None:
+            _schedule_workflow_analyzers(changeset, analyzer_actors)
 
     task.add_done_callback(_cleanup)
 
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import katalog.processors.kreuzberg_document_extract as extract_module
+from katalog.models import Actor, ActorType, Asset, ChangesetStats, MetadataChanges, OpStatus
+from katalog.processors.kreuzberg_document_extract import KreuzbergDocumentExtractProcessor
+from tests.utils.fakes import MemoryAccessor
+
+
+class FakeDoc:
+    def __init__(self, content: str) -> None:
+        self.content = content
+        self.mime_type = "text/plain"
+        self.detected_languages = None
+        self.chunks = None
+
+    def get_page_count(self) -> int:
+        return 0
+
+    def get_chunk_count(self) -> int:
+        return 0
+
+    def get_detected_language(self) -> str | None:
+        return None
+
+    def get_metadata_field(self, field_name: str) -> Any | None:
+        _ = field_name
+        return None
+
+
+def make_changes(asset_id: int, payload: bytes) -> MetadataChanges:
+    asset = Asset(
+        id=asset_id,
+        actor_id=1,
+        namespace="test",
+        external_id=f"cid-{asset_id}",
+        canonical_uri=f"uri://file/{asset_id}",
+    )
+
+    async def fake_get_data_reader(key, changes):
+        return MemoryAccessor(payload)
+
+    object.__setattr__(asset, "get_data_reader", fake_get_data_reader)
+    return MetadataChanges(asset=asset, loaded=[])
+
+
+@pytest.fixture
+def calls(monkeypatch) -> list[tuple[str, Any]]:
+    recorded: list[tuple[str, Any]] = []
+
+    async def fake_batch_extract_bytes(data_list, mime_types, config=None):
+        recorded.append(("batch_bytes", len(data_list)))
+        return [FakeDoc(bytes(data).decode()) for data in data_list]
+
+    async def fake_extract_file(path, mime_type=None, config=None):
+        content = Path(path).read_bytes()
+        recorded.append(("file", (len(content), config.extraction_timeout_secs)))
+        return FakeDoc(content[:10].decode())
+
+    async def fake_extract_bytes(data, mime_type, config=None):
+        recorded.append(("bytes", len(data)))
+        return FakeDoc(bytes(data).decode())
+
+    monkeypatch.setattr(extract_module, "batch_extract_bytes", fake_batch_extract_bytes)
+    monkeypatch.setattr(extract_module, "extract_file", fake_extract_file)
+    monkeypatch.setattr(extract_module, "extract_bytes", fake_extract_bytes)
+    return recorded
+
+
+@pytest.mark.asyncio
+async def test_run_batch_groups_small_and_spools_large(db_session, calls):
+    _ = db_session
+    processor = KreuzbergDocumentExtractProcessor(
+        actor=Actor(id=1, name="p", plugin_id="p", type=ActorType.PROCESSOR),
+        batch_max_files=2,
+        large_file_bytes=64,
+        oversized_file_bytes=128,
+        oversized_timeout_secs=7,
+        spool_chunk_bytes=16,
+    )
+    batch = [
+        make_changes(1, b"small one"),
+        make_changes(2, b"small two"),
+        make_changes(3, b"small three"),
+        make_changes(4, b"L" * 100),
+        make_changes(5, b"O" * 200),
+    ]
+
+    results = await processor.run_batch(batch)
+
+    assert [result.status for result in results] == [OpStatus.COMPLETED] * 5
+    assert ("batch_bytes", 2) in calls
+    assert ("bytes", len(b"small three")) in calls
+    # Large documents are spooled and run one at a time; oversized get the timeout config.
+    assert ("file", (100, None)) in calls
+    assert ("file", (200, 7)) in calls
+
+    small, large, oversized = results[0].stats, results[3].stats, results[4].stats
+    assert small is not None and large is not None and oversized is not None
+    assert small["batch_size"] == 2
+    assert small["buffered_bytes"] == len(b"small one")
+    assert large["spooled"] == 1 and large["buffered_bytes"] == 0
+    assert large["input_bytes"] == 100
+    assert oversized["oversized"] == 1
+
+
+@pytest.mark.asyncio
+async def test_run_batch_skips_files_above_max_size(db_session, calls):
+    _ = db_session
+    processor = KreuzbergDocumentExtractProcessor(
+        actor=Actor(id=1, name="p", plugin_id="p", type=ActorType.PROCESSOR),
+        max_file_bytes=32,
+        spool_chunk_bytes=16,
+    )
+
+    results = await processor.run_batch([make_changes(1, b"x" * 100)])
+
+    assert results[0].status == OpStatus.SKIPPED
+    assert "max_file_bytes" in (results[0].message or "")
+    assert calls == []
+
+
+def test_changeset_stats_aggregates_processor_stats():
+    stats = ChangesetStats()
+    stats.record_processor_stats("proc", {"duration_ms": 5, "input_bytes": 10})
+    stats.record_processor_stats("proc", {"duration_ms": 15, "input_bytes": 4})
+
+    assert stats.processor_stats["proc"] == {
+        "results": 2,
+        "duration_ms_total": 20.0,
+        "duration_ms_max": 15.0,
+        "input_bytes_total": 14.0,
+        "input_bytes_max": 10.0,
+    }
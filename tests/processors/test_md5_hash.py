@@ -127,3 +127,4 @@ async def test_run_computes_expected_hash():
     assert len(result.metadata) == 1
     metadata = result.metadata[0]
     assert metadata.value_text == hashlib.md5(payload).hexdigest()
+    assert result.stats == {"bytes_read": len(payload)}
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import pytest
+
+from katalog.constants.metadata import FILE_SIZE, HASH_SAMPLE
+from katalog.models import Actor, ActorType, Asset, MetadataChanges, make_metadata
+from katalog.processors.sample_hash import SampleHashProcessor, sample_ranges
+from tests.utils.fakes import MemoryAccessor
+
+
+def _changes(payload: bytes) -> MetadataChanges:
+    asset = Asset(
+        id=1,
+        actor_id=1,
+        namespace="test",
+        external_id="cid",
+        canonical_uri="uri://file",
+    )
+
+    async def fake_get_data_reader(key, changes):  # noqa: ANN001
+        return MemoryAccessor(payload)
+
+    object.__setattr__(asset, "get_data_reader", fake_get_data_reader)
+    size = make_metadata(FILE_SIZE, len(payload), actor_id=1)
+    size.changeset_id = 1
+    return MetadataChanges(asset=asset, loaded=[size])
+
+
+async def _sample_hash(payload: bytes, sample_size: int = 4) -> tuple[str, dict[str, float]]:
+    processor = SampleHashProcessor(
+        actor=Actor(id=2, name="p", plugin_id="p", type=ActorType.PROCESSOR),
+        sample_size=sample_size,
+    )
+    result = await processor.run(_changes(payload))
+    [metadata] = result.metadata
+    assert metadata.key == HASH_SAMPLE
+    return str(metadata.value_text), result.stats or {}
+
+
+def test_sample_ranges_cover_small_files_fully():
+    assert sample_ranges(0, 4) == []
+    assert sample_ranges(12, 4) == [(0, 12)]
+    assert sample_ranges(20, 4) == [(0, 4), (8, 4), (16, 4)]
+
+
+@pytest.mark.asyncio
+async def test_sample_hash_reads_only_samples(db_session):
+    _ = db_session
+    payload = b"HEAD" + b"x" * 8 + b"MIDL" + b"y" * 8 + b"TAIL"
+    digest, stats = await _sample_hash(payload)
+
+    assert stats == {"bytes_read": 12, "bytes_skipped": len(payload) - 12}
+    # Bytes outside the samples do not change the hash...
+    same, _ = await _sample_hash(payload.replace(b"x", b"z"))
+    assert same == digest
+    # ...but the samples and the size do.
+    changed, _ = await _sample_hash(payload.replace(b"TAIL", b"tail"))
+    longer, _ = await _sample_hash(payload + b"!")
+    assert changed != digest
+    assert longer != digest
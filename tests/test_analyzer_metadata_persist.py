@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pytest
+
+from katalog.analyzers.runtime import persist_analyzer_metadata
+from katalog.constants.metadata import FILE_TITLE
+from katalog.db.actors import get_actor_repo
+from katalog.db.assets import get_asset_repo
+from katalog.db.changesets import get_changeset_repo
+from katalog.db.metadata import get_metadata_repo
+from katalog.models import ActorType, Asset, MetadataChanges, OpStatus, make_metadata
+
+
+@pytest.mark.asyncio
+async def test_analyzer_metadata_is_persisted_in_batches(db_session, monkeypatch):
+    _ = db_session
+    monkeypatch.setenv("KATALOG_BATCH_SIZE", "2")
+    actor_db = get_actor_repo()
+    asset_db = get_asset_repo()
+    md_db = get_metadata_repo()
+    source = await actor_db.create(
+        name="source", plugin_id="plugin.source", type=ActorType.SOURCE
+    )
+    analyzer = await actor_db.create(
+        name="analyzer", plugin_id="plugin.analyzer", type=ActorType.ANALYZER
+    )
+    changeset = await get_changeset_repo().create_auto(status=OpStatus.IN_PROGRESS)
+    assets: list[Asset] = []
+    for idx in range(5):
+        asset = Asset(
+            namespace="test",
+            external_id=f"asset-{idx}",
+            canonical_uri=f"file:///asset-{idx}",
+            actor_id=source.id,
+        )
+        await asset_db.save_record(asset, changeset=changeset, actor=source)
+        assets.append(asset)
+
+    batch_sizes: list[int] = []
+    persist_batch = md_db.persist_changes_batch
+
+    async def _counting_persist(changeset, changes_list, existing):  # noqa: ANN001
+        batch_sizes.append(len(changes_list))
+        return await persist_batch(changeset, changes_list, existing)
+
+    monkeypatch.setattr(type(md_db), "persist_changes_batch", staticmethod(_counting_persist))
+
+    entries = [
+        make_metadata(FILE_TITLE, f"Title {asset.external_id}", asset=asset)
+        for asset in assets
+    ]
+    # Entries for unknown assets are skipped.
+    entries.append(make_metadata(FILE_TITLE, "Ghost", asset_id=999_999))
+    await persist_analyzer_metadata(actor=analyzer, changeset=changeset, metadata=entries)
+
+    assert batch_sizes == [2, 2, 1]
+    for asset in assets:
+        loaded = await md_db.for_asset(asset, include_removed=True)
+        changes = MetadataChanges(asset=asset, loaded=loaded)
+        assert changes.latest_value(FILE_TITLE, value_type=str) == f"Title {asset.external_id}"
+        titles = [entry for entry in loaded if entry.actor_id == analyzer.id]
+        assert [entry.changeset_id for entry in titles] == [changeset.id]
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+
+import pytest
+import pytest_asyncio
+
+from katalog.analyzers.duplicate_discovery import DuplicateDiscoveryAnalyzer
+from katalog.analyzers.duplicates import ExactDuplicateAnalyzer
+from katalog.analyzers.near_duplicates import NearDuplicateAnalyzer
+from katalog.analyzers.runtime import persist_analyzer_metadata
+from katalog.analyzers import scheduler
+from katalog.analyzers.scheduler import analyzer_stages, run_scheduled_analyzers
+from katalog.analyzers.sidecar_links import SidecarLinksAnalyzer
+from katalog.analyzers.stats import StatsAnalyzer
+from katalog.constants.metadata import (
+    FILE_NAME,
+    FILE_PATH,
+    SIDECAR_TARGET_NAME,
+    SIDECAR_TYPE,
+)
+from katalog.config import build_app_context, current_app_context, use_app_context
+from katalog.db.actors import get_actor_repo
+from katalog.db.assets import get_asset_repo
+from katalog.db.changesets import get_changeset_repo
+from katalog.db.metadata import sync_config_db
+from katalog.db.sqlspec import close_db
+from katalog.models import Actor, ActorType, Asset, OpStatus, make_metadata
+from katalog.plugins import registry as plugin_registry
+from katalog.sources.fake_assets import FakeAssetSource
+from katalog.workflows import WorkflowActorSpec, WorkflowSpec, start_workflow_file
+from katalog.workflows.contracts import WorkflowSourceActorsInput
+from katalog.workflows.runtime import wait_for_workflow_analyzers
+
+
+def test_analyzer_stages_follow_declared_keys():
+    plugins = [
+        StatsAnalyzer,
+        ExactDuplicateAnalyzer,
+        NearDuplicateAnalyzer,
+        DuplicateDiscoveryAnalyzer,
+        SidecarLinksAnalyzer,
+    ]
+    actors = [
+        Actor(id=idx, name=plugin.__name__, plugin_id=plugin.plugin_id, type=ActorType.ANALYZER)
+        for idx, plugin in enumerate(plugins, 1)
+    ]
+
+    stages = analyzer_stages(actors)
+
+    # Exact duplicates read the hashes discovery writes; stats read anything.
+    assert [[actor.name for actor in stage] for stage in stages] == [
+        ["NearDuplicateAnalyzer", "DuplicateDiscoveryAnalyzer", "SidecarLinksAnalyzer"],
+        ["StatsAnalyzer", "ExactDuplicateAnalyzer"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_scheduled_analyzers_skip_unchanged_inputs(db_session):
+    _ = db_session
+    actor_db = get_actor_repo()
+    changeset_db = get_changeset_repo()
+    source = await actor_db.create(
+        name="source", plugin_id="plugin.source", type=ActorType.SOURCE
+    )
+    sidecars = await actor_db.create(
+        name="sidecars",
+        plugin_id=SidecarLinksAnalyzer.plugin_id,
+        type=ActorType.ANALYZER,
+    )
+    near = await actor_db.create(
+        name="near",
+        plugin_id=NearDuplicateAnalyzer.plugin_id,
+        type=ActorType.ANALYZER,
+    )
+
+    trigger = await changeset_db.create(id=1, status=OpStatus.IN_PROGRESS)
+    for name, extra in (
+        ("IMG_1.JPG", []),
+        ("IMG_1.JPG.xmp", [(SIDECAR_TYPE, "xmp"), (SIDECAR_TARGET_NAME, "img_1.jpg")]),
+    ):
+        asset = Asset(
+            namespace="test",
+            external_id=name,
+            canonical_uri=f"file:///photos/{name}",
+            actor_id=source.id,
+        )
+        await get_asset_repo().save_record(asset, changeset=trigger, actor=source)
+        await persist_analyzer_metadata(
+            actor=source,
+            changeset=trigger,
+            metadata=[
+                make_metadata(FILE_NAME, name, source.id, asset=asset),
+                make_metadata(FILE_PATH, f"/photos/{name}", source.id, asset=asset),
+                *[make_metadata(key, value, source.id, asset=asset) for key, value in extra],
+            ],
+        )
+    await trigger.finalize(status=OpStatus.COMPLETED)
+
+    analyzer_changeset = await run_scheduled_analyzers([near, sidecars], trigger=trigger)
+
+    assert analyzer_changeset is not None
+    assert analyzer_changeset.status == OpStatus.COMPLETED
+    outputs = analyzer_changeset.data["outputs"]
+    assert outputs[str(sidecars.id)]["data"]["linked"] == 1
+
+    summary = trigger.data["analyzers"]
+    assert summary["changed_assets"] == 2
+    assert summary["assets_removed"] is False
+    assert summary["changeset_id"] == analyzer_changeset.id
+    runs = {run["name"]: run for run in summary["runs"]}
+    assert runs["near"]["status"] == OpStatus.SKIPPED.value
+    assert runs["near"]["reason"] == "inputs unchanged"
+    assert "changeset_id" not in runs["near"]
+    assert runs["sidecars"]["status"] == OpStatus.COMPLETED.value
+    assert runs["sidecars"]["changeset_id"] == analyzer_changeset.id
+    assert runs["sidecars"]["duration_ms"] >= 0
+
+    stored = await changeset_db.get_or_none(id=trigger.id)
+    assert stored is not None
+    assert stored.data["analyzers"]["runs"] == summary["runs"]
+
+    # Nothing changed since: every analyzer is skipped, no changeset is opened.
+    quiet = await changeset_db.create(id=2, status=OpStatus.IN_PROGRESS)
+    await quiet.finalize(status=OpStatus.COMPLETED)
+    assert await run_scheduled_analyzers([near, sidecars], trigger=quiet) is None
+    assert {run["status"] for run in quiet.data["analyzers"]["runs"]} == {
+        OpStatus.SKIPPED.value
+    }
+
+
+@pytest_asyncio.fixture
+async def file_db(tmp_path, monkeypatch):
+    # A file database, so analyzers really read through the read-only pool.
+    db_url = f"sqlite:///{tmp_path / 'katalog.db'}"
+    monkeypatch.setenv("KATALOG_WORKSPACE", str(tmp_path))
+    monkeypatch.setenv("KATALOG_DATABASE_URL", db_url)
+    with use_app_context(build_app_context(workspace=tmp_path, db_url=db_url)):
+        plugin_registry.clear_instance_cache()
+        await sync_config_db()
+        yield
+        await wait_for_workflow_analyzers(cancel=True)
+        await close_db()
+
+
+def _analyzed_workflow_spec() -> WorkflowSpec:
+    return WorkflowSpec(
+        file_name="analyzed.workflow.toml",
+        file_path="<analyzed>",
+        workflow_id="workflow-analyzed",
+        name="Workflow analyzed",
+        description=None,
+        version="1.0.0",
+        input=WorkflowSourceActorsInput(),
+        missing_assets_policy="lost",
+        always_process=False,
+        actors=[
+            WorkflowActorSpec(
+                name="Fake source",
+                plugin_id=FakeAssetSource.plugin_id,
+                identity_key="analyzed-source",
+                actor_type=ActorType.SOURCE,
+                config={
+                    "namespace": "analyzed",
+                    "total_assets": 5,
+                    "seed": 1,
+                    "batch_delay_ms": 0,
+                    "batch_jitter_ms": 0,
+                    "include_collection": False,
+                },
+                disabled=False,
+            ),
+            WorkflowActorSpec(
+                name="Stats",
+                plugin_id=StatsAnalyzer.plugin_id,
+                identity_key="analyzed-stats",
+                actor_type=ActorType.ANALYZER,
+                config={},
+                disabled=False,
+            ),
+        ],
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(
+    not hasattr(sqlite3.Connection, "enable_load_extension"),
+    reason="file databases load the sqlite-vec extension",
+)
+async def test_started_workflow_waits_for_previous_background_analyzers(file_db):
+    _ = file_db
+    spec = _analyzed_workflow_spec()
+    changeset_db = get_changeset_repo()
+
+    first = (await start_workflow_file(spec, sync_first=True))["changeset"]
+    await first.task
+    assert current_app_context().state["workflow_analyzer_tasks"]
+
+    # The first run's analyzers hold a changeset open; starting again waits for them.
+    second = (await start_workflow_file(spec))["changeset"]
+    await second.task
+    await wait_for_workflow_analyzers()
+
+    changesets = {changeset.id: changeset for changeset in await changeset_db.list_rows()}
+    analyzer_runs = [
+        changeset
+        for changeset in changesets.values()
+        if (changeset.data or {}).get("trigger_changeset_id") == first.id
+    ]
+    assert [changeset.status for changeset in analyzer_runs] == [OpStatus.COMPLETED]
+    assert changesets[second.id].status == OpStatus.COMPLETED
+    assert "sqlspec_analysis_config" in current_app_context().state
+
+
+@pytest.mark.asyncio
+async def test_cancelled_scheduled_analyzers_do_not_leave_a_changeset_open(
+    db_session, monkeypatch
+):
+    _ = db_session
+    actor_db = get_actor_repo()
+    changeset_db = get_changeset_repo()
+    stats = await actor_db.create(
+        name="stats", plugin_id=StatsAnalyzer.plugin_id, type=ActorType.ANALYZER
+    )
+    source = await actor_db.create(
+        name="source", plugin_id="plugin.source", type=ActorType.SOURCE
+    )
+    trigger = await changeset_db.create(id=1, status=OpStatus.IN_PROGRESS)
+    asset = Asset(
+        namespace="test", external_id="a", canonical_uri="file:///a", actor_id=source.id
+    )
+    await get_asset_repo().save_record(asset, changeset=trigger, actor=source)
+    await persist_analyzer_metadata(
+        actor=source,
+        changeset=trigger,
+        metadata=[make_metadata(FILE_NAME, "a", source.id, asset=asset)],
+    )
+    await trigger.finalize(status=OpStatus.COMPLETED)
+
+    started = asyncio.Event()
+
+    async def _blocked(*args, **kwargs):  # noqa: ANN002, ANN003
+        _ = args, kwargs
+        started.set()
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(scheduler, "do_run_analyzer", _blocked)
+    task = asyncio.create_task(run_scheduled_analyzers([stats], trigger=trigger))
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    [analyzer_changeset] = [
+        changeset
+        for changeset in await changeset_db.list_rows(order_by="id")
+        if changeset.id != trigger.id
+    ]
+    assert analyzer_changeset.status == OpStatus.CANCELED
+    await changeset_db.begin(message="next run", status=OpStatus.IN_PROGRESS)
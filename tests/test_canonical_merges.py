@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import pytest
+
+from katalog.db.actors import get_actor_repo
+from katalog.db.assets import get_asset_repo
+from katalog.db.canonical import get_canonical_repo
+from katalog.db.changesets import get_changeset_repo
+from katalog.models import ActorType, Asset, OpStatus
+from katalog.models.query import AssetQuery
+
+
+@pytest.mark.asyncio
+async def test_canonical_merges_resolve_to_flat_sets(db_session):
+    _ = db_session
+    actor = await get_actor_repo().create(
+        name="source", plugin_id="plugin.source", type=ActorType.SOURCE
+    )
+    changeset = await get_changeset_repo().create(id=1, status=OpStatus.IN_PROGRESS)
+    asset_db = get_asset_repo()
+    canonical = get_canonical_repo()
+
+    assets: list[Asset] = []
+    for idx in range(6):
+        asset = Asset(
+            namespace="test",
+            external_id=f"asset-{idx}",
+            canonical_uri=f"file:///asset-{idx}",
+            actor_id=actor.id,
+        )
+        await asset_db.save_record(asset, changeset=changeset, actor=actor)
+        assets.append(asset)
+    a, b, c, d, e, f = (int(asset.id) for asset in assets)
+    query = AssetQuery(offset=0, limit=100)
+
+    # A chain written on asset rows (c -> b -> a) collapses onto its root.
+    assets[1].canonical_asset_id = a
+    await asset_db.save_record(assets[1], changeset=changeset, actor=actor)
+    assets[2].canonical_asset_id = b
+    await asset_db.save_record(assets[2], changeset=changeset, actor=actor)
+    assert await canonical.effective_ids([a, b, c]) == {a: a, b: a, c: a}
+    stored = await asset_db.get_or_none(id=c)
+    assert stored is not None and stored.canonical_asset_id == a
+
+    # Bulk merges join whole sets: {d, e} joins the set of c, rooted at a.
+    assert await canonical.merge_groups([[d, e], [c, e]]) == 2
+    assert await canonical.members(b) == [a, b, c, d, e]
+    assert await asset_db.count_assets_for_query(query=query) == 2
+    assert await asset_db.list_asset_ids_for_query(query=query) == [a, f]
+
+    # Unmerging a member leaves the rest of its set merged.
+    assert await canonical.unmerge([c]) == 1
+    assert await asset_db.count_assets_for_query(query=query) == 3
+    assert await canonical.members(c) == [c]
+
+    # Deleting the root hands the set to its oldest remaining member.
+    await asset_db.delete_assets([a])
+    assert await canonical.members(e) == [b, d, e]
+    assert await asset_db.list_asset_ids_for_query(query=query) == [b, c, f]
+
+    # Clearing the pointer on an asset row detaches it again.
+    stored = await asset_db.get_or_none(id=d)
+    assert stored is not None and stored.canonical_asset_id == b
+    stored.canonical_asset_id = None
+    await asset_db.save_record(stored, changeset=changeset, actor=actor)
+    assert await canonical.members(b) == [b, e]
+    assert await canonical.rebuild() == 1
+
+
+@pytest.mark.asyncio
+async def test_deleting_canonical_roots_hands_each_set_over(db_session):
+    _ = db_session
+    actor = await get_actor_repo().create(
+        name="source", plugin_id="plugin.source", type=ActorType.SOURCE
+    )
+    changeset = await get_changeset_repo().create(id=1, status=OpStatus.IN_PROGRESS)
+    asset_db = get_asset_repo()
+    canonical = get_canonical_repo()
+
+    assets: list[Asset] = []
+    for idx in range(6):
+        asset = Asset(
+            namespace="test",
+            external_id=f"asset-{idx}",
+            canonical_uri=f"file:///asset-{idx}",
+            actor_id=actor.id,
+        )
+        await asset_db.save_record(asset, changeset=changeset, actor=actor)
+        assets.append(asset)
+    a, b, c, d, e, f = (int(asset.id) for asset in assets)
+    assert await canonical.merge_groups([[a, b, c], [d, e]]) == 3
+
+    # Both roots leave in one call; every set moves to its oldest remaining member.
+    await asset_db.delete_assets([a, d])
+
+    assert await canonical.members(c) == [b, c]
+    assert await canonical.members(e) == [e]
+    assert await canonical.effective_ids([b, c, e, f]) == {b: b, c: b, e: e, f: f}
+    rows = {int(asset.id): asset.canonical_asset_id for asset in await asset_db.list_rows(order_by="id")}
+    assert rows == {b: None, c: b, e: None, f: None}
+    query = AssetQuery(offset=0, limit=100)
+    assert await asset_db.list_asset_ids_for_query(query=query) == [b, e, f]
+
+    # Rescanning the new root keeps the set intact.
+    stored = await asset_db.get_or_none(id=b)
+    assert stored is not None
+    await asset_db.save_record(stored, changeset=changeset, actor=actor)
+    assert await canonical.members(c) == [b, c]
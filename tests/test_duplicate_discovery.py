@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import pytest
+
+from katalog.analyzers.base import AnalyzerScope
+from katalog.analyzers.duplicate_discovery import DuplicateDiscoveryAnalyzer
+from katalog.analyzers.runtime import persist_analyzer_metadata
+from katalog.constants.metadata import FILE_SIZE, HASH_SAMPLE
+from katalog.db.actors import get_actor_repo
+from katalog.db.assets import get_asset_repo
+from katalog.db.changesets import get_changeset_repo
+from katalog.models import ActorType, Asset, OpStatus, make_metadata
+from tests.utils.fakes import MemoryAccessor
+
+SIZE = 10_000
+SAMPLE = 100
+
+
+def _payload(fill: bytes, *, middle: bytes = b"m", hidden: bytes = b"h") -> bytes:
+    # Only bytes outside the head/middle/tail samples differ for `hidden`.
+    data = bytearray(fill * SIZE)
+    data[SIZE // 2 - SAMPLE // 2] = middle[0]
+    data[SAMPLE * 2] = hidden[0]
+    return bytes(data)
+
+
+@pytest.mark.asyncio
+async def test_duplicate_discovery_reads_only_colliding_files(db_session, monkeypatch):
+    _ = db_session
+    actor_db = get_actor_repo()
+    asset_db = get_asset_repo()
+    source = await actor_db.create(
+        name="source", plugin_id="plugin.source", type=ActorType.SOURCE
+    )
+    analyzer_actor = await actor_db.create(
+        name="discovery",
+        plugin_id=DuplicateDiscoveryAnalyzer.plugin_id,
+        type=ActorType.ANALYZER,
+    )
+    changeset = await get_changeset_repo().create_auto(status=OpStatus.IN_PROGRESS)
+
+    payloads = {
+        "original": _payload(b"a"),
+        "copy": _payload(b"a"),
+        "other_middle": _payload(b"a", middle=b"M"),
+        "hidden_change": _payload(b"a", hidden=b"H"),
+        "unique_size": b"a" * (SIZE + 1),
+    }
+    assets: dict[str, Asset] = {}
+    for name in payloads:
+        asset = Asset(
+            namespace="test",
+            external_id=name,
+            canonical_uri=f"file:///{name}",
+            actor_id=source.id,
+        )
+        await asset_db.save_record(asset, changeset=changeset, actor=source)
+        assets[name] = asset
+    await persist_analyzer_metadata(
+        actor=source,
+        changeset=changeset,
+        metadata=[
+            make_metadata(FILE_SIZE, len(payloads[name]), source.id, asset=asset)
+            for name, asset in assets.items()
+        ],
+    )
+    payload_by_id = {int(asset.id): payloads[name] for name, asset in assets.items()}
+
+    async def fake_get_data_reader(self, key, changes):  # noqa: ANN001
+        return MemoryAccessor(payload_by_id[int(self.id)])
+
+    monkeypatch.setattr(Asset, "get_data_reader", fake_get_data_reader)
+
+    analyzer = DuplicateDiscoveryAnalyzer(analyzer_actor, sample_size=SAMPLE)
+    result = await analyzer.run(changeset=changeset, scope=AnalyzerScope.all())
+
+    stages = result.output["stages"]
+    assert stages["size"] == {"assets": 5, "candidates": 4}
+    assert stages["sample"] == {"groups": 1, "candidates": 3}
+    assert stages["full"] == {"hashed": 3, "groups": 1}
+    assert [(group.kind, group.attributes["asset_ids"]) for group in result.groups] == [
+        ("exact_duplicate", sorted([assets["original"].id, assets["copy"].id]))
+    ]
+
+    bytes_read = 4 * 3 * SAMPLE + 3 * SIZE
+    assert result.output["bytes_read"] == bytes_read
+    assert result.output["bytes_skipped"] == 4 * SIZE + (SIZE + 1) - bytes_read
+    assert changeset.stats.bytes_read == bytes_read
+    sample_stats = changeset.stats.processor_stats[
+        "katalog.processors.sample_hash.SampleHashProcessor"
+    ]
+    assert sample_stats["bytes_read_total"] == 4 * 3 * SAMPLE
+
+    # Hashes are only recomputed when the data changes.
+    rerun = await analyzer.run(changeset=changeset, scope=AnalyzerScope.all())
+    assert rerun.output["bytes_read"] == 0
+    assert [group.label for group in rerun.groups] == [
+        group.label for group in result.groups
+    ]
+    assert HASH_SAMPLE in analyzer.outputs
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import pytest
+
+from katalog.analyzers.base import AnalyzerScope
+from katalog.analyzers.duplicates import ExactDuplicateAnalyzer
+from katalog.analyzers.runtime import persist_analyzer_metadata
+from katalog.constants.metadata import HASH_MD5
+from katalog.db.actors import get_actor_repo
+from katalog.db.assets import get_asset_repo
+from katalog.db.changesets import get_changeset_repo
+from katalog.models import ActorType, Asset, OpStatus, make_metadata
+
+
+def _groups(result) -> dict[str, tuple[str, list[int]]]:  # noqa: ANN001
+    return {
+        group.label: (group.attributes["change"], group.attributes["asset_ids"])
+        for group in result.groups
+    }
+
+
+@pytest.mark.asyncio
+async def test_exact_duplicates_report_only_changed_groups(db_session, monkeypatch):
+    _ = db_session
+    actor_db = get_actor_repo()
+    asset_db = get_asset_repo()
+    changeset_db = get_changeset_repo()
+    source = await actor_db.create(
+        name="source", plugin_id="plugin.source", type=ActorType.SOURCE
+    )
+    analyzer_actor = await actor_db.create(
+        name="duplicates",
+        plugin_id=ExactDuplicateAnalyzer.plugin_id,
+        type=ActorType.ANALYZER,
+    )
+
+    first = await changeset_db.create(id=1, status=OpStatus.IN_PROGRESS)
+    assets: list[Asset] = []
+    for idx in range(5):
+        asset = Asset(
+            namespace="test",
+            external_id=f"file-{idx}",
+            canonical_uri=f"file:///file-{idx}",
+            actor_id=source.id,
+        )
+        await asset_db.save_record(asset, changeset=first, actor=source)
+        assets.append(asset)
+    a, b, c, d, e = assets
+    hashes = [(a, "AAAA"), (b, "aaaa "), (c, "bbbb"), (d, "bbbb"), (e, "cccc")]
+    await persist_analyzer_metadata(
+        actor=source,
+        changeset=first,
+        metadata=[
+            make_metadata(HASH_MD5, value, source.id, asset=asset)
+            for asset, value in hashes
+        ],
+    )
+
+    analyzer = ExactDuplicateAnalyzer(analyzer_actor)
+    state = None
+
+    async def _load_state():
+        return state
+
+    monkeypatch.setattr(analyzer, "load_analyzer_state", _load_state)
+    result = await analyzer.run(changeset=first, scope=AnalyzerScope.all())
+
+    assert result.output["full_rebuild"] is True
+    assert _groups(result) == {
+        "aaaa": ("added", sorted([a.id, b.id])),
+        "bbbb": ("added", sorted([c.id, d.id])),
+    }
+    state = result.state
+
+    # e joins the "aaaa" group and d leaves "bbbb"; only those assets are revisited.
+    second = await changeset_db.create(id=2, status=OpStatus.IN_PROGRESS)
+    await persist_analyzer_metadata(
+        actor=source,
+        changeset=second,
+        metadata=[
+            make_metadata(HASH_MD5, "aaaa", source.id, asset=e),
+            make_metadata(HASH_MD5, "dddd", source.id, asset=d),
+        ],
+    )
+    result = await analyzer.run(changeset=second, scope=AnalyzerScope.all())
+
+    assert result.output["full_rebuild"] is False
+    assert result.output["changed_assets"] == 2
+    assert _groups(result) == {
+        "aaaa": ("changed", sorted([a.id, b.id, e.id])),
+        "bbbb": ("removed", [c.id]),
+    }
+    state = result.state
+
+    # A conflicting hash from a second actor takes the asset out of its group.
+    other_source = await actor_db.create(
+        name="other", plugin_id="plugin.other", type=ActorType.SOURCE
+    )
+    third = await changeset_db.create(id=3, status=OpStatus.IN_PROGRESS)
+    await persist_analyzer_metadata(
+        actor=other_source,
+        changeset=third,
+        metadata=[make_metadata(HASH_MD5, "ffff", other_source.id, asset=a)],
+    )
+    result = await analyzer.run(changeset=third, scope=AnalyzerScope.all())
+
+    assert [issue.file_ids for issue in result.issues] == [[str(a.id)]]
+    assert _groups(result) == {"aaaa": ("changed", sorted([b.id, e.id]))}
+
+    # Nothing changed: no findings at all.
+    state = result.state
+    fourth = await changeset_db.create(id=4, status=OpStatus.IN_PROGRESS)
+    result = await analyzer.run(changeset=fourth, scope=AnalyzerScope.all())
+    assert result.output["changed_assets"] == 0
+    assert result.groups == []
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from katalog.constants.metadata import HASH_MD5
+from katalog.db.actors import get_actor_repo
+from katalog.db.assets import get_asset_repo
+from katalog.db.changesets import get_changeset_repo
+from katalog.db.fingerprints import get_fingerprint_repo
+from katalog.models import Actor, ActorType, ChangesetStats, MetadataChanges, OpStatus
+from katalog.processors.base import ProcessorResult
+from katalog.processors.md5_hash import MD5HashProcessor
+from katalog.sources.filesystem import FilesystemClient
+from katalog.sources.runtime import run_sources
+from katalog.workflows.contracts import WorkflowSourceActorsInput
+from katalog.workflows.pipeline import ProcessorPipeline, WorkflowPipelineRunner
+
+
+async def _scan(actor: Actor) -> dict[str, float]:
+    changeset = await get_changeset_repo().begin(
+        actors=[actor],
+        message="Filesystem scan",
+        status=OpStatus.IN_PROGRESS,
+    )
+    status = await run_sources(sources=[actor], changeset=changeset)
+    await changeset.finalize(status=status)
+    assert status == OpStatus.COMPLETED
+    return changeset.data["scan_metrics"]
+
+
+class _CountingMD5(MD5HashProcessor):
+    """MD5 processor that counts runs and fails the first `failures` of them."""
+
+    def __init__(self, actor: Actor, *, failures: int = 0) -> None:
+        super().__init__(actor)
+        self.runs = 0
+        self.failures = failures
+
+    async def run(self, changes: MetadataChanges) -> ProcessorResult:
+        self.runs += 1
+        if self.failures:
+            self.failures -= 1
+            return ProcessorResult(status=OpStatus.ERROR, message="flaky read")
+        return await super().run(changes)
+
+
+async def _run_workflow(
+    actor: Actor, pipeline: ProcessorPipeline, *, always_process: bool = False
+) -> ChangesetStats:
+    changeset = await get_changeset_repo().begin(
+        actors=[actor], message="Filesystem workflow", status=OpStatus.IN_PROGRESS
+    )
+    status = await WorkflowPipelineRunner().run(
+        changeset=changeset,
+        workflow_input=WorkflowSourceActorsInput(actor_ids=[int(actor.id)]),
+        source_actors=[actor],
+        processor_pipeline=pipeline,
+        always_process=always_process,
+    )
+    await changeset.finalize(status=status)
+    assert status == OpStatus.COMPLETED
+    assert changeset.stats is not None
+    return changeset.stats
+
+
+async def _fingerprint_setup(tmp_path: Path, files: int) -> tuple[Actor, _CountingMD5]:
+    root = tmp_path / "root"
+    root.mkdir()
+    for idx in range(files):
+        (root / f"file_{idx}.txt").write_text(f"hello {idx}")
+    actor_db = get_actor_repo()
+    source = await actor_db.create(
+        name="filesystem-pipeline",
+        plugin_id=FilesystemClient.plugin_id,
+        type=ActorType.SOURCE,
+        config={"root_path": str(root), "max_files": 0},
+    )
+    md5_actor = await actor_db.create(
+        name="md5", plugin_id=MD5HashProcessor.plugin_id, type=ActorType.PROCESSOR
+    )
+    return source, _CountingMD5(md5_actor)
+
+
+async def _md5_count() -> int:
+    asset_db = get_asset_repo()
+    count = 0
+    for asset in await asset_db.list_rows(order_by="id"):
+        metadata = await asset_db.load_metadata(asset, include_removed=False)
+        count += any(entry.key == HASH_MD5 for entry in metadata)
+    return count
+
+
+@pytest.mark.asyncio
+async def test_rescan_skips_files_with_unchanged_fingerprint(tmp_path: Path, db_session):
+    _ = db_session
+    root = tmp_path / "root"
+    root.mkdir()
+    for idx in range(3):
+        (root / f"file_{idx}.txt").write_text(f"hello {idx}")
+    actor = await get_actor_repo().create(
+        name="filesystem-fingerprints",
+        plugin_id=FilesystemClient.plugin_id,
+        type=ActorType.SOURCE,
+        config={"root_path": str(root), "max_files": 0},
+    )
+
+    first = await _scan(actor)
+    assert first["assets_saved"] == 3
+    assert first["assets_unchanged"] == 0
+
+    second = await _scan(actor)
+    assert second["assets_seen"] == 3
+    assert second["assets_saved"] == 0
+    assert second["assets_unchanged"] == 3
+    assert second["assets_lost"] == 0
+
+    changed = root / "file_1.txt"
+    changed.write_text("hello again")
+    stat = changed.stat()
+    os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    (root / "file_2.txt").unlink()
+
+    third = await _scan(actor)
+    assert third["assets_saved"] == 1
+    assert third["assets_unchanged"] == 1
+    assert third["assets_lost"] == 1
+
+    namespace = FilesystemClient(actor, root_path=str(root)).get_namespace()
+    known = await get_fingerprint_repo().load(actor_id=int(actor.id), namespace=namespace)
+    # The deleted file's fingerprint is forgotten along with lost-tracking.
+    assert len(known) == 2
+
+
+@pytest.mark.asyncio
+async def test_skip_unchanged_can_be_disabled(tmp_path: Path, db_session):
+    _ = db_session
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "only.txt").write_text("only")
+    actor = await get_actor_repo().create(
+        name="filesystem-no-fingerprints",
+        plugin_id=FilesystemClient.plugin_id,
+        type=ActorType.SOURCE,
+        config={"root_path": str(root), "max_files": 0, "skip_unchanged": False},
+    )
+
+    await _scan(actor)
+    second = await _scan(actor)
+    assert second["assets_saved"] == 1
+    assert second["assets_unchanged"] == 0
+
+
+@pytest.mark.asyncio
+async def test_always_process_bypasses_unchanged_fast_path(tmp_path: Path, db_session):
+    _ = db_session
+    source, md5 = await _fingerprint_setup(tmp_path, files=2)
+
+    await _run_workflow(source, [[md5]])
+    assert md5.runs == 2
+
+    quiet = await _run_workflow(source, [[md5]])
+    assert quiet.assets_unchanged == 2
+    assert md5.runs == 2
+
+    forced = await _run_workflow(source, [[md5]], always_process=True)
+    assert forced.assets_unchanged == 2
+    assert md5.runs == 4
+
+
+@pytest.mark.asyncio
+async def test_new_processor_backfills_unchanged_files(tmp_path: Path, db_session):
+    _ = db_session
+    source, md5 = await _fingerprint_setup(tmp_path, files=2)
+
+    await _run_workflow(source, [])
+    assert await _md5_count() == 0
+
+    backfill = await _run_workflow(source, [[md5]])
+    assert backfill.assets_unchanged == 2
+    assert md5.runs == 2
+    assert await _md5_count() == 2
+
+    # Now processed by this pipeline, the fast path applies again.
+    await _run_workflow(source, [[md5]])
+    assert md5.runs == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_processing_is_retried_on_rescan(tmp_path: Path, db_session):
+    _ = db_session
+    source, md5 = await _fingerprint_setup(tmp_path, files=1)
+    md5.failures = 1
+
+    await _run_workflow(source, [[md5]])
+    assert md5.runs == 1
+    assert await _md5_count() == 0
+
+    retry = await _run_workflow(source, [[md5]])
+    assert retry.assets_unchanged == 0
+    assert md5.runs == 2
+    assert await _md5_count() == 1
+
+    settled = await _run_workflow(source, [[md5]])
+    assert settled.assets_unchanged == 1
+    assert md5.runs == 2
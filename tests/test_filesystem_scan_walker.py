@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from katalog.constants.metadata import FILE_PATH, FILE_SIZE
+from katalog.db.actors import get_actor_repo
+from katalog.db.changesets import get_changeset_repo
+from katalog.models import Actor, ActorType, OpStatus
+from katalog.sources.filesystem import FilesystemClient
+from katalog.sources.runtime import run_sources
+
+
+def _make_tree(tmp_path: Path) -> Path:
+    # db_session uses tmp_path as the workspace, so scan a dedicated subtree.
+    root = tmp_path / "root"
+    for sub in ("a", "a/b", "c", "node_modules/pkg", "notes.txt"):
+        (root / sub).mkdir(parents=True, exist_ok=True)
+    (root / "top.txt").write_text("top")
+    (root / "a" / "one.txt").write_text("one")
+    (root / "a" / "b" / "two.md").write_text("two!")
+    (root / "c" / "three.txt").write_text("three")
+    (root / "node_modules" / "pkg" / "index.js").write_text("js")
+    # A directory whose name matches a file pattern must still be walked.
+    (root / "notes.txt" / "inner.md").write_text("inner")
+    return root
+
+
+async def _collect(client: FilesystemClient) -> tuple[dict[str, int], dict[str, float]]:
+    scan_result = await client.scan()
+    found: dict[str, int] = {}
+    async for item in scan_result.iterator:
+        values = {md.key: md.value for md in item.metadata}
+        found[str(values[FILE_PATH])] = int(values[FILE_SIZE])
+    assert scan_result.status == OpStatus.COMPLETED
+    return found, scan_result.metrics
+
+
+@pytest.mark.asyncio
+async def test_walker_prunes_excluded_directories(tmp_path: Path, db_session):
+    _ = db_session
+    root = _make_tree(tmp_path)
+    client = FilesystemClient(
+        actor=Actor(id=1, name="fs", plugin_id=FilesystemClient.plugin_id, type=ActorType.SOURCE),
+        root_path=str(root),
+        max_files=0,
+        exclude_patterns=["node_modules/*", "*.txt"],
+        scan_workers=3,
+    )
+
+    found, metrics = await _collect(client)
+
+    root = root.resolve()
+    assert found == {
+        str(root / "a" / "b" / "two.md"): 4,
+        str(root / "notes.txt" / "inner.md"): 5,
+    }
+    assert metrics["fs_dirs_pruned"] == 1
+    # root, a, a/b, c, notes.txt
+    assert metrics["fs_dirs_scanned"] == 5
+    assert metrics["fs_files_yielded"] == 2
+
+
+@pytest.mark.asyncio
+async def test_walker_resolves_symlinked_files(tmp_path: Path, db_session):
+    _ = db_session
+    target = tmp_path / "target"
+    target.mkdir()
+    (target / "real.txt").write_text("real")
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "link.txt").symlink_to(target / "real.txt")
+    (root / "linked_dir").symlink_to(target, target_is_directory=True)
+
+    client = FilesystemClient(
+        actor=Actor(id=1, name="fs", plugin_id=FilesystemClient.plugin_id, type=ActorType.SOURCE),
+        root_path=str(root),
+        max_files=0,
+    )
+
+    found, _metrics = await _collect(client)
+
+    assert found == {str((target / "real.txt").resolve()): 4}
+
+
+@pytest.mark.asyncio
+async def test_scan_metrics_report_files_per_second(tmp_path: Path, db_session):
+    _ = db_session
+    root = _make_tree(tmp_path)
+    actor = await get_actor_repo().create(
+        name="filesystem-walker",
+        plugin_id=FilesystemClient.plugin_id,
+        type=ActorType.SOURCE,
+        config={"root_path": str(root), "max_files": 0},
+    )
+    changeset = await get_changeset_repo().begin(
+        actors=[actor],
+        message="Filesystem scan",
+        status=OpStatus.IN_PROGRESS,
+    )
+    status = await run_sources(sources=[actor], changeset=changeset)
+    await changeset.finalize(status=status)
+
+    scan_metrics = changeset.data["scan_metrics"]
+    assert scan_metrics["assets_seen"] == 6
+    assert scan_metrics["fs_files_yielded"] == 6
+    assert scan_metrics["files_per_second"] > 0
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from katalog.api.operations import watch_source
+from katalog.db.actors import get_actor_repo
+from katalog.db.assets import get_asset_repo
+from katalog.db.changesets import get_changeset_repo
+from katalog.models import Actor, ActorType, OpStatus
+from katalog.sources.filesystem import FilesystemClient
+from katalog.sources.filesystem_watch import FilesystemWatcher
+from katalog.workflows.contracts import (
+    WorkflowInputSpec,
+    WorkflowSourceActorsInput,
+    WorkflowSourcePathsInput,
+)
+from katalog.workflows.pipeline import WorkflowPipelineRunner
+
+
+async def _collect_batches(watcher: FilesystemWatcher, mutate) -> list:
+    stop = asyncio.Event()
+    batches = []
+
+    async def _drive() -> None:
+        await asyncio.sleep(0.3)
+        mutate()
+        await asyncio.sleep(1.0)
+        stop.set()
+
+    driver = asyncio.create_task(_drive())
+    async for batch in watcher.batches(stop_event=stop):
+        batches.append(batch)
+    await driver
+    return batches
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", ["poll", "inotify"])
+async def test_watcher_coalesces_changes_into_batches(tmp_path: Path, backend: str):
+    if backend == "inotify" and not sys.platform.startswith("linux"):
+        pytest.skip("inotify is Linux-only")
+    root = tmp_path / "root"
+    (root / "a").mkdir(parents=True)
+    (root / "a" / "old.txt").write_text("old")
+    (root / "gone.txt").write_text("gone")
+    watcher = FilesystemWatcher(
+        str(root), backend=backend, debounce_seconds=0.2, poll_interval_seconds=0.1
+    )
+
+    def _mutate() -> None:
+        (root / "new.txt").write_text("new")
+        (root / "a" / "old.txt").rename(root / "a" / "renamed.txt")
+        (root / "gone.txt").unlink()
+
+    batches = await _collect_batches(watcher, _mutate)
+
+    changed = {path for batch in batches for path in batch.changed_paths}
+    removed = {path for batch in batches for path in batch.removed_paths}
+    assert str(root / "new.txt") in changed
+    assert str(root / "a" / "renamed.txt") in changed
+    assert {str(root / "a" / "old.txt"), str(root / "gone.txt")} <= removed
+    assert not any(batch.overflow for batch in batches)
+
+
+@pytest.mark.asyncio
+async def test_watcher_overflow_requests_rescan(tmp_path: Path):
+    root = tmp_path / "root"
+    root.mkdir()
+    watcher = FilesystemWatcher(
+        str(root), backend="poll", debounce_seconds=0.2, poll_interval_seconds=0.1, max_pending=5
+    )
+
+    def _mutate() -> None:
+        for idx in range(20):
+            (root / f"file_{idx}.txt").write_text("x")
+
+    batches = await _collect_batches(watcher, _mutate)
+
+    assert batches and batches[0].overflow
+    assert batches[0].changed_paths == []
+
+
+async def _run(actor: Actor, workflow_input: WorkflowInputSpec):
+    changeset = await get_changeset_repo().begin(
+        actors=[actor], message="Watch test", status=OpStatus.IN_PROGRESS
+    )
+    status = await WorkflowPipelineRunner().run(
+        changeset=changeset,
+        workflow_input=workflow_input,
+        source_actors=[actor],
+        processor_pipeline=[],
+    )
+    await changeset.finalize(status=status)
+    assert status == OpStatus.COMPLETED
+    return changeset.stats
+
+
+@pytest.mark.asyncio
+async def test_source_paths_input_keeps_renamed_assets(tmp_path: Path, db_session):
+    _ = db_session
+    root = tmp_path / "root"
+    root.mkdir()
+    for name in ("keep.txt", "move.txt", "delete.txt", "replace.txt"):
+        (root / name).write_text(name)
+    actor = await get_actor_repo().create(
+        name="filesystem-watch",
+        plugin_id=FilesystemClient.plugin_id,
+        type=ActorType.SOURCE,
+        config={"root_path": str(root), "max_files": 0},
+    )
+    await _run(actor, WorkflowSourceActorsInput(actor_ids=[int(actor.id)]))
+    asset_db = get_asset_repo()
+    moved_asset = await asset_db.get_or_none(
+        external_id=f"inode:{(root / 'move.txt').stat().st_ino}"
+    )
+    assert moved_asset is not None
+
+    (root / "sub").mkdir()
+    (root / "move.txt").rename(root / "sub" / "moved.txt")
+    (root / "delete.txt").unlink()
+    # A new file on the inode of a removed one, without depending on the
+    # filesystem handing out freed inodes: same inode, new size and mtime.
+    (root / "replace.txt").rename(root / "added.txt")
+    (root / "added.txt").write_text("a different file")
+    os.utime(root / "added.txt", ns=(1_000_000_000, 1_000_000_000))
+
+    stats = await _run(
+        actor,
+        WorkflowSourcePathsInput(
+            actor_ids=[int(actor.id)],
+            paths=[str(root / "sub"), str(root / "added.txt")],
+            removed_paths=[
+                str(root / "move.txt"),
+                str(root / "delete.txt"),
+                str(root / "replace.txt"),
+            ],
+        ),
+    )
+
+    # The moved file keeps its asset; the file on the reused inode is new, and
+    # both removed files are lost. keep.txt is not touched.
+    assert stats.assets_seen == 2
+    assert stats.assets_added == 1
+    assert stats.assets_lost == 2
+    moved = await asset_db.get_or_none(
+        external_id=f"inode:{(root / 'sub' / 'moved.txt').stat().st_ino}"
+    )
+    assert moved is not None and moved.id == moved_asset.id
+    added = await asset_db.get_or_none(
+        external_id=f"inode:{(root / 'added.txt').stat().st_ino}"
+    )
+    assert added is not None and added.id not in (moved_asset.id, None)
+
+
+@pytest.mark.asyncio
+async def test_watch_source_finalizes_failed_runs_as_error(tmp_path: Path, db_session, monkeypatch):
+    _ = db_session
+    root = tmp_path / "root"
+    root.mkdir()
+    actor = await get_actor_repo().create(
+        name="filesystem-watch-fail",
+        plugin_id=FilesystemClient.plugin_id,
+        type=ActorType.SOURCE,
+        config={"root_path": str(root), "watch_backend": "poll"},
+    )
+
+    async def _failing_run(self, **kwargs):
+        _ = self, kwargs
+        raise RuntimeError("intentional watch failure")
+
+    monkeypatch.setattr(WorkflowPipelineRunner, "run", _failing_run)
+    stop = asyncio.Event()
+
+    async def _stop(changeset) -> None:
+        _ = changeset
+        stop.set()
+
+    runs = await watch_source(
+        int(actor.id), run_processors=False, stop_event=stop, on_changeset=_stop
+    )
+
+    assert runs == 1
+    changesets = await get_changeset_repo().list_rows(order_by="id")
+    assert [changeset.status for changeset in changesets] == [OpStatus.ERROR]
+    assert changesets[0].data["error_message"] == "intentional watch failure"
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import pytest
+
+from katalog.db.actors import get_actor_repo
+from katalog.db.folder_tree import FolderPath, SourceFolder, get_folder_tree_repo
+from katalog.models import ActorType
+from katalog.sources.filesystem import FilesystemClient
+
+
+async def _actor_id() -> int:
+    actor = await get_actor_repo().create(
+        name="folder-tree",
+        plugin_id=FilesystemClient.plugin_id,
+        type=ActorType.SOURCE,
+        config={"root_path": "/tmp"},
+    )
+    return int(actor.id)
+
+
+@pytest.mark.asyncio
+async def test_resolve_paths_reports_missing_ancestors(db_session):
+    _ = db_session
+    actor_id = await _actor_id()
+    repo = get_folder_tree_repo()
+    await repo.save(
+        actor_id=actor_id,
+        folders=[SourceFolder("b", "B", "a"), SourceFolder("c", "C", "b")],
+    )
+
+    resolution = await repo.resolve_paths(actor_id=actor_id, folder_ids=["c"])
+    assert resolution.paths == {}
+    assert resolution.missing == {"a"}
+
+    await repo.save(actor_id=actor_id, folders=[SourceFolder("a", "A", None)])
+    resolution = await repo.resolve_paths(actor_id=actor_id, folder_ids=["c", "b"])
+    assert resolution.missing == set()
+    assert resolution.paths == {
+        "b": FolderPath("A/B", "a/b"),
+        "c": FolderPath("A/B/C", "a/b/c"),
+    }
+
+
+@pytest.mark.asyncio
+async def test_move_resets_only_the_moved_subtree(db_session):
+    _ = db_session
+    actor_id = await _actor_id()
+    repo = get_folder_tree_repo()
+    await repo.save(
+        actor_id=actor_id,
+        folders=[
+            SourceFolder("root", "Root"),
+            SourceFolder("x", "X", "root"),
+            SourceFolder("x1", "X1", "x"),
+            SourceFolder("x10", "X10", "x1"),
+            SourceFolder("y", "Y", "root"),
+        ],
+    )
+    await repo.resolve_paths(actor_id=actor_id, folder_ids=["x10", "y"])
+
+    moved = await repo.save(
+        actor_id=actor_id,
+        folders=[SourceFolder("x1", "Renamed", "y"), SourceFolder("y", "Y", "root")],
+    )
+    assert moved == {"x1"}
+
+    resolution = await repo.resolve_paths(actor_id=actor_id, folder_ids=["x10", "x", "y"])
+    assert resolution.paths["x10"] == FolderPath("Root/Y/Renamed/X10", "root/y/x1/x10")
+    assert resolution.paths["x"] == FolderPath("Root/X", "root/x")
+
+    await repo.delete(actor_id=actor_id, folder_ids=["y"])
+    resolution = await repo.resolve_paths(actor_id=actor_id, folder_ids=["x10"])
+    assert resolution.paths == {}
+    assert await repo.count(actor_id=actor_id) == 2
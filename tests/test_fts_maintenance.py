@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from katalog.api.system import fts_index_stats, fts_maintenance
+from katalog.db.fts import FtsPoint, get_fts_repo
+from katalog.db.sqlspec.fts import fts_table_name, parse_fts5_structure
+from katalog.db.sqlspec.sql_helpers import scalar
+from katalog.runtime.fts_maintenance import configure_fts_merge, fts_bulk_ingest
+
+
+async def _index_points(actor_id: int, count: int) -> None:
+    repo = get_fts_repo()
+    for index in range(count):
+        await repo.upsert_asset_points(
+            asset_id=10_000 + index,
+            actor_id=actor_id,
+            metadata_key_ids=[1],
+            points=[FtsPoint(metadata_id=10_000 + index, text=f"hello world {index}")],
+        )
+
+
+def test_parse_fts5_structure_counts_segments() -> None:
+    # cookie, nLevel=2, nSegment=3, writeCounter=0,
+    # level0: 2 segments (pages 1-1, 2-3), level1: 1 segment (pages 4-7)
+    blob = bytes.fromhex("00000001" "02" "03" "00" "00" "02" "010101" "020203" "00" "01" "030407")
+    assert parse_fts5_structure(blob) == ([2, 1], 1 + 2 + 4, 0)
+    assert parse_fts5_structure(None) == ([], 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_merge_and_optimize_reduce_segments(db_session):
+    table = fts_table_name(1)
+    await _index_points(1, 1)
+    await fts_maintenance(action="configure", tables=[table], automerge=0)
+    await _index_points(1, 8)
+
+    stats = await fts_index_stats([table])
+    before = stats["tables"][0]
+    assert before["segments"] >= 8
+    assert before["settings"]["automerge"] == 0
+
+    merged = await fts_maintenance(action="merge", tables=[table], pages=1000)
+    result = merged["results"][0]
+    assert result["steps"] >= 1
+    assert result["segments_after"] < result["segments_before"]
+
+    await _index_points(1, 3)
+    optimized = await fts_maintenance(action="optimize", tables=[table])
+    assert optimized["results"][0]["segments_after"] == 1
+
+    count = await scalar(
+        db_session, f'SELECT COUNT(*) FROM "{table}" WHERE "{table}" MATCH ?', ["hello"]
+    )
+    assert count == 8
+
+
+@pytest.mark.asyncio
+async def test_bulk_ingest_restores_merge_settings(db_session):
+    _ = db_session
+    table = fts_table_name(2)
+    await _index_points(2, 1)
+
+    async with fts_bulk_ingest():
+        during = (await fts_index_stats([table]))["tables"][0]["settings"]
+        await _index_points(2, 5)
+
+    after = (await fts_index_stats([table]))["tables"][0]
+    assert during["automerge"] == 0
+    assert after["settings"]["automerge"] == 4
+    assert after["settings"]["crisismerge"] == 16
+
+
+@pytest.mark.asyncio
+async def test_bulk_ingest_keeps_configured_merge_settings(db_session):
+    _ = db_session
+    table = fts_table_name(3)
+    await _index_points(3, 1)
+    await configure_fts_merge(automerge=8, crisismerge=32, tables=[table])
+
+    async with fts_bulk_ingest():
+        await _index_points(3, 5)
+
+    after = (await fts_index_stats([table]))["tables"][0]
+    assert after["settings"]["automerge"] == 8
+    assert after["settings"]["crisismerge"] == 32
+
+
+@pytest.mark.asyncio
+async def test_overlapping_bulk_ingests_restore_settings_once(db_session):
+    _ = db_session
+    table = fts_table_name(4)
+    await _index_points(4, 1)
+    await configure_fts_merge(automerge=8, crisismerge=32, tables=[table])
+
+    async def _settings() -> dict:
+        return (await fts_index_stats([table]))["tables"][0]["settings"]
+
+    first_entered = asyncio.Event()
+    first_done = asyncio.Event()
+
+    async def _first() -> None:
+        async with fts_bulk_ingest():
+            first_entered.set()
+            await first_done.wait()
+
+    first = asyncio.create_task(_first())
+    await first_entered.wait()
+    async with fts_bulk_ingest():
+        # The outer run finishes first; the inner run keeps the bulk settings.
+        first_done.set()
+        await first
+        assert (await _settings())["automerge"] == 0
+
+    assert (await _settings())["automerge"] == 8
+    assert (await _settings())["crisismerge"] == 32
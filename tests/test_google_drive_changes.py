@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from katalog.config import actor_path
+from katalog.constants.metadata import FILE_PATH
+from katalog.db.actors import get_actor_repo
+from katalog.db.assets import get_asset_repo
+from katalog.db.changesets import get_changeset_repo
+from katalog.models import Actor, ActorType, OpStatus
+from katalog.sources.google_drive import GOOGLE_DRIVE_FOLDER_MIME, GoogleDriveClient
+from katalog.sources.runtime import run_sources
+
+
+class FakeDrive:
+    """Just enough of the Drive v3 API for files.list, files.get and changes.list."""
+
+    def __init__(self) -> None:
+        self.files: dict[str, dict[str, Any]] = {
+            "root": {"id": "root", "name": "My Drive", "mimeType": GOOGLE_DRIVE_FOLDER_MIME}
+        }
+        # page token -> changes.list payload; missing tokens answer 410 Gone.
+        self.change_pages: dict[str, dict[str, Any]] = {}
+        self.start_page_token = "1"
+        self.requests: list[str] = []
+
+    def add(self, file_id: str, name: str, parent: str, *, folder: bool = False) -> dict:
+        file = {
+            "id": file_id,
+            "name": name,
+            "parents": [parent],
+            "mimeType": GOOGLE_DRIVE_FOLDER_MIME if folder else "text/plain",
+            "modifiedTime": "2024-01-01T00:00:00.000Z",
+        }
+        self.files[file_id] = file
+        return file
+
+    def listing(self, query: str) -> list[dict[str, Any]]:
+        files = [f for f in self.files.values() if f["id"] != "root" and not f.get("trashed")]
+        parent = re.search(r"'([^']+)' in parents", query)
+        if parent:
+            return [f for f in files if parent.group(1) in f.get("parents", [])]
+        if GOOGLE_DRIVE_FOLDER_MIME in query:
+            return [f for f in files if f["mimeType"] == GOOGLE_DRIVE_FOLDER_MIME]
+        return files
+
+    def handle(self, path: str, params: dict[str, str]) -> tuple[int, dict[str, Any]]:
+        self.requests.append(path)
+        if path == "/drive/v3/changes/startPageToken":
+            return 200, {"startPageToken": self.start_page_token}
+        if path == "/drive/v3/changes":
+            page = self.change_pages.get(params.get("pageToken", ""))
+            return (200, page) if page is not None else (410, {"error": "gone"})
+        if path == "/drive/v3/files":
+            return 200, {"files": self.listing(params.get("q", ""))}
+        if path.startswith("/drive/v3/files/"):
+            file = self.files.get(path.rsplit("/", 1)[1])
+            return (200, file) if file is not None else (404, {"error": "not found"})
+        return 404, {"error": "not found"}
+
+
+@pytest.fixture
+def fake_drive():
+    drive = FakeDrive()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            url = urlparse(self.path)
+            params = {key: values[0] for key, values in parse_qs(url.query).items()}
+            status, payload = drive.handle(url.path, params)
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    drive.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield drive
+    server.shutdown()
+    thread.join()
+
+
+async def _drive_actor(drive: FakeDrive) -> Actor:
+    actor = await get_actor_repo().create(
+        name="drive-changes",
+        plugin_id=GoogleDriveClient.plugin_id,
+        type=ActorType.SOURCE,
+        config={"api_base_url": drive.base_url, "allow_incremental": True},
+    )
+    (actor_path(int(actor.id)) / "token.json").write_text(
+        json.dumps(
+            {
+                "token": "fake-token",
+                "refresh_token": "fake-refresh",
+                "client_id": "fake-client",
+                "client_secret": "fake-secret",
+                # Without an expiry the token counts as expired and would be
+                # refreshed against the real OAuth endpoint.
+                "expiry": "2999-01-01T00:00:00Z",
+            }
+        )
+    )
+    return actor
+
+
+async def _seed_token(actor: Actor, token: str) -> None:
+    changeset = await get_changeset_repo().begin(
+        actors=[actor], message="Seed Drive token", status=OpStatus.IN_PROGRESS
+    )
+    changeset.data = {
+        **(changeset.data or {}),
+        "source_state": {
+            str(actor.id): {"start_page_token": token, "corpora": "user", "drive_id": None}
+        },
+    }
+    await changeset.finalize(status=OpStatus.COMPLETED)
+
+
+async def _scan(actor: Actor) -> dict[str, float]:
+    changeset = await get_changeset_repo().begin(
+        actors=[actor], message="Drive scan", status=OpStatus.IN_PROGRESS
+    )
+    status = await run_sources(sources=[actor], changeset=changeset, run_processors=False)
+    await changeset.finalize(status=status)
+    assert status == OpStatus.COMPLETED
+    return changeset.data["scan_metrics"]
+
+
+def _change(file: dict[str, Any], *, removed: bool = False) -> dict[str, Any]:
+    return {"fileId": file["id"], "changeType": "file", "removed": removed, "file": file}
+
+
+@pytest.mark.asyncio
+async def test_changes_apply_additions_moves_and_removals(db_session, fake_drive):
+    _ = db_session
+    actor = await _drive_actor(fake_drive)
+    await _seed_token(actor, "1")
+    docs = fake_drive.add("f1", "docs", "root", folder=True)
+    a = fake_drive.add("a", "a.txt", "f1")
+    b = fake_drive.add("b", "b.txt", "f1")
+    c = fake_drive.add("c", "c.txt", "root")
+    fake_drive.change_pages["1"] = {
+        "changes": [_change(docs), _change(a), _change(b), _change(c)],
+        "newStartPageToken": "2",
+    }
+
+    metrics = await _scan(actor)
+
+    assert metrics["assets_added"] == 4
+    state = await get_changeset_repo().latest_source_state(int(actor.id))
+    assert state is not None and state["start_page_token"] == "2"
+
+    # Renaming a folder only reports the folder; its files must be re-resolved.
+    docs = {**docs, "name": "papers"}
+    fake_drive.files["f1"] = docs
+    fake_drive.files.pop("c")
+    fake_drive.change_pages["2"] = {
+        "changes": [_change(docs), {"fileId": "c", "changeType": "file", "removed": True}],
+        "newStartPageToken": "3",
+    }
+
+    metrics = await _scan(actor)
+
+    assert metrics["assets_lost"] == 1
+    moved = await get_asset_repo().list_asset_ids_for_paths(
+        actor_id=int(actor.id), paths=["My Drive/papers"], key=FILE_PATH
+    )
+    assert len(moved) == 3
+    stale = await get_asset_repo().list_asset_ids_for_paths(
+        actor_id=int(actor.id), paths=["My Drive/docs"], key=FILE_PATH
+    )
+    assert stale == []
+    state = await get_changeset_repo().latest_source_state(int(actor.id))
+    assert state["start_page_token"] == "3"
+
+
+@pytest.mark.asyncio
+async def test_expired_token_falls_back_to_full_scan(db_session, fake_drive):
+    _ = db_session
+    actor = await _drive_actor(fake_drive)
+    await _seed_token(actor, "expired")
+    fake_drive.add("f1", "docs", "root", folder=True)
+    fake_drive.add("a", "a.txt", "f1")
+    fake_drive.start_page_token = "7"
+
+    metrics = await _scan(actor)
+
+    assert metrics["assets_added"] == 2
+    assert "/drive/v3/files" in fake_drive.requests
+    state = await get_changeset_repo().latest_source_state(int(actor.id))
+    assert state is not None and state["start_page_token"] == "7"
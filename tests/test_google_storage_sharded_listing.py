@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from katalog.db.actors import get_actor_repo
+from katalog.models import ActorType
+from katalog.sources.google_storage import GoogleStorageSource
+
+BUCKET = "bucket"
+OBJECTS = sorted(
+    [
+        "root/a.txt",
+        *(f"root/docs/{idx:02d}.pdf" for idx in range(7)),
+        *(f"root/images/{idx:02d}.png" for idx in range(5)),
+        "root/m.txt",
+        *(f"root/videos/{idx:02d}.mp4" for idx in range(4)),
+        "root/z.txt",
+        "other/outside.txt",
+    ]
+)
+PAGE_SIZE = 2
+
+
+class FakeGcs:
+    def __init__(self) -> None:
+        self.listings: list[dict[str, str]] = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def list_objects(self, params: dict[str, str]) -> dict[str, Any]:
+        prefix = params.get("prefix", "")
+        delimiter = params.get("delimiter")
+        start = params.get("startOffset")
+        end = params.get("endOffset")
+        names = [
+            name
+            for name in OBJECTS
+            if name.startswith(prefix)
+            and (start is None or name >= start)
+            and (end is None or name < end)
+        ]
+        items: list[str] = []
+        prefixes: set[str] = set()
+        for name in names:
+            rest = name[len(prefix) :]
+            if delimiter and delimiter in rest:
+                prefixes.add(prefix + rest.split(delimiter, 1)[0] + delimiter)
+            else:
+                items.append(name)
+        offset = int(params.get("pageToken") or 0)
+        page = items[offset : offset + PAGE_SIZE]
+        payload: dict[str, Any] = {
+            "kind": "storage#objects",
+            "items": [
+                {
+                    "kind": "storage#object",
+                    "bucket": BUCKET,
+                    "name": name,
+                    "size": str(len(name)),
+                    "contentType": "application/octet-stream",
+                    "updated": "2024-05-01T10:00:00.000Z",
+                }
+                for name in page
+            ],
+            "prefixes": sorted(prefixes),
+        }
+        if offset + PAGE_SIZE < len(items):
+            payload["nextPageToken"] = str(offset + PAGE_SIZE)
+        return payload
+
+
+@pytest.fixture
+def fake_gcs():
+    gcs = FakeGcs()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            parsed = urlparse(self.path)
+            if parsed.path != f"/storage/v1/b/{BUCKET}/o":
+                self.send_error(404)
+                return
+            params = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+            gcs.listings.append(params)
+            with gcs.lock:
+                gcs.active += 1
+                gcs.max_active = max(gcs.max_active, gcs.active)
+            time.sleep(0.02)
+            with gcs.lock:
+                gcs.active -= 1
+            body = json.dumps(gcs.list_objects(params)).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    gcs.endpoint = f"http://127.0.0.1:{server.server_address[1]}"
+    yield gcs
+    server.shutdown()
+    thread.join()
+
+
+async def _source(fake_gcs: FakeGcs, **config: Any) -> GoogleStorageSource:
+    actor = await get_actor_repo().create(
+        name="gcs-sharded",
+        plugin_id=GoogleStorageSource.plugin_id,
+        type=ActorType.SOURCE,
+        config={
+            "gcs_url": f"gs://{BUCKET}/root",
+            "api_endpoint": fake_gcs.endpoint,
+            "project": "test",
+            **config,
+        },
+    )
+    return GoogleStorageSource(actor, **(actor.config or {}))
+
+
+EXPECTED = [name for name in OBJECTS if name.startswith("root/")]
+
+
+@pytest.mark.asyncio
+async def test_discovered_shards_are_listed_concurrently(db_session, fake_gcs):
+    _ = db_session
+    source = await _source(fake_gcs, listing_concurrency=4)
+
+    scan_result = await source.scan()
+    names = [result.asset.external_id async for result in scan_result.iterator]
+
+    assert sorted(names) == EXPECTED
+    assert fake_gcs.listings[0]["delimiter"] == "/"
+    assert fake_gcs.max_active > 1
+    cursor = scan_result.checkpoint()
+    assert [(shard["start"], shard["end"]) for shard in cursor["shards"]] == [
+        (None, "root/docs/"),
+        ("root/docs/", "root/images/"),
+        ("root/images/", "root/videos/"),
+        ("root/videos/", None),
+    ]
+    assert all(shard["done"] for shard in cursor["shards"])
+
+
+@pytest.mark.asyncio
+async def test_resume_continues_each_shard_from_its_checkpoint(db_session, fake_gcs):
+    _ = db_session
+    source = await _source(fake_gcs, shard_prefixes=["docs", "m.txt"], listing_concurrency=2)
+
+    scan_result = await source.scan()
+    first: list[str] = []
+    async for result in scan_result.iterator:
+        first.append(result.asset.external_id)
+        if len(first) == 5:
+            break
+    cursor = scan_result.checkpoint()
+    await scan_result.iterator.aclose()
+
+    assert [(shard["start"], shard["end"]) for shard in cursor["shards"]] == [
+        (None, "root/docs/"),
+        ("root/docs/", "root/m.txt/"),
+        ("root/m.txt/", None),
+    ]
+
+    resumed = await source.resume_scan(json.loads(json.dumps(cursor)))
+    rest = [result.asset.external_id async for result in resumed.iterator]
+
+    assert set(first) | set(rest) == set(EXPECTED)
+    assert len(rest) < len(EXPECTED)
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+from katalog.db.actors import get_actor_repo
+from katalog.db.assets import get_asset_repo
+from katalog.db.changesets import get_changeset_repo
+from katalog.db.fingerprints import get_fingerprint_repo
+from katalog.models import Actor, ActorType, OpStatus
+from katalog.processors.runtime import processor_pipeline_key
+from katalog.sources.http_url import HttpUrlSource
+from katalog.sources.runtime import run_sources
+
+
+class FakeSite:
+    def __init__(self) -> None:
+        self.etag = '"v1"'
+        self.last_modified = "Wed, 01 May 2024 10:00:00 GMT"
+        self.requests: list[tuple[str, str, dict[str, str]]] = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+
+@pytest.fixture
+def fake_site():
+    site = FakeSite()
+
+    class Handler(BaseHTTPRequestHandler):
+        def _respond(self, with_body: bool) -> None:
+            headers = {key.lower(): value for key, value in self.headers.items()}
+            site.requests.append((self.command, self.path, headers))
+            if self.path.startswith("/slow"):
+                with site.lock:
+                    site.active += 1
+                    site.max_active = max(site.max_active, site.active)
+                time.sleep(0.1)
+                with site.lock:
+                    site.active -= 1
+            if headers.get("if-none-match") == site.etag:
+                self.send_response(304)
+                self.send_header("ETag", site.etag)
+                self.end_headers()
+                return
+            body = b"%PDF-1.4 fake"
+            self.send_response(200)
+            self.send_header("Content-Type", "application/pdf")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", site.etag)
+            self.send_header("Last-Modified", site.last_modified)
+            self.end_headers()
+            if with_body:
+                self.wfile.write(body)
+
+        def do_HEAD(self) -> None:  # noqa: N802
+            self._respond(with_body=False)
+
+        def do_GET(self) -> None:  # noqa: N802
+            self._respond(with_body=True)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    site.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield site
+    server.shutdown()
+    thread.join()
+
+
+async def _scan(actor: Actor) -> dict[str, float]:
+    changeset = await get_changeset_repo().begin(
+        actors=[actor], message="HTTP scan", status=OpStatus.IN_PROGRESS
+    )
+    status = await run_sources(sources=[actor], changeset=changeset, run_processors=False)
+    await changeset.finalize(status=status)
+    assert status == OpStatus.COMPLETED
+    return changeset.data["scan_metrics"]
+
+
+@pytest.mark.asyncio
+async def test_rescan_sends_validators_and_skips_unmodified_urls(
+    db_session, tmp_path, fake_site
+):
+    _ = db_session
+    json_file = tmp_path / "documents.json"
+    json_file.write_text(json.dumps([{"url": f"{fake_site.base_url}/doc.pdf"}]))
+    json_actor = await get_actor_repo().create(
+        name="json-list",
+        plugin_id="katalog.sources.json_list.JsonListSource",
+        type=ActorType.SOURCE,
+        config={"json_file": str(json_file)},
+    )
+    await get_actor_repo().create(
+        name="http-url",
+        plugin_id=HttpUrlSource.plugin_id,
+        type=ActorType.SOURCE,
+        config={"timeout_seconds": 2.0},
+    )
+
+    await _scan(json_actor)
+    assert "if-none-match" not in fake_site.requests[-1][2]
+    # A 304 is only trusted for the pipeline that processed the URL.
+    http_assets = await get_asset_repo().list_rows(order_by="id", namespace="web")
+    asset_ids = [int(asset.id) for asset in http_assets]
+    assert asset_ids
+    fingerprints = get_fingerprint_repo()
+    assert await fingerprints.settled(asset_ids, pipeline_key=processor_pipeline_key([])) == set(
+        asset_ids
+    )
+    assert not await fingerprints.settled(asset_ids, pipeline_key=processor_pipeline_key([]) + 1)
+
+    metrics = await _scan(json_actor)
+    method, _path, headers = fake_site.requests[-1]
+    assert method == "HEAD"
+    assert headers["if-none-match"] == '"v1"'
+    assert headers["if-modified-since"] == fake_site.last_modified
+    assert metrics["assets_unchanged"] >= 1
+
+    fake_site.etag = '"v2"'
+    await _scan(json_actor)
+    metrics = await _scan(json_actor)
+    assert fake_site.requests[-1][2]["if-none-match"] == '"v2"'
+    assert metrics["assets_unchanged"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_requests_are_limited_per_host(db_session, fake_site):
+    _ = db_session
+    actor = await get_actor_repo().create(
+        name="http-url-limits",
+        plugin_id=HttpUrlSource.plugin_id,
+        type=ActorType.SOURCE,
+        config={"max_connections_per_host": 2},
+    )
+    source = HttpUrlSource(actor, **(actor.config or {}))
+    try:
+        responses = await asyncio.gather(
+            *(
+                source._crawl_once(f"{fake_site.base_url}/slow/{idx}", method="GET")
+                for idx in range(6)
+            )
+        )
+    finally:
+        await source.close()
+
+    assert all(response is not None and response.status_code == 200 for response in responses)
+    assert fake_site.max_active == 2
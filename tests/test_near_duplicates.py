@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import pytest
+
+from katalog.analyzers.base import AnalyzerScope
+from katalog.analyzers.near_duplicates import NearDuplicateAnalyzer
+from katalog.analyzers.runtime import persist_analyzer_metadata
+from katalog.constants.metadata import DOC_TEXT, HASH_MINHASH, HASH_SIMHASH, REL_SIMILAR_TO
+from katalog.db.actors import get_actor_repo
+from katalog.db.assets import get_asset_repo
+from katalog.db.changesets import get_changeset_repo
+from katalog.models import ActorType, Asset, MetadataChanges, OpStatus, make_metadata
+from katalog.processors.near_duplicate_fingerprint import NearDuplicateFingerprintProcessor
+from katalog.utils.similarity import (
+    format_simhash,
+    hamming_distance,
+    minhash_bands,
+    minhash_signature,
+    minhash_similarity,
+    parse_simhash,
+    shingle_hashes,
+    simhash,
+    simhash_blocks,
+    tokenize,
+)
+
+BASE_TEXT = " ".join(f"word{idx}" for idx in range(200))
+EDITED_TEXT = BASE_TEXT.replace("word100 ", "changed ")
+OTHER_TEXT = " ".join(f"other{idx}" for idx in range(200))
+
+
+def _fingerprints(text: str) -> tuple[list[int], str]:
+    tokens = tokenize(text)
+    return minhash_signature(shingle_hashes(tokens, 5), 128), format_simhash(simhash(tokens))
+
+
+def test_minhash_estimates_jaccard_similarity():
+    base, _ = _fingerprints(BASE_TEXT)
+    edited, _ = _fingerprints(EDITED_TEXT)
+    other, _ = _fingerprints(OTHER_TEXT)
+
+    assert minhash_similarity(base, base) == 1.0
+    assert minhash_similarity(base, edited) > 0.85
+    assert minhash_similarity(base, other) < 0.1
+    assert minhash_similarity(base, base[:64]) is None
+    assert any(
+        left == right
+        for left, right in zip(minhash_bands(base, 16), minhash_bands(edited, 16))
+    )
+
+
+def test_simhash_blocks_share_a_block_within_distance():
+    value = parse_simhash(_fingerprints(BASE_TEXT)[1])
+    assert value is not None
+    flipped = value ^ (1 << 0) ^ (1 << 30) ^ (1 << 63)
+    assert hamming_distance(value, flipped) == 3
+
+    shared = set(simhash_blocks(value, 3)) & set(simhash_blocks(flipped, 3))
+    assert len(shared) == 1
+    assert parse_simhash(format_simhash(flipped)) == flipped
+    assert parse_simhash("not-hex") is None
+
+
+async def _save_fingerprints(source, changeset, assets_by_text):  # noqa: ANN001
+    metadata = []
+    for asset, text in assets_by_text:
+        if text is None:
+            # A None value tombstones the actor's current fingerprints.
+            metadata.append(make_metadata(HASH_MINHASH, None, source.id, asset=asset))
+            metadata.append(make_metadata(HASH_SIMHASH, None, source.id, asset=asset))
+            continue
+        minhash, simhash_hex = _fingerprints(text)
+        metadata.append(make_metadata(HASH_MINHASH, minhash, source.id, asset=asset))
+        metadata.append(make_metadata(HASH_SIMHASH, simhash_hex, source.id, asset=asset))
+    await persist_analyzer_metadata(actor=source, changeset=changeset, metadata=metadata)
+
+
+def _relations(result) -> set[tuple[int, int, bool]]:  # noqa: ANN001
+    return {
+        (entry.asset_id, entry.value_relation_id, entry.removed)
+        for entry in result.metadata
+        if entry.key == REL_SIMILAR_TO
+    }
+
+
+@pytest.mark.asyncio
+async def test_near_duplicate_analyzer_updates_pairs_incrementally(db_session, monkeypatch):
+    _ = db_session
+    actor_db = get_actor_repo()
+    asset_db = get_asset_repo()
+    changeset_db = get_changeset_repo()
+    source = await actor_db.create(
+        name="source", plugin_id="plugin.source", type=ActorType.SOURCE
+    )
+    analyzer_actor = await actor_db.create(
+        name="near duplicates",
+        plugin_id=NearDuplicateAnalyzer.plugin_id,
+        type=ActorType.ANALYZER,
+    )
+
+    first = await changeset_db.create(id=1, status=OpStatus.IN_PROGRESS)
+    assets: list[Asset] = []
+    for idx in range(3):
+        asset = Asset(
+            namespace="test",
+            external_id=f"doc-{idx}",
+            canonical_uri=f"file:///doc-{idx}",
+            actor_id=source.id,
+        )
+        await asset_db.save_record(asset, changeset=first, actor=source)
+        assets.append(asset)
+    original, edited, unrelated = assets
+    await _save_fingerprints(
+        source,
+        first,
+        [(original, BASE_TEXT), (edited, EDITED_TEXT), (unrelated, OTHER_TEXT)],
+    )
+
+    analyzer = NearDuplicateAnalyzer(analyzer_actor)
+    state = None
+
+    async def _load_state():
+        return state
+
+    monkeypatch.setattr(analyzer, "load_analyzer_state", _load_state)
+    result = await analyzer.run(changeset=first, scope=AnalyzerScope.all())
+
+    low, high = sorted([original.id, edited.id])
+    assert _relations(result) == {(high, low, False)}
+    assert result.output["indexed_assets"] == 3
+    assert result.output["pairs_added"] == 1
+    state = result.state
+    assert state == {"changeset_id": first.id}
+
+    # Nothing changed since the checkpoint: no work and no findings.
+    second = await changeset_db.create(id=2, status=OpStatus.IN_PROGRESS)
+    result = await analyzer.run(changeset=second, scope=AnalyzerScope.all())
+    assert result.output["changed_assets"] == 0
+    assert result.metadata == []
+    state = result.state
+
+    # The unrelated document becomes a copy and the edited one loses its text.
+    third = await changeset_db.create(id=3, status=OpStatus.IN_PROGRESS)
+    await _save_fingerprints(source, third, [(unrelated, BASE_TEXT), (edited, None)])
+    result = await analyzer.run(changeset=third, scope=AnalyzerScope.all())
+
+    assert result.output["changed_assets"] == 2
+    assert result.output["pairs_removed"] == 1
+    assert _relations(result) == {
+        (high, low, True),
+        (max(original.id, unrelated.id), min(original.id, unrelated.id), False),
+    }
+
+
+@pytest.mark.asyncio
+async def test_fingerprints_are_retracted_when_text_gets_too_short(db_session):
+    _ = db_session
+    actor_db = get_actor_repo()
+    asset_db = get_asset_repo()
+    changeset_db = get_changeset_repo()
+    source = await actor_db.create(
+        name="source", plugin_id="plugin.source", type=ActorType.SOURCE
+    )
+    processor_actor = await actor_db.create(
+        name="fingerprints",
+        plugin_id=NearDuplicateFingerprintProcessor.plugin_id,
+        type=ActorType.PROCESSOR,
+    )
+    processor = NearDuplicateFingerprintProcessor(processor_actor)
+    asset = Asset(
+        namespace="test",
+        external_id="doc",
+        canonical_uri="file:///doc",
+        actor_id=source.id,
+    )
+    first = await changeset_db.create(id=1, status=OpStatus.IN_PROGRESS)
+    await asset_db.save_record(asset, changeset=first, actor=source)
+
+    async def _process(changeset, text: str | None):  # noqa: ANN001
+        staged = []
+        if text is not None:
+            staged = [
+                make_metadata(DOC_TEXT, None, source.id, asset=asset, changeset=changeset),
+                make_metadata(DOC_TEXT, text, source.id, asset=asset, changeset=changeset),
+            ]
+        changes = MetadataChanges(
+            asset=asset, loaded=await asset_db.load_metadata(asset), staged=staged
+        )
+        if not processor.should_run(changes):
+            return None
+        result = await processor.run(changes)
+        for entry in result.metadata:
+            entry.asset_id = asset.id
+        await persist_analyzer_metadata(
+            actor=source, changeset=changeset, metadata=[*staged, *result.metadata]
+        )
+        current = MetadataChanges(asset=asset, loaded=await asset_db.load_metadata(asset))
+        return {key: [entry.value for entry in entries] for key, entries in current.current().items()}
+
+    current = await _process(first, BASE_TEXT)
+    assert current is not None
+    assert len(current[HASH_MINHASH][0]) == 128
+    assert len(current[HASH_SIMHASH]) == 1
+
+    second = await changeset_db.create(id=2, status=OpStatus.IN_PROGRESS)
+    current = await _process(second, "too short")
+    assert current is not None
+    assert current[HASH_MINHASH] == [[]]
+    assert HASH_SIMHASH not in current
+
+    # The empty signature stops the processor from re-running on unchanged text.
+    third = await changeset_db.create(id=3, status=OpStatus.IN_PROGRESS)
+    assert await _process(third, None) is None
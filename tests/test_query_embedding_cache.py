@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from katalog.vectors import embedding
+from katalog.vectors.embedding import (
+    QueryEmbeddingCache,
+    embed_query_cached,
+    normalize_query_text,
+    query_embedding_cache,
+)
+
+
+@pytest.fixture
+def embed_calls(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls: list[str] = []
+
+    async def _fake_embed(text: str, *, model, backend, dim):  # noqa: ANN001
+        calls.append(text)
+        await asyncio.sleep(0)
+        return [float(len(text)), float(dim or 0)]
+
+    monkeypatch.setattr(embedding, "embed_text_kreuzberg", _fake_embed)
+    query_embedding_cache().clear()
+    yield calls
+    query_embedding_cache().clear()
+
+
+def test_normalize_query_text_collapses_whitespace() -> None:
+    assert normalize_query_text("  hello \t\n world ") == "hello world"
+    assert normalize_query_text("ﬁle") == "file"
+
+
+@pytest.mark.asyncio
+async def test_repeated_query_embeds_once(embed_calls: list[str]) -> None:
+    first = await embed_query_cached("hello  world", actor_id=1, dim=64)
+    second = await embed_query_cached(" hello world ", actor_id=1, dim=64)
+
+    assert first == second
+    assert embed_calls == ["hello world"]
+    # Returned vectors are copies; mutating one must not poison the cache.
+    first.append(99.0)
+    assert await embed_query_cached("hello world", actor_id=1, dim=64) == second
+
+    await embed_query_cached("hello world", actor_id=2, dim=64)
+    await embed_query_cached("hello world", actor_id=1, dim=32)
+    assert len(embed_calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_queries_share_inflight_embedding(embed_calls: list[str]) -> None:
+    results = await asyncio.gather(
+        *(embed_query_cached("same query", actor_id=1, dim=8) for _ in range(5))
+    )
+
+    assert embed_calls == ["same query"]
+    assert all(result == results[0] for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used() -> None:
+    cache = QueryEmbeddingCache(max_entries=2)
+
+    async def _vector() -> list[float]:
+        return [1.0]
+
+    await cache.get_or_embed((1, "preset", "fast", 8, "a"), _vector)
+    await cache.get_or_embed((1, "preset", "fast", 8, "b"), _vector)
+    await cache.get_or_embed((1, "preset", "fast", 8, "a"), _vector)
+    await cache.get_or_embed((1, "preset", "fast", 8, "c"), _vector)
+    await cache.get_or_embed((1, "preset", "fast", 8, "b"), _vector)
+
+    assert cache.stats() == {"entries": 2, "max_entries": 2, "hits": 1, "misses": 4}
+
+
+@pytest.mark.asyncio
+async def test_persisted_embeddings_survive_memory_cache_clear(
+    embed_calls: list[str],
+) -> None:
+    first = await embed_query_cached("persisted query", actor_id=1, dim=8, persist=True)
+    query_embedding_cache().clear()
+    second = await embed_query_cached("persisted  query", actor_id=2, dim=8, persist=True)
+
+    assert second == first
+    assert embed_calls == ["persisted query"]
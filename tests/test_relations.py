@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import pytest
+
+from katalog.analyzers.runtime import persist_analyzer_metadata
+from katalog.constants.metadata import REL_CHILD_OF, REL_LINK_TO, get_metadata_id
+from katalog.db.actors import get_actor_repo
+from katalog.db.assets import get_asset_repo
+from katalog.db.changesets import get_changeset_repo
+from katalog.db.relations import get_relation_repo
+from katalog.models import ActorType, Asset, OpStatus, make_metadata
+
+
+@pytest.mark.asyncio
+async def test_relation_edges_follow_metadata_and_traverse_cycles(db_session):
+    _ = db_session
+    actor_db = get_actor_repo()
+    asset_db = get_asset_repo()
+    relations = get_relation_repo()
+    actor = await actor_db.create(
+        name="source", plugin_id="plugin.source", type=ActorType.SOURCE
+    )
+    first = await get_changeset_repo().create(id=1, status=OpStatus.IN_PROGRESS)
+
+    assets: list[Asset] = []
+    for idx in range(5):
+        asset = Asset(
+            namespace="test",
+            external_id=f"asset-{idx}",
+            canonical_uri=f"file:///asset-{idx}",
+            actor_id=actor.id,
+        )
+        await asset_db.save_record(asset, changeset=first, actor=actor)
+        assets.append(asset)
+    a, b, c, d, e = assets
+
+    # a -> b -> c -> a is a cycle; d is linked to c by another key; e stays alone.
+    await persist_analyzer_metadata(
+        actor=actor,
+        changeset=first,
+        metadata=[
+            make_metadata(REL_LINK_TO, b.id, actor.id, asset=a),
+            make_metadata(REL_LINK_TO, c.id, actor.id, asset=b),
+            make_metadata(REL_LINK_TO, a.id, actor.id, asset=c),
+            make_metadata(REL_CHILD_OF, c.id, actor.id, asset=d),
+        ],
+    )
+    assert await relations.count() == 4
+
+    link_key = int(get_metadata_id(REL_LINK_TO))
+    edges = await relations.neighbors(c.id, direction="in")
+    assert sorted((edge.from_asset_id, edge.metadata_key_id) for edge in edges) == sorted(
+        [(b.id, link_key), (d.id, int(get_metadata_id(REL_CHILD_OF)))]
+    )
+    assert [edge.actor_ids for edge in edges] == [(actor.id,), (actor.id,)]
+
+    traversal = await relations.traverse(a.id, max_depth=5, direction="out")
+    assert [(item.asset_id, item.depth) for item in traversal.assets] == [(b.id, 1), (c.id, 2)]
+    assert traversal.truncated is False
+
+    traversal = await relations.traverse(a.id, max_depth=1, direction="both")
+    assert sorted(item.asset_id for item in traversal.assets) == sorted([b.id, c.id])
+
+    traversal = await relations.traverse(a.id, max_depth=3, key_ids=[link_key], limit=1)
+    assert [item.asset_id for item in traversal.assets] == [min(b.id, c.id)]
+    assert traversal.truncated is True
+
+    component = await relations.component(a.id)
+    assert sorted(item.asset_id for item in component.assets) == sorted([b.id, c.id, d.id])
+    assert (await relations.component(e.id)).assets == []
+
+    # Retracting an edge removes it from the index; a rebuild agrees.
+    second = await get_changeset_repo().create(id=2, status=OpStatus.IN_PROGRESS)
+    await persist_analyzer_metadata(
+        actor=actor,
+        changeset=second,
+        metadata=[make_metadata(REL_CHILD_OF, c.id, actor.id, asset=d, removed=True)],
+    )
+    component = await relations.component(a.id)
+    assert sorted(item.asset_id for item in component.assets) == sorted([b.id, c.id])
+    assert await relations.rebuild() == 3
+
+    # Deleting an asset drops every edge touching it.
+    await asset_db.delete_assets([b.id])
+    assert await relations.count() == 1
+    traversal = await relations.traverse(a.id, max_depth=5, direction="out")
+    assert traversal.assets == []
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+
+import pytest
+
+from katalog.sources import remote_reader
+from katalog.sources.remote_reader import RangeResponse, RemoteDataReader, RemoteReadPool
+
+CHUNK = 1024
+BLOB = bytes(range(256)) * 20  # 5120 bytes, five chunks
+
+
+class FakeObject:
+    def __init__(self, data: bytes, *, honor_ranges: bool = True) -> None:
+        self.data = data
+        self.honor_ranges = honor_ranges
+        self.calls: list[tuple[int, int | None]] = []
+
+    async def fetch(self, start: int, end: int | None) -> RangeResponse:
+        self.calls.append((start, end))
+        await asyncio.sleep(0.01)
+        if not self.honor_ranges:
+            return RangeResponse(data=self.data, start=0, total_size=len(self.data))
+        return RangeResponse(
+            data=self.data[start:end], start=start, total_size=len(self.data)
+        )
+
+
+def _reader(
+    remote: FakeObject,
+    pool: RemoteReadPool,
+    *,
+    digest: str | None = None,
+    size: int | None = None,
+):
+    return RemoteDataReader(
+        pool=pool,
+        fetch_range=remote.fetch,
+        object_key="fake:blob",
+        cache_type="sha256" if digest else None,
+        cache_digest=digest,
+        size=size,
+        chunk_size=CHUNK,
+    )
+
+
+@pytest.mark.asyncio
+async def test_small_reads_fetch_only_the_needed_chunks_and_hit_the_cache():
+    remote = FakeObject(BLOB)
+    digest = hashlib.sha256(BLOB).hexdigest()
+    pool = RemoteReadPool(2)
+
+    assert await _reader(remote, pool, digest=digest).read(10, 100) == BLOB[10:110]
+    assert remote.calls == [(0, CHUNK)]
+
+    # A fresh reader of the same content is served from the chunk cache.
+    assert await _reader(remote, pool, digest=digest).read(20, 50) == BLOB[20:70]
+    assert len(remote.calls) == 1
+
+    assert await _reader(remote, pool, digest=digest).read(CHUNK - 5, 10) == BLOB[CHUNK - 5 : CHUNK + 5]
+    assert remote.calls[1:] == [(CHUNK, 2 * CHUNK)]
+
+    assert await _reader(remote, pool, digest=digest).read() == BLOB
+    assert await _reader(remote, pool, digest=digest).read(4000) == BLOB[4000:]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reads_share_downloads():
+    remote = FakeObject(BLOB)
+    pool = RemoteReadPool(4)
+
+    results = await asyncio.gather(*(_reader(remote, pool).read(0, 3000) for _ in range(5)))
+
+    assert all(result == BLOB[:3000] for result in results)
+    assert remote.calls == [(0, 3 * CHUNK)]
+
+
+@pytest.mark.asyncio
+async def test_server_without_range_support_and_no_cache():
+    remote = FakeObject(BLOB, honor_ranges=False)
+    pool = RemoteReadPool(1)
+
+    assert await _reader(remote, pool).read(CHUNK * 2 + 3, 7) == BLOB[CHUNK * 2 + 3 : CHUNK * 2 + 10]
+    assert await _reader(remote, pool).read() == BLOB
+    assert await _reader(remote, pool).read(100, 5, no_cache=True) == BLOB[100:105]
+
+
+@pytest.mark.asyncio
+async def test_server_ignoring_ranges_is_downloaded_once(monkeypatch):
+    monkeypatch.setattr(remote_reader, "PART_CHUNKS", 2)
+    remote = FakeObject(BLOB, honor_ranges=False)
+    pool = RemoteReadPool(4)
+
+    assert await _reader(remote, pool, size=len(BLOB)).read() == BLOB
+    assert remote.calls == [(0, 2 * CHUNK)]
+
+
+@pytest.mark.asyncio
+async def test_ranged_parts_download_in_parallel(monkeypatch):
+    monkeypatch.setattr(remote_reader, "PART_CHUNKS", 2)
+    remote = FakeObject(BLOB)
+    pool = RemoteReadPool(4)
+
+    assert await _reader(remote, pool, size=len(BLOB)).read() == BLOB
+    assert sorted(remote.calls) == [(0, 2 * CHUNK), (2 * CHUNK, 4 * CHUNK), (4 * CHUNK, len(BLOB))]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_reader_does_not_fail_readers_sharing_its_download():
+    remote = FakeObject(BLOB)
+    pool = RemoteReadPool(2)
+
+    owner = asyncio.create_task(_reader(remote, pool).read(0, 100))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(_reader(remote, pool).read(0, 100))
+    await asyncio.sleep(0)
+    owner.cancel()
+
+    assert await waiter == BLOB[:100]
+    assert owner.cancelled()
+    assert remote.calls == [(0, CHUNK)]
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from katalog.analyzers import retrieval_eval
+from katalog.analyzers.base import AnalyzerScope
+from katalog.analyzers.retrieval_eval import QueryCase, RetrievalEvalAnalyzer, _latency_percentiles
+from katalog.constants.metadata import DOC_CHUNK_TEXT, get_metadata_id
+from katalog.db.vectors import VectorSearchHit
+from katalog.models import Actor, ActorType
+
+
+def test_latency_percentiles_use_nearest_rank():
+    assert _latency_percentiles([]) == {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    assert _latency_percentiles([float(value) for value in range(100, 0, -1)]) == {
+        "p50": 50.0,
+        "p95": 95.0,
+        "p99": 99.0,
+        "max": 100.0,
+    }
+    assert _latency_percentiles([3.0, 1.0]) == {"p50": 1.0, "p95": 3.0, "p99": 3.0, "max": 3.0}
+
+
+class _FakeVectors:
+    def __init__(self) -> None:
+        self.active = 0
+        self.max_active = 0
+
+    async def is_ready(self) -> tuple[bool, str | None]:
+        return True, None
+
+    async def search(self, *, query_vector, asset_ids, **kwargs):  # noqa: ANN001
+        _ = asset_ids, kwargs
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        # Even-numbered queries find their source asset first, odd ones miss.
+        asset_id = int(query_vector[0])
+        target = asset_id if asset_id % 2 == 0 else 999
+        return [
+            VectorSearchHit(
+                point_id=asset_id,
+                asset_id=target,
+                metadata_key_id=int(get_metadata_id(DOC_CHUNK_TEXT)),
+                source_text="text",
+                distance=0.1,
+                metadata_id=asset_id,
+            )
+        ]
+
+
+@pytest.mark.asyncio
+async def test_query_cases_are_evaluated_concurrently(db_session, tmp_path, monkeypatch):
+    _ = db_session
+    vectors = _FakeVectors()
+    cases = [
+        QueryCase(
+            case_id=f"q{asset_id}",
+            source_asset_id=asset_id,
+            query=str(asset_id),
+            quote=None,
+            relevant_metadata_ids=(),
+            relevant_asset_ids=(),
+            relevant_asset_external_ids=(),
+            relevant_asset_uris=(),
+        )
+        for asset_id in range(1, 9)
+    ]
+
+    async def _embed(query: str, **kwargs):  # noqa: ANN001
+        _ = kwargs
+        return [float(query)]
+
+    async def _scoped(self, scope):  # noqa: ANN001
+        _ = self, scope
+        return [case.source_asset_id for case in cases]
+
+    async def _cases(self, scope):  # noqa: ANN001
+        _ = self, scope
+        return cases
+
+    monkeypatch.setattr(retrieval_eval, "get_vector_repo", lambda: vectors)
+    monkeypatch.setattr(retrieval_eval, "embed_query_cached", _embed)
+    monkeypatch.setattr(retrieval_eval, "analyzer_export_dir", lambda **kwargs: tmp_path)
+    monkeypatch.setattr(RetrievalEvalAnalyzer, "_resolve_scoped_asset_ids", _scoped)
+    monkeypatch.setattr(RetrievalEvalAnalyzer, "_load_query_cases", _cases)
+    analyzer = RetrievalEvalAnalyzer(
+        Actor(id=2, name="eval", plugin_id=RetrievalEvalAnalyzer.plugin_id, type=ActorType.ANALYZER),
+        search_index=1,
+        concurrency=3,
+        k_values=[1],
+    )
+
+    result = await analyzer.run(
+        changeset=SimpleNamespace(id=1),  # type: ignore[arg-type]
+        scope=AnalyzerScope.all(),
+    )
+
+    assert vectors.max_active == 3
+    summary = result.output["summary"]
+    assert summary["queries_evaluated"] == 8
+    assert summary["metrics"]["hit_rate@1"] == 0.5
+    latency = summary["latency_ms"]
+    assert set(latency) == {"p50", "p95", "p99", "max"}
+    assert 10.0 <= latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+    summary_csv = next(path for path in tmp_path.iterdir() if path.name.endswith("summary.csv"))
+    assert "latency_p99_ms" in summary_csv.read_text(encoding="utf-8")
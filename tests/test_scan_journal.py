@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from katalog.db.actors import get_actor_repo
+from katalog.db.changesets import get_changeset_repo
+from katalog.db.scan_journal import get_scan_journal_repo
+from katalog.models import Actor, ActorType, OpStatus
+from katalog.sources import journal
+from katalog.sources.filesystem import FilesystemClient
+from katalog.sources.runtime import run_sources
+
+
+async def _scan(actor: Actor) -> dict[str, float]:
+    changeset = await get_changeset_repo().begin(
+        actors=[actor], message="Filesystem scan", status=OpStatus.IN_PROGRESS
+    )
+    status = await run_sources(sources=[actor], changeset=changeset, run_processors=False)
+    await changeset.finalize(status=status)
+    assert status == OpStatus.COMPLETED
+    return changeset.data["scan_metrics"]
+
+
+@pytest.mark.asyncio
+async def test_interrupted_scan_resumes_with_correct_lost_accounting(
+    tmp_path: Path, db_session, monkeypatch: pytest.MonkeyPatch
+):
+    _ = db_session
+    root = tmp_path / "root"
+    for folder in ("a", "b", "c"):
+        (root / folder).mkdir(parents=True)
+        for idx in range(4):
+            (root / folder / f"{folder}{idx}.txt").write_text(f"{folder} {idx}")
+    actor = await get_actor_repo().create(
+        name="filesystem-journal",
+        plugin_id=FilesystemClient.plugin_id,
+        type=ActorType.SOURCE,
+        config={"root_path": str(root), "max_files": 0, "skip_unchanged": False},
+    )
+    await _scan(actor)
+    (root / "c" / "c3.txt").unlink()
+
+    # Checkpoint after every asset, then die partway through the rescan.
+    monkeypatch.setattr(journal, "CHECKPOINT_INTERVAL_SECONDS", 0.0)
+    original_build = FilesystemClient._build_scan_result
+    built = 0
+
+    def _failing_build(self, item, *, external_id):
+        nonlocal built
+        built += 1
+        if built > 6:
+            raise RuntimeError("scan interrupted")
+        return original_build(self, item, external_id=external_id)
+
+    monkeypatch.setattr(FilesystemClient, "_build_scan_result", _failing_build)
+    changeset = await get_changeset_repo().begin(
+        actors=[actor], message="Interrupted scan", status=OpStatus.IN_PROGRESS
+    )
+    with pytest.raises(RuntimeError, match="scan interrupted"):
+        await run_sources(sources=[actor], changeset=changeset, run_processors=False)
+    await changeset.finalize(status=OpStatus.ERROR)
+
+    session = await get_scan_journal_repo().get(actor_id=int(actor.id))
+    assert session is not None and session.cursor is not None
+    assert session.cursor["root_path"] == str(root.resolve())
+
+    monkeypatch.setattr(FilesystemClient, "_build_scan_result", original_build)
+    metrics = await _scan(actor)
+
+    assert metrics["scan_sessions_resumed"] == 1
+    # Only the unfinished part of the tree is listed again.
+    assert metrics["assets_saved"] < 11
+    # Files seen only by the interrupted run are not mistaken for missing ones.
+    assert metrics["assets_lost"] == 1
+    assert await get_scan_journal_repo().get(actor_id=int(actor.id)) is None
+
+
+@pytest.mark.asyncio
+async def test_finished_scan_leaves_no_journal(tmp_path: Path, db_session):
+    _ = db_session
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "only.txt").write_text("only")
+    actor = await get_actor_repo().create(
+        name="filesystem-journal-clean",
+        plugin_id=FilesystemClient.plugin_id,
+        type=ActorType.SOURCE,
+        config={"root_path": str(root), "max_files": 0},
+    )
+
+    metrics = await _scan(actor)
+
+    assert "scan_sessions_resumed" not in metrics
+    assert await get_scan_journal_repo().get(actor_id=int(actor.id)) is None
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import pytest
+
+from katalog.api.search_fusion import (
+    MAX_CANDIDATE_POOL,
+    BoostSignals,
+    RankedCandidate,
+    apply_boosts,
+    candidate_pool_size,
+    fuse_ranked_lists,
+)
+from katalog.models.query import AssetQuery
+from katalog.models.views import SearchFusionSpec
+
+
+def _candidate(asset_id: int, metadata_id: int, score: float) -> RankedCandidate:
+    return RankedCandidate(
+        asset_id=asset_id,
+        metadata_id=metadata_id,
+        metadata_key_id=1,
+        text=f"text {metadata_id}",
+        raw_score=score,
+    )
+
+
+def test_rrf_prefers_assets_found_by_both_sides() -> None:
+    lexical = [_candidate(1, 10, 5.0), _candidate(2, 20, 4.0)]
+    semantic = [_candidate(3, 30, 0.9), _candidate(2, 21, 0.8)]
+
+    fused = fuse_ranked_lists(lexical, semantic, spec=SearchFusionSpec())
+
+    assert [c.asset_id for c in fused][0] == 2
+    top = fused[0]
+    assert top.lexical_rank == 2
+    assert top.semantic_rank == 2
+    # Semantic chunk represents the fused hit when both sides matched.
+    assert top.metadata_id == 21
+    assert top.score == pytest.approx(1 / 62 + 1 / 62)
+
+
+def test_weighted_fusion_normalizes_each_side() -> None:
+    lexical = [_candidate(1, 10, 12.0), _candidate(2, 20, 2.0)]
+    semantic = [_candidate(2, 21, 0.95), _candidate(1, 11, 0.15)]
+    spec = SearchFusionSpec(method="weighted", lexical_weight=0.25, semantic_weight=1.0)
+
+    fused = fuse_ranked_lists(lexical, semantic, spec=spec)
+
+    scores = {c.asset_id: c.score for c in fused}
+    assert scores[1] == pytest.approx(0.25)
+    assert scores[2] == pytest.approx(1.0)
+    assert fused[0].asset_id == 2
+
+
+def test_metadata_key_fuses_per_row() -> None:
+    lexical = [_candidate(1, 10, 3.0), _candidate(1, 11, 2.0)]
+    semantic = [_candidate(1, 11, 0.9)]
+
+    fused = fuse_ranked_lists(lexical, semantic, spec=SearchFusionSpec(), key="metadata")
+
+    assert [c.metadata_id for c in fused] == [11, 10]
+
+
+def test_boosts_reorder_by_source_and_recency() -> None:
+    lexical = [_candidate(1, 10, 3.0), _candidate(2, 20, 2.0)]
+    spec = SearchFusionSpec(
+        source_boosts={7: 2.0},
+        recency_boost=1.0,
+        recency_half_life_days=30.0,
+    )
+    fused = fuse_ranked_lists(lexical, [], spec=spec)
+    boosted = apply_boosts(
+        fused,
+        {
+            1: BoostSignals(actor_id=5, age_days=3650.0),
+            2: BoostSignals(actor_id=7, age_days=0.0),
+        },
+        spec=spec,
+    )
+
+    assert boosted[0].asset_id == 2
+    assert boosted[0].score == pytest.approx(fused[1].score * 2.0 * 2.0)
+
+
+def test_candidate_pool_is_bounded() -> None:
+    spec = SearchFusionSpec(candidate_pool=100)
+    assert candidate_pool_size(spec, top_k=None, minimum=20) == 100
+    assert candidate_pool_size(spec, top_k=None, minimum=300) == 300
+    assert candidate_pool_size(spec, top_k=10**9, minimum=1) == MAX_CANDIDATE_POOL
+
+
+def test_asset_query_parses_source_boost_strings() -> None:
+    query = AssetQuery(
+        search="hello",
+        search_mode="hybrid",
+        search_source_boosts=["3:1.5", "4:0"],
+    )
+    assert query.search_source_boosts == {3: 1.5, 4: 0.0}
+
+    with pytest.raises(ValueError):
+        AssetQuery(search_source_boosts=["3"])
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import pytest
+
+from katalog.analyzers.base import AnalyzerScope
+from katalog.analyzers.runtime import persist_analyzer_metadata
+from katalog.analyzers.sidecar_links import SidecarLinksAnalyzer
+from katalog.constants.metadata import (
+    FILE_NAME,
+    FILE_PATH,
+    SIDECAR_TARGET_NAME,
+    SIDECAR_TYPE,
+)
+from katalog.db.actors import get_actor_repo
+from katalog.db.assets import get_asset_repo
+from katalog.db.changesets import get_changeset_repo
+from katalog.models import ActorType, Asset, OpStatus, make_metadata
+
+
+def _links(result) -> list[tuple[int, int, bool]]:  # noqa: ANN001
+    return sorted(
+        (int(md.asset_id), int(md.value_relation_id), bool(md.removed))
+        for md in result.metadata
+    )
+
+
+@pytest.mark.asyncio
+async def test_sidecar_links_resolve_only_changed_sidecars(db_session, monkeypatch):
+    _ = db_session
+    actor_db = get_actor_repo()
+    asset_db = get_asset_repo()
+    changeset_db = get_changeset_repo()
+    source = await actor_db.create(
+        name="source", plugin_id="plugin.source", type=ActorType.SOURCE
+    )
+    analyzer_actor = await actor_db.create(
+        name="sidecars",
+        plugin_id=SidecarLinksAnalyzer.plugin_id,
+        type=ActorType.ANALYZER,
+    )
+
+    async def _add_asset(changeset, name: str, metadata) -> Asset:  # noqa: ANN001
+        asset = Asset(
+            namespace="test",
+            external_id=name,
+            canonical_uri=f"file:///photos/{name}",
+            actor_id=source.id,
+        )
+        await asset_db.save_record(asset, changeset=changeset, actor=source)
+        await persist_analyzer_metadata(
+            actor=source,
+            changeset=changeset,
+            metadata=[
+                make_metadata(FILE_NAME, name, source.id, asset=asset),
+                make_metadata(FILE_PATH, f"/photos/{name}", source.id, asset=asset),
+                *[
+                    make_metadata(key, value, source.id, asset=asset)
+                    for key, value in metadata
+                ],
+            ],
+        )
+        return asset
+
+    first = await changeset_db.create(id=1, status=OpStatus.IN_PROGRESS)
+    photo = await _add_asset(first, "IMG_1.JPG", [])
+    photo_xmp = await _add_asset(
+        first,
+        "IMG_1.JPG.xmp",
+        [(SIDECAR_TYPE, "xmp"), (SIDECAR_TARGET_NAME, "img_1.jpg")],
+    )
+    raw_xmp = await _add_asset(
+        first,
+        "IMG_2.CR2.xmp",
+        [(SIDECAR_TYPE, "xmp"), (SIDECAR_TARGET_NAME, "IMG_2.CR2")],
+    )
+
+    analyzer = SidecarLinksAnalyzer(analyzer_actor)
+    state = None
+
+    async def _load_state():
+        return state
+
+    monkeypatch.setattr(analyzer, "load_analyzer_state", _load_state)
+    result = await analyzer.run(changeset=first, scope=AnalyzerScope.all())
+
+    assert result.output["full_rebuild"] is True
+    assert result.output["linked"] == 1
+    assert result.output["unresolved"] == 1
+    assert _links(result) == [(photo_xmp.id, photo.id, False)]
+    assert [issue.extra["sidecar_asset_id"] for issue in result.issues] == [raw_xmp.id]
+    state = result.state
+
+    # The missing raw file shows up; only its sidecar is resolved again.
+    second = await changeset_db.create(id=2, status=OpStatus.IN_PROGRESS)
+    raw = await _add_asset(second, "IMG_2.CR2", [])
+    result = await analyzer.run(changeset=second, scope=AnalyzerScope.all())
+
+    assert result.output["changed_assets"] == 1
+    assert result.output["resolved_sidecars"] == 1
+    assert result.output["linked"] == 2
+    assert _links(result) == [(raw_xmp.id, raw.id, False)]
+    assert result.issues == []
+    state = result.state
+
+    # Deleting a target retracts the link of its sidecar.
+    await asset_db.delete_assets([photo.id])
+    third = await changeset_db.create(id=3, status=OpStatus.IN_PROGRESS)
+    result = await analyzer.run(changeset=third, scope=AnalyzerScope.all())
+
+    assert result.output["changed_assets"] == 0
+    assert _links(result) == [(photo_xmp.id, photo.id, True)]
+    assert [issue.extra["sidecar_asset_id"] for issue in result.issues] == [photo_xmp.id]
+    assert (result.output["linked"], result.output["unresolved"]) == (1, 1)
+    state = result.state
+
+    # Nothing changed: nothing is resolved again.
+    fourth = await changeset_db.create(id=4, status=OpStatus.IN_PROGRESS)
+    result = await analyzer.run(changeset=fourth, scope=AnalyzerScope.all())
+    assert result.output["resolved_sidecars"] == 0
+    assert result.metadata == []
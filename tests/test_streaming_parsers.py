@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+
+import pytest
+
+from katalog.db.actors import get_actor_repo
+from katalog.models import ActorType
+from katalog.sources.csv import CsvSource
+from katalog.sources.json_list import JsonListSource
+from katalog.utils.streaming import iter_json_records
+
+
+def _records(payload: object, **kwargs) -> list[tuple[str | None, object]]:
+    # A tiny read size forces values to straddle buffer refills.
+    text = json.dumps(payload, indent=1)
+    return list(iter_json_records(io.StringIO(text), read_size=3, **kwargs))
+
+
+def test_iter_json_records_matches_supported_layouts():
+    rows = [{"url": "https://e.com/1", "n": 12.5e3}, {"url": "https://e.com/2", "ok": True}]
+
+    assert _records(rows) == [(None, row) for row in rows]
+    assert _records({"meta": {"x": [1]}, "data": rows}, records_field="data") == [
+        (None, row) for row in rows
+    ]
+    assert _records(
+        {"data": {"a": rows[0], "b": rows[1]}}, records_field="data", records_are_map=True
+    ) == [("a", rows[0]), ("b", rows[1])]
+    assert _records({"documents": rows[:1], "records": rows[1:]}) == [(None, rows[1])]
+    assert _records({"documents": rows}) == [(None, row) for row in rows]
+    assert _records({"url": "https://e.com/single"}) == [
+        (None, {"url": "https://e.com/single"})
+    ]
+
+
+@pytest.mark.parametrize(
+    ("text", "kwargs"),
+    [
+        ('{"data": {"a": 1}}', {"records_field": "data"}),
+        ('{"other": []}', {"records_field": "data"}),
+        ("5", {}),
+        ('[{"url": 1}, ', {}),
+    ],
+)
+def test_iter_json_records_rejects_unsupported_documents(text, kwargs):
+    with pytest.raises(ValueError):
+        list(iter_json_records(io.StringIO(text), **kwargs))
+
+
+@pytest.mark.asyncio
+async def test_json_list_scan_streams_a_large_record_map(db_session, tmp_path):
+    _ = db_session
+    total = 5000
+    json_file = tmp_path / "records.json"
+    with json_file.open("w", encoding="utf-8") as handle:
+        handle.write('{"generated": "today", "items": {')
+        for idx in range(total):
+            separator = "," if idx else ""
+            url = f"https://example.com/{idx}" if idx % 10 else "not-a-url"
+            handle.write(f'{separator}"id-{idx}": {json.dumps({"url": url})}')
+        handle.write("}}")
+
+    actor = await get_actor_repo().create(
+        name="json-stream",
+        plugin_id=JsonListSource.plugin_id,
+        type=ActorType.SOURCE,
+        config={"json_file": str(json_file), "records_field": "items", "records_are_map": True},
+    )
+    source = JsonListSource(actor, **(actor.config or {}))
+
+    scan_result = await source.scan()
+    external_ids = [result.asset.external_id async for result in scan_result.iterator]
+
+    assert len(external_ids) == total - total // 10
+    assert external_ids[:2] == ["id-1", "id-2"]
+    assert scan_result.ignored == total // 10
+
+
+@pytest.mark.asyncio
+async def test_csv_rows_stream_across_batches(db_session, tmp_path):
+    _ = db_session
+    total = 2500
+    csv_file = tmp_path / "rows.csv"
+    with csv_file.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["id", "name"])
+        for idx in range(total):
+            writer.writerow([f"row-{idx}", f"multi\nline {idx}"])
+
+    actor = await get_actor_repo().create(
+        name="csv-stream",
+        plugin_id=CsvSource.plugin_id,
+        type=ActorType.SOURCE,
+        config={"csv_file": str(csv_file), "id_column": "id"},
+    )
+    source = CsvSource(actor, **(actor.config or {}))
+
+    rows = [row async for row in source.iter_raw_rows()]
+
+    assert len(rows) == total + 1
+    assert rows[-1].row_number == total + 1
+    assert rows[-1].values == [f"row-{total - 1}", f"multi\nline {total - 1}"]
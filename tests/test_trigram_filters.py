@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import pytest
+
+from katalog.api.assets import list_assets
+from katalog.api.metadata import build_trigram_index, drop_trigram_index
+from katalog.constants.metadata import FILE_PATH
+from katalog.db.sqlspec import session_scope
+from katalog.db.sqlspec.sql_helpers import scalar, select
+from katalog.models.query import AssetQuery
+
+
+async def _asset_ids(op: str, value: str) -> set[int]:
+    response = await list_assets(
+        AssetQuery.model_validate(
+            {
+                "view_id": "default",
+                "offset": 0,
+                "limit": 1000,
+                "columns": ["asset/id"],
+                "filters": [{"key": str(FILE_PATH), "op": op, "value": value}],
+            }
+        )
+    )
+    return {int(item.asset_id) for item in response.items}
+
+
+async def _sample_path() -> str:
+    async with session_scope() as session:
+        rows = await select(
+            session,
+            "SELECT m.value_text FROM metadata m "
+            "JOIN metadata_registry r ON r.id = m.metadata_key_id "
+            "WHERE r.key = ? AND m.value_text IS NOT NULL ORDER BY m.id LIMIT 1",
+            [str(FILE_PATH)],
+        )
+    assert rows
+    return str(rows[0]["value_text"])
+
+
+@pytest.mark.asyncio
+async def test_trigram_index_matches_like_semantics(seeded_assets):
+    _ = seeded_assets
+    path = await _sample_path()
+    middle = path[len(path) // 3 : len(path) // 3 + 4]
+    cases = [
+        ("contains", middle),
+        ("contains", middle.upper()),
+        ("startsWith", path[:5]),
+        ("endsWith", path[-5:]),
+        ("contains", path[-2:]),
+    ]
+    expected = {case: await _asset_ids(*case) for case in cases}
+    assert expected[("contains", middle)]
+
+    status = await build_trigram_index([str(FILE_PATH)])
+    assert status["metadata_keys"] == [str(FILE_PATH)]
+    assert status["indexed_rows"] > 0
+
+    for case in cases:
+        assert await _asset_ids(*case) == expected[case], case
+
+    await drop_trigram_index()
+    assert await _asset_ids("contains", middle) == expected[("contains", middle)]
+
+
+@pytest.mark.asyncio
+async def test_trigram_index_tracks_new_and_deleted_rows(seeded_assets):
+    _ = seeded_assets
+    await build_trigram_index([str(FILE_PATH)])
+
+    async with session_scope() as session:
+        row = (
+            await select(
+                session,
+                "SELECT m.id FROM metadata m "
+                "JOIN metadata_registry r ON r.id = m.metadata_key_id "
+                "WHERE r.key = ? ORDER BY m.id LIMIT 1",
+                [str(FILE_PATH)],
+            )
+        )[0]
+        await session.execute(
+            "UPDATE metadata SET value_text = ? WHERE id = ?",
+            "/unique/zqxjv-marker.txt",
+            row["id"],
+        )
+        await session.commit()
+        matched = await scalar(
+            session,
+            "SELECT COUNT(*) FROM metadata_trigram WHERE value_text LIKE ?",
+            ["%zqxjv%"],
+        )
+    assert matched == 1
+    assert len(await _asset_ids("contains", "zqxjv")) == 1
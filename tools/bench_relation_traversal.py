@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from katalog.constants.metadata import REL_LINK_TO, get_metadata_id
+from katalog.db.relations import get_relation_repo
+from katalog.db.sqlspec import session_scope
+from katalog.db.sqlspec.sql_helpers import execute
+from katalog.db.sqlspec.tables import ASSET_TABLE, RELATION_EDGE_TABLE
+from katalog.lifespan import app_lifespan
+
+_BATCH = 10_000
+
+
+async def _populate(assets: int, fanout: int, seed: int) -> int:
+    rng = random.Random(seed)
+    key_id = int(get_metadata_id(REL_LINK_TO))
+    edges = 0
+    async with session_scope() as session:
+        await execute(
+            session,
+            "INSERT INTO actors (id, name, plugin_id, type) VALUES (1, 'bench', 'bench', 0)",
+        )
+        for start in range(1, assets + 1, _BATCH):
+            ids = range(start, min(start + _BATCH, assets + 1))
+            await session.execute_many(
+                f"""
+                INSERT INTO {ASSET_TABLE} (id, actor_id, namespace, external_id, canonical_uri)
+                VALUES (:id, 1, 'bench', :external_id, :uri)
+                """,
+                [{"id": i, "external_id": str(i), "uri": f"bench://{i}"} for i in ids],
+            )
+            rows = {
+                (i, rng.randint(1, assets))
+                for i in ids
+                for _ in range(fanout)
+            }
+            await session.execute_many(
+                f"""
+                INSERT OR IGNORE INTO {RELATION_EDGE_TABLE}
+                    (from_asset_id, metadata_key_id, to_asset_id, actor_id, changeset_id)
+                VALUES (:from_asset_id, :key_id, :to_asset_id, 1, 1)
+                """,
+                [
+                    {"from_asset_id": a, "key_id": key_id, "to_asset_id": b}
+                    for a, b in rows
+                    if a != b
+                ],
+            )
+            edges += sum(1 for a, b in rows if a != b)
+        await session.commit()
+    return edges
+
+
+async def _time(label: str, runs: int, call) -> None:  # noqa: ANN001
+    samples: list[float] = []
+    size = 0
+    truncated = False
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = await call()
+        samples.append((time.perf_counter() - started) * 1000)
+        if isinstance(result, list):
+            size = len(result)
+        else:
+            size = len(result.assets)
+            truncated = truncated or result.truncated
+    samples.sort()
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    print(
+        f"{label:<16} median {statistics.median(samples):8.2f} ms  "
+        f"p95 {p95:8.2f} ms  results {size:>6,}{'  (truncated)' if truncated else ''}"
+    )
+
+
+async def _run(args: argparse.Namespace, workspace: Path) -> None:
+    async with app_lifespan(init_mode="fast", workspace=workspace):
+        print(
+            f"Generating {args.assets:,} assets with {args.fanout} links each in {workspace}",
+            file=sys.stderr,
+        )
+        edges = await _populate(args.assets, args.fanout, args.seed)
+        print(f"Indexed {edges:,} edges", file=sys.stderr)
+
+        repo = get_relation_repo()
+        rng = random.Random(args.seed + 1)
+        starts = [rng.randint(1, args.assets) for _ in range(args.runs)]
+        cursor = iter(starts * 3)
+
+        await _time("neighbors", args.runs, lambda: repo.neighbors(next(cursor)))
+        await _time(
+            f"traverse d={args.depth}",
+            args.runs,
+            lambda: repo.traverse(next(cursor), max_depth=args.depth, limit=args.limit),
+        )
+        await _time(
+            "component",
+            args.runs,
+            lambda: repo.component(next(cursor), limit=args.limit),
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Generate a synthetic relation graph in a scratch workspace and measure "
+            "neighbor, k-hop and connected-component query latency."
+        )
+    )
+    parser.add_argument("--assets", type=int, default=100_000, help="Assets (default: 100000)")
+    parser.add_argument("--fanout", type=int, default=2, help="Links per asset (default: 2)")
+    parser.add_argument("--depth", type=int, default=3, help="Traversal depth (default: 3)")
+    parser.add_argument("--limit", type=int, default=1000, help="Result limit (default: 1000)")
+    parser.add_argument("--runs", type=int, default=50, help="Queries per kind (default: 50)")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed (default: 7)")
+    parser.add_argument(
+        "--workspace",
+        default=None,
+        help="Empty directory for the scratch workspace (default: a temporary directory)",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workspace = Path(args.workspace) if args.workspace else Path(tmp)
+        workspace.mkdir(parents=True, exist_ok=True)
+        asyncio.run(_run(args, workspace))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from katalog.utils.streaming import iter_json_records, iterate_in_thread
+
+
+def _write_json(path: Path, records: int, *, as_map: bool) -> None:
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write('{"generated": "bench", "items": ' + ("{" if as_map else "["))
+        for idx in range(records):
+            if idx:
+                handle.write(",")
+            record = json.dumps(
+                {
+                    "url": f"https://example.com/docs/{idx}.pdf",
+                    "title": f"Document {idx}",
+                    "tags": ["alpha", "beta"],
+                    "score": idx * 0.5,
+                }
+            )
+            handle.write(f'"doc-{idx}": {record}' if as_map else record)
+        handle.write("}}" if as_map else "]}")
+
+
+def _write_csv(path: Path, records: int) -> None:
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["id", "url", "title", "score"])
+        for idx in range(records):
+            writer.writerow(
+                [f"doc-{idx}", f"https://example.com/docs/{idx}.pdf", f"Document {idx}", idx * 0.5]
+            )
+
+
+async def _drain_json(path: Path, *, as_map: bool) -> int:
+    count = 0
+    with path.open("r", encoding="utf-8") as handle:
+        records = iter_json_records(handle, records_field="items", records_are_map=as_map)
+        async for _ in iterate_in_thread(records):
+            count += 1
+    return count
+
+
+async def _drain_csv(path: Path) -> int:
+    count = 0
+    with path.open("r", encoding="utf-8-sig", newline="") as handle:
+        async for _ in iterate_in_thread(iter(csv.reader(handle))):
+            count += 1
+    return count
+
+
+def _measure(label: str, path: Path, drain) -> None:  # noqa: ANN001
+    tracemalloc.start()
+    started = time.perf_counter()
+    count = asyncio.run(drain())
+    elapsed = time.perf_counter() - started
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    size_mb = path.stat().st_size / (1024 * 1024)
+    print(
+        f"{label:<10} {count:>10,} records  {size_mb:8.1f} MiB  "
+        f"{count / elapsed:>12,.0f} rec/s  {size_mb / elapsed:7.1f} MiB/s  "
+        f"peak {peak / (1024 * 1024):6.1f} MiB"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Generate synthetic JSON/CSV record files and measure the throughput and "
+            "peak Python memory of the streaming parsers used by the list sources."
+        )
+    )
+    parser.add_argument(
+        "--records",
+        type=int,
+        default=1_000_000,
+        help="Records per synthetic file (default: 1000000)",
+    )
+    parser.add_argument(
+        "--dir",
+        default=None,
+        help="Directory for the generated files (default: a temporary directory)",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(args.dir) if args.dir else Path(tmp)
+        root.mkdir(parents=True, exist_ok=True)
+        json_list = root / "records-list.json"
+        json_map = root / "records-map.json"
+        csv_file = root / "records.csv"
+        print(f"Writing {args.records:,} synthetic records per file to {root}", file=sys.stderr)
+        _write_json(json_list, args.records, as_map=False)
+        _write_json(json_map, args.records, as_map=True)
+        _write_csv(csv_file, args.records)
+
+        _measure("json-list", json_list, lambda: _drain_json(json_list, as_map=False))
+        _measure("json-map", json_map, lambda: _drain_json(json_map, as_map=True))
+        _measure("csv", csv_file, lambda: _drain_csv(csv_file))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())